@@ -330,6 +330,29 @@ class TestValidateCommand:
         assert "--json-output" in result.output
         assert "--verbose" in result.output
 
+    def test_validate_with_result_cache(self, cli_runner, sample_cli_config, tmp_path):
+        """Test --cache-path reuses results on the second run."""
+        cache_path = tmp_path / "results.db"
+        html_path = tmp_path / "report.html"
+        args = ['validate', sample_cli_config, '--cache-path', str(cache_path), '-o', str(html_path)]
+
+        first = cli_runner.invoke(cli, args)
+        second = cli_runner.invoke(cli, args)
+
+        assert first.exit_code == 0
+        assert second.exit_code == 0
+        assert cache_path.exists()
+        assert "reused from the result cache" in second.output
+        assert "CACHED" in html_path.read_text()
+
+    def test_validate_resume_without_checkpoint(self, cli_runner, sample_cli_config, tmp_path, monkeypatch):
+        """Test --resume runs from the start and leaves no checkpoint behind."""
+        monkeypatch.chdir(tmp_path)
+        result = cli_runner.invoke(cli, ['validate', sample_cli_config, '--resume', '-o', str(tmp_path / "report.html")])
+
+        assert result.exit_code == 0
+        assert list(tmp_path.glob(".datak9_cache/checkpoints/run-*.ckpt")) == []
+
 
 # ============================================================================
 # LIST-VALIDATIONS COMMAND TESTS
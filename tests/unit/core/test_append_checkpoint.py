@@ -0,0 +1,132 @@
+"""
+Tests for append-aware incremental validation.
+
+Author: Daniel Edge
+"""
+
+import pytest
+import pandas as pd
+
+from validation_framework.core.append_checkpoint import AppendCheckpointStore
+from validation_framework.core.config import ValidationConfig
+from validation_framework.core.optimized_engine import OptimizedValidationEngine
+from validation_framework.loaders.factory import LoaderFactory
+
+VALIDATIONS = [
+    {'type': 'UniqueKeyCheck', 'severity': 'ERROR', 'params': {'fields': ['id']}},
+    {'type': 'RangeCheck', 'severity': 'ERROR', 'params': {'field': 'amount', 'min_value': 0}},
+    {'type': 'CompletenessCheck', 'severity': 'WARNING', 'params': {'field': 'amount', 'min_completeness': 0.5}},
+    {'type': 'RowCountRangeCheck', 'severity': 'ERROR', 'params': {'min_rows': 1}},
+]
+
+
+def _config(path, file_format, checkpoint_dir, append_only=True):
+    return ValidationConfig({
+        'validation_job': {'name': 'Append', 'files': [{
+            'name': 'events', 'path': str(path), 'format': file_format,
+            'append_only': append_only, 'validations': VALIDATIONS,
+        }]},
+        'processing': {'chunk_size': 4, 'checkpoint_dir': str(checkpoint_dir)},
+    })
+
+
+def _run(path, file_format, checkpoint_dir, append_only=True):
+    report = OptimizedValidationEngine(_config(path, file_format, checkpoint_dir, append_only)).run(verbose=False)
+    file_report = report.file_reports[0]
+    results = [(r.rule_name, r.passed, r.failed_count, r.total_count) for r in file_report.validation_results]
+    return results, file_report.metadata.get('append')
+
+
+def _frame(ids, amounts):
+    return pd.DataFrame({'id': ids, 'amount': amounts})
+
+
+@pytest.mark.unit
+class TestAppendCheckpoint:
+    """Test append runs read only the tail and report whole-file results."""
+
+    def test_csv_append_matches_full_run(self, tmp_path):
+        path = tmp_path / "events.csv"
+        _frame(range(10), [1, -1, 2, 3, None, 5, 6, 7, 8, 9]).to_csv(path, index=False)
+
+        first, append = _run(path, 'csv', tmp_path / "ckpt")
+        assert append['resumed'] is False
+
+        # Appended rows repeat an id from the first run and add an out-of-range amount
+        with open(path, 'a') as f:
+            f.write("3,10\n10,-5\n11,12\n")
+        second, append = _run(path, 'csv', tmp_path / "ckpt")
+        full, _ = _run(path, 'csv', tmp_path / "unused", append_only=False)
+
+        assert append['resumed'] is True
+        assert append['rows_from_checkpoint'] == 10
+        assert append['start'] > 0
+        assert second == full
+        assert second[0][2] > 0  # duplicate id 3 spans both runs
+        assert second[1][2] == 2
+
+    def test_tail_is_read_from_checkpoint_offset(self, tmp_path):
+        path = tmp_path / "events.csv"
+        _frame(range(6), range(6)).to_csv(path, index=False)
+        _run(path, 'csv', tmp_path / "ckpt")
+        with open(path, 'a') as f:
+            f.write("6,6\n7,7\n")
+
+        plan = AppendCheckpointStore(str(tmp_path / "ckpt")).plan(
+            _config(path, 'csv', tmp_path / "ckpt").files[0], "other-config")
+        assert plan.resumed is False  # changed validation config restarts
+
+        _, append = _run(path, 'csv', tmp_path / "ckpt")
+        loader = LoaderFactory.create_loader(str(path), file_format='csv',
+                                             byte_range=(append['start'], append['end']))
+        tail = pd.concat(loader.load())
+
+        assert tail['id'].tolist() == [6, 7]
+
+    def test_rewritten_file_is_revalidated(self, tmp_path):
+        path = tmp_path / "events.csv"
+        _frame(range(8), range(8)).to_csv(path, index=False)
+        _run(path, 'csv', tmp_path / "ckpt")
+
+        _frame([1, 1, 2, 3, 4, 5, 6, 7, 8], range(9)).to_csv(path, index=False)
+        results, append = _run(path, 'csv', tmp_path / "ckpt")
+
+        assert append['resumed'] is False
+        assert results[0][1] is False
+        assert results[0][3] == 9
+
+    def test_incomplete_last_line_is_not_checkpointed(self, tmp_path):
+        path = tmp_path / "events.csv"
+        path.write_text("id,amount\n1,1\n2,2\n")
+        _run(path, 'csv', tmp_path / "ckpt")
+        with open(path, 'a') as f:
+            f.write("3,3")
+
+        _, append = _run(path, 'csv', tmp_path / "ckpt")
+        with open(path, 'a') as f:
+            f.write("\n4,4\n")
+        results, append_after = _run(path, 'csv', tmp_path / "ckpt")
+
+        assert append['resumed'] is True
+        assert append_after['rows_from_checkpoint'] == 2
+        assert results[0][3] == 4
+
+    def test_parquet_new_row_groups(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        pa = pytest.importorskip("pyarrow")
+        path = tmp_path / "events.parquet"
+        first = pa.Table.from_pandas(_frame([1, 2, 3], [1.0, 2.0, -3.0]), preserve_index=False)
+        second = pa.Table.from_pandas(_frame([3, 4], [4.0, 5.0]), preserve_index=False)
+
+        pq.write_table(first, path)
+        _run(path, 'parquet', tmp_path / "ckpt")
+
+        with pq.ParquetWriter(path, first.schema) as writer:
+            writer.write_table(first)
+            writer.write_table(second)
+        results, append = _run(path, 'parquet', tmp_path / "ckpt")
+        full, _ = _run(path, 'parquet', tmp_path / "unused", append_only=False)
+
+        assert append == {'resumed': True, 'rows_from_checkpoint': 3, 'start': 1, 'end': 2, 'unit': 'row_groups'}
+        assert results == full
+        assert results[0][1] is False
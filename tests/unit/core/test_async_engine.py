@@ -8,6 +8,7 @@ performance improvements from parallel processing.
 import pytest
 import pandas as pd
 import tempfile
+import json
 import yaml
 import asyncio
 from pathlib import Path
@@ -111,6 +112,18 @@ class TestAsyncJSONLoader:
         assert "file_path" in metadata
         assert "format" in metadata
 
+    async def test_async_json_loader_record_path(self, tmp_path):
+        """Test async JSON loader streams the array of an object envelope."""
+        path = tmp_path / "envelope.json"
+        path.write_text(json.dumps({"meta": {"page": 1}, "data": [{"id": i} for i in range(5)]}))
+        loader = AsyncJSONLoader(file_path=str(path), chunk_size=2, record_path="data")
+
+        chunks = [chunk async for chunk in loader.load()]
+        metadata = await loader.get_metadata()
+
+        assert [chunk["id"].tolist() for chunk in chunks] == [[0, 1], [2, 3], [4]]
+        assert metadata["row_count"] == 5
+
 
 @pytest.mark.asyncio
 @pytest.mark.unit
@@ -0,0 +1,62 @@
+"""
+Tests for the numpy-backed bloom filter.
+
+Author: Daniel Edge
+"""
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from validation_framework.core.bloom_filter import BloomFilter
+
+
+@pytest.mark.unit
+class TestBloomFilter:
+    """Test batch membership, merging and serialization."""
+
+    def test_no_false_negatives_and_bounded_false_positives(self):
+        """Test added keys are always found and the FP rate is near the target."""
+        bloom = BloomFilter(capacity=20_000, error_rate=0.01)
+        bloom.add_many(np.arange(20_000))
+
+        assert bloom.contains_many(np.arange(20_000)).all()
+        assert bloom.contains_many(np.arange(20_000, 120_000)).mean() < 0.02
+        assert 5 in bloom and -1 not in bloom
+
+    def test_frame_keys(self):
+        """Test multi-column keys are hashed per row."""
+        bloom = BloomFilter(capacity=100)
+        bloom.add_many(pd.DataFrame({"id": [1, 2], "code": ["a", "b"]}))
+
+        found = bloom.contains_many(pd.DataFrame({"id": [1.0, 2, 1], "code": ["a", "b", "b"]}))
+
+        assert found[:2].tolist() == [True, True]
+
+    def test_merge_is_union(self):
+        """Test merged filters contain the keys of both."""
+        first = BloomFilter(capacity=1_000)
+        second = BloomFilter(capacity=1_000)
+        first.add_many(["a", "b"])
+        second.add_many(["c"])
+
+        first.merge(second)
+
+        assert first.contains_many(["a", "b", "c"]).all()
+        assert first.count == 3
+        with pytest.raises(ValueError):
+            first.merge(BloomFilter(capacity=10))
+
+    def test_serialization_round_trip(self):
+        """Test to_bytes/from_bytes and pickling keep every bit."""
+        bloom = BloomFilter(capacity=1_000, error_rate=0.001)
+        bloom.add_many(range(500))
+
+        for restored in (BloomFilter.from_bytes(bloom.to_bytes()), pickle.loads(pickle.dumps(bloom))):
+            assert np.array_equal(restored.bits, bloom.bits)
+            assert (restored.num_hashes, restored.error_rate, restored.count) == (bloom.num_hashes, 0.001, 500)
+            assert restored.contains_many(range(500)).all()
+        with pytest.raises(ValueError):
+            BloomFilter.from_bytes(b"not a filter")
@@ -0,0 +1,100 @@
+"""
+Tests for the per-chunk computation cache.
+
+Author: Daniel Edge
+"""
+
+import pytest
+import pandas as pd
+
+from validation_framework.core import chunk_cache
+from validation_framework.core.chunk_cache import activate_chunk_cache, get_chunk_cache
+from validation_framework.core.config import ValidationConfig
+from validation_framework.core.optimized_engine import OptimizedValidationEngine
+
+
+@pytest.fixture
+def chunk():
+    return pd.DataFrame({'amount': ['1', 'x', None, '40'], 'code': ['A', ' ', None, 'BC']})
+
+
+@pytest.mark.unit
+class TestChunkCache:
+    """Test derived values are computed once per active chunk."""
+
+    def test_values_are_shared_while_active(self, chunk):
+        with activate_chunk_cache(chunk) as cache:
+            first = chunk_cache.to_numeric(chunk, 'amount')
+            second = chunk_cache.to_numeric(chunk, 'amount')
+            chunk_cache.null_mask(chunk, 'code')
+
+            assert first is second
+            assert (cache.hits, cache.misses) == (1, 2)
+
+        assert first.isna().tolist() == [False, True, True, False]
+
+    def test_cache_is_cleared_after_chunk(self, chunk):
+        with activate_chunk_cache(chunk) as cache:
+            chunk_cache.as_strings(chunk, 'code')
+            assert len(cache) == 1
+
+        assert len(cache) == 0
+        assert get_chunk_cache(chunk) is None
+
+    def test_other_frames_are_not_cached(self, chunk):
+        subset = chunk[chunk['code'].notna()]
+
+        with activate_chunk_cache(chunk) as cache:
+            assert chunk_cache.blank_mask(subset, 'code').tolist() == [False, True, False]
+            assert chunk_cache.null_mask(subset, 'code') is not chunk_cache.null_mask(subset, 'code')
+            assert len(cache) == 0
+
+    def test_condition_mask_keyed_by_expression(self, chunk):
+        calls = []
+
+        def evaluate():
+            calls.append(1)
+            return chunk['code'] == 'A'
+
+        with activate_chunk_cache(chunk):
+            chunk_cache.condition_mask(chunk, "code == 'A'", evaluate)
+            chunk_cache.condition_mask(chunk, "code == 'A'", evaluate)
+            chunk_cache.condition_mask(chunk, "code == 'B'", evaluate)
+
+        assert len(calls) == 2
+
+
+@pytest.mark.unit
+def test_shared_values_do_not_change_results(tmp_path):
+    """Validations sharing a field and condition report the same as alone."""
+    path = tmp_path / "data.csv"
+    pd.DataFrame({
+        'amount': [5, -1, None, 'bad', 200] * 4,
+        'status': ['ACTIVE', 'ACTIVE', 'CLOSED', 'ACTIVE', ' '] * 4,
+    }).to_csv(path, index=False)
+
+    validations = [
+        {'type': 'RangeCheck', 'severity': 'ERROR', 'params': {'field': 'amount', 'min_value': 0, 'max_value': 100},
+         'condition': "status == 'ACTIVE'"},
+        {'type': 'MandatoryFieldCheck', 'severity': 'ERROR', 'params': {'fields': ['status', 'amount']}},
+        {'type': 'RegexCheck', 'severity': 'ERROR', 'params': {'field': 'amount', 'pattern': r'^\d+(\.\d+)?$'}},
+        {'type': 'StringLengthCheck', 'severity': 'ERROR', 'params': {'field': 'amount', 'max_length': 3}},
+        {'type': 'CompletenessCheck', 'severity': 'ERROR', 'params': {'field': 'amount', 'min_completeness': 0.9}},
+    ]
+
+    def run(selected):
+        config = ValidationConfig({
+            'validation_job': {'name': 'Cache', 'files': [
+                {'name': 'data', 'path': str(path), 'format': 'csv', 'validations': selected}
+            ]},
+            'processing': {'chunk_size': 6},
+        })
+        report = OptimizedValidationEngine(config).run(verbose=False)
+        return [(r.rule_name, r.passed, r.failed_count, r.total_count) for r in report.file_reports[0].validation_results]
+
+    together = run(validations)
+    alone = [run([v])[0] for v in validations]
+
+    assert together == alone
+    assert together[0][2] == 4  # -1 and 200 on ACTIVE rows
+    assert together[1][2] == 8  # blank status and null amount
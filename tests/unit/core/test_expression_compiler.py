@@ -0,0 +1,181 @@
+"""
+Tests for the condition/rule expression compiler and compiled rule queries.
+
+Author: Daniel Edge
+"""
+
+from unittest.mock import patch
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from validation_framework.core.config import ValidationConfig
+from validation_framework.core.engine import ValidationEngine
+from validation_framework.core.exceptions import ExpressionCompileError
+from validation_framework.core.expression_compiler import compile_expression, evaluate_expression
+from validation_framework.core.optimized_engine import OptimizedValidationEngine
+from validation_framework.core.registry import get_registry
+from validation_framework.core.rule_query import answer_rule_validations
+from validation_framework.validations.builtin.inline_checks import InlineBusinessRuleCheck
+
+pl = pytest.importorskip("polars")
+
+
+@pytest.fixture
+def customers():
+    return pd.DataFrame({
+        "age": [25, 17, None, 40],
+        "status": ["ACTIVE", "CLOSED", None, "ACTIVE"],
+        "first name": ["Ann", "", "Cy", None],
+    })
+
+
+@pytest.mark.unit
+class TestExpressionCompiler:
+    """Test SQL-like and pandas syntax compile to the same masks as pandas."""
+
+    @pytest.mark.parametrize("expression, expected", [
+        ("age >= 18", [True, False, False, True]),
+        ("age >= 18 AND status == 'ACTIVE'", [True, False, False, True]),
+        ("age < 18 | status == 'CLOSED'", [False, True, False, False]),
+        ("status != 'ACTIVE'", [False, True, True, False]),
+        ("status IN ('ACTIVE', 'CLOSED')", [True, True, False, True]),
+        ("status NOT IN ('ACTIVE')", [False, True, True, False]),
+        ("status IS NULL OR age IS NULL", [False, False, True, False]),
+        ("NOT (age > 20)", [False, True, True, False]),
+        ("`first name`.str.len() > 1", [True, False, True, False]),
+        ("age.isnull()", [False, False, True, False]),
+        ("age * 2 = 50", [True, False, False, False]),
+    ])
+    def test_masks(self, customers, expression, expected):
+        assert evaluate_expression(customers, expression).tolist() == expected
+
+    def test_matches_pandas_eval(self, customers):
+        expression = "(age >= 18 & status == 'ACTIVE') | (status != 'ACTIVE')"
+        expected = customers.eval(expression).to_numpy(dtype=bool)
+
+        np.testing.assert_array_equal(evaluate_expression(customers, expression), expected)
+
+    def test_today_parses_string_dates(self):
+        df = pd.DataFrame({"created": ["2020-01-01", "2999-01-01", None]})
+
+        assert evaluate_expression(df, "created <= today").tolist() == [True, False, False]
+
+    @pytest.mark.parametrize("expression", ["age >> 2", "__import__('os')", "age.apply(len)", "age >="])
+    def test_unsupported_syntax_is_rejected(self, expression):
+        with pytest.raises(ExpressionCompileError):
+            compile_expression(expression)
+
+    def test_unknown_column_is_rejected_with_schema(self):
+        with pytest.raises(ExpressionCompileError, match="unknown column 'salary'"):
+            compile_expression("salary > 0", {"age": pl.Int64})
+
+
+def _rule_config(csv_path, polars_rules=True):
+    return ValidationConfig({
+        'validation_job': {
+            'name': 'Rules',
+            'files': [{
+                'name': 'customers',
+                'path': str(csv_path),
+                'format': 'csv',
+                'validations': [
+                    {'type': 'InlineBusinessRuleCheck', 'severity': 'ERROR',
+                     'params': {'rule': "age >= 18", 'error_message': 'Too young'}},
+                    {'type': 'MandatoryFieldCheck', 'severity': 'ERROR', 'params': {'fields': ['status']}},
+                    {'type': 'InlineBusinessRuleCheck', 'severity': 'WARNING',
+                     'params': {'rule': "balance > 0", 'description': 'Positive balance'},
+                     'condition': "status == 'ACTIVE'"},
+                ]
+            }]
+        },
+        'processing': {'chunk_size': 7, 'polars_rules': polars_rules}
+    })
+
+
+@pytest.fixture
+def rule_csv(tmp_path):
+    path = tmp_path / "customers.csv"
+    pd.DataFrame({
+        'age': [25, 17, 30, 16, 45] * 6,
+        'status': ['ACTIVE', 'ACTIVE', 'CLOSED', 'ACTIVE', 'NA'] * 6,
+        'balance': [10, -5, -1, 0, 3] * 6,
+    }).to_csv(path, index=False)
+    return path
+
+
+def _summary(report):
+    return [
+        (r.rule_name, r.passed, r.failed_count, r.total_count, r.message,
+         [(s['row'], s.get('values')) for s in r.sample_failures])
+        for r in report.file_reports[0].validation_results
+    ]
+
+
+@pytest.mark.unit
+class TestCompiledRuleQuery:
+    """Test rule validations answered by one Polars query match the chunked path."""
+
+    @pytest.mark.parametrize("engine_class", [ValidationEngine, OptimizedValidationEngine])
+    def test_compiled_matches_chunked(self, rule_csv, engine_class):
+        # The rule checks must not reach the chunked (pandas) path
+        with patch.object(InlineBusinessRuleCheck, "_passing_mask", side_effect=AssertionError("chunked path")):
+            compiled = engine_class(_rule_config(rule_csv)).run(verbose=False)
+        chunked = engine_class(_rule_config(rule_csv, polars_rules=False)).run(verbose=False)
+
+        assert _summary(compiled) == _summary(chunked)
+
+        results = compiled.file_reports[0].validation_results
+        assert [r.rule_name for r in results][0] == 'InlineBusinessRuleCheck'
+        assert results[0].failed_count == 12
+        assert results[0].sample_failures[0]['row'] == 1
+        assert results[2].failed_count == 12  # only ACTIVE rows are checked
+
+    def test_query_answers_compilable_rules(self, rule_csv):
+        results = answer_rule_validations(_rule_config(rule_csv).files[0], get_registry(), 100)
+
+        assert sorted(results) == [0, 2]
+        assert [results[0].failed_count, results[2].failed_count] == [12, 12]
+
+    def test_uncompilable_rule_uses_chunked_path(self, rule_csv):
+        config = _rule_config(rule_csv)
+        config.files[0]['validations'][0]['params']['rule'] = "age.between(18, 99)"
+
+        report = OptimizedValidationEngine(config).run(verbose=False)
+        result = report.file_reports[0].validation_results[0]
+
+        # The chunked path cannot evaluate the method call either: reported as a failure, not skipped
+        assert result.passed is False
+
+    def test_compiled_query_is_opt_in(self, rule_csv):
+        config = _rule_config(rule_csv)
+        del config.raw_config['processing']['polars_rules']
+
+        with patch("validation_framework.core.optimized_engine.answer_rule_validations",
+                   side_effect=AssertionError("compiled query")):
+            report = OptimizedValidationEngine(ValidationConfig(config.raw_config)).run(verbose=False)
+
+        assert report.file_reports[0].validation_results[0].failed_count == 12
+
+    @pytest.mark.parametrize("values, rule", [
+        ([5] * 10_500 + ['x'] + [20] * 99, "v >= 10"),  # string past the inference window
+        ([5] * 10_500 + [1.5] + [20] * 99, "v >= 10"),  # float past the inference window
+        (['x'] + [5] * 50 + [20] * 50, "v >= 10"),
+        ([1, 'a'] * 50, "v == 'a'"),
+        (['true', 'false', None] * 40, "v == True"),
+    ])
+    def test_mixed_type_columns_match_chunked(self, tmp_path, values, rule):
+        path = tmp_path / "mixed.csv"
+        pd.DataFrame({'v': values}).to_csv(path, index=False)
+
+        def run(polars_rules):
+            config = _rule_config(path, polars_rules)
+            config.files[0]['validations'] = [
+                {'type': 'InlineBusinessRuleCheck', 'severity': 'ERROR', 'params': {'rule': rule}}
+            ]
+            result = OptimizedValidationEngine(config).run(verbose=False).file_reports[0].validation_results[0]
+            return result.passed, result.failed_count, result.total_count, [s['row'] for s in result.sample_failures]
+
+        # Sample values may print nulls differently ('None' vs 'nan'); counts and rows agree
+        assert run(True) == run(False)
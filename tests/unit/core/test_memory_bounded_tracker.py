@@ -0,0 +1,54 @@
+"""
+Tests for the batch API of MemoryBoundedTracker.
+
+Author: Daniel Edge
+"""
+
+import numpy as np
+import pytest
+
+from validation_framework.core.memory_bounded_tracker import MemoryBoundedTracker
+
+
+def _keys(count=3_000, distinct=1_000):
+    rng = np.random.default_rng(3)
+    return [("k", int(value)) for value in rng.integers(0, distinct, count)]
+
+
+@pytest.mark.unit
+class TestMemoryBoundedTrackerBatches:
+    """Test add_many/contains_many/add_and_check_many match the per-key API."""
+
+    @pytest.mark.parametrize("max_memory_keys", [10_000, 200])
+    def test_batches_match_per_key_calls(self, max_memory_keys):
+        """Test batch results equal add_and_check() key by key, before and after spillover."""
+        keys = _keys()
+        single = MemoryBoundedTracker(max_memory_keys=max_memory_keys)
+        batched = MemoryBoundedTracker(max_memory_keys=max_memory_keys)
+
+        expected = [single.add_and_check(key)[0] for key in keys]
+        was_seen = np.concatenate([
+            batched.add_and_check_many(keys[i:i + 500])[0] for i in range(0, len(keys), 500)
+        ])
+
+        assert was_seen.tolist() == expected
+        assert batched.get_statistics()["total_keys"] == single.get_statistics()["total_keys"]
+        assert batched.is_spilled is (max_memory_keys == 200)
+        single.close()
+        batched.close()
+
+    def test_contains_many_and_statistics_after_spill(self):
+        """Test batch lookups resolve from disk and count one lookup per key."""
+        tracker = MemoryBoundedTracker(max_memory_keys=4)
+        added = tracker.add_many(["a", "b", "a", "c", "d", "e"])
+
+        found = tracker.contains_many(["a", "e", "zz"])
+        stats = tracker.get_statistics()
+
+        assert added.tolist() == [True, True, False, True, True, True]
+        assert found.tolist() == [True, True, False]
+        assert stats["total_lookups"] == 9
+        assert stats["memory_hits"] == 1 and stats["disk_hits"] == 2
+        assert stats["total_keys_added"] == stats["total_keys"] == 5
+        assert sorted(key for batch in tracker.iter_key_batches(batch_size=2) for key in batch) == list("abcde")
+        tracker.close()
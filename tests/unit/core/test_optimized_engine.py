@@ -377,6 +377,31 @@ class TestSinglePassValidationState:
         assert hasattr(result, 'execution_time')
         assert result.execution_time > 0
 
+    def test_incremental_validation_sees_cross_chunk_duplicates(self):
+        """Test validations with incremental state keep exact results across chunks."""
+        from validation_framework.validations.builtin.record_checks import UniqueKeyCheck
+
+        validation = UniqueKeyCheck(
+            name="UniqueKeyCheck",
+            severity=Severity.ERROR,
+            params={"fields": ["id"]}
+        )
+        validation_config = {'type': 'UniqueKeyCheck', 'severity': 'ERROR'}
+        context = {'max_sample_failures': 100}
+
+        state = SinglePassValidationState(validation, validation_config, context)
+        assert state.incremental is True
+
+        state.process_chunk(pd.DataFrame({'id': [1, 2, 3]}), chunk_idx=0)
+        state.process_chunk(pd.DataFrame({'id': [3, 4, 1]}), chunk_idx=1)
+        result = state.finalize()
+
+        assert result.passed is False
+        assert result.failed_count == 2
+        assert result.total_count == 6
+        assert [s['row'] for s in result.sample_failures] == [3, 5]
+        assert result.is_sampled is False
+
 
 # ============================================================================
 # OPTIMIZED VALIDATION ENGINE TESTS
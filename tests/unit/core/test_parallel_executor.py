@@ -0,0 +1,290 @@
+"""
+Tests for parallel chunk and file execution in the engines.
+
+Parallel runs must produce exactly the same results as a serial run,
+whatever the number of workers.
+
+Author: Daniel Edge
+"""
+
+import pickle
+import subprocess
+import sys
+import textwrap
+from functools import partial
+from pathlib import Path
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from validation_framework.core.config import ValidationConfig
+from validation_framework.core.engine import ValidationEngine
+from validation_framework.core.observers import EngineObserver
+from validation_framework.core.parallel_executor import ParallelFileScheduler, resolve_file_workers
+from validation_framework.core.memory_bounded_tracker import MemoryBoundedTracker
+from validation_framework.core.optimized_engine import OptimizedValidationEngine
+
+
+def _config(csv_path, chunk_size=25, workers=1):
+    """Build a config with a mix of incremental and per-chunk validations."""
+    return ValidationConfig({
+        'validation_job': {
+            'name': 'Parallel Test',
+            'files': [{
+                'name': 'data',
+                'path': str(csv_path),
+                'format': 'csv',
+                'validations': [
+                    {'type': 'UniqueKeyCheck', 'severity': 'ERROR', 'params': {'fields': ['id']}},
+                    {'type': 'DuplicateRowCheck', 'severity': 'ERROR', 'params': {'key_fields': ['code']}},
+                    {'type': 'CompletenessCheck', 'severity': 'WARNING',
+                     'params': {'field': 'amount', 'min_completeness': 0.99}},
+                    {'type': 'StatisticalOutlierCheck', 'severity': 'WARNING',
+                     'params': {'field': 'amount', 'method': 'zscore', 'threshold': 2.5}},
+                    {'type': 'RangeCheck', 'severity': 'ERROR',
+                     'params': {'field': 'amount', 'min_value': 0, 'max_value': 150}},
+                    {'type': 'RowCountRangeCheck', 'severity': 'ERROR', 'params': {'min_rows': 1}},
+                ]
+            }]
+        },
+        'processing': {'chunk_size': chunk_size, 'workers': workers}
+    })
+
+
+@pytest.fixture
+def parallel_csv(tmp_path):
+    """CSV file with duplicates spread across chunk boundaries."""
+    rng = np.random.RandomState(42)
+    amounts = rng.normal(100, 15, 200).round(2)
+    amounts[[5, 77, 150]] = [400, -90, 350]
+    df = pd.DataFrame({
+        'id': list(range(190)) + [3, 30, 60, 90, 120, 150, 180, 10, 20, 40],
+        'code': [f"C{i % 120}" for i in range(200)],
+        'amount': amounts,
+    })
+    df.loc[[12, 99], 'amount'] = None
+    path = tmp_path / "parallel.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def _summaries(report):
+    return [
+        (r.rule_name, r.passed, r.failed_count, r.total_count, r.message,
+         [s.get('row') for s in r.sample_failures])
+        for r in report.file_reports[0].validation_results
+    ]
+
+
+@pytest.mark.unit
+class TestParallelChunkExecution:
+    """Test map-reduce chunk validation."""
+
+    def test_parallel_matches_serial(self, parallel_csv):
+        """Test results are identical for 1, 2 and 3 workers."""
+        serial = OptimizedValidationEngine(_config(parallel_csv)).run(verbose=False)
+        expected = _summaries(serial)
+
+        for workers in (2, 3):
+            engine = OptimizedValidationEngine(_config(parallel_csv), workers=workers)
+            assert engine.workers == workers
+            assert _summaries(engine.run(verbose=False)) == expected
+
+    def test_parallel_detects_cross_chunk_duplicates(self, parallel_csv):
+        """Test duplicates in different chunks are found by merged states."""
+        report = OptimizedValidationEngine(_config(parallel_csv, workers=2)).run(verbose=False)
+        results = {r.rule_name: r for r in report.file_reports[0].validation_results}
+
+        assert results['UniqueKeyCheck'].failed_count == 10
+        assert results['DuplicateRowCheck'].failed_count == 80
+        assert results['RowCountRangeCheck'].passed is True
+
+    @pytest.mark.parametrize("max_duplicates", [1, 4, 12])
+    def test_parallel_early_termination_matches_serial(self, parallel_csv, max_duplicates):
+        def run(workers):
+            config = _config(parallel_csv, chunk_size=25, workers=workers)
+            for validation in config.files[0]['validations'][:2]:
+                validation['params'].update(enable_early_termination=True, max_duplicates=max_duplicates)
+            return _summaries(OptimizedValidationEngine(config).run(verbose=False))[:2]
+
+        serial = run(1)
+
+        assert run(2) == serial
+        assert [summary[2] for summary in serial] == [min(10, max_duplicates), min(80, max_duplicates)]
+
+    def test_parallel_run_with_default_options_finishes(self, tmp_path):
+        """Test a multi-chunk run with workers after Polars/PyArrow started their threads."""
+        script = textwrap.dedent(f"""
+            import numpy as np, pandas as pd, polars as pl, pyarrow.csv
+            from validation_framework.core.config import ValidationConfig
+            from validation_framework.core.optimized_engine import OptimizedValidationEngine
+
+            rng = np.random.default_rng(1)
+            pd.DataFrame({{
+                'id': rng.integers(0, 40000, 50000), 'amount': rng.normal(size=50000),
+                'age': rng.integers(0, 90, 50000),
+            }}).to_csv({str(tmp_path / 'big.csv')!r}, index=False)
+            # Busy thread pools in the parent, as after a Polars pre-scan
+            pl.scan_csv({str(tmp_path / 'big.csv')!r}).select(pl.col('age').sum()).collect()
+            pyarrow.csv.read_csv({str(tmp_path / 'big.csv')!r})
+
+            def run(workers):
+                config = ValidationConfig({{
+                    'validation_job': {{'name': 'Big', 'files': [{{
+                        'name': 'big', 'path': {str(tmp_path / 'big.csv')!r}, 'format': 'csv',
+                        'validations': [
+                            {{'type': 'UniqueKeyCheck', 'severity': 'ERROR', 'params': {{'fields': ['id']}}}},
+                            {{'type': 'RangeCheck', 'severity': 'ERROR', 'params': {{'field': 'amount', 'min_value': 0}}}},
+                            {{'type': 'InlineBusinessRuleCheck', 'severity': 'ERROR', 'params': {{'rule': 'age >= 18'}}}},
+                        ]}}]}},
+                    'processing': {{'chunk_size': 7000}},
+                }})
+                report = OptimizedValidationEngine(config, workers=workers).run(verbose=False)
+                return [r.failed_count for r in report.file_reports[0].validation_results]
+
+            assert run(2) == run(1)
+        """)
+
+        # Run in a fresh interpreter so a hung pool fails the test instead of the session
+        subprocess.run([sys.executable, "-c", script], check=True, timeout=300,
+                       cwd=Path(__file__).resolve().parents[3])
+
+    def test_workers_default_from_config(self, parallel_csv):
+        """Test worker count is read from processing.workers."""
+        assert OptimizedValidationEngine(_config(parallel_csv, workers=4)).workers == 4
+        assert OptimizedValidationEngine(_config(parallel_csv)).workers == 1
+
+
+@pytest.mark.unit
+class TestTrackerPickling:
+    """Test trackers survive the trip back from worker processes."""
+
+    def test_pickle_in_memory_tracker(self):
+        tracker = MemoryBoundedTracker(max_memory_keys=100)
+        for key in range(10):
+            tracker.add(key)
+
+        restored = pickle.loads(pickle.dumps(tracker))
+
+        assert sorted(restored.iter_keys()) == list(range(10))
+        assert restored.has_seen(5)
+
+    def test_pickle_spilled_tracker(self):
+        tracker = MemoryBoundedTracker(max_memory_keys=5)
+        for key in range(20):
+            tracker.add(key)
+        assert tracker.is_spilled
+
+        restored = pickle.loads(pickle.dumps(tracker))
+        try:
+            assert restored.is_spilled
+            assert sorted(restored.iter_keys()) == list(range(20))
+        finally:
+            restored.close()
+            tracker.close()
+
+
+class _RecordingObserver(EngineObserver):
+    """Observer that records the order of engine events."""
+
+    def __init__(self):
+        self.events = []
+
+    def on_job_start(self, job_name, file_count):
+        self.events.append(("job_start", file_count))
+
+    def on_file_start(self, file_name, file_path, validation_count):
+        self.events.append(("file_start", file_name))
+
+    def on_validation_start(self, validation_type, file_name):
+        self.events.append(("validation_start", validation_type))
+
+    def on_validation_complete(self, validation_type, result):
+        self.events.append(("validation_complete", validation_type))
+
+    def on_file_complete(self, report):
+        self.events.append(("file_complete", report.file_name))
+
+    def on_job_complete(self, report):
+        self.events.append(("job_complete", len(report.file_reports)))
+
+    def on_error(self, error, context):
+        self.events.append(("error", str(error)))
+
+
+def _multi_file_config(tmp_path, parallel_files=False):
+    """Config with files of different sizes (listed smallest first)."""
+    files = []
+    for idx, rows in enumerate([10, 400, 60]):
+        df = pd.DataFrame({'id': [i % (rows - 3) for i in range(rows)], 'name': ['x'] * rows})
+        path = tmp_path / f"file_{idx}.csv"
+        df.to_csv(path, index=False)
+        files.append({
+            'name': f"file_{idx}",
+            'path': str(path),
+            'format': 'csv',
+            'validations': [
+                {'type': 'UniqueKeyCheck', 'severity': 'ERROR', 'params': {'fields': ['id']}},
+                {'type': 'MandatoryFieldCheck', 'severity': 'ERROR', 'params': {'fields': ['name']}},
+            ]
+        })
+    files.append({'name': 'missing', 'path': str(tmp_path / "missing.csv"), 'format': 'csv',
+                  'validations': [{'type': 'EmptyFileCheck', 'severity': 'ERROR'}]})
+    return ValidationConfig({
+        'validation_job': {'name': 'Multi File', 'files': files},
+        'processing': {'chunk_size': 50, 'parallel_files': parallel_files}
+    })
+
+
+def _report_summary(report):
+    return [
+        (f.file_name, f.status, [(r.rule_name, r.passed, r.failed_count, r.message) for r in f.validation_results])
+        for f in report.file_reports
+    ]
+
+
+@pytest.mark.unit
+class TestParallelFileExecution:
+    """Test file-level parallelism in both engines."""
+
+    def test_standard_engine_matches_serial(self, tmp_path):
+        """Test reports and observer events match a serial run."""
+        serial_observer = _RecordingObserver()
+        serial = ValidationEngine(_multi_file_config(tmp_path), observers=[serial_observer]).run(verbose=False)
+
+        parallel_observer = _RecordingObserver()
+        engine = ValidationEngine(_multi_file_config(tmp_path, parallel_files=3), observers=[parallel_observer])
+        assert engine.file_workers == 3
+        parallel = engine.run(verbose=False)
+
+        assert _report_summary(parallel) == _report_summary(serial)
+        assert parallel_observer.events == serial_observer.events
+        assert parallel.overall_status == serial.overall_status
+
+    def test_optimized_engine_matches_serial(self, tmp_path):
+        """Test the optimized engine gives the same report with file workers."""
+        serial = OptimizedValidationEngine(_multi_file_config(tmp_path)).run(verbose=False)
+        parallel = OptimizedValidationEngine(
+            _multi_file_config(tmp_path), file_workers=2
+        ).run(verbose=False)
+
+        assert _report_summary(parallel) == _report_summary(serial)
+
+    def test_tiny_memory_budget_runs_files_one_at_a_time(self, tmp_path):
+        """Test files still complete, in config order, when only one fits the budget."""
+        config = _multi_file_config(tmp_path)
+        factory = partial(ValidationEngine, config, observers=[], file_workers=1)
+        scheduler = ParallelFileScheduler(factory, config.files, workers=3,
+                                          chunk_size=config.chunk_size, memory_budget=1)
+
+        names = [file_report.file_name for _, file_report in scheduler.run()]
+
+        assert names == ['file_0', 'file_1', 'file_2', 'missing']
+
+    def test_resolve_file_workers(self):
+        """Test parallel_files setting is translated into a worker count."""
+        assert resolve_file_workers(False) == 1
+        assert resolve_file_workers(None) == 1
+        assert resolve_file_workers(4) == 4
+        assert resolve_file_workers(True) >= 1
@@ -0,0 +1,124 @@
+"""
+Tests for answering validations from Parquet footer statistics.
+
+Author: Daniel Edge
+"""
+
+from unittest.mock import patch
+
+import pytest
+import pandas as pd
+
+from validation_framework.core.config import ValidationConfig
+from validation_framework.core.engine import ValidationEngine
+from validation_framework.core.optimized_engine import OptimizedValidationEngine
+from validation_framework.core.parquet_statistics import ParquetStatistics, answer_statistics_validations
+from validation_framework.core.registry import get_registry
+
+pq = pytest.importorskip("pyarrow.parquet")
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def orders_parquet(tmp_path):
+    """Ten row groups of 10 rows; only row group 7 has a bad amount and a null note."""
+    path = tmp_path / "orders.parquet"
+    amounts = list(range(1, 101))
+    amounts[75] = -5
+    notes = [f"note {i}" for i in range(100)]
+    notes[78] = None
+    pq.write_table(pa.table({
+        "order_id": list(range(100)),
+        "amount": amounts,
+        "note": notes,
+        "ratio": [0.5] * 100,
+    }), path, row_group_size=10)
+    return path
+
+
+def _config(path, validations, parquet_statistics=True):
+    return ValidationConfig({
+        'validation_job': {
+            'name': 'Statistics',
+            'files': [{'name': 'orders', 'path': str(path), 'format': 'parquet', 'validations': validations}]
+        },
+        'processing': {'chunk_size': 7, 'polars_rules': False, 'parquet_statistics': parquet_statistics}
+    })
+
+
+def _summary(report):
+    return [
+        (r.rule_name, r.passed, r.failed_count, r.total_count,
+         [(s['row'], s.get('value')) for s in r.sample_failures])
+        for r in report.file_reports[0].validation_results
+    ]
+
+
+VALIDATIONS = [
+    {'type': 'RangeCheck', 'severity': 'ERROR', 'params': {'field': 'amount', 'min_value': 0}},
+    {'type': 'RangeCheck', 'severity': 'ERROR', 'params': {'field': 'order_id', 'min_value': 0, 'max_value': 99}},
+    {'type': 'MandatoryFieldCheck', 'severity': 'ERROR', 'params': {'fields': ['order_id', 'note']}},
+    {'type': 'CompletenessCheck', 'severity': 'WARNING', 'params': {'field': 'note', 'min_completeness': 1.0}},
+    {'type': 'RowCountRangeCheck', 'severity': 'ERROR', 'params': {'min_rows': 10, 'max_rows': 50}},
+    {'type': 'MandatoryFieldCheck', 'severity': 'ERROR', 'params': {'fields': ['ratio']}},
+]
+
+
+@pytest.mark.unit
+class TestParquetStatistics:
+    """Test footer statistics and row-group pruning."""
+
+    def test_column_statistics(self, orders_parquet):
+        statistics = ParquetStatistics(str(orders_parquet))
+
+        assert statistics.num_rows == 100
+        assert statistics.num_row_groups == 10
+        amount = statistics.column("amount")
+        assert (amount[7].min, amount[7].max) == (-5, 80)
+        assert [chunk.null_count for chunk in statistics.column("note")][7] == 1
+        assert statistics.column("missing") is None
+
+    def test_file_rows_maps_read_positions(self, orders_parquet):
+        statistics = ParquetStatistics(str(orders_parquet))
+
+        assert statistics.file_rows([2, 7], [0, 9, 10, 15]) == [20, 29, 70, 75]
+
+    def test_answers_and_prunes(self, orders_parquet):
+        config = _config(orders_parquet, VALIDATIONS)
+        results = answer_statistics_validations(config.files[0], get_registry(), 7, 100)
+
+        # Float columns are never answered: NaN is not in the null counts
+        assert sorted(results) == [0, 1, 2, 3, 4]
+        assert results[0].passed is False
+        assert results[0].sample_failures[0]['row'] == 75
+        assert results[0].total_count == 100
+        assert results[1].passed is True
+        assert results[2].sample_failures[0]['row'] == 78
+        assert results[2].total_count == 200
+        assert results[3].failed_count == 1
+        assert results[4].passed is False
+
+    def test_pruned_scan_reads_only_failing_row_groups(self, orders_parquet):
+        config = _config(orders_parquet, VALIDATIONS[:1])
+        with patch("validation_framework.loaders.parquet_loader.ParquetLoader.load", autospec=True,
+                   side_effect=lambda loader: iter([pd.read_parquet(orders_parquet).iloc[70:80].reset_index(drop=True)])) as load:
+            answer_statistics_validations(config.files[0], get_registry(), 7, 100)
+
+        assert load.call_args[0][0].kwargs["row_groups"] == [7]
+
+    @pytest.mark.parametrize("engine_class", [ValidationEngine, OptimizedValidationEngine])
+    def test_matches_full_scan(self, orders_parquet, engine_class):
+        with_statistics = engine_class(_config(orders_parquet, VALIDATIONS)).run(verbose=False)
+        full_scan = engine_class(_config(orders_parquet, VALIDATIONS, parquet_statistics=False)).run(verbose=False)
+
+        assert [r[:4] for r in _summary(with_statistics)] == [r[:4] for r in _summary(full_scan)]
+        assert [r[4][:1] for r in _summary(with_statistics)][:3] == [[(75, -5.0)], [], [(78, 'None')]]
+
+    def test_blank_strings_are_not_ruled_out(self, tmp_path):
+        path = tmp_path / "names.parquet"
+        pq.write_table(pa.table({"name": ["Ann", " ", "Bo"]}), path)
+        config = _config(path, [{'type': 'MandatoryFieldCheck', 'severity': 'ERROR', 'params': {'fields': ['name']}}])
+
+        report = ValidationEngine(config).run(verbose=False)
+
+        assert report.file_reports[0].validation_results[0].failed_count == 1
@@ -0,0 +1,103 @@
+"""
+Tests for the hash-partitioned on-disk key store.
+
+Author: Daniel Edge
+"""
+
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from validation_framework.core.partitioned_key_store import PartitionedKeyStore, hash_keys
+
+
+@pytest.mark.unit
+class TestPartitionedKeyStore:
+    """Test batch key tracking with spillover to partition runs."""
+
+    def test_add_many_matches_exact_duplicates_after_spill(self):
+        """Test new/duplicate flags stay exact once keys are on disk."""
+        keys = np.random.default_rng(7).integers(0, 5_000, 20_000)
+
+        with PartitionedKeyStore(max_memory_keys=1_000, partitions=8) as store:
+            is_new = np.concatenate([store.add_many(keys[i:i + 2_500]) for i in range(0, len(keys), 2_500)])
+            stats = store.get_statistics()
+
+            assert np.array_equal(is_new, ~pd.Series(keys).duplicated().to_numpy())
+            assert stats["is_spilled"] is True
+            assert stats["total_keys"] == len(np.unique(keys))
+            assert stats["total_lookups"] == len(keys)
+            assert store.contains_many(np.array([keys[0], -1])).tolist() == [True, False]
+
+    def test_frame_keys_hash_int_and_float_chunks_alike(self):
+        """Test a key column read as int or float hashes identically."""
+        ints = pd.DataFrame({"id": [1, 2], "code": ["a", "b"]})
+        floats = pd.DataFrame({"id": [1.0, 2.0], "code": ["a", "b"]})
+
+        assert np.array_equal(hash_keys(ints), hash_keys(floats))
+        assert not np.array_equal(hash_keys(ints, seed=0), hash_keys(ints, seed=1))
+
+        store = PartitionedKeyStore(partitions=4)
+        store.add_many(ints)
+        assert store.add_many(floats).tolist() == [False, False]
+        store.close()
+
+    def test_pickle_and_merge_fingerprints(self):
+        """Test pickled stores keep their keys and merge by fingerprint."""
+        first = PartitionedKeyStore(max_memory_keys=10, partitions=4)
+        first.add_many(list(range(50)))
+        restored = pickle.loads(pickle.dumps(first))
+        first.close()
+
+        later = PartitionedKeyStore(partitions=4)
+        later.add_many(list(range(40, 60)))
+        added = np.concatenate([
+            restored.add_fingerprints(np.full(len(fps), partition), fps)
+            for partition, fps in later.fingerprints()
+        ])
+
+        assert int((~added).sum()) == 10
+        assert restored.get_statistics()["total_keys"] == 60
+        assert restored.is_spilled is True
+        restored.close()
+        later.close()
+
+    def test_close_removes_partition_runs(self):
+        """Test the temporary run directory is deleted on close."""
+        store = PartitionedKeyStore(max_memory_keys=5, partitions=2)
+        store.add_many(list(range(20)))
+        directory = store.directory
+
+        store.close()
+
+        assert directory is not None
+        assert not os.path.exists(directory)
+
+    def test_large_int64_keys_stay_distinct(self):
+        """Test int64 keys above 2^53 hash from their exact value."""
+        ids = pd.Series([1500000000000000001, 1500000000000000002, 1500000000000000003])
+        nullable = pd.Series([1500000000000000001, None, 7], dtype="Int64")
+
+        assert len(set(hash_keys(ids).tolist())) == 3
+        assert hash_keys(nullable)[2] == hash_keys(pd.Series([7.0]))[0]
+        assert hash_keys(nullable)[1] == hash_keys(pd.Series([np.nan]))[0]
+        assert hash_keys(pd.Series([1.5]))[0] != hash_keys(pd.Series([np.float64(1.5).view(np.int64)]))[0]
+
+    def test_mixed_type_keys_hash_with_their_type(self):
+        """Test the int 1 and the string "1" of one object column stay distinct."""
+        mixed = pd.Series([1, "1", None, 2.0, (1, 2), 2 ** 70, 2 ** 70 + 1], dtype=object)
+
+        for seed in (0, 1):
+            hashes = hash_keys(mixed, seed).tolist()
+            assert len(set(hashes)) == 7
+            # Numbers and nulls hash as in numeric columns, strings as in string columns
+            assert hashes[0] == hash_keys(pd.Series([1]), seed)[0]
+            assert hashes[3] == hash_keys(pd.Series([2]), seed)[0]
+            assert hashes[2] == hash_keys(pd.Series([np.nan]), seed)[0] == hash_keys(pd.Series(["x", None]), seed)[1]
+            assert hashes[1] == hash_keys(pd.Series(["1", "2"]), seed)[0]
+
+        with PartitionedKeyStore(partitions=4) as store:
+            assert store.add_many(pd.DataFrame({"id": [1, "1", 1, "1"]})).tolist() == [True, True, False, False]
@@ -0,0 +1,108 @@
+"""
+Tests for column projection pushdown.
+
+Author: Daniel Edge
+"""
+
+import pytest
+import pandas as pd
+
+from validation_framework.core.config import ValidationConfig
+from validation_framework.core.optimized_engine import OptimizedValidationEngine
+from validation_framework.core.projection import resolve_required_columns
+from validation_framework.core.registry import get_registry
+from validation_framework.loaders.factory import LoaderFactory
+from validation_framework.validations.base import expression_columns
+
+
+def _validation(validation_type, params=None, condition=None):
+    config = {'type': validation_type, 'severity': 'ERROR', 'params': params or {}}
+    if condition:
+        config['condition'] = condition
+    return config
+
+
+@pytest.mark.unit
+class TestRequiredColumns:
+    """Test validations declare the columns they read."""
+
+    def test_union_of_params_and_conditions(self):
+        validations = [
+            _validation('MandatoryFieldCheck', {'fields': ['id', 'name']}),
+            _validation('RangeCheck', {'field': 'amount', 'min_value': 0}, condition="status == 'ACTIVE'"),
+            _validation('DuplicateRowCheck', {'key_fields': ['code']}),
+            _validation('InlineBusinessRuleCheck', {'rule': "age >= 18 AND country != 'US'"}),
+            _validation('RowCountRangeCheck', {'min_rows': 1}),
+        ]
+
+        columns = resolve_required_columns(validations, get_registry())
+
+        assert columns == ['age', 'amount', 'code', 'country', 'id', 'name', 'status']
+
+    def test_undeclared_validation_reads_all_columns(self):
+        validations = [
+            _validation('RangeCheck', {'field': 'amount'}),
+            _validation('BlankRecordCheck'),
+        ]
+
+        assert resolve_required_columns(validations, get_registry()) is None
+
+    def test_consider_all_fields_reads_all_columns(self):
+        validations = [_validation('DuplicateRowCheck', {'consider_all_fields': True})]
+
+        assert resolve_required_columns(validations, get_registry()) is None
+
+    def test_file_level_checks_only_reads_all_columns(self):
+        validations = [_validation('EmptyFileCheck'), _validation('RowCountRangeCheck', {'min_rows': 1})]
+
+        assert resolve_required_columns(validations, get_registry()) is None
+
+    def test_expression_columns(self):
+        assert expression_columns("(`first name` == 'x and y') OR NOT flag") == {'first name', 'flag'}
+        assert expression_columns("name.str.len() > 3 and code in ['A', 'B']") == {'name', 'code'}
+        assert expression_columns(None) == set()
+
+
+@pytest.mark.unit
+def test_engine_passes_projection_to_loader(tmp_path, monkeypatch):
+    """Test the engine reads only needed columns and results are unchanged."""
+    path = tmp_path / "wide.csv"
+    pd.DataFrame({
+        'id': [1, 2, 2, 4],
+        'amount': [10, -5, 20, 30],
+        'notes': ['a', 'b', 'c', 'd'],
+        'extra': [0, 0, 0, 0],
+    }).to_csv(path, index=False)
+
+    config = ValidationConfig({
+        'validation_job': {
+            'name': 'Projection',
+            'files': [{
+                'name': 'wide',
+                'path': str(path),
+                'format': 'csv',
+                'validations': [
+                    _validation('UniqueKeyCheck', {'fields': ['id']}),
+                    _validation('RangeCheck', {'field': 'amount', 'min_value': 0}),
+                    _validation('ColumnPresenceCheck', {'required_columns': ['notes', 'extra']}),
+                ]
+            }]
+        }
+    })
+
+    requested = []
+    original = LoaderFactory.create_loader.__func__
+
+    def spy(cls, *args, **kwargs):
+        requested.append(kwargs.get('columns'))
+        return original(cls, *args, **kwargs)
+
+    monkeypatch.setattr(LoaderFactory, 'create_loader', classmethod(spy))
+
+    report = OptimizedValidationEngine(config).run(verbose=False)
+    results = {r.rule_name: r for r in report.file_reports[0].validation_results}
+
+    assert requested == [['amount', 'id']]
+    assert results['UniqueKeyCheck'].failed_count == 1
+    assert results['RangeCheck'].failed_count == 1
+    assert results['ColumnPresenceCheck'].passed is True
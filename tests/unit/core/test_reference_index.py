@@ -0,0 +1,89 @@
+"""
+Tests for the shared, persistent reference-key index.
+
+Author: Daniel Edge
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from validation_framework.core import reference_index
+from validation_framework.core.exceptions import DataLoadError
+from validation_framework.core.reference_index import clear_reference_cache, get_reference_index
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start and end every test with an empty per-process cache."""
+    clear_reference_cache()
+    yield
+    clear_reference_cache()
+
+
+@pytest.mark.unit
+class TestReferenceIndex:
+    """Test building, sharing and persisting reference key indexes."""
+
+    def test_contains_matches_by_value_and_skips_null_keys(self, tmp_path):
+        """Test lookups for single and composite keys (nulls never match)."""
+        path = tmp_path / "ref.csv"
+        pd.DataFrame({"id": [1, 2, None], "code": ["a", "b", "c"]}).to_csv(path, index=False)
+
+        single = get_reference_index(str(path), ["id"])
+        composite = get_reference_index(str(path), ["id", "code"])
+
+        assert len(single) == 2
+        assert single.contains(pd.Series([1, 2.0, 3])).tolist() == [True, True, False]
+        assert composite.contains(pd.DataFrame({"k": [1, 2, None], "c": ["a", "a", "c"]})).tolist() == [
+            True, False, False
+        ]
+
+    def test_index_is_shared_in_process_and_rebuilt_when_file_changes(self, tmp_path):
+        """Test the cache returns the same index until mtime/size change."""
+        path = tmp_path / "ref.csv"
+        pd.DataFrame({"id": [1, 2]}).to_csv(path, index=False)
+
+        first = get_reference_index(str(path), "id")
+        assert get_reference_index(str(path), ["id"]) is first
+
+        pd.DataFrame({"id": [1, 2, 3]}).to_csv(path, index=False)
+        changed = get_reference_index(str(path), ["id"])
+
+        assert changed is not first
+        assert changed.contains(pd.Series([3])).tolist() == [True]
+
+    def test_persisted_index_is_reused_across_processes(self, tmp_path, monkeypatch):
+        """Test a later run memory-maps the index instead of re-reading the file."""
+        path = tmp_path / "ref.parquet"
+        cache_dir = tmp_path / "index"
+        pd.DataFrame({"id": np.arange(1000)}).to_parquet(path)
+
+        built = get_reference_index(str(path), ["id"], "parquet", cache_dir=str(cache_dir))
+        assert len(os.listdir(cache_dir)) == 1
+
+        clear_reference_cache()
+        monkeypatch.setattr(
+            reference_index, "_build_index",
+            lambda *args: pytest.fail("index should be loaded from disk")
+        )
+        loaded = get_reference_index(str(path), ["id"], "parquet", cache_dir=str(cache_dir))
+
+        assert isinstance(loaded.hashes, np.memmap)
+        assert np.array_equal(loaded.hashes, built.hashes)
+
+    def test_lookup_values_and_load_errors(self, tmp_path):
+        """Test original key values are fetched back and missing columns raise."""
+        path = tmp_path / "ref.csv"
+        pd.DataFrame({"id": [5, 6, 7, 5]}).to_csv(path, index=False)
+        index = get_reference_index(str(path), ["id"])
+
+        found, positions = index.positions(index.hashes)
+        assert found.all()
+        assert index.lookup_values(index.hashes) == [5, 6, 7]
+        assert index.lookup_values(index.hashes, limit=1) == [5]
+
+        with pytest.raises(DataLoadError):
+            get_reference_index(str(path), ["missing"])
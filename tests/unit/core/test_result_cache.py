@@ -0,0 +1,201 @@
+"""
+Tests for the persistent result cache.
+
+Author: Daniel Edge
+"""
+
+import json
+import os
+
+import pytest
+import pandas as pd
+
+from validation_framework.core.config import ValidationConfig
+from validation_framework.core.engine import ValidationEngine
+from validation_framework.core.optimized_engine import OptimizedValidationEngine
+from validation_framework.core.registry import get_registry
+from validation_framework.core.result_cache import ResultCache, file_fingerprint, is_cacheable
+from validation_framework.core.results import Severity, ValidationResult
+from validation_framework.loaders.factory import LoaderFactory
+
+
+@pytest.fixture
+def data_csv(tmp_path):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({'id': [1, 2, 2, 4], 'amount': [10, -5, 20, 30]}).to_csv(path, index=False)
+    return path
+
+
+def _config(csv_path, cache_path, min_value=0, hash_mode="sampled"):
+    return ValidationConfig({
+        'validation_job': {
+            'name': 'Cached',
+            'files': [{
+                'name': 'data',
+                'path': str(csv_path),
+                'format': 'csv',
+                'validations': [
+                    {'type': 'UniqueKeyCheck', 'severity': 'ERROR', 'params': {'fields': ['id']}},
+                    {'type': 'RangeCheck', 'severity': 'WARNING', 'params': {'field': 'amount', 'min_value': min_value}},
+                    {'type': 'RowCountRangeCheck', 'severity': 'ERROR', 'params': {'min_rows': 1}, 'enabled': False},
+                ]
+            }]
+        },
+        'processing': {'result_cache': {'path': str(cache_path), 'hash_mode': hash_mode}},
+    })
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Record the validations each loader is created for."""
+    created = []
+    original = LoaderFactory.create_loader.__func__
+
+    def spy(cls, *args, **kwargs):
+        created.append(kwargs.get('file_path'))
+        return original(cls, *args, **kwargs)
+
+    monkeypatch.setattr(LoaderFactory, 'create_loader', classmethod(spy))
+    return created
+
+
+def _summary(report):
+    return [
+        (r.rule_name, r.passed, r.failed_count, r.total_count, r.message)
+        for r in report.file_reports[0].validation_results
+    ]
+
+
+@pytest.mark.unit
+class TestResultCacheEngines:
+    """Test the engines reuse results of unchanged files and rules."""
+
+    @pytest.mark.parametrize("engine_class", [ValidationEngine, OptimizedValidationEngine])
+    def test_second_run_is_answered_from_cache(self, data_csv, tmp_path, loads, engine_class):
+        cache_path = tmp_path / "cache.db"
+
+        first = engine_class(_config(data_csv, cache_path)).run(verbose=False)
+        loads.clear()
+        second = engine_class(_config(data_csv, cache_path)).run(verbose=False)
+
+        assert _summary(second) == _summary(first)
+        assert loads == []
+        assert all(r.cached for r in second.file_reports[0].validation_results)
+        assert not any(r.cached for r in first.file_reports[0].validation_results)
+        assert second.file_reports[0].metadata['result_cache'] == {'hits': 2, 'misses': 0}
+        assert second.file_reports[0].metadata['column_count'] == 2
+
+    def test_changed_rule_is_rerun(self, data_csv, tmp_path):
+        cache_path = tmp_path / "cache.db"
+        OptimizedValidationEngine(_config(data_csv, cache_path)).run(verbose=False)
+
+        report = OptimizedValidationEngine(_config(data_csv, cache_path, min_value=15)).run(verbose=False)
+        results = report.file_reports[0].validation_results
+
+        assert [r.cached for r in results] == [True, False]
+        assert results[1].failed_count == 2
+        assert [r.rule_name for r in results] == ['UniqueKeyCheck', 'RangeCheck']
+
+    def test_changed_file_is_rerun(self, data_csv, tmp_path):
+        cache_path = tmp_path / "cache.db"
+        OptimizedValidationEngine(_config(data_csv, cache_path)).run(verbose=False)
+
+        pd.DataFrame({'id': [1, 2, 3], 'amount': [1, 2, 3]}).to_csv(data_csv, index=False)
+        report = OptimizedValidationEngine(_config(data_csv, cache_path)).run(verbose=False)
+
+        assert not any(r.cached for r in report.file_reports[0].validation_results)
+        assert report.file_reports[0].error_count == 0
+
+    @pytest.mark.parametrize("engine_class", [ValidationEngine, OptimizedValidationEngine])
+    def test_error_results_keep_their_place_and_are_not_cached(self, data_csv, tmp_path, engine_class):
+        cache_path = tmp_path / "cache.db"
+        config = _config(data_csv, cache_path)
+        config.files[0]['validations'][1:] = [
+            {'type': 'NoSuchCheck', 'severity': 'ERROR', 'params': {}},
+            {'type': 'RegexCheck', 'severity': 'WARNING', 'params': {'field': 'id', 'pattern': '[0-9'}},
+            {'type': 'RangeCheck', 'severity': 'WARNING', 'params': {'field': 'amount', 'min_value': 0}},
+        ]
+
+        first = engine_class(config).run(verbose=False)
+        second = engine_class(config).run(verbose=False)
+        results = second.file_reports[0].validation_results
+
+        assert _summary(second) == _summary(first)
+        assert [r.rule_name for r in results] == ['UniqueKeyCheck', 'NoSuchCheck', 'RegexCheck', 'RangeCheck']
+        assert [r.cached for r in results] == [True, False, False, True]
+        assert results[2].message.startswith('Invalid regex pattern')
+
+    def test_changed_record_path_is_rerun(self, tmp_path):
+        data_json = tmp_path / "data.json"
+        data_json.write_text(json.dumps({
+            'customers': [{'id': 1, 'amount': 5}, {'id': 2, 'amount': 7}],
+            'refunds': [{'id': 3, 'amount': -5}, {'id': 3, 'amount': -9}, {'id': 4, 'amount': 1}],
+        }))
+
+        def run(record_path):
+            config = _config(data_json, tmp_path / "cache.db")
+            config.files[0].update(format='json', record_path=record_path)
+            return OptimizedValidationEngine(config).run(verbose=False).file_reports[0].validation_results
+
+        run('customers')
+        results = run('refunds')
+
+        assert not any(r.cached for r in results)
+        assert [(r.failed_count, r.total_count) for r in results] == [(1, 3), (2, 3)]
+        assert all(r.cached for r in run('refunds'))
+
+    def test_full_hash_ignores_modification_time(self, data_csv, tmp_path):
+        stat = os.stat(data_csv)
+        sampled = file_fingerprint(str(data_csv))
+        full = file_fingerprint(str(data_csv), "full")
+
+        os.utime(data_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert file_fingerprint(str(data_csv)) != sampled
+        assert file_fingerprint(str(data_csv), "full") == full
+
+
+@pytest.mark.unit
+class TestResultCacheStorage:
+    """Test cache storage, cacheability and eviction."""
+
+    def _result(self, name):
+        return ValidationResult(rule_name=name, severity=Severity.ERROR, passed=False, message="x",
+                                failed_count=1, total_count=3, sample_failures=[{"row": 1, "value": 2}])
+
+    def test_round_trip(self, tmp_path):
+        cache = ResultCache(str(tmp_path / "c.db"))
+        cache.put_many("fp", [("k", self._result("A"))])
+
+        restored = cache.get_many(["k", "missing"])
+
+        assert list(restored) == ["k"]
+        assert restored["k"].cached is True
+        assert restored["k"].severity == Severity.ERROR
+        assert restored["k"].sample_failures == [{"row": 1, "value": 2}]
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = ResultCache(str(tmp_path / "c.db"), max_entries=2)
+        cache.put_many("fp", [("a", self._result("A"))])
+        cache.put_many("fp", [("b", self._result("B"))])
+        cache.get_many(["a"])  # a is now more recent than b
+        cache.put_many("fp", [("c", self._result("C"))])
+
+        assert len(cache) == 2
+        assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+
+    def test_size_limit(self, tmp_path):
+        cache = ResultCache(str(tmp_path / "c.db"), max_size_mb=0.0005)  # ~500 bytes
+        cache.put_many("fp", [(str(i), self._result("A" * 100)) for i in range(10)])
+
+        assert 0 < len(cache) < 10
+
+    def test_cacheability(self):
+        registry = get_registry()
+
+        assert is_cacheable({'type': 'RangeCheck', 'params': {'field': 'a'}}, registry)
+        assert not is_cacheable({'type': 'RangeCheck', 'params': {'field': 'a'}, 'condition': 'created <= today'}, registry)
+        assert not is_cacheable({'type': 'InlineBusinessRuleCheck', 'params': {'rule': 'end_date < NOW'}}, registry)
+        assert not is_cacheable({'type': 'FreshnessCheck', 'params': {}}, registry)
+        assert not is_cacheable({'type': 'ReferentialIntegrityCheck', 'params': {}}, registry)
+        assert not is_cacheable({'type': 'NoSuchCheck'}, registry)
@@ -0,0 +1,218 @@
+"""
+Tests for crash-safe checkpoints and resumed runs.
+
+Author: Daniel Edge
+"""
+
+import pickle
+
+import pytest
+import pandas as pd
+
+from validation_framework.core.config import ValidationConfig
+from validation_framework.core.memory_bounded_tracker import MemoryBoundedTracker
+from validation_framework.core.optimized_engine import OptimizedValidationEngine, SinglePassValidationState
+from validation_framework.core.partitioned_key_store import PartitionedKeyStore
+from validation_framework.core.run_checkpoint import SpillFiles
+from validation_framework.loaders.factory import LoaderFactory
+
+VALIDATIONS = [
+    {'type': 'UniqueKeyCheck', 'severity': 'ERROR', 'params': {'fields': ['id']}},
+    {'type': 'RangeCheck', 'severity': 'ERROR', 'params': {'field': 'amount', 'min_value': 0}},
+    {'type': 'MandatoryFieldCheck', 'severity': 'ERROR', 'params': {'fields': ['amount']}},
+]
+
+
+@pytest.fixture
+def job(tmp_path):
+    files = []
+    for name in ('first', 'second'):
+        path = tmp_path / f"{name}.csv"
+        pd.DataFrame({
+            'id': [1, 2, 3, 4, 5, 6, 7, 8, 9, 1, 11, 12, 13, 14, 5, 16],
+            'amount': [1, -1, 2, None, 3, 4, 5, -6, 7, 8, 9, 10, -11, 12, 13, 14],
+        }).to_csv(path, index=False)
+        files.append({'name': name, 'path': str(path), 'format': 'csv', 'validations': VALIDATIONS})
+
+    def make_config(interval=None, file_format='csv'):
+        if file_format == 'parquet':
+            for file_config in [f for f in files if f['format'] == 'csv']:
+                path = file_config['path'].replace('.csv', '.parquet')
+                pd.read_csv(file_config['path']).to_parquet(path, row_group_size=3)
+                file_config.update(path=path, format='parquet')
+        processing = {'chunk_size': 4, 'checkpoint_dir': str(tmp_path / "ckpt"), 'polars_rules': False}
+        if interval is not None:
+            processing['checkpoint_interval'] = interval
+        return ValidationConfig({'validation_job': {'name': 'Resume', 'files': files}, 'processing': processing})
+
+    return make_config
+
+
+@pytest.fixture
+def loader_options(monkeypatch):
+    """Record the options of every loader created."""
+    options = []
+    original = LoaderFactory.create_loader
+
+    def create_loader(*args, **kwargs):
+        options.append(kwargs)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(LoaderFactory, 'create_loader', create_loader)
+    return options
+
+
+@pytest.fixture
+def chunk_log(monkeypatch):
+    """Record (file, first row) of every chunk validated; optionally crash."""
+    log = []
+    crash_at = {}
+    original = SinglePassValidationState.process_chunk
+
+    def process_chunk(self, chunk, chunk_idx):
+        key = (self.context['file_name'], self.total_rows)
+        if key == crash_at.get('key'):
+            raise KeyboardInterrupt
+        if self.validation.name == 'UniqueKeyCheck':
+            log.append(key)
+        original(self, chunk, chunk_idx)
+
+    monkeypatch.setattr(SinglePassValidationState, 'process_chunk', process_chunk)
+    return log, crash_at
+
+
+def _summary(report):
+    return [
+        [(r.rule_name, r.passed, r.failed_count, r.total_count) for r in file_report.validation_results]
+        for file_report in report.file_reports
+    ]
+
+
+@pytest.mark.unit
+class TestRunCheckpoint:
+    """Test interrupted runs resume with the same results."""
+
+    def test_resume_skips_validated_files_and_chunks(self, job, chunk_log):
+        log, crash_at = chunk_log
+        expected = _summary(OptimizedValidationEngine(job()).run(verbose=False))
+
+        crash_at['key'] = ('second', 12)
+        with pytest.raises(KeyboardInterrupt):
+            OptimizedValidationEngine(job(interval=1e-9)).run(verbose=False)
+
+        log.clear()
+        crash_at.clear()
+        report = OptimizedValidationEngine(job()).run(verbose=False, resume=True)
+
+        assert _summary(report) == expected
+        assert log == [('second', 12)]  # only the chunk after the checkpoint is validated again
+        assert expected[0][0][2] > 0 and expected[0][1][2] == 3
+
+    @pytest.mark.parametrize("file_format, option", [("csv", "byte_range"), ("parquet", "row_groups")])
+    def test_resume_seeks_past_validated_rows(self, job, chunk_log, loader_options, file_format, option):
+        log, crash_at = chunk_log
+        expected = _summary(OptimizedValidationEngine(job(file_format=file_format)).run(verbose=False))
+
+        crash_at['key'] = ('second', 8)
+        with pytest.raises(KeyboardInterrupt):
+            OptimizedValidationEngine(job(interval=1e-9, file_format=file_format)).run(verbose=False)
+
+        log.clear()
+        crash_at.clear()
+        loader_options.clear()
+        report = OptimizedValidationEngine(job(file_format=file_format)).run(verbose=False, resume=True)
+
+        assert _summary(report) == expected
+        # Validation continues at row 8
+        assert log[0] == ('second', 8) and all(name == 'second' and row > 8 for name, row in log[1:])
+        # The read starts at row 8 (CSV) or at row group 2, rows 6-8 (Parquet)
+        resumed = [options[option] for options in loader_options if option in options]
+        if file_format == 'csv':
+            content = open(job().files[1]['path'], 'rb').read()
+            assert resumed == [(len(b''.join(content.splitlines(keepends=True)[:9])), len(content))]
+        else:
+            assert resumed == [[2, 3, 4, 5]]
+
+    def test_resume_reads_unindexable_file_from_start(self, job, chunk_log, loader_options):
+        log, crash_at = chunk_log
+        second = job().files[1]['path']
+        with open(second, 'a') as f:
+            f.write('17,6" pipe\n')
+
+        crash_at['key'] = ('second', 8)
+        with pytest.raises(KeyboardInterrupt):
+            OptimizedValidationEngine(job(interval=1e-9)).run(verbose=False)
+
+        log.clear()
+        crash_at.clear()
+        OptimizedValidationEngine(job()).run(verbose=False, resume=True)
+
+        assert log == [('second', 8), ('second', 12), ('second', 16)]
+        assert not any('byte_range' in options for options in loader_options)
+
+    def test_checkpoint_removed_after_completed_run(self, job, tmp_path):
+        OptimizedValidationEngine(job(interval=1e-9)).run(verbose=False)
+
+        assert list((tmp_path / "ckpt").glob("run-*.ckpt")) == []
+
+    def test_changed_file_is_validated_again(self, job, chunk_log):
+        log, crash_at = chunk_log
+        crash_at['key'] = ('second', 8)
+        with pytest.raises(KeyboardInterrupt):
+            OptimizedValidationEngine(job(interval=1e-9)).run(verbose=False)
+
+        first = job().files[0]['path']
+        with open(first, 'a') as f:
+            f.write("17,-1\n")
+
+        log.clear()
+        crash_at.clear()
+        report = OptimizedValidationEngine(job()).run(verbose=False, resume=True)
+
+        assert log == [('first', 0), ('first', 4), ('first', 8), ('first', 12), ('first', 16), ('second', 8), ('second', 12)]
+        assert report.file_reports[0].validation_results[1].failed_count == 4
+
+    def test_resume_without_checkpoint_runs_from_start(self, job, chunk_log):
+        log, _ = chunk_log
+        OptimizedValidationEngine(job()).run(verbose=False, resume=True)
+
+        assert len(log) == 8
+
+
+@pytest.mark.unit
+class TestSpilledTrackerCheckpoints:
+    """Test spilled key trackers are checkpointed by reference to their spill files."""
+
+    def test_checkpoints_reference_spill_files(self, tmp_path):
+        tracker = MemoryBoundedTracker(max_memory_keys=10)
+        store = PartitionedKeyStore(max_memory_keys=10, partitions=4)
+        tracker.add_many(list(range(10_000)))
+        store.add_many(list(range(10_000)))
+        files = SpillFiles(tmp_path / "spill")
+
+        with files.exporting():
+            pickle.dumps((tracker, store))
+        tracker.add_many(list(range(10_000, 15_000)))
+        store.add_many(list(range(10_000, 15_000)))
+        with files.exporting():
+            checkpoint = pickle.dumps((tracker, store))
+        files.remove_unreferenced()
+
+        # Crash after the next checkpoint's files were written but before its pickle
+        tracker.add_many(list(range(15_000, 16_000)))
+        store.add_many(list(range(15_000, 16_000)))
+        with files.exporting():
+            pickle.dumps((tracker, store))
+
+        # The pickle holds paths, not the keys (8+ bytes each when read back)
+        assert len(checkpoint) < 10_000 < len(pickle.dumps((tracker, store)))
+        restored_tracker, restored_store = pickle.loads(checkpoint)
+        for restored in (restored_tracker, restored_store):
+            assert restored.contains_many(list(range(15_000))).all()
+            assert restored.contains_many([15_000, 15_999]).tolist() == [False, False]
+        assert restored_store.get_statistics()["total_keys"] == 15_000
+
+        for restored in (restored_tracker, restored_store, tracker, store):
+            restored.close()
+        # Closing the trackers leaves the checkpoint's files alone
+        assert {path.suffix for path in (tmp_path / "spill").iterdir()} == {".u64", ".db"}
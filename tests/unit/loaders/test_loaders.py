@@ -4,6 +4,7 @@ Unit tests for data loaders and loader factory.
 Tests the factory pattern and individual loader implementations.
 """
 
+import json
 import pytest
 import tempfile
 import pandas as pd
@@ -231,6 +232,129 @@ class TestCSVLoader:
 
 
 @pytest.mark.unit
+class TestColumnProjection:
+    """Test loaders only parse the requested columns."""
+
+    def test_csv_loader_reads_requested_columns(self, temp_csv_file):
+        loader = CSVLoader(temp_csv_file, columns=["age", "id", "not_in_file"])
+
+        df = next(loader.load())
+
+        assert list(df.columns) == ["id", "age"]
+        assert len(df) == 5
+        # Metadata still describes the whole file
+        assert loader.get_metadata()["column_count"] == 4
+
+    def test_csv_loader_without_matching_columns_reads_all(self, temp_csv_file):
+        df = next(CSVLoader(temp_csv_file, columns=["missing"]).load())
+
+        assert list(df.columns) == ["id", "name", "age", "balance"]
+
+    def test_parquet_loader_reads_requested_columns(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        from validation_framework.loaders.parquet_loader import ParquetLoader
+
+        path = tmp_path / "data.parquet"
+        pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"], "age": [1, 2, 3]}).to_parquet(path)
+
+        chunks = list(ParquetLoader(str(path), chunk_size=2, columns=["name"]).load())
+
+        assert [list(chunk.columns) for chunk in chunks] == [["name"], ["name"]]
+        assert sum(len(chunk) for chunk in chunks) == 3
+
+
+@pytest.mark.unit
+class TestCSVLoaderPyArrowEngine:
+    """Test the PyArrow streaming engine of the CSV loader."""
+
+    def test_matches_pandas_engine(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "mixed.csv"
+        pd.DataFrame({
+            "id": range(2500),
+            "note": [None if i % 5 == 0 else f'line "{i}"\nnext' for i in range(2500)],
+            "amount": [None if i % 3 == 0 else i * 1.5 for i in range(2500)],
+            "created": ["2024-01-01 10:00:00"] * 2500,
+        }).to_csv(path, index=False)
+
+        pandas_chunks = list(CSVLoader(str(path), chunk_size=1000).load())
+        arrow_chunks = list(CSVLoader(str(path), chunk_size=1000, engine="pyarrow", block_size=20000).load())
+
+        assert [len(chunk) for chunk in arrow_chunks] == [1000, 1000, 500]
+        assert list(arrow_chunks[0].dtypes) == list(pandas_chunks[0].dtypes)
+        pd.testing.assert_frame_equal(pd.concat(arrow_chunks), pd.concat(pandas_chunks), check_dtype=False)
+
+    def test_skips_rows_with_too_many_fields(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "bad.csv"
+        path.write_text("id,name\n1,a\n2,b,extra\n3,c\n")
+        loader = CSVLoader(str(path), engine="pyarrow")
+
+        df = pd.concat(list(loader.load()))
+
+        assert df["id"].tolist() == [1, 3]
+        assert loader.skipped_rows == 1
+
+    def test_skipped_rows_counted_once_with_date_column(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "bad_dates.csv"
+        path.write_text("id,created\n1,2024-01-01\n2,2024-01-02,extra\n3,2024-01-03\n")
+        loader = CSVLoader(str(path), engine="pyarrow")
+
+        df = pd.concat(list(loader.load()))
+
+        assert df["created"].tolist() == ["2024-01-01", "2024-01-03"]
+        assert loader.skipped_rows == 1
+
+    def test_falls_back_to_pandas_after_yielded_chunks(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "late_text.csv"
+        path.write_text("id\n" + "".join(f"{i}\n" for i in range(3000)) + "abc\n")
+
+        chunks = list(CSVLoader(str(path), chunk_size=500, engine="pyarrow", block_size=1000).load())
+
+        assert sum(len(chunk) for chunk in chunks) == 3001
+        assert pd.concat(chunks)["id"].astype(str).tolist()[-2:] == ["2999", "abc"]
+
+    def test_unknown_engine_is_rejected(self, temp_csv_file):
+        with pytest.raises(RuntimeError, match="Unknown CSV engine"):
+            list(CSVLoader(temp_csv_file, engine="duckdb").load())
+
+
+@pytest.mark.unit
+class TestPolarsCSVLoader:
+    """Test the Polars CSV loader streams bounded chunks."""
+
+    def test_streams_chunks_of_requested_size(self, large_csv_file):
+        pl = pytest.importorskip("polars")
+        from validation_framework.loaders.polars_csv_loader import PolarsCSVLoader
+
+        chunks = list(PolarsCSVLoader(large_csv_file, chunk_size=300).load())
+
+        assert [chunk.height for chunk in chunks] == [300, 300, 300, 100]
+        assert pl.concat(chunks)["value"].to_list() == list(range(1000, 2000))
+
+    def test_stops_when_consumer_stops(self, large_csv_file):
+        pytest.importorskip("polars")
+        from validation_framework.loaders.polars_csv_loader import PolarsCSVLoader
+
+        chunks = PolarsCSVLoader(large_csv_file, chunk_size=100).load()
+        first = next(chunks)
+        chunks.close()
+
+        assert first["id"].to_list() == list(range(100))
+
+    def test_rechunk_regroups_uneven_batches(self):
+        pl = pytest.importorskip("polars")
+        from validation_framework.loaders.polars_csv_loader import _rechunk
+
+        batches = [pl.DataFrame({"x": list(range(start, end))}) for start, end in [(0, 3), (3, 3), (3, 11), (11, 12)]]
+
+        chunks = list(_rechunk(iter(batches), 4))
+
+        assert [chunk["x"].to_list() for chunk in chunks] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9, 10, 11]]
+
+
 class TestCustomLoaderRegistration:
     """Tests for registering custom loaders."""
 
@@ -463,3 +587,77 @@ class TestJSONLoader:
         formats = LoaderFactory.list_supported_formats()
 
         assert "json" in formats
+
+    def test_json_array_is_parsed_in_chunks(self, tmp_path):
+        """Test arrays are decoded incrementally into chunk_size chunks."""
+        path = tmp_path / "orders.json"
+        path.write_text(json.dumps([{"id": i, "customer": {"name": f"c{i}"}} for i in range(25)], indent=2))
+
+        chunks = list(JSONLoader(file_path=str(path), chunk_size=10).load())
+
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        assert list(chunks[0].columns) == ["id", "customer_name"]
+        assert chunks[2].index.tolist() == list(range(20, 25))
+
+    def test_json_loader_record_path_envelope(self, tmp_path):
+        """Test loading the record array of an object envelope."""
+        path = tmp_path / "response.json"
+        path.write_text(json.dumps({
+            "meta": {"page": 1, "tags": ["a", "b"]},
+            "response": {"count": 3, "items": [{"id": 1}, {"id": 2}, {"id": 3}]},
+        }))
+
+        df = pd.concat(JSONLoader(file_path=str(path), record_path="response.items").load())
+
+        assert df["id"].tolist() == [1, 2, 3]
+        with pytest.raises(RuntimeError, match="record_path"):
+            list(JSONLoader(file_path=str(path), record_path="data").load())
+
+    def test_json_stream_handles_values_split_across_reads(self):
+        """Test elements, strings and numbers spanning buffer refills."""
+        import io
+        from validation_framework.loaders.json_stream import iter_json_array
+
+        records = [{"id": 12345678901234567890, "text": 'quote " and ] bracket', "nested": [1, {"x": None}]}] * 5
+
+        for read_size in (1, 3, 17):
+            assert list(iter_json_array(io.StringIO(json.dumps(records)), read_size=read_size)) == records
+
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_array(io.StringIO('[{"id": 1}, {"id": 2}'), read_size=4))
+
+    def test_jsonl_malformed_lines_are_counted(self, tmp_path, caplog, capsys):
+        """Test malformed JSON Lines are skipped, counted and logged."""
+        path = tmp_path / "events.jsonl"
+        path.write_text('{"id": 1}\n{"id": 2,\n\n{"id": 3}\n')
+        loader = JSONLoader(file_path=str(path))
+
+        with caplog.at_level("WARNING"):
+            df = pd.concat(loader.load())
+
+        assert df["id"].tolist() == [1, 3]
+        assert loader.malformed_lines == 1
+        assert "first at line 2" in caplog.text
+        assert capsys.readouterr().out == ""
+
+    def test_jsonl_arrow_matches_json_loads(self, tmp_path, monkeypatch):
+        """Test the pyarrow.json path decodes like the json.loads path."""
+        pytest.importorskip("pyarrow")
+        from validation_framework.loaders import json_loader
+
+        path = tmp_path / "orders.jsonl"
+        path.write_text("".join(
+            json.dumps({"id": i, "at": "2024-01-01T10:00:00", "customer": {"name": f"c{i}", "geo": {"lat": 1.5}},
+                        "amount": None if i % 4 == 0 else i * 2.5}) + "\n"
+            for i in range(500)
+        ))
+
+        arrow_chunks = list(JSONLoader(file_path=str(path), chunk_size=200, block_size=4096).load())
+        monkeypatch.setattr(json_loader, "HAS_PYARROW", False)
+        python_chunks = list(JSONLoader(file_path=str(path), chunk_size=200, block_size=4096).load())
+
+        assert [len(chunk) for chunk in arrow_chunks] == [200, 200, 100]
+        assert list(arrow_chunks[0].columns) == ["id", "at", "customer_name", "customer_geo_lat", "amount"]
+        pd.testing.assert_frame_equal(
+            pd.concat(arrow_chunks), pd.concat(python_chunks)[list(arrow_chunks[0].columns)], check_dtype=False
+        )
@@ -0,0 +1,160 @@
+"""
+Unit tests for parallel byte-range CSV parsing.
+
+Author: Daniel Edge
+"""
+
+import pytest
+import pandas as pd
+
+from validation_framework.loaders.csv_loader import CSVLoader
+from validation_framework.loaders.parallel_csv import CSVRowIndex, ParallelCSVReader, find_split_points, index_rows
+
+
+@pytest.fixture
+def quoted_csv_file(tmp_path):
+    """CSV file of 20,000 rows whose quoted notes contain newlines, delimiters and quotes."""
+    path = tmp_path / "quoted.csv"
+    pd.DataFrame({
+        "id": range(20000),
+        "note": [f'line {i}\nsecond, "part"' if i % 7 == 0 else f"note {i}" for i in range(20000)],
+        "amount": [i * 0.5 for i in range(20000)],
+    }).to_csv(path, index=False)
+    return path
+
+
+def _rows_at(path, points):
+    """Parse every range on its own."""
+    return [
+        pd.concat(list(CSVLoader(str(path), byte_range=(start, end)).load()), ignore_index=True)
+        for start, end in zip(points, points[1:])
+    ]
+
+
+@pytest.mark.unit
+class TestFindSplitPoints:
+    """Test quote-aware split points."""
+
+    def test_splits_only_at_row_boundaries(self, quoted_csv_file):
+        points = find_split_points(str(quoted_csv_file), 10000)
+
+        assert points[0] == 0 and points[-1] == quoted_csv_file.stat().st_size
+        assert len(points) > 10
+        ranges = _rows_at(quoted_csv_file, points)
+        assert sum(len(frame) for frame in ranges) == 20000
+        assert pd.concat(ranges, ignore_index=True)["id"].tolist() == list(range(20000))
+
+    def test_unbalanced_quotes_cannot_be_split(self, tmp_path):
+        path = tmp_path / "stray.csv"
+        path.write_text('id,name\n' + '1,6" pipe\n2,bolt\n' * 101)
+
+        assert find_split_points(str(path), 100) is None
+
+
+@pytest.mark.unit
+class TestParallelCSVReader:
+    """Test parallel parsing and the row-offset index."""
+
+    def test_matches_serial_loader(self, quoted_csv_file):
+        serial = list(CSVLoader(str(quoted_csv_file), chunk_size=1000).load())
+        loader = CSVLoader(str(quoted_csv_file), chunk_size=1000, parse_workers=2)
+
+        parallel = list(loader.load())
+
+        assert len(parallel) == len(serial)
+        for parallel_chunk, serial_chunk in zip(parallel, serial):
+            pd.testing.assert_frame_equal(parallel_chunk, serial_chunk)
+        assert loader.row_index.total_rows == 20000
+        assert loader.get_metadata()["total_rows"] == 20000
+
+    def test_unordered_chunks_hold_every_row(self, quoted_csv_file):
+        options = {"delimiter": ",", "encoding": "utf-8", "header": 0, "columns": ["id"]}
+        points = find_split_points(str(quoted_csv_file), 20000)
+        reader = ParallelCSVReader(str(quoted_csv_file), 1000, 2, options, split_points=points)
+
+        frames = list(reader.chunks(ordered=False))
+
+        assert list(frames[0].columns) == ["id"]
+        assert sorted(pd.concat(frames)["id"]) == list(range(20000))
+        assert reader.row_index.total_rows == 20000
+
+    def test_row_index_locates_rows(self, quoted_csv_file):
+        points = find_split_points(str(quoted_csv_file), 20000)
+        reader = ParallelCSVReader(str(quoted_csv_file), 1000, 2,
+                                   {"delimiter": ",", "encoding": "utf-8", "header": 0},
+                                   split_points=points)
+        list(reader.chunks())
+        index = CSVRowIndex.from_dict(reader.row_index.to_dict())
+
+        offset, skip = index.locate(12345)
+        rows = pd.concat(list(CSVLoader(str(quoted_csv_file), byte_range=(offset, index.file_size)).load()))
+
+        assert rows["id"].iloc[skip] == 12345
+
+    def test_stray_quotes_fall_back_to_serial(self, tmp_path):
+        path = tmp_path / "stray.csv"
+        path.write_text("id,name\n" + '1,6" pipe\n' * 50001)
+
+        chunks = list(CSVLoader(str(path), chunk_size=10000, parse_workers=2).load())
+
+        assert sum(len(chunk) for chunk in chunks) == 50001
+
+    def test_byte_range_parsed_in_parallel(self, quoted_csv_file):
+        index = index_rows(str(quoted_csv_file), stop_row=12345)
+        offset, skip = index.locate(12345)
+
+        loader = CSVLoader(str(quoted_csv_file), chunk_size=1000, parse_workers=2,
+                           byte_range=(offset, index.file_size))
+        rows = pd.concat(list(loader.load()))
+
+        assert rows["id"].tolist() == list(range(12345, 20000))
+        assert loader.row_index is None
+
+
+@pytest.mark.unit
+class TestIndexRows:
+    """Test row offsets found by scanning the bytes."""
+
+    @pytest.mark.parametrize("block_size", [7, 4096, 4 * 1024 * 1024])
+    def test_offsets_match_parsed_rows(self, quoted_csv_file, block_size):
+        index = index_rows(str(quoted_csv_file), block_size=block_size)
+
+        assert index.total_rows == 20000
+        for row in (0, 1, 7, 12345, 19999):
+            offset, skip = index.locate(row)
+            rows = pd.concat(list(CSVLoader(str(quoted_csv_file), byte_range=(offset, index.file_size)).load()))
+            assert rows["id"].iloc[skip] == row
+
+    def test_stop_row_is_indexed_exactly(self, quoted_csv_file):
+        index = index_rows(str(quoted_csv_file), stop_row=12345, block_size=4096)
+
+        offset, skip = index.locate(12345)
+        rows = pd.concat(list(CSVLoader(str(quoted_csv_file), byte_range=(offset, index.file_size)).load()))
+
+        assert skip == 0 and rows["id"].iloc[0] == 12345
+
+    def test_blank_lines_and_carriage_returns(self, tmp_path):
+        path = tmp_path / "blank.csv"
+        path.write_bytes(b'id,note\r\n1,a\r\n\r\n  \r\n\t\r\n2,"b\r\n\r\nc"\r\n,\r\n3,d')
+        parsed = pd.read_csv(path)
+
+        index = index_rows(str(path), stop_row=2, block_size=5)
+
+        assert index.locate(2) == (path.read_bytes().index(b",\r\n3"), 0)
+        assert index_rows(str(path)).total_rows == len(parsed) == 4
+
+    @pytest.mark.parametrize("content", [
+        'id,name\n1,6" pipe\n2,bolt\n',       # quote inside a field
+        'id,name\n1,"open\n2,bolt\n',          # quote that never closes
+        'id,name\n1,a,extra\n2,bolt\n',        # more fields than the header
+        'id,name\r1,a\r2,bolt\r',              # rows ended by carriage returns
+    ])
+    def test_ambiguous_files_are_not_indexed(self, tmp_path, content):
+        path = tmp_path / "ambiguous.csv"
+        path.write_bytes(content.encode())
+
+        assert index_rows(str(path), stop_row=1) is None
+
+    def test_stop_row_beyond_file(self, quoted_csv_file):
+        assert index_rows(str(quoted_csv_file), stop_row=20001) is None
+        assert index_rows(str(quoted_csv_file), stop_row=20000).locate(20000) == (quoted_csv_file.stat().st_size, 0)
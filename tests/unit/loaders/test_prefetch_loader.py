@@ -0,0 +1,91 @@
+"""
+Unit tests for the background prefetch loader wrapper.
+"""
+
+import pytest
+import pandas as pd
+
+from validation_framework.loaders.csv_loader import CSVLoader
+from validation_framework.loaders.prefetch_loader import PrefetchLoader, with_prefetch
+
+
+@pytest.fixture
+def chunked_csv_file(tmp_path):
+    """CSV file that loads as 10 chunks of 10 rows."""
+    path = tmp_path / "prefetch.csv"
+    pd.DataFrame({"id": range(100), "value": [i * 2 for i in range(100)]}).to_csv(path, index=False)
+    return str(path)
+
+
+class _FailingLoader:
+    """Loader that fails after yielding one chunk."""
+
+    file_path = "failing.csv"
+
+    def load(self):
+        yield pd.DataFrame({"id": [1]})
+        raise ValueError("corrupt chunk")
+
+    def get_metadata(self):
+        return {"file_path": self.file_path}
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_prefetch_yields_same_chunks(chunked_csv_file, mode):
+    """Test prefetching does not change chunk contents or order."""
+    loader = CSVLoader(chunked_csv_file, chunk_size=10)
+    expected = list(loader.load())
+
+    prefetch = PrefetchLoader(CSVLoader(chunked_csv_file, chunk_size=10), queue_depth=3, mode=mode)
+    chunks = list(prefetch.load())
+
+    assert len(chunks) == len(expected) == 10
+    for chunk, expected_chunk in zip(chunks, expected):
+        pd.testing.assert_frame_equal(chunk, expected_chunk)
+
+    stats = prefetch.stats.to_dict()
+    assert stats["chunks"] == 10
+    assert stats["queue_depth"] == 3
+    assert stats["max_queue_fill"] <= 3
+    assert stats["bottleneck"] in ("io", "cpu")
+
+
+def test_prefetch_delegates_metadata(chunked_csv_file):
+    """Test non-load attributes are delegated to the wrapped loader."""
+    loader = CSVLoader(chunked_csv_file, chunk_size=10)
+    prefetch = PrefetchLoader(loader)
+
+    assert prefetch.get_metadata() == loader.get_metadata()
+    assert prefetch.chunk_size == 10
+
+
+def test_prefetch_reraises_loader_errors():
+    """Test loader exceptions reach the consumer after earlier chunks."""
+    chunks = []
+    with pytest.raises(ValueError, match="corrupt chunk"):
+        for chunk in PrefetchLoader(_FailingLoader()).load():
+            chunks.append(chunk)
+
+    assert len(chunks) == 1
+
+
+def test_prefetch_stops_when_consumer_stops_early(chunked_csv_file):
+    """Test abandoning the iterator stops the background producer."""
+    prefetch = PrefetchLoader(CSVLoader(chunked_csv_file, chunk_size=10), queue_depth=1)
+    iterator = prefetch.load()
+    next(iterator)
+    iterator.close()
+
+    # A fresh pass starts from the beginning
+    assert len(list(prefetch.load())) == 10
+
+
+def test_with_prefetch_disabled(chunked_csv_file):
+    """Test a depth of 0 leaves the loader unwrapped."""
+    loader = CSVLoader(chunked_csv_file, chunk_size=10)
+
+    assert with_prefetch(loader, 0) is loader
+    assert isinstance(with_prefetch(loader, 2), PrefetchLoader)
+
+    with pytest.raises(ValueError):
+        PrefetchLoader(loader, mode="fibre")
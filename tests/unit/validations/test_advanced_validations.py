@@ -101,6 +101,44 @@ class TestStatisticalOutlierCheck:
         # Clean data should have no outliers
         assert result.passed is True or result.failed_count == 0
 
+    def test_zscore_second_pass_when_buffer_exceeded(self, dataframe_with_outliers, tmp_path):
+        """Test Z-score re-reads the file when values exceed the buffer."""
+        csv_path = tmp_path / "outliers.csv"
+        dataframe_with_outliers.to_csv(csv_path, index=False)
+        params = {"field": "value", "method": "zscore", "threshold": 3.0}
+
+        buffered = StatisticalOutlierCheck(name="Buffered", severity=Severity.WARNING, params=params)
+        expected = buffered.validate(create_data_iterator(dataframe_with_outliers, chunk_size=7), {})
+
+        two_pass = StatisticalOutlierCheck(
+            name="TwoPass", severity=Severity.WARNING, params={**params, "buffer_size": 5}
+        )
+        context = {'file_config': {'path': str(csv_path)}, 'chunk_size': 7}
+        result = two_pass.validate(create_data_iterator(dataframe_with_outliers, chunk_size=7), context)
+
+        assert result.failed_count == expected.failed_count > 0
+        assert [s["row"] for s in result.sample_failures] == [s["row"] for s in expected.sample_failures]
+
+    def test_merged_states_match_single_pass(self, dataframe_with_outliers):
+        """Test merging partial states gives the same statistics as one pass."""
+        validation = StatisticalOutlierCheck(
+            name="OutlierTest",
+            severity=Severity.WARNING,
+            params={"field": "value", "method": "iqr", "sample_size": 20}
+        )
+        single = validation.validate(iter([dataframe_with_outliers]), {})
+
+        split = len(dataframe_with_outliers) // 3
+        first = validation.init_state({})
+        validation.update_state(first, dataframe_with_outliers.iloc[:split], 0, {})
+        second = validation.init_state({})
+        validation.update_state(second, dataframe_with_outliers.iloc[split:], split, {})
+        merged = validation.finalize_state(validation.merge_states(first, second), {})
+
+        assert merged.message == single.message
+        assert merged.failed_count == single.failed_count
+        assert merged.total_count == single.total_count == 20
+
 
 # ============================================================================
 # CROSS-FIELD COMPARISON TESTS
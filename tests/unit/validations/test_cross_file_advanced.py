@@ -408,6 +408,119 @@ class TestCrossFileKeyCheckSuperset:
         assert result.passed is False
         assert "not found" in result.message.lower()
 
+    def test_superset_counts_all_missing_keys(self, temp_csv_file):
+        """Test every missing reference key is counted, not just the samples."""
+        create_reference_file(temp_csv_file, pd.DataFrame({"id": range(300)}))
+        df = pd.DataFrame({"customer_id": range(50)})
+
+        validation = CrossFileKeyCheck(
+            name="CustomerSuperset",
+            severity=Severity.WARNING,
+            params={
+                "foreign_key": "customer_id",
+                "reference_file": temp_csv_file,
+                "reference_key": "id",
+                "check_mode": "superset"
+            }
+        )
+        result = validation.validate(create_data_iterator(df, chunk_size=20), {})
+
+        assert result.passed is False
+        assert result.failed_count == 250
+        assert "250 reference keys" in result.message
+
+
+# ============================================================================
+# SORT-MERGE JOIN TESTS
+# ============================================================================
+
+def sort_merge_check(reference_path: str, check_mode: str, join_strategy: str = "sort_merge") -> CrossFileKeyCheck:
+    """Build a CrossFileKeyCheck on customer_id -> id with the given join strategy."""
+    return CrossFileKeyCheck(
+        name="CustomerSortMerge",
+        severity=Severity.ERROR,
+        params={
+            "foreign_key": "customer_id",
+            "reference_file": reference_path,
+            "reference_key": "id",
+            "check_mode": check_mode,
+            "join_strategy": join_strategy
+        }
+    )
+
+
+@pytest.mark.unit
+class TestCrossFileKeyCheckSortMerge:
+    """Test CrossFileKeyCheck with join_strategy: sort_merge."""
+
+    @pytest.mark.parametrize("check_mode", ["exact_match", "subset", "superset"])
+    def test_matches_hash_strategy_on_sorted_inputs(self, temp_csv_file, check_mode):
+        """Test sort_merge gives the same counts as hash when windows span chunks."""
+        create_reference_file(temp_csv_file, pd.DataFrame({"id": [1, 2, 2, 3, 5, 8, 9, 10, 12, 15, 20, 21]}))
+        df = pd.DataFrame({"customer_id": [1, 1, 2, 4, 5, 5, 6, 9, 12, 12, 13, 21, 30]})
+        context = {"chunk_size": 3, "reference_index_dir": None}
+
+        merged = sort_merge_check(temp_csv_file, check_mode).validate(
+            create_data_iterator(df, chunk_size=4), context
+        )
+        hashed = sort_merge_check(temp_csv_file, check_mode, "hash").validate(
+            create_data_iterator(df, chunk_size=4), context
+        )
+
+        assert merged.passed is False
+        assert merged.failed_count == hashed.failed_count
+        assert merged.total_count == hashed.total_count
+
+    def test_superset_reports_missing_reference_keys(self, temp_csv_file):
+        """Test superset mode samples the reference keys no current key matched."""
+        create_reference_file(temp_csv_file, pd.DataFrame({"id": range(0, 40, 2)}))
+        df = pd.DataFrame({"customer_id": range(0, 20)})
+
+        result = sort_merge_check(temp_csv_file, "superset").validate(
+            create_data_iterator(df, chunk_size=6), {"chunk_size": 5, "reference_index_dir": None}
+        )
+
+        assert result.passed is False
+        assert result.failed_count == 10
+        assert "10 reference keys" in result.message
+
+    def test_falls_back_when_reference_unsorted(self, temp_csv_file):
+        """Test an unsorted reference file is detected and the hash path gives the verdict."""
+        create_reference_file(temp_csv_file, pd.DataFrame({"id": [1, 2, 3, 50, 4, 5, 6]}))
+        df = pd.DataFrame({"customer_id": [1, 4, 6, 50, 51]})
+
+        result = sort_merge_check(temp_csv_file, "exact_match").validate(
+            create_data_iterator(df, chunk_size=2), {"chunk_size": 2, "reference_index_dir": None}
+        )
+
+        assert result.failed_count == 1
+        assert result.sample_failures[0]["value"] == "51"
+
+    def test_falls_back_when_current_unsorted(self, temp_csv_file):
+        """Test an unsorted current file falls back without double-counting earlier chunks."""
+        create_reference_file(temp_csv_file, pd.DataFrame({"id": range(10)}))
+        df = pd.DataFrame({"customer_id": [0, 1, 11, 9, 2, 12]})
+
+        result = sort_merge_check(temp_csv_file, "superset").validate(
+            create_data_iterator(df, chunk_size=3), {"chunk_size": 4, "reference_index_dir": None}
+        )
+        exact = sort_merge_check(temp_csv_file, "exact_match").validate(
+            create_data_iterator(df, chunk_size=3), {"chunk_size": 4, "reference_index_dir": None}
+        )
+
+        assert result.failed_count == 6  # 3-8 never appear in the current file
+        assert exact.failed_count == 2
+
+    def test_overlap_mode_rejected(self, temp_csv_file):
+        """Test sort_merge is refused for overlap mode."""
+        create_reference_file(temp_csv_file, pd.DataFrame({"id": [1, 2, 3]}))
+        df = pd.DataFrame({"customer_id": [1, 2, 3]})
+
+        result = sort_merge_check(temp_csv_file, "overlap").validate(create_data_iterator(df), {})
+
+        assert result.passed is False
+        assert "join_strategy" in result.message
+
 
 # ============================================================================
 # ERROR HANDLING TESTS
@@ -320,6 +320,26 @@ class TestCrossFileDuplicateCheck:
         # Should pass (composite keys won't match with customers data)
         assert result.passed is True
 
+    def test_keys_match_by_value_across_reference_files(self, tmp_path):
+        """Test int keys match float reference keys and NULL keys never match."""
+        pd.DataFrame({'id': [1.0, None, 3.0]}).to_csv(tmp_path / 'old.csv', index=False)
+        pd.DataFrame({'id': [7]}).to_csv(tmp_path / 'older.csv', index=False)
+        data = pd.DataFrame({'id': [1, 2, 7, None]})
+
+        validation = CrossFileDuplicateCheck(
+            name="test_by_value",
+            severity=Severity.ERROR,
+            params={
+                'columns': ['id'],
+                'reference_files': ['old.csv', 'older.csv', 'missing.csv'],
+            }
+        )
+        result = validation.validate(iter([data]), {'base_path': str(tmp_path)})
+
+        assert result.passed is False
+        assert result.failed_count == 2
+        assert [s['key_values']['id'] for s in result.sample_failures] == ['1.0', '7.0']
+
 
 class TestCrossFileValidationIntegration:
     """Integration tests for cross-file validations."""
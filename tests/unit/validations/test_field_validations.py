@@ -191,6 +191,36 @@ class TestRegexCheck:
 
         assert result.passed is True
 
+    def test_failure_count_is_exact_beyond_samples(self):
+        """Test failed_count counts every failure, not just the samples kept."""
+        # "AB12\n" matches: Python re semantics ($ before a trailing newline) are kept
+        df = pd.DataFrame({"code": ["AB12", "bad", None, "AB12\n", "CD34"] * 40})
+
+        validation = RegexCheck(
+            name="RegexCheck",
+            severity=Severity.ERROR,
+            params={"field": "code", "pattern": r'^[A-Z]{2}\d{2}$'}
+        )
+        result = validation.validate(create_data_iterator(df, chunk_size=30), {"max_sample_failures": 5})
+
+        assert result.failed_count == 40
+        assert len(result.sample_failures) == 5
+        assert [s["row"] for s in result.sample_failures[:2]] == [1, 6]
+
+    def test_invert_counts_matching_values(self):
+        """Test invert=True fails values that match, using re.match semantics."""
+        df = pd.DataFrame({"note": ["TEST row", "real", "a TEST", "TEST"]})
+
+        validation = RegexCheck(
+            name="RegexCheck",
+            severity=Severity.ERROR,
+            params={"field": "note", "pattern": r'TEST', "invert": True}
+        )
+        result = validation.validate(create_data_iterator(df), {})
+
+        assert result.failed_count == 2
+        assert [s["row"] for s in result.sample_failures] == [0, 3]
+
 
 # ============================================================================
 # VALID VALUES CHECK TESTS
@@ -274,6 +304,38 @@ class TestValidValuesCheck:
 
         assert result.passed is True
 
+    def test_exact_count_with_condition_and_case(self):
+        """Test failures are counted exactly on condition rows, ignoring case."""
+        df = pd.DataFrame({
+            "status": ["active", "CLOSED", "bogus", None, "Pending"] * 30,
+            "region": ["EU", "EU", "EU", "EU", "US"] * 30,
+        })
+
+        validation = ValidValuesCheck(
+            name="ValidValuesCheck",
+            severity=Severity.ERROR,
+            params={"field": "status", "valid_values": ["ACTIVE", "CLOSED"], "case_sensitive": False},
+            condition="region == 'EU'"
+        )
+        result = validation.validate(create_data_iterator(df, chunk_size=40), {"max_sample_failures": 2})
+
+        assert result.failed_count == 30
+        assert [s["row"] for s in result.sample_failures] == [2, 7]
+
+    def test_numeric_valid_values_match_numbers(self):
+        """Test numeric valid_values match numeric columns."""
+        df = pd.DataFrame({"priority": [1, 2, 3, 4]})
+
+        validation = ValidValuesCheck(
+            name="ValidValuesCheck",
+            severity=Severity.ERROR,
+            params={"field": "priority", "valid_values": [1, 2, 3]}
+        )
+        result = validation.validate(create_data_iterator(df), {})
+
+        assert result.failed_count == 1
+        assert result.sample_failures[0]["value"] == "4"
+
 
 # ============================================================================
 # RANGE CHECK TESTS
@@ -379,6 +441,22 @@ class TestRangeCheck:
 
         assert result.passed is True
 
+    def test_exact_count_beyond_samples(self):
+        """Test every out-of-range value is counted, with per-bound messages."""
+        df = pd.DataFrame({"score": [-5, 50, 150, None, "n/a"] * 60})
+
+        validation = RangeCheck(
+            name="RangeCheck",
+            severity=Severity.ERROR,
+            params={"field": "score", "min_value": 0, "max_value": 100}
+        )
+        result = validation.validate(create_data_iterator(df, chunk_size=70), {"max_sample_failures": 2})
+
+        assert result.failed_count == 120
+        assert [s["message"] for s in result.sample_failures] == [
+            "Value -5.0 is below minimum 0", "Value 150.0 exceeds maximum 100"
+        ]
+
 
 # ============================================================================
 # DATE FORMAT CHECK TESTS
@@ -460,6 +538,24 @@ class TestDateFormatCheck:
 
         assert result.passed is True
 
+    def test_several_formats_with_exact_count(self):
+        """Test any listed format is accepted and every failure is counted."""
+        df = pd.DataFrame({
+            "date": ["2025-01-15", "15/01/2025", "2025-02-30", None, "0001-01-01", "Jan 15"] * 50
+        })
+
+        validation = DateFormatCheck(
+            name="DateFormatCheck",
+            severity=Severity.ERROR,
+            params={"field": "date", "format": ["%Y-%m-%d", "%d/%m/%Y"], "allow_null": False}
+        )
+        result = validation.validate(create_data_iterator(df, chunk_size=40), {"max_sample_failures": 4})
+
+        # Feb 30, null and "Jan 15" fail; 0001-01-01 is valid (outside pandas' timestamp range)
+        assert result.failed_count == 150
+        assert [s["row"] for s in result.sample_failures] == [2, 3, 5, 8]
+        assert result.sample_failures[1]["message"] == "Null value not allowed"
+
 
 # ============================================================================
 # STRING LENGTH CHECK TESTS
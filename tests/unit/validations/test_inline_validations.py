@@ -88,6 +88,21 @@ class TestInlineRegexCheck:
         assert result.failed_count == 2
         assert any("Bob#123" in str(f) for f in result.sample_failures)
 
+    def test_inline_regex_exact_count_beyond_samples(self):
+        """Test failed_count counts every failure, not just the samples kept."""
+        df = pd.DataFrame({"sku": ["SKU-1", "sku-2", None, "X SKU-3", 42] * 30})
+
+        validation = InlineRegexCheck(
+            name="SkuFormat",
+            severity=Severity.ERROR,
+            params={"field": "sku", "pattern": r"SKU-\d", "description": "SKU present"}
+        )
+        result = validation.validate(create_data_iterator(df, chunk_size=25), {"max_sample_failures": 3})
+
+        # search semantics: "X SKU-3" passes; "sku-2" and 42 fail
+        assert result.failed_count == 60
+        assert [s["value"] for s in result.sample_failures] == ["sku-2", "42", "sku-2"]
+
     def test_inline_regex_us_ssn_format(self):
         """Test US SSN format validation."""
         df = pd.DataFrame({
@@ -372,6 +387,22 @@ class TestInlineLookupCheck:
         assert result.passed is False
         assert "Missing required parameters" in result.message
 
+    def test_lookup_large_reference_list_exact_count(self):
+        """Test 100k-entry reference lists and exact counts beyond the samples."""
+        codes = [f"P{i:06d}" for i in range(100_000)]
+        df = pd.DataFrame({"product": ["P000042", "X1", None, "P099999", 7] * 40})
+
+        validation = InlineLookupCheck(
+            name="ProductCodes",
+            severity=Severity.ERROR,
+            params={"field": "product", "reference_values": codes, "description": "Known products"}
+        )
+        result = validation.validate(create_data_iterator(df, chunk_size=30), {"max_sample_failures": 3})
+
+        assert result.failed_count == 80
+        assert [s["value"] for s in result.sample_failures] == ["X1", "7", "X1"]
+        assert "Invalid values: 7, X1" in result.message
+
 
 @pytest.mark.integration
 class TestInlineValidationsIntegration:
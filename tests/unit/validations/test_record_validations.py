@@ -8,6 +8,7 @@ Author: Daniel Edge
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 
 from validation_framework.validations.builtin.record_checks import (
@@ -16,6 +17,7 @@ from validation_framework.validations.builtin.record_checks import (
     UniqueKeyCheck
 )
 from validation_framework.core.results import Severity
+from validation_framework.core.partitioned_key_store import PartitionedKeyStore
 from tests.conftest import create_data_iterator
 
 
@@ -267,6 +269,235 @@ class TestUniqueKeyCheck:
         assert result.passed is False or result.passed is True  # Depends on implementation
 
 
+# ============================================================================
+# INCREMENTAL PROTOCOL TESTS
+# ============================================================================
+
+def _run_in_partitions(validation, df, split):
+    """Run a validation over two row ranges and merge the partial states."""
+    first = validation.init_state({})
+    validation.update_state(first, df.iloc[:split], 0, {})
+    second = validation.init_state({})
+    validation.update_state(second, df.iloc[split:], split, {})
+    state = validation.merge_states(first, second)
+    try:
+        return validation.finalize_state(state, {})
+    finally:
+        validation.release_state(state)
+
+
+@pytest.mark.unit
+class TestIncrementalKeyChecks:
+    """Test the incremental protocol of the key-based record checks."""
+
+    def test_duplicates_across_chunks_detected(self):
+        """Test duplicates spanning chunk boundaries are counted once each."""
+        df = pd.DataFrame({"id": [1, 2, 3, 1, 2, 1], "value": [0] * 6})
+
+        validation = DuplicateRowCheck(
+            name="DuplicateRowCheck",
+            severity=Severity.ERROR,
+            params={"key_fields": ["id"]}
+        )
+        result = validation.validate(create_data_iterator(df, chunk_size=2), {})
+
+        assert result.passed is False
+        assert result.failed_count == 3
+        assert [s["row"] for s in result.sample_failures] == [3, 4, 5]
+
+    def test_merged_states_match_single_pass(self):
+        """Test merging partial states gives the same result as one pass."""
+        df = pd.DataFrame({"id": [5, 6, 7, 6, 8, 5, 9, 7]})
+
+        validation = UniqueKeyCheck(
+            name="UniqueKeyCheck",
+            severity=Severity.ERROR,
+            params={"fields": ["id"]}
+        )
+        single = validation.validate(create_data_iterator(df), {})
+        merged = _run_in_partitions(validation, df, split=4)
+
+        assert merged.failed_count == single.failed_count == 3
+        assert merged.total_count == single.total_count == 8
+        assert [s["row"] for s in merged.sample_failures] == [s["row"] for s in single.sample_failures]
+        assert merged.sample_failures[1]["first_seen_row"] == 0
+
+    def test_merged_states_without_duplicates(self):
+        """Test merged states report all keys as unique."""
+        df = pd.DataFrame({"a": [1, 2, 3, 4], "b": ["x", "y", "z", "w"]})
+
+        validation = DuplicateRowCheck(
+            name="DuplicateRowCheck",
+            severity=Severity.ERROR,
+            params={"consider_all_fields": True}
+        )
+        result = _run_in_partitions(validation, df, split=2)
+
+        assert result.passed is True
+        assert result.total_count == 4
+
+
+@pytest.mark.unit
+class TestHashedKeyChecks:
+    """Test the 64-bit row hashing mode of the key-based record checks."""
+
+    def test_hashed_duplicates_match_tuple_keys(self):
+        """Test hashing finds the same duplicates and samples as key tuples."""
+        df = pd.DataFrame({
+            "id": [1, 2, 1, 3, 2, None, 1, 4, 3],
+            "code": ["a", "b", "a", "c", "x", "d", "a", "e", "c"],
+        })
+
+        results = []
+        for hash_keys in (False, True):
+            validation = DuplicateRowCheck(
+                name="DuplicateRowCheck",
+                severity=Severity.ERROR,
+                params={"key_fields": ["id", "code"], "hash_keys": hash_keys, "use_bloom_filter": False}
+            )
+            results.append(validation.validate(create_data_iterator(df, chunk_size=4), {}))
+
+        assert results[1].failed_count == results[0].failed_count == 3
+        assert results[1].sample_failures == results[0].sample_failures
+        # Matches by hash are reported as approximate
+        assert "keys matched by hash" in results[1].message
+        assert "keys matched by hash" not in results[0].message
+
+    def test_first_hash_collisions_resolved_by_second_hash(self, monkeypatch):
+        """Test different keys with the same first hash are not reported as duplicates."""
+        from validation_framework.validations.builtin import record_checks
+        real_hash_keys = record_checks.hash_keys
+        monkeypatch.setattr(
+            record_checks, "hash_keys",
+            lambda keys, seed=0: real_hash_keys(keys, seed) if seed else np.zeros(len(keys), dtype=np.uint64)
+        )
+        df = pd.DataFrame({"id": [1, 2, 3, 2, 4, 1, 3, 5]})
+
+        validation = UniqueKeyCheck(
+            name="UniqueKeyCheck",
+            severity=Severity.ERROR,
+            params={"fields": ["id"], "hash_keys": True}
+        )
+        result = validation.validate(create_data_iterator(df, chunk_size=3), {})
+
+        assert result.failed_count == 3
+        assert [(s["row"], s["first_seen_row"]) for s in result.sample_failures] == [(3, 1), (5, 0), (6, 2)]
+
+    def test_hashed_runs_move_to_key_store_beyond_hash_table_size(self):
+        """Test hash_table_size bounds the hashed runs, also when states are merged."""
+        df = pd.DataFrame({"id": [1, 2, 3, 4, 5, 6, 7, 8, 2, 7]})
+        validation = UniqueKeyCheck(
+            name="UniqueKeyCheck",
+            severity=Severity.ERROR,
+            params={"fields": ["id"], "hash_keys": True, "hash_table_size": 3, "key_store_partitions": 4}
+        )
+
+        state = validation.init_state({})
+        for start in range(0, 10, 3):
+            validation.update_state(state, df.iloc[start:start + 3], start, {})
+        tracker = state["tracker"]
+        result = validation.finalize_state(state, {})
+        validation.release_state(state)
+        merged = _run_in_partitions(validation, df, split=5)
+
+        assert state["hashed"] is None and isinstance(tracker, PartitionedKeyStore)
+        assert result.failed_count == merged.failed_count == 2
+        assert [(s["row"], s["first_seen_row"]) for s in result.sample_failures] == [(8, 1), (9, 6)]
+        assert [s["row"] for s in merged.sample_failures] == [8, 9]
+
+    def test_partitioned_key_store_matches_memory_tracker(self):
+        """Test the partitioned key store finds the same duplicates, also when merged."""
+        df = pd.DataFrame({"id": [5, 6, 7, 6, 8, 5, 9, 7, 10, 6]})
+
+        results = []
+        for params in ({}, {"key_store": "partitioned", "hash_table_size": 2, "key_store_partitions": 4}):
+            validation = UniqueKeyCheck(
+                name="UniqueKeyCheck",
+                severity=Severity.ERROR,
+                params={"fields": ["id"], "use_bloom_filter": False, **params}
+            )
+            results.append(validation.validate(create_data_iterator(df, chunk_size=3), {}))
+        merged = _run_in_partitions(validation, df, split=5)
+
+        assert results[1].failed_count == results[0].failed_count == merged.failed_count == 4
+        assert results[1].sample_failures == results[0].sample_failures
+        assert [s["row"] for s in merged.sample_failures] == [3, 5, 7, 9]
+
+    def test_partitioned_key_store_large_int64_ids(self):
+        """Test distinct int64 IDs above 2^53 are not reported as duplicates."""
+        df = pd.DataFrame({"id": [1500000000000000001, 1500000000000000002, 1500000000000000003]})
+
+        for params in ({"key_store": "partitioned"}, {"hash_keys": True}):
+            validation = UniqueKeyCheck(
+                name="UniqueKeyCheck",
+                severity=Severity.ERROR,
+                params={"fields": ["id"], **params}
+            )
+            result = validation.validate(create_data_iterator(df, chunk_size=2), {})
+
+            assert result.failed_count == 0
+
+    def test_bloom_filter_with_worker_states(self):
+        """Test the bloom pre-filter gives exact results, also for merged worker states."""
+        df = pd.DataFrame({"id": [3, 4, 3, 5, 4, 6, 3, 7, 8, 5]})
+        validation = DuplicateRowCheck(
+            name="DuplicateRowCheck",
+            severity=Severity.ERROR,
+            params={"key_fields": ["id"], "hash_table_size": 2}
+        )
+
+        state = validation.init_state({})
+        assert state["bloom"] is not None
+        for start in range(0, 10, 3):
+            partial = validation.init_state({"partial_state": True})
+            assert partial["bloom"] is None and partial["tracker"] is None
+            validation.update_state(partial, df.iloc[start:start + 3], start, {})
+            state = validation.merge_states(state, partial)
+        validation.update_state(state, pd.DataFrame({"id": [6, 9]}), 10, {})
+        result = validation.finalize_state(state, {})
+        validation.release_state(state)
+
+        assert result.failed_count == 5
+        assert [s["row"] for s in result.sample_failures] == [2, 4, 6, 9, 10]
+
+    def test_partitioned_worker_states_merged_by_hash(self):
+        """Test worker states of the partitioned store ship hashes the parent merges in one batch."""
+        df = pd.DataFrame({"id": [3, 4, 3, 5, 4, 6, 3, 7, 8, 5]})
+        validation = UniqueKeyCheck(
+            name="UniqueKeyCheck",
+            severity=Severity.ERROR,
+            params={"fields": ["id"], "key_store": "partitioned"}
+        )
+
+        state = validation.init_state({})
+        for start in range(0, 10, 3):
+            partial = validation.init_state({"partial_state": True})
+            assert partial["tracker"] is None and partial["hashed"] is not None
+            validation.update_state(partial, df.iloc[start:start + 3], start, {})
+            state = validation.merge_states(state, partial)
+        result = validation.finalize_state(state, {})
+        validation.release_state(state)
+
+        assert result.failed_count == 4
+        assert [s["row"] for s in result.sample_failures] == [2, 4, 6, 9]
+
+    def test_hashed_merged_states_match_single_pass(self):
+        """Test merging hashed partial states gives the same result as one pass."""
+        df = pd.DataFrame({"id": [5, 6, 7, 6, 8, 5, 9, 7], "part": ["a"] * 8})
+
+        validation = UniqueKeyCheck(
+            name="UniqueKeyCheck",
+            severity=Severity.ERROR,
+            params={"fields": ["id", "part"], "hash_keys": True}
+        )
+        single = validation.validate(create_data_iterator(df), {})
+        merged = _run_in_partitions(validation, df, split=4)
+
+        assert merged.failed_count == single.failed_count == 3
+        assert merged.sample_failures == single.sample_failures
+        assert merged.sample_failures[1]["first_seen_row"] == 0
+
+
 # ============================================================================
 # INTEGRATION TESTS
 # ============================================================================
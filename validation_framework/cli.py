@@ -75,7 +75,20 @@ def cli():
               default='WARNING', help='Logging level')
 @click.option('--log-file', type=click.Path(), help='Optional log file path')
 @click.option('--no-optimize', is_flag=True, help='Disable single-pass optimization (use standard engine)')
-def validate(config_file, html_output, json_output, verbose, fail_on_warning, delimiter, log_level, log_file, no_optimize):
+@click.option('--workers', '-w', type=click.IntRange(min=1), default=None,
+              help='Worker processes for parallel chunk validation (default: processing.workers from config, or 1)')
+@click.option('--cache/--no-cache', 'use_cache', default=None,
+              help='Reuse results of unchanged files and validations (default: processing.result_cache from config)')
+@click.option('--cache-path', type=click.Path(), default=None,
+              help='Result cache database file (default: .datak9_cache/results.db); implies --cache')
+@click.option('--full-hash', is_flag=True,
+              help='Fingerprint files for the result cache by hashing their full content instead of sampled blocks')
+@click.option('--checkpoint-interval', type=click.IntRange(min=1), default=None,
+              help='Save a crash-safe checkpoint at most every N seconds (default: processing.checkpoint_interval from config)')
+@click.option('--resume', is_flag=True,
+              help='Continue an interrupted run from its last checkpoint')
+def validate(config_file, html_output, json_output, verbose, fail_on_warning, delimiter, log_level, log_file, no_optimize, workers,
+             use_cache, cache_path, full_hash, checkpoint_interval, resume):
     """
     Run data validation from a configuration file.
 
@@ -109,6 +122,19 @@ def validate(config_file, html_output, json_output, verbose, fail_on_warning, de
     \b
     # With custom log level and file
     data-validate validate config.yaml --log-level DEBUG --log-file "logs/{timestamp}.log"
+
+    \b
+    # Validate chunks on 8 worker processes
+    data-validate validate config.yaml --workers 8
+
+    \b
+    # Skip validations whose file and rule are unchanged since the last run
+    data-validate validate config.yaml --cache
+
+    \b
+    # Checkpoint every 5 minutes, then continue after a crash
+    data-validate validate config.yaml --checkpoint-interval 300
+    data-validate validate config.yaml --resume
     """
     # Create pattern expander with consistent timestamp for this run
     run_timestamp = datetime.now()
@@ -131,7 +157,7 @@ def validate(config_file, html_output, json_output, verbose, fail_on_warning, de
             engine = ValidationEngine.from_config(config_file)
         else:
             logger.info("Using optimized validation engine (single-pass mode)")
-            engine = OptimizedValidationEngine.from_config(config_file, use_single_pass=True)
+            engine = OptimizedValidationEngine.from_config(config_file, use_single_pass=True, workers=workers)
         logger.info(f"Configuration loaded: {engine.config.job_name}")
 
         # Override delimiter for all files if specified on CLI
@@ -141,6 +167,30 @@ def validate(config_file, html_output, json_output, verbose, fail_on_warning, de
                 file_config['delimiter'] = delim_char
             logger.info(f"Using delimiter: {repr(delim_char)}")
 
+        # Override result cache settings if specified on CLI
+        if use_cache is False:
+            engine.config.result_cache = False
+        elif use_cache or cache_path or full_hash:
+            options = engine.config.result_cache
+            options = dict(options) if isinstance(options, dict) else {}
+            options["enabled"] = True
+            if cache_path:
+                options["path"] = cache_path
+            if full_hash:
+                options["hash_mode"] = "full"
+            engine.config.result_cache = options
+            logger.info(f"Result cache enabled: {options}")
+
+        # Checkpoint/resume (optimized engine only)
+        if checkpoint_interval:
+            engine.config.checkpoint_interval = checkpoint_interval
+        run_options = {}
+        if resume:
+            if no_optimize:
+                po.warning("--resume requires the optimized engine; running from the start")
+            else:
+                run_options["resume"] = True
+
         # Performance advisory: Check files and recommend Parquet if needed
         # (Skip database sources)
         advisor = get_performance_advisor()
@@ -158,7 +208,7 @@ def validate(config_file, html_output, json_output, verbose, fail_on_warning, de
                         po.info(line)
                     po.blank_line()
 
-        report = engine.run(verbose=verbose)
+        report = engine.run(verbose=verbose, **run_options)
 
         # Build context for pattern expansion
         context = {'job_name': engine.config.job_name}
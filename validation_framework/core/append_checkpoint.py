@@ -0,0 +1,292 @@
+"""
+Append-aware incremental validation for growing CSV and Parquet files.
+
+Feeds that only ever append (new lines at the end of a CSV, new row groups
+at the end of a Parquet file) do not need their whole history revalidated
+on every run. For files marked ``append_only: true`` the optimized engine
+saves a checkpoint after each run:
+
+- the validated extent: a byte offset (CSV, always at a line boundary) or a
+  row group count (Parquet), plus a digest identifying that prefix
+- the accumulated state of every validation (incremental states such as
+  the MemoryBoundedTracker keys of UniqueKeyCheck/DuplicateRowCheck,
+  running aggregates, sample failures) and the number of rows validated
+
+The next run verifies the prefix is unchanged, restores the states, reads
+only the new tail and still reports whole-file results. If the file was
+rewritten or truncated, the validation config changed, or the checkpoint is
+unreadable, the file is validated from the start.
+
+Checkpoints are pickled; keep the checkpoint directory private to the
+account running the validations.
+
+Example YAML:
+    processing:
+      checkpoint_dir: ".datak9_cache/checkpoints"
+    files:
+      - name: "events"
+        path: "landing/events.csv"
+        append_only: true
+
+Author: Daniel Edge
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import logging
+import os
+import pickle
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+    pq = None
+
+DEFAULT_CHECKPOINT_DIR = os.path.join(".datak9_cache", "checkpoints")
+
+# Formats whose appended data can be read on its own
+APPEND_FORMATS = ("csv", "parquet")
+
+# Size of the blocks identifying a CSV prefix (its start and its end)
+_EDGE_BLOCK = 64 * 1024
+
+# Bumped when the checkpoint layout changes; older checkpoints are ignored
+_CHECKPOINT_VERSION = 1
+
+
+@dataclass
+class AppendCheckpoint:
+    """
+    What a previous run validated and the validation states it ended with.
+
+    Attributes:
+        config_hash: Hash of the validation config the states belong to
+        file_format: "csv" or "parquet"
+        position: Bytes (CSV) or row groups (Parquet) already validated
+        digest: Digest of the file prefix up to ``position``
+        total_rows: Rows validated so far
+        states: Snapshot of each scan state, in validation order
+    """
+
+    config_hash: str
+    file_format: str
+    position: int
+    digest: str
+    total_rows: int
+    states: List[Dict[str, Any]] = field(default_factory=list)
+    version: int = _CHECKPOINT_VERSION
+
+
+@dataclass
+class AppendPlan:
+    """
+    Which part of a file a run reads.
+
+    Attributes:
+        file_format: "csv" or "parquet"
+        start: First byte / row group to read
+        end: End of the data this run covers (exclusive)
+        end_digest: Digest of the prefix up to ``end``; None if the run
+                    cannot be checkpointed (CSV not ending in a newline)
+        checkpoint: Checkpoint being resumed, or None for a full read
+    """
+
+    file_format: str
+    start: int
+    end: int
+    end_digest: Optional[str]
+    checkpoint: Optional[AppendCheckpoint] = None
+
+    @property
+    def resumed(self) -> bool:
+        """True if the run continues from a checkpoint."""
+        return self.checkpoint is not None
+
+    def loader_kwargs(self) -> Dict[str, Any]:
+        """Loader options restricting the read to [start, end)."""
+        if self.file_format == "csv":
+            return {"byte_range": (self.start, self.end)}
+        return {"row_groups": list(range(self.start, self.end))}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary for the file report metadata."""
+        return {
+            "resumed": self.resumed,
+            "rows_from_checkpoint": self.checkpoint.total_rows if self.checkpoint else 0,
+            "start": self.start,
+            "end": self.end,
+            "unit": "bytes" if self.file_format == "csv" else "row_groups",
+        }
+
+
+def _csv_digest(path: str, position: int) -> str:
+    """Digest of the first ``position`` bytes: its size, first and last blocks."""
+    digest = hashlib.sha256(str(position).encode())
+    with open(path, "rb") as f:
+        digest.update(f.read(min(position, _EDGE_BLOCK)))
+        tail_start = max(0, position - _EDGE_BLOCK)
+        f.seek(tail_start)
+        digest.update(f.read(position - tail_start))
+    return digest.hexdigest()
+
+
+def _csv_extent(path: str) -> Tuple[int, Optional[str]]:
+    """Current size of a CSV and, if it ends with a newline, its digest."""
+    size = os.path.getsize(path)
+    if size == 0:
+        return 0, None
+    with open(path, "rb") as f:
+        f.seek(size - 1)
+        complete = f.read(1) == b"\n"
+    return size, _csv_digest(path, size) if complete else None
+
+
+def _parquet_row_groups(path: str) -> Tuple[str, List[Tuple[int, int]]]:
+    """Schema and (rows, bytes) of every row group of a Parquet file."""
+    metadata = pq.ParquetFile(path).metadata
+    groups = [(metadata.row_group(i).num_rows, metadata.row_group(i).total_byte_size)
+              for i in range(metadata.num_row_groups)]
+    return str(metadata.schema.to_arrow_schema()), groups
+
+
+def _parquet_digest(schema: str, groups: List[Tuple[int, int]], position: int) -> str:
+    return hashlib.sha256(f"{schema}|{groups[:position]}".encode()).hexdigest()
+
+
+def dump_checkpoint(path: Path, checkpoint: Any) -> None:
+    """
+    Pickle a checkpoint atomically (a crash never leaves a partial file).
+
+    Args:
+        path: Checkpoint file (its directory is created if needed)
+        checkpoint: Object to save
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".tmp")
+    with open(temp_path, "wb") as f:
+        pickle.dump(checkpoint, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
+
+
+def load_checkpoint(path: Path) -> Optional[Any]:
+    """
+    Load a checkpoint saved by dump_checkpoint().
+
+    Args:
+        path: Checkpoint file
+
+    Returns:
+        The saved object, or None if there is none or it cannot be read
+    """
+    if not path.exists():
+        return None
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+        return None
+
+
+class AppendCheckpointStore:
+    """
+    Saves and loads append checkpoints, one file per validated source.
+
+    Example:
+        >>> store = AppendCheckpointStore(".datak9_cache/checkpoints")
+        >>> plan = store.plan(file_config, config_hash)
+        >>> loader = LoaderFactory.create_loader(path, **plan.loader_kwargs())
+    """
+
+    def __init__(self, directory: str = DEFAULT_CHECKPOINT_DIR):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory holding checkpoint files (created on save)
+        """
+        self.directory = Path(directory)
+
+    def _path(self, file_config: Dict[str, Any]) -> Path:
+        source = f"{os.path.abspath(file_config['path'])}|{file_config.get('name')}"
+        return self.directory / f"{hashlib.sha256(source.encode()).hexdigest()[:24]}.ckpt"
+
+    def load(self, file_config: Dict[str, Any]) -> Optional[AppendCheckpoint]:
+        """
+        Load the checkpoint of a file.
+
+        Args:
+            file_config: File configuration dictionary
+
+        Returns:
+            AppendCheckpoint, or None if there is none or it cannot be read
+        """
+        checkpoint = load_checkpoint(self._path(file_config))
+        if not isinstance(checkpoint, AppendCheckpoint) or checkpoint.version != _CHECKPOINT_VERSION:
+            return None
+        return checkpoint
+
+    def save(self, file_config: Dict[str, Any], checkpoint: AppendCheckpoint) -> None:
+        """
+        Save a checkpoint atomically.
+
+        Args:
+            file_config: File configuration dictionary
+            checkpoint: Checkpoint to save
+        """
+        dump_checkpoint(self._path(file_config), checkpoint)
+
+    def discard(self, file_config: Dict[str, Any]) -> None:
+        """Delete the checkpoint of a file, if any."""
+        self._path(file_config).unlink(missing_ok=True)
+
+    def plan(self, file_config: Dict[str, Any], config_hash: str) -> Optional[AppendPlan]:
+        """
+        Decide which part of a file this run must read.
+
+        Args:
+            file_config: File configuration dictionary
+            config_hash: Hash of the current validation config
+
+        Returns:
+            AppendPlan, or None if the format does not support append reads
+        """
+        file_format = (file_config.get("format") or "").lower()
+        path = file_config["path"]
+        if file_format not in APPEND_FORMATS or os.path.isdir(path):
+            return None
+        if file_format == "parquet" and not HAS_PYARROW:
+            return None
+
+        checkpoint = self.load(file_config)
+        if checkpoint is not None and (checkpoint.config_hash != config_hash
+                                       or checkpoint.file_format != file_format):
+            logger.info(f"Validation config of {file_config['name']} changed; revalidating from the start")
+            checkpoint = None
+
+        if file_format == "csv":
+            end, end_digest = _csv_extent(path)
+            if checkpoint is not None and (
+                checkpoint.position > end or _csv_digest(path, checkpoint.position) != checkpoint.digest
+            ):
+                checkpoint = None
+        else:
+            schema, groups = _parquet_row_groups(path)
+            end = len(groups)
+            end_digest = _parquet_digest(schema, groups, end)
+            if checkpoint is not None and (
+                checkpoint.position > end or _parquet_digest(schema, groups, checkpoint.position) != checkpoint.digest
+            ):
+                checkpoint = None
+
+        if checkpoint is None and self._path(file_config).exists():
+            logger.info(f"{file_config['name']} was rewritten or its checkpoint is stale; revalidating from the start")
+
+        start = checkpoint.position if checkpoint is not None else 0
+        return AppendPlan(file_format, start, end, end_digest, checkpoint)
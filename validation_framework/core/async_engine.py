@@ -158,6 +158,8 @@ class AsyncValidationEngine:
                 "encoding": file_config.get("encoding", "utf-8"),
                 "header": file_config.get("header", 0),
             }
+            if file_config.get("record_path"):
+                loader_kwargs["record_path"] = file_config["record_path"]
 
             loader = await AsyncLoaderFactory.create_loader(
                 file_path=file_path,
@@ -249,6 +251,7 @@ class AsyncValidationEngine:
                     "file_name": file_config["name"],
                     "file_path": file_config["path"],
                     "max_sample_failures": self.config.max_sample_failures,
+                    "reference_index_dir": self.config.reference_index_dir,
                 }
 
                 # Run validation in thread pool to avoid blocking
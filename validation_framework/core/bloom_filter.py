@@ -0,0 +1,183 @@
+"""
+Numpy-backed bloom filter for duplicate pre-filtering.
+
+Bits live in a numpy uint8 array; a batch of keys is hashed once into
+uint64 values (see ``partitioned_key_store.hash_keys``) and the k bit
+positions are derived by double hashing, h1 + i * h2 (mod m), for the whole
+batch at once. A negative answer is definite, so callers only need to
+resolve the keys the filter reports as possibly seen.
+
+Filters are plain Python objects holding a numpy array, so they pickle into
+checkpoints and worker results, and ``to_bytes``/``from_bytes`` give a
+compact form for storing a filter between runs. Filters with the same size
+and hash count combine with a bitwise OR (``merge``), e.g. to join the
+filters built by parallel workers.
+
+Example:
+    >>> bloom = BloomFilter(capacity=10_000_000, error_rate=0.01)
+    >>> hashes = hash_keys(chunk[["customer_id"]])
+    >>> maybe_seen = bloom.contains_hashes(hashes)
+    >>> bloom.add_hashes(hashes)
+
+Author: Daniel Edge
+"""
+
+import math
+import struct
+from typing import Any, Iterator
+
+import numpy as np
+
+from validation_framework.core.partitioned_key_store import hash_keys
+
+_HEADER = struct.Struct("<4sQQQQ")
+_MAGIC = b"DK9B"
+
+
+def _second_hash(hashes: np.ndarray) -> np.ndarray:
+    """Derive the double-hashing step from h1 (splitmix64 finalizer, forced odd)."""
+    h = hashes ^ (hashes >> np.uint64(31))
+    h = h * np.uint64(0x7FB5D329728EA185)
+    h = h ^ (h >> np.uint64(27))
+    h = h * np.uint64(0x81DADEF4BC2DD44D)
+    h = h ^ (h >> np.uint64(33))
+    return h | np.uint64(1)
+
+
+class BloomFilter:
+    """
+    Space-efficient probabilistic set with vectorized batch operations.
+
+    Sized from the expected number of keys and the accepted false positive
+    rate: m = -n ln(p) / ln(2)^2 bits and k = m/n ln(2) hash positions.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """
+        Initialize an empty filter.
+
+        Args:
+            capacity: Expected number of distinct keys
+            error_rate: False positive rate at capacity (0 < error_rate < 1)
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = int(capacity)
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.bits = np.zeros((self.num_bits + 7) // 8, dtype=np.uint8)
+        self.count = 0
+
+    def _positions(self, hashes: np.ndarray) -> Iterator[np.ndarray]:
+        """Yield the bit positions of every hash, one hash function at a time."""
+        h1 = np.asarray(hashes, dtype=np.uint64)
+        h2 = _second_hash(h1)
+        num_bits = np.uint64(self.num_bits)
+        for i in range(self.num_hashes):
+            yield (h1 + np.uint64(i) * h2) % num_bits
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        """
+        Add a batch of uint64 key hashes.
+
+        Args:
+            hashes: uint64 hashes from hash_keys()
+        """
+        for positions in self._positions(hashes):
+            np.bitwise_or.at(
+                self.bits,
+                (positions >> np.uint64(3)).astype(np.intp),
+                np.left_shift(1, (positions & np.uint64(7)).astype(np.uint8)).astype(np.uint8),
+            )
+        self.count += len(hashes)
+
+    def contains_hashes(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Check a batch of uint64 key hashes.
+
+        Args:
+            hashes: uint64 hashes from hash_keys()
+
+        Returns:
+            Boolean array: False means definitely not added, True means
+            possibly added
+        """
+        result = np.ones(len(hashes), dtype=bool)
+        for positions in self._positions(hashes):
+            byte_values = self.bits[(positions >> np.uint64(3)).astype(np.intp)]
+            result &= ((byte_values >> (positions & np.uint64(7)).astype(np.uint8)) & 1).astype(bool)
+        return result
+
+    def add_many(self, keys: Any) -> None:
+        """Add a batch of keys (anything accepted by hash_keys())."""
+        self.add_hashes(hash_keys(keys))
+
+    def contains_many(self, keys: Any) -> np.ndarray:
+        """Check a batch of keys (anything accepted by hash_keys())."""
+        return self.contains_hashes(hash_keys(keys))
+
+    def add(self, key: Any) -> None:
+        """Add a single key."""
+        self.add_many([key])
+
+    def __contains__(self, key: Any) -> bool:
+        """Check a single key (possibly added / definitely not added)."""
+        return bool(self.contains_many([key])[0])
+
+    def merge(self, other: "BloomFilter") -> "BloomFilter":
+        """
+        Add every key of another filter (bitwise OR), in place.
+
+        Args:
+            other: Filter with the same number of bits and hash functions
+
+        Returns:
+            This filter
+
+        Raises:
+            ValueError: If the filters were sized differently
+        """
+        if (other.num_bits, other.num_hashes) != (self.num_bits, self.num_hashes):
+            raise ValueError(
+                "Cannot merge bloom filters of different sizes "
+                f"({self.num_bits} bits/{self.num_hashes} hashes vs "
+                f"{other.num_bits} bits/{other.num_hashes} hashes)"
+            )
+        np.bitwise_or(self.bits, other.bits, out=self.bits)
+        self.count += other.count
+        return self
+
+    def to_bytes(self) -> bytes:
+        """Serialize the filter (header plus raw bit array)."""
+        header = _HEADER.pack(_MAGIC, self.capacity, self.num_bits, self.num_hashes, self.count)
+        return header + struct.pack("<d", self.error_rate) + self.bits.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        """
+        Restore a filter written by to_bytes().
+
+        Raises:
+            ValueError: If the data is not a serialized bloom filter
+        """
+        if len(data) < _HEADER.size + 8:
+            raise ValueError("Not a serialized bloom filter (too short)")
+        magic, capacity, num_bits, num_hashes, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError("Not a serialized bloom filter (bad header)")
+        (error_rate,) = struct.unpack_from("<d", data, _HEADER.size)
+
+        bloom = cls.__new__(cls)
+        bloom.capacity = capacity
+        bloom.error_rate = error_rate
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.count = count
+        bloom.bits = np.frombuffer(data, dtype=np.uint8, offset=_HEADER.size + 8).copy()
+        if len(bloom.bits) != (num_bits + 7) // 8:
+            raise ValueError("Not a serialized bloom filter (truncated bit array)")
+        return bloom
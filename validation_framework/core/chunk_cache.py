@@ -0,0 +1,186 @@
+"""
+Per-chunk computation cache shared by the validations of a file.
+
+The single-pass engine hands the same chunk to every validation. Many of
+them start with the same vectorized work: evaluating an identical condition,
+``pd.to_numeric`` on a field, ``astype(str)`` on a field, null masks. While
+a chunk is being validated the engine activates a ``ChunkCache`` for it and
+these helpers compute each (column, transformation) once; the cache is
+cleared as soon as the chunk is done.
+
+The helpers work on any DataFrame. When the frame is not the active chunk
+(standard engine, condition-filtered subsets, sampled data) they simply
+compute the value, so validations can use them unconditionally.
+
+Cached values are shared between validations and must not be modified in
+place.
+
+Example:
+    >>> with activate_chunk_cache(chunk):
+    ...     for state in validation_states:
+    ...         state.process_chunk(chunk, chunk_idx)
+
+Author: Daniel Edge
+"""
+
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Pattern
+import threading
+
+import pandas as pd
+
+
+_local = threading.local()
+
+
+class ChunkCache:
+    """
+    Memo of derived columns and masks for one chunk.
+
+    Values are keyed by (column, transformation); column is None for values
+    that depend on several columns, such as condition masks.
+    """
+
+    def __init__(self, chunk: Any):
+        """
+        Initialize the cache.
+
+        Args:
+            chunk: The chunk whose derived values are cached
+        """
+        self.chunk = chunk
+        self._values: Dict[Any, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, column: Optional[str], transformation: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return a cached value, computing it on first use.
+
+        Args:
+            column: Column the value is derived from (None if several)
+            transformation: Name of the transformation (e.g. "to_numeric")
+            compute: Callable producing the value
+
+        Returns:
+            The cached or newly computed value
+        """
+        key = (column, transformation)
+        try:
+            value = self._values[key]
+        except KeyError:
+            self.misses += 1
+            value = self._values[key] = compute()
+        else:
+            self.hits += 1
+        return value
+
+    def clear(self) -> None:
+        """Drop the chunk and every cached value."""
+        self._values.clear()
+        self.chunk = None
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+@contextmanager
+def activate_chunk_cache(chunk: Any) -> Iterator[ChunkCache]:
+    """
+    Share derived values between validations while a chunk is validated.
+
+    Args:
+        chunk: Chunk about to be handed to every validation
+
+    Yields:
+        The active ChunkCache; it is cleared on exit
+    """
+    cache = ChunkCache(chunk)
+    previous = getattr(_local, "cache", None)
+    _local.cache = cache
+    try:
+        yield cache
+    finally:
+        _local.cache = previous
+        cache.clear()
+
+
+def get_chunk_cache(df: Any) -> Optional[ChunkCache]:
+    """
+    Return the active cache if ``df`` is the chunk it was activated for.
+
+    Args:
+        df: DataFrame a validation is working on
+
+    Returns:
+        ChunkCache, or None when ``df`` is not the active chunk
+    """
+    cache = getattr(_local, "cache", None)
+    if cache is not None and cache.chunk is df:
+        return cache
+    return None
+
+
+def cached(df: Any, column: Optional[str], transformation: Hashable, compute: Callable[[], Any]) -> Any:
+    """
+    Compute a derived value once per chunk.
+
+    Args:
+        df: DataFrame the value is derived from
+        column: Column the value is derived from (None if several)
+        transformation: Name of the transformation
+        compute: Callable producing the value
+
+    Returns:
+        The value, shared with other validations when ``df`` is the active chunk
+    """
+    cache = get_chunk_cache(df)
+    if cache is None:
+        return compute()
+    return cache.get(column, transformation, compute)
+
+
+def to_numeric(df: pd.DataFrame, column: str) -> pd.Series:
+    """``pd.to_numeric(df[column], errors='coerce')``, computed once per chunk."""
+    return cached(df, column, "to_numeric", lambda: pd.to_numeric(df[column], errors="coerce"))
+
+
+def as_strings(df: pd.DataFrame, column: str) -> pd.Series:
+    """``df[column].astype(str)``, computed once per chunk."""
+    return cached(df, column, "astype(str)", lambda: df[column].astype(str))
+
+
+def string_lengths(df: pd.DataFrame, column: str) -> pd.Series:
+    """``df[column].astype(str).str.len()``, computed once per chunk."""
+    return cached(df, column, "str.len", lambda: as_strings(df, column).str.len())
+
+
+def null_mask(df: pd.DataFrame, column: str) -> pd.Series:
+    """``df[column].isna()``, computed once per chunk."""
+    return cached(df, column, "isna", lambda: df[column].isna())
+
+
+def blank_mask(df: pd.DataFrame, column: str) -> pd.Series:
+    """``df[column].astype(str).str.strip() == ''``, computed once per chunk."""
+    return cached(df, column, "blank", lambda: as_strings(df, column).str.strip() == "")
+
+
+def regex_mask(df: pd.DataFrame, column: str, regex: Pattern, search: bool = False) -> pd.Series:
+    """
+    Whether each value of ``df[column].astype(str)`` matches ``regex``.
+
+    Uses Python ``re`` semantics (``regex.match``, or ``regex.search`` when
+    ``search`` is True) vectorized by pandas, computed once per chunk.
+    """
+    method = "search" if search else "match"
+
+    def compute() -> pd.Series:
+        values = as_strings(df, column)
+        return values.str.contains(regex) if search else values.str.match(regex)
+
+    return cached(df, column, (f"regex.{method}", regex.pattern, regex.flags), compute)
+
+
+def condition_mask(df: Any, condition: str, compute: Callable[[], Any]) -> Any:
+    """Boolean mask of a condition expression, evaluated once per chunk."""
+    return cached(df, None, ("condition", condition), compute)
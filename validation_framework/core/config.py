@@ -19,6 +19,8 @@ from validation_framework.core.constants import (
     DEFAULT_CHUNK_SIZE,
     MAX_SAMPLE_FAILURES
 )
+from validation_framework.core.append_checkpoint import DEFAULT_CHECKPOINT_DIR
+from validation_framework.core.reference_index import DEFAULT_REFERENCE_INDEX_DIR
 from validation_framework.utils.path_patterns import PathPatternExpander
 
 
@@ -214,7 +216,17 @@ class ValidationConfig:
                      self.raw_config.get("settings", {}))))
         self.chunk_size = processing.get("chunk_size", DEFAULT_CHUNK_SIZE)
         self.parallel_files = processing.get("parallel_files", False)
+        self.workers = processing.get("workers", 1)
+        self.csv_parse_workers = processing.get("csv_parse_workers", 1)
+        self.prefetch_depth = processing.get("prefetch_depth", 2)
+        self.prefetch_mode = processing.get("prefetch_mode", "thread")
+        self.polars_rules = processing.get("polars_rules", False)
+        self.parquet_statistics = processing.get("parquet_statistics", True)
+        self.result_cache = processing.get("result_cache", False)
+        self.checkpoint_dir = processing.get("checkpoint_dir", DEFAULT_CHECKPOINT_DIR)
+        self.checkpoint_interval = processing.get("checkpoint_interval")
         self.max_sample_failures = processing.get("max_sample_failures", MAX_SAMPLE_FAILURES)
+        self.reference_index_dir = processing.get("reference_index_dir", DEFAULT_REFERENCE_INDEX_DIR)
 
     def _parse_files(self, files_config: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -277,6 +289,9 @@ class ValidationConfig:
                     "delimiter": file_config.get("delimiter", ","),
                     "encoding": file_config.get("encoding", "utf-8"),
                     "header": file_config.get("header", 0),
+                    "engine": file_config.get("engine"),
+                    "record_path": file_config.get("record_path"),
+                    "append_only": file_config.get("append_only", False),
                 })
 
             parsed_files.append(parsed_file)
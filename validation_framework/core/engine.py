@@ -11,6 +11,7 @@ The engine:
 
 import time
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 import logging
@@ -23,7 +24,13 @@ from validation_framework.core.results import (
     Status,
 )
 from validation_framework.loaders.factory import LoaderFactory
+from validation_framework.loaders.prefetch_loader import PrefetchLoader, with_prefetch
+from validation_framework.core.projection import resolve_required_columns
+from validation_framework.core.rule_query import answer_rule_validations
+from validation_framework.core.parquet_statistics import answer_statistics_validations
+from validation_framework.core.result_cache import ResultCache
 from validation_framework.core.logging_config import get_logger
+from validation_framework.core.parallel_executor import ParallelFileScheduler, resolve_file_workers
 
 # Import to trigger registration of built-in validations
 import validation_framework.validations.builtin.registry  # noqa
@@ -54,7 +61,8 @@ class ValidationEngine:
     def __init__(
         self,
         config: ValidationConfig,
-        observers: Optional[List['EngineObserver']] = None
+        observers: Optional[List['EngineObserver']] = None,
+        file_workers: Optional[int] = None
     ) -> None:
         """
         Initialize the validation engine.
@@ -64,10 +72,17 @@ class ValidationEngine:
             observers: Optional list of observers to receive engine events.
                       If None, creates a default CLIProgressObserver for
                       backwards compatibility.
+            file_workers: Worker processes for validating files concurrently
+                         (default: from processing.parallel_files, normally 1)
         """
         self.config: ValidationConfig = config
         self.registry: ValidationRegistry = get_registry()
         self.observers: List['EngineObserver'] = observers if observers is not None else []
+        self.file_workers = (
+            file_workers if file_workers is not None
+            else resolve_file_workers(config.parallel_files)
+        )
+        self._result_cache: Optional[ResultCache] = None
 
     @classmethod
     def from_config(cls, config_path: str) -> "ValidationEngine":
@@ -179,6 +194,10 @@ class ValidationEngine:
         )
         logger.debug("Validation report initialized")
 
+        # Validate files concurrently when configured; reports (and observer
+        # events) still arrive in configuration order
+        parallel_reports = self._parallel_file_reports()
+
         # Process each file
         for file_idx, file_config in enumerate(self.config.files, 1):
             logger.info(f"Processing file {file_idx}/{len(self.config.files)}: {file_config['name']}")
@@ -192,7 +211,10 @@ class ValidationEngine:
             )
 
             # Validate the file
-            file_report = self._validate_file(file_config, verbose)
+            if parallel_reports is not None:
+                _, file_report = next(parallel_reports)
+            else:
+                file_report = self._process_file(file_config, verbose)
             logger.info(f"File validation completed: {file_config['name']} - Status: {file_report.status.value}")
 
             # Add to overall report
@@ -213,6 +235,64 @@ class ValidationEngine:
 
         return report
 
+    def _parallel_file_reports(self):
+        """
+        Start concurrent file validation if more than one file worker is set.
+
+        Returns:
+            Iterator of (file_config, FileValidationReport) in configuration
+            order, or None to validate files serially
+        """
+        if self.file_workers <= 1 or len(self.config.files) <= 1:
+            return None
+
+        engine_factory = partial(type(self), self.config, observers=[], file_workers=1)
+        scheduler = ParallelFileScheduler(
+            engine_factory,
+            self.config.files,
+            workers=min(self.file_workers, len(self.config.files)),
+            chunk_size=self.config.chunk_size,
+        )
+        return scheduler.run()
+
+    def _process_file(self, file_config: Dict[str, Any], verbose: bool) -> FileValidationReport:
+        """
+        Validate a single file (entry point used by file worker processes).
+
+        Args:
+            file_config: File configuration dictionary
+            verbose: Whether to print progress
+
+        Returns:
+            FileValidationReport with all validation results for this file
+        """
+        result_cache = self._get_result_cache()
+        if result_cache is None:
+            return self._validate_file(file_config, verbose)
+
+        # Reuse results of unchanged (file, validation) pairs; run the rest
+        file_report = result_cache.validate_file(
+            file_config, self.registry, self._cache_scope(),
+            lambda config: self._validate_file(config, verbose),
+        )
+        if verbose and file_report.metadata["result_cache"]["hits"]:
+            po.info(f"{file_report.metadata['result_cache']['hits']} result(s) reused from the result cache", indent=2)
+        return file_report
+
+    def _get_result_cache(self) -> Optional[ResultCache]:
+        """Open the cache configured in processing.result_cache (None if disabled)."""
+        if self._result_cache is None:
+            self._result_cache = ResultCache.from_config(self.config.result_cache)
+        return self._result_cache
+
+    def _cache_scope(self) -> Dict[str, Any]:
+        """Engine settings that are part of every result cache key."""
+        return {
+            "engine": type(self).__name__,
+            "chunk_size": self.config.chunk_size,
+            "max_sample_failures": self.config.max_sample_failures,
+        }
+
     def _validate_file(self, file_config: Dict[str, Any], verbose: bool) -> FileValidationReport:
         """
         Validate a single file.
@@ -235,6 +315,20 @@ class ValidationEngine:
         )
 
         try:
+            # Rule-style validations are answered by one compiled Polars query
+            # (opt-in: the query is an extra scan of the file)
+            compiled_results = (
+                answer_rule_validations(file_config, self.registry, self.config.max_sample_failures)
+                if self.config.polars_rules else {}
+            )
+
+            # Checks settled by Parquet footer statistics read no (or only some) row groups
+            if self.config.parquet_statistics:
+                compiled_results.update(answer_statistics_validations(
+                    file_config, self.registry, self.config.chunk_size,
+                    self.config.max_sample_failures, skip=compiled_results
+                ))
+
             # Create data loader (file or database)
             if file_config["format"] == "database":
                 # Database source
@@ -249,6 +343,11 @@ class ValidationEngine:
                 )
             else:
                 # File source
+                # Only parse the columns the validations need
+                columns = resolve_required_columns(
+                    [v for idx, v in enumerate(file_config.get("validations", [])) if idx not in compiled_results],
+                    self.registry,
+                )
                 loader = LoaderFactory.create_loader(
                     file_path=file_config["path"],
                     file_format=file_config["format"],
@@ -257,19 +356,28 @@ class ValidationEngine:
                     encoding=file_config.get("encoding"),
                     header=file_config.get("header"),
                     sheet_name=file_config.get("sheet_name"),
+                    columns=columns,
+                    parse_workers=self.config.csv_parse_workers,
+                    engine=file_config.get("engine"),
+                    record_path=file_config.get("record_path"),
                 )
 
             # Get file metadata (or database metadata)
             metadata = loader.get_metadata()
             file_report.metadata = metadata
 
+            # Decode upcoming chunks in the background while validations run
+            loader = with_prefetch(loader, self.config.prefetch_depth, self.config.prefetch_mode)
+
             # Build validation context
             context = {
                 "file_path": file_config["path"],
                 "file_name": file_config["name"],
                 "file_format": file_config["format"],
                 "file_config": file_config,  # Include full file config for validations that need it
+                "chunk_size": self.config.chunk_size,
                 "max_sample_failures": self.config.max_sample_failures,
+                "reference_index_dir": self.config.reference_index_dir,
                 **metadata,
             }
 
@@ -289,25 +397,34 @@ class ValidationEngine:
                     print(f"  {po.DIM}[{val_idx}/{len(validations)}]{po.RESET} {validation_type}...", end=" ", flush=True)
 
                 try:
-                    # Get validation class from registry
-                    validation_class = self.registry.get(validation_type)
-
-                    # Instantiate validation
-                    validation = validation_class(
-                        name=validation_type,
-                        severity=validation_config["severity"],
-                        params=validation_config.get("params", {}),
-                        condition=validation_config.get("condition"),
-                    )
-
-                    # Execute validation
-                    exec_start = time.time()
-
-                    # Create fresh data iterator for this validation
-                    data_iterator = loader.load()
-
-                    result = validation.validate(data_iterator, context)
-                    result.execution_time = time.time() - exec_start
+                    if val_idx - 1 in compiled_results:
+                        # Already answered by the compiled rule query or Parquet statistics
+                        result = compiled_results[val_idx - 1]
+                    else:
+                        # Get validation class from registry
+                        validation_class = self.registry.get(validation_type)
+
+                        # Instantiate validation
+                        validation = validation_class(
+                            name=validation_type,
+                            severity=validation_config["severity"],
+                            params=validation_config.get("params", {}),
+                            condition=validation_config.get("condition"),
+                        )
+
+                        # Execute validation
+                        exec_start = time.time()
+
+                        # Create fresh data iterator for this validation
+                        data_iterator = loader.load()
+
+                        try:
+                            result = validation.validate(data_iterator, context)
+                        finally:
+                            # Stop background prefetching if the validation returned early
+                            if hasattr(data_iterator, "close"):
+                                data_iterator.close()
+                        result.execution_time = time.time() - exec_start
 
                     # Add result to report
                     file_report.add_result(result)
@@ -351,6 +468,10 @@ class ValidationEngine:
                     )
                     file_report.add_result(error_result)
 
+            if isinstance(loader, PrefetchLoader):
+                file_report.metadata["prefetch"] = loader.stats.to_dict()
+                logger.info(f"Prefetch statistics for {file_config['name']}: {file_report.metadata['prefetch']}")
+
         except FileNotFoundError:
             if verbose:
                 po.error("File not found!", indent=2)
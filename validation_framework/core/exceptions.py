@@ -468,6 +468,33 @@ class ColumnNotFoundError(ValidationExecutionError):
         })
 
 
+class ExpressionCompileError(DataK9Exception):
+    """
+    Condition or rule expression cannot be compiled.
+
+    Raised by the expression compiler for unsupported syntax or unknown
+    columns. Callers fall back to evaluating the expression with pandas.
+
+    Example:
+        >>> raise ExpressionCompileError("age >> 2", "unsupported operator 'RShift'")
+    """
+
+    def __init__(self, expression: str, reason: str):
+        """
+        Initialize expression compile error.
+
+        Args:
+            expression: Expression that failed to compile
+            reason: Why it could not be compiled
+        """
+        super().__init__(
+            f"Cannot compile expression '{expression}': {reason}",
+            details={'expression': expression, 'reason': reason}
+        )
+        self.expression = expression
+        self.reason = reason
+
+
 # ============================================================================
 # Database Errors
 # ============================================================================
@@ -0,0 +1,432 @@
+"""
+Compiler from DataK9 condition/rule expressions to Polars expressions.
+
+Conditions and InlineBusinessRuleCheck rules are written in a SQL-like
+syntax that also accepts pandas operators:
+
+    age >= 18 AND status == 'ACTIVE'
+    (amount >= 0 & amount <= 1000000) | override == True
+    country IN ('US', 'UK') AND NOT email IS NULL
+    `first name`.str.len() > 1
+
+The expression is parsed with Python's ``ast`` module (after translating
+the SQL keywords) and turned into a boolean ``pl.Expr``. Nothing is ever
+passed to ``eval``.
+
+Null handling follows pandas: comparisons against a missing value are
+False, except ``!=`` which is True. The final mask never contains nulls.
+
+Author: Daniel Edge
+"""
+
+import ast
+import io
+import keyword
+import re
+import tokenize
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional, Set, Tuple
+
+from validation_framework.core.backend import HAS_POLARS
+from validation_framework.core.exceptions import ExpressionCompileError
+
+if HAS_POLARS:
+    import polars as pl
+
+
+# SQL keywords and their Python equivalents
+_SQL_KEYWORDS = {
+    "AND": "and",
+    "OR": "or",
+    "NOT": "not",
+    "IN": "in",
+    "IS": "is",
+    "NULL": "None",
+    "null": "None",
+    "TRUE": "True",
+    "FALSE": "False",
+}
+
+# pandas/SQL operators and their Python equivalents. '&' and '|' become
+# 'and'/'or' so they bind looser than comparisons, as in pandas.eval.
+_OPERATORS = {"&": "and", "|": "or", "~": "not", "=": "=="}
+
+_BACKTICK_NAME = re.compile(r"`([^`]+)`")
+_PLACEHOLDER = "__datak9_col_{}__"
+
+# Values resolved at evaluation time when no column has the same name
+_DATE_NAMES = ("today", "now")
+
+_COMPARISONS = {
+    ast.Eq: "__eq__",
+    ast.NotEq: "__ne__",
+    ast.Lt: "__lt__",
+    ast.LtE: "__le__",
+    ast.Gt: "__gt__",
+    ast.GtE: "__ge__",
+}
+
+_ARITHMETIC = {
+    ast.Add: "__add__",
+    ast.Sub: "__sub__",
+    ast.Mult: "__mul__",
+    ast.Div: "__truediv__",
+    ast.FloorDiv: "__floordiv__",
+    ast.Mod: "__mod__",
+    ast.Pow: "__pow__",
+}
+
+# Series methods supported in expressions: name -> (builder, argument count)
+_METHODS = {
+    "isnull": (lambda e: e.is_null(), 0),
+    "isna": (lambda e: e.is_null(), 0),
+    "notnull": (lambda e: e.is_not_null(), 0),
+    "notna": (lambda e: e.is_not_null(), 0),
+    "abs": (lambda e: e.abs(), 0),
+}
+
+_STRING_METHODS = {
+    "len": (lambda e: e.str.len_chars(), 0),
+    "lower": (lambda e: e.str.to_lowercase(), 0),
+    "upper": (lambda e: e.str.to_uppercase(), 0),
+    "strip": (lambda e: e.str.strip_chars(), 0),
+    "contains": (lambda e, pattern: e.str.contains(pattern), 1),
+    "startswith": (lambda e, prefix: e.str.starts_with(prefix), 1),
+    "endswith": (lambda e, suffix: e.str.ends_with(suffix), 1),
+}
+
+
+# Quoted strings are removed before looking for column names in expressions
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_IDENTIFIER = re.compile(r"(?<![\w.])[A-Za-z_][A-Za-z0-9_]*")
+
+# Words in condition/rule expressions that are never column names
+_EXPRESSION_WORDS = {"AND", "OR", "NOT", "IN", "IS", "NULL", "TRUE", "FALSE", "NONE"}
+
+
+def expression_columns(expression: Optional[str]) -> Set[str]:
+    """
+    Find the column names referenced by a condition or rule expression.
+
+    Identifiers that are not columns (function names, ``today``) may be
+    returned too; callers intersect the result with the file's columns.
+
+    Args:
+        expression: Expression such as "age >= 18 AND status == 'ACTIVE'"
+
+    Returns:
+        Set of referenced column names
+    """
+    if not expression:
+        return set()
+
+    text = _STRING_LITERAL.sub(" ", str(expression))
+    columns = set(_BACKTICK_NAME.findall(text))
+    text = _BACKTICK_NAME.sub(" ", text)
+
+    for name in _IDENTIFIER.findall(text):
+        if keyword.iskeyword(name) or name.upper() in _EXPRESSION_WORDS:
+            continue
+        columns.add(name)
+    return columns
+
+
+def normalize_expression(expression: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Translate a SQL-like/pandas expression into Python expression syntax.
+
+    Args:
+        expression: Condition or rule expression
+
+    Returns:
+        Tuple of (python_source, placeholders) where placeholders maps the
+        identifiers standing in for backticked column names to the names
+
+    Raises:
+        ExpressionCompileError: If the expression cannot be tokenized
+    """
+    placeholders: Dict[str, str] = {}
+
+    def replace_backtick(match: "re.Match") -> str:
+        placeholder = _PLACEHOLDER.format(len(placeholders))
+        placeholders[placeholder] = match.group(1)
+        return placeholder
+
+    text = _BACKTICK_NAME.sub(replace_backtick, expression.strip())
+
+    parts = []
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(text).readline):
+            if token.type in (tokenize.NEWLINE, tokenize.NL, tokenize.ENDMARKER,
+                              tokenize.INDENT, tokenize.DEDENT, tokenize.COMMENT):
+                continue
+            if token.type == tokenize.NAME and token.string in _SQL_KEYWORDS:
+                parts.append(_SQL_KEYWORDS[token.string])
+            elif token.type == tokenize.OP and token.string in _OPERATORS:
+                parts.append(_OPERATORS[token.string])
+            else:
+                parts.append(token.string)
+    except (tokenize.TokenError, IndentationError, SyntaxError) as e:
+        raise ExpressionCompileError(expression, f"cannot tokenize expression: {e}") from e
+
+    return " ".join(parts), placeholders
+
+
+def compile_expression(expression: str, schema: Optional[Mapping[str, Any]] = None) -> "pl.Expr":
+    """
+    Compile a condition or rule expression into a boolean Polars expression.
+
+    Args:
+        expression: Condition or rule expression
+        schema: Optional mapping of column name to Polars dtype. When given,
+                unknown names are rejected and string columns compared with
+                ``today``/``now`` are parsed as dates.
+
+    Returns:
+        Boolean pl.Expr without nulls (True where the expression holds)
+
+    Raises:
+        ExpressionCompileError: If the expression uses unsupported syntax,
+                                unknown columns, or Polars is not installed
+    """
+    if not HAS_POLARS:
+        raise ExpressionCompileError(expression, "Polars is not installed")
+    if not expression or not str(expression).strip():
+        raise ExpressionCompileError(str(expression), "expression is empty")
+
+    tree, placeholders = _parse(str(expression))
+    builder = _PolarsExpressionBuilder(str(expression), placeholders, dict(schema) if schema is not None else None)
+    return builder.as_boolean(builder.visit(tree.body)).fill_null(False)
+
+
+@lru_cache(maxsize=256)
+def _parse(expression: str) -> Tuple[ast.Expression, Dict[str, str]]:
+    """Parse an expression once; the same condition is compiled for every chunk."""
+    source, placeholders = normalize_expression(expression)
+    try:
+        tree = ast.parse(source, mode="eval")
+    except SyntaxError as e:
+        raise ExpressionCompileError(expression, f"invalid syntax: {e.msg}") from e
+    return tree, placeholders
+
+
+class _Operand:
+    """A compiled sub-expression and what kind of value it is."""
+
+    __slots__ = ("expr", "kind", "value", "column")
+
+    def __init__(self, expr: Any, kind: str, value: Any = None, column: Optional[str] = None):
+        self.expr = expr
+        self.kind = kind        # 'column', 'literal', 'date', 'datetime', 'predicate', 'value'
+        self.value = value      # Python value for literals
+        self.column = column    # Column name for 'column' operands
+
+
+class _PolarsExpressionBuilder:
+    """Walks a Python AST and builds the equivalent Polars expression."""
+
+    def __init__(self, expression: str, placeholders: Dict[str, str], schema: Optional[Dict[str, Any]]):
+        self.expression = expression
+        self.placeholders = placeholders
+        self.schema = schema
+
+    def error(self, reason: str) -> ExpressionCompileError:
+        return ExpressionCompileError(self.expression, reason)
+
+    def visit(self, node: ast.AST) -> _Operand:
+        method = getattr(self, f"visit_{type(node).__name__}", None)
+        if method is None:
+            raise self.error(f"unsupported syntax '{type(node).__name__}'")
+        return method(node)
+
+    def as_boolean(self, operand: _Operand) -> "pl.Expr":
+        """Use an operand as a predicate (bare boolean columns are allowed)."""
+        if operand.kind == "literal":
+            return pl.lit(bool(operand.value))
+        return operand.expr
+
+    # --- Leaves -----------------------------------------------------------
+
+    def visit_Name(self, node: ast.Name) -> _Operand:
+        name = self.placeholders.get(node.id, node.id)
+        if self.schema is not None and name not in self.schema:
+            if name == "today":
+                return _Operand(pl.lit(date.today()), "date")
+            if name == "now":
+                return _Operand(pl.lit(datetime.now()), "datetime")
+            raise self.error(f"unknown column '{name}'")
+        if self.schema is None and name in _DATE_NAMES:
+            return _Operand(pl.lit(date.today() if name == "today" else datetime.now()),
+                            "date" if name == "today" else "datetime")
+        return _Operand(pl.col(name), "column", column=name)
+
+    def visit_Constant(self, node: ast.Constant) -> _Operand:
+        if not isinstance(node.value, (str, int, float, bool)) and node.value is not None:
+            raise self.error(f"unsupported literal {node.value!r}")
+        return _Operand(pl.lit(node.value), "literal", value=node.value)
+
+    # --- Boolean logic ----------------------------------------------------
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> _Operand:
+        exprs = [self.as_boolean(self.visit(value)).fill_null(False) for value in node.values]
+        combined = exprs[0]
+        for expr in exprs[1:]:
+            combined = combined & expr if isinstance(node.op, ast.And) else combined | expr
+        return _Operand(combined, "predicate")
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> _Operand:
+        operand = self.visit(node.operand)
+        if isinstance(node.op, ast.Not):
+            return _Operand(~self.as_boolean(operand).fill_null(False), "predicate")
+        if isinstance(node.op, ast.USub):
+            if operand.kind == "literal":
+                return _Operand(pl.lit(-operand.value), "literal", value=-operand.value)
+            return _Operand(-operand.expr, "value")
+        if isinstance(node.op, ast.UAdd):
+            return operand
+        raise self.error("unsupported unary operator")
+
+    # --- Comparisons ------------------------------------------------------
+
+    def visit_Compare(self, node: ast.Compare) -> _Operand:
+        left = self.visit(node.left)
+        parts = []
+        for op, comparator in zip(node.ops, node.comparators):
+            parts.append(self._compare(left, op, comparator))
+            if not isinstance(op, (ast.In, ast.NotIn)):
+                left = self.visit(comparator)
+
+        combined = parts[0]
+        for part in parts[1:]:
+            combined = combined & part
+        return _Operand(combined, "predicate")
+
+    def _compare(self, left: _Operand, op: ast.cmpop, comparator: ast.AST) -> "pl.Expr":
+        if isinstance(op, (ast.In, ast.NotIn)):
+            values = self._literal_values(comparator)
+            expr = left.expr.is_in(values).fill_null(False)
+            return ~expr if isinstance(op, ast.NotIn) else expr
+
+        right = self.visit(comparator)
+
+        if isinstance(op, (ast.Is, ast.IsNot)):
+            if right.kind != "literal" or right.value is not None:
+                raise self.error("'IS' can only be used with NULL")
+            return left.expr.is_null() if isinstance(op, ast.Is) else left.expr.is_not_null()
+
+        method = _COMPARISONS.get(type(op))
+        if method is None:
+            raise self.error(f"unsupported comparison '{type(op).__name__}'")
+
+        left_expr, right_expr = self._coerce_dates(left, right)
+        result = getattr(left_expr, method)(right_expr)
+        # pandas semantics: comparisons with a missing value are False, except '!='
+        return result.fill_null(isinstance(op, ast.NotEq))
+
+    def _coerce_dates(self, left: _Operand, right: _Operand) -> Tuple["pl.Expr", "pl.Expr"]:
+        """Parse string columns compared with today/now as dates."""
+        if left.kind in ("date", "datetime") and right.kind not in ("date", "datetime"):
+            return left.expr, self._as_temporal(right, left.kind)
+        if right.kind in ("date", "datetime") and left.kind not in ("date", "datetime"):
+            return self._as_temporal(left, right.kind), right.expr
+        return left.expr, right.expr
+
+    def _as_temporal(self, operand: _Operand, kind: str) -> "pl.Expr":
+        dtype = self.schema.get(operand.column) if (self.schema and operand.column) else None
+        if dtype is not None and dtype == pl.Date:
+            return operand.expr if kind == "date" else operand.expr.cast(pl.Datetime)
+        if dtype is not None and isinstance(dtype, pl.Datetime):
+            return operand.expr.dt.date() if kind == "date" else operand.expr
+        parsed = operand.expr.cast(pl.Utf8).str.to_datetime(strict=False)
+        return parsed.dt.date() if kind == "date" else parsed
+
+    def _literal_values(self, node: ast.AST) -> list:
+        if isinstance(node, ast.Constant):
+            # SQL "IN ('A')" parses as a parenthesised single value
+            return [self.visit(node).value]
+        if not isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+            raise self.error("'IN' needs a list of values")
+        values = []
+        for element in node.elts:
+            operand = self.visit(element)
+            if operand.kind != "literal":
+                raise self.error("'IN' lists may only contain literal values")
+            values.append(operand.value)
+        return values
+
+    # --- Arithmetic and functions ------------------------------------------
+
+    def visit_BinOp(self, node: ast.BinOp) -> _Operand:
+        method = _ARITHMETIC.get(type(node.op))
+        if method is None:
+            raise self.error(f"unsupported operator '{type(node.op).__name__}'")
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        return _Operand(getattr(left.expr, method)(right.expr), "value")
+
+    def visit_Call(self, node: ast.Call) -> _Operand:
+        if node.keywords:
+            raise self.error("keyword arguments are not supported")
+
+        # abs(x)
+        if isinstance(node.func, ast.Name) and node.func.id == "abs" and len(node.args) == 1:
+            return _Operand(self.visit(node.args[0]).expr.abs(), "value")
+
+        if not isinstance(node.func, ast.Attribute):
+            raise self.error("only Series methods can be called")
+
+        method_name = node.func.attr
+        target = node.func.value
+
+        # x.str.method(...)
+        if isinstance(target, ast.Attribute) and target.attr == "str":
+            builder, arg_count = _STRING_METHODS.get(method_name, (None, None))
+            base = self.visit(target.value)
+        else:
+            builder, arg_count = _METHODS.get(method_name, (None, None))
+            base = self.visit(target)
+            if method_name == "isin" and len(node.args) == 1:
+                return _Operand(base.expr.is_in(self._literal_values(node.args[0])).fill_null(False), "predicate")
+
+        if builder is None or len(node.args) != arg_count:
+            raise self.error(f"unsupported method '{method_name}'")
+
+        args = []
+        for arg in node.args:
+            operand = self.visit(arg)
+            if operand.kind != "literal":
+                raise self.error(f"arguments of '{method_name}' must be literals")
+            args.append(operand.value)
+
+        kind = "predicate" if method_name in ("isnull", "isna", "notnull", "notna") else "value"
+        return _Operand(builder(base.expr, *args), kind)
+
+
+def evaluate_expression(df: Any, expression: str) -> Any:
+    """
+    Evaluate an expression against a pandas or Polars DataFrame.
+
+    Only the referenced columns of a pandas DataFrame are converted to Polars.
+
+    Args:
+        df: pandas or Polars DataFrame
+        expression: Condition or rule expression
+
+    Returns:
+        Boolean numpy array (one entry per row)
+
+    Raises:
+        ExpressionCompileError: If the expression cannot be compiled
+    """
+    if not HAS_POLARS:
+        raise ExpressionCompileError(expression, "Polars is not installed")
+
+    if isinstance(df, pl.DataFrame):
+        frame = df
+    else:
+        referenced = [col for col in df.columns if col in expression_columns(expression)]
+        frame = pl.from_pandas(df[referenced]) if referenced else pl.DataFrame({"__rows__": range(len(df))})
+
+    compiled = compile_expression(expression, frame.schema)
+    return frame.select(compiled.alias("__mask__")).to_series().to_numpy()
@@ -6,6 +6,10 @@ without running out of memory. When the in-memory limit is reached, keys are
 spilled to a SQLite database on disk.
 
 This enables validation of 200GB+ files while keeping memory usage under control.
+
+Vectorized callers should use the batch API (add_many, contains_many,
+add_and_check_many): after spillover a batch is resolved with one indexed
+join against a staged temporary table rather than one query per key.
 """
 
 import sqlite3
@@ -13,9 +17,14 @@ import tempfile
 import os
 import logging
 import hashlib
-from typing import Any, Optional, Tuple, Dict
+import shutil
+import uuid
+from typing import Any, Optional, Tuple, Dict, Iterator, Iterable, List
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
@@ -69,6 +78,8 @@ class MemoryBoundedTracker:
         self.db_path = db_path
         self.db_conn: Optional[sqlite3.Connection] = None
         self.is_spilled = False
+        # Name of this tracker's database copy in run checkpoints (set when first saved)
+        self._spill_id: Optional[str] = None
 
         # Statistics
         self.total_keys_added = 0
@@ -321,6 +332,188 @@ class MemoryBoundedTracker:
         was_added = False if was_seen else self.add(key)
         return was_seen, was_added
 
+    # ------------------------------------------------------------------
+    # Batch API
+    # ------------------------------------------------------------------
+
+    def contains_many(self, keys: Iterable[Any]) -> np.ndarray:
+        """
+        Check a batch of keys in one pass.
+
+        In memory this is a single set probe per key; after spillover the
+        batch is staged in a temporary table and resolved with one indexed
+        join instead of one SELECT per key.
+
+        Args:
+            keys: Iterable of keys (any hashable Python objects)
+
+        Returns:
+            Boolean array, True where the key was previously added
+
+        Example:
+            >>> tracker.contains_many(["customer_123", "customer_456"])
+            array([ True, False])
+        """
+        keys = list(keys)
+        found = self._lookup_many(keys)
+        self.total_lookups += len(keys)
+        if self.is_spilled:
+            self.disk_hits += int(found.sum())
+        else:
+            self.memory_hits += int(found.sum())
+        return found
+
+    def add_many(self, keys: Iterable[Any]) -> np.ndarray:
+        """
+        Add a batch of keys.
+
+        Equivalent to calling add() for every key in order: a key repeated
+        within the batch is only added at its first position, and lookup
+        statistics are counted the same way.
+
+        Args:
+            keys: Iterable of keys (any hashable Python objects)
+
+        Returns:
+            Boolean array, True where the key was newly added
+        """
+        was_seen, _ = self.add_and_check_many(keys)
+        return ~was_seen
+
+    def add_and_check_many(
+        self,
+        keys: Iterable[Any],
+        candidates: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Check and add a batch of keys.
+
+        Args:
+            keys: Iterable of keys (any hashable Python objects)
+            candidates: Optional boolean mask of keys that may have been seen,
+                        e.g. from a bloom filter. Keys outside the mask are
+                        added without a lookup, so they must be new and must
+                        not repeat within the batch.
+
+        Returns:
+            Tuple of boolean arrays (was_seen_before, was_added), as
+            add_and_check() would return them key by key
+        """
+        keys = list(keys)
+        was_seen = np.zeros(len(keys), dtype=bool)
+        if not keys:
+            return was_seen, was_seen.copy()
+
+        if candidates is None:
+            lookup_keys = keys
+            positions = np.arange(len(keys))
+        else:
+            positions = np.flatnonzero(candidates)
+            lookup_keys = [keys[pos] for pos in positions]
+
+        if lookup_keys:
+            # Repeats within the batch are hits against the batch's first occurrence
+            repeated = pd.Series(lookup_keys, dtype=object).duplicated().to_numpy()
+            found = self._lookup_many(lookup_keys) | repeated
+            was_seen[positions] = found
+
+            self.total_lookups += len(lookup_keys)
+            if self.is_spilled:
+                self.disk_hits += int(found.sum())
+            else:
+                self.memory_hits += int(found.sum())
+
+        new_keys = [key for key, seen in zip(keys, was_seen) if not seen]
+        self._insert_many(new_keys)
+        return was_seen, ~was_seen
+
+    def _lookup_many(self, keys: List[Any]) -> np.ndarray:
+        """Membership of a batch of keys, without touching statistics."""
+        if not self.is_spilled:
+            memory_keys = self.memory_keys
+            return np.fromiter((key in memory_keys for key in keys), dtype=bool, count=len(keys))
+
+        # Stage the batch and resolve it with one indexed join
+        conn = self.db_conn
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS batch_keys (pos INTEGER PRIMARY KEY, key_hash TEXT)")
+        conn.execute("DELETE FROM batch_keys")
+        conn.executemany(
+            "INSERT INTO batch_keys (pos, key_hash) VALUES (?, ?)",
+            ((pos, self._hash_key(key)) for pos, key in enumerate(keys))
+        )
+        found = np.zeros(len(keys), dtype=bool)
+        positions = [pos for (pos,) in conn.execute(
+            "SELECT b.pos FROM batch_keys b JOIN seen_keys s ON s.key_hash = b.key_hash"
+        )]
+        found[positions] = True
+        return found
+
+    def _insert_many(self, keys: List[Any]) -> None:
+        """Store keys known to be new, spilling to disk if the memory limit is reached."""
+        if not keys:
+            return
+
+        self.total_keys_added += len(keys)
+
+        if not self.is_spilled:
+            room = self.max_memory_keys - len(self.memory_keys)
+            self.memory_keys.update(keys[:room])
+            keys = keys[room:]
+            if len(self.memory_keys) < self.max_memory_keys:
+                return
+            self._spill_to_disk()
+
+        if keys:
+            self.db_conn.executemany(
+                "INSERT OR IGNORE INTO seen_keys (key_hash, key_value) VALUES (?, ?)",
+                ((self._hash_key(key), self._serialize_key(key)) for key in keys)
+            )
+            self.db_conn.commit()
+
+    def iter_keys(self) -> Iterator[Any]:
+        """
+        Iterate over every key currently tracked.
+
+        Used when merging partial trackers (e.g. states built from different
+        ranges of the same file). Spilled keys are read back from disk in
+        batches, so memory stays bounded.
+
+        Yields:
+            Tracked keys, in no particular order
+        """
+        if not self.is_spilled:
+            yield from list(self.memory_keys)
+            return
+
+        import pickle
+        self.db_conn.commit()
+        cursor = self.db_conn.execute("SELECT key_value FROM seen_keys")
+        while True:
+            rows = cursor.fetchmany(10000)
+            if not rows:
+                break
+            for (key_value,) in rows:
+                yield pickle.loads(key_value)
+
+    def iter_key_batches(self, batch_size: int = 10_000) -> Iterator[List[Any]]:
+        """
+        Iterate over every tracked key in lists of up to batch_size keys.
+
+        Convenient for feeding contains_many()/add_and_check_many() of
+        another tracker.
+
+        Yields:
+            Lists of tracked keys
+        """
+        batch = []
+        for key in self.iter_keys():
+            batch.append(key)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about tracker usage.
@@ -405,6 +598,90 @@ class MemoryBoundedTracker:
             f"{stats['memory_hit_rate']:.1f}% memory hit rate"
         )
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Support pickling (e.g. returning partial states from worker processes).
+
+        SQLite connections cannot be pickled, so spilled keys are read back
+        and sent as a key list; the receiving tracker spills again if needed.
+        Inside a run checkpoint the keys added since the previous checkpoint
+        are appended to the checkpoint's copy of the database instead, and
+        only its path and row count are pickled.
+        """
+        from validation_framework.core.run_checkpoint import active_spill_files
+
+        state = self.__dict__.copy()
+        state["db_conn"] = None
+        state["db_path"] = None
+
+        spill_files = active_spill_files()
+        if spill_files is not None and self.is_spilled:
+            if self._spill_id is None:
+                self._spill_id = state["_spill_id"] = uuid.uuid4().hex
+            path = spill_files.path(f"{self._spill_id}.db")
+            state["checkpoint_db"] = (path, self._export_new_keys(path))
+            return state
+
+        state["is_spilled"] = False
+        state["memory_keys"] = set(self.iter_keys())
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled tracker, spilling to disk if over the memory limit."""
+        checkpoint_db = state.pop("checkpoint_db", None)
+        self.__dict__.update(state)
+        if checkpoint_db is not None:
+            self._restore_checkpoint_db(*checkpoint_db)
+            return
+        if len(self.memory_keys) >= self.max_memory_keys:
+            self._spill_to_disk()
+
+    def _export_new_keys(self, path: str) -> int:
+        """
+        Append the keys not yet in a checkpoint's copy of the database.
+
+        Rows keep their rowid; keys are only ever inserted, so the copy's
+        highest rowid marks how far it is up to date.
+
+        Args:
+            path: Database copy kept with the checkpoint
+
+        Returns:
+            Highest rowid the checkpoint covers
+        """
+        self.db_conn.commit()
+        self.db_conn.execute("ATTACH DATABASE ? AS checkpoint", (path,))
+        try:
+            self.db_conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoint.seen_keys (key_hash TEXT PRIMARY KEY, key_value BLOB)"
+            )
+            (exported,) = self.db_conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM checkpoint.seen_keys").fetchone()
+            self.db_conn.execute(
+                "INSERT INTO checkpoint.seen_keys (rowid, key_hash, key_value) "
+                "SELECT rowid, key_hash, key_value FROM main.seen_keys WHERE rowid > ?",
+                (exported,)
+            )
+            self.db_conn.commit()
+        finally:
+            self.db_conn.execute("DETACH DATABASE checkpoint")
+        (last_row,) = self.db_conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM seen_keys").fetchone()
+        return last_row
+
+    def _restore_checkpoint_db(self, path: str, last_row: int) -> None:
+        """Continue from a checkpoint's copy of the database, up to its row count."""
+        # Rows appended after the checkpoint was written belong to no checkpoint
+        conn = sqlite3.connect(path)
+        try:
+            conn.execute("DELETE FROM seen_keys WHERE rowid > ?", (last_row,))
+            conn.commit()
+        finally:
+            conn.close()
+
+        fd, self.db_path = tempfile.mkstemp(suffix='.db', prefix='tracker_')
+        os.close(fd)
+        shutil.copyfile(path, self.db_path)
+        self._init_database()
+
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -17,6 +17,7 @@ Example: 15 validations × 273 chunks = 4,095 file read operations
 
 import time
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple, Iterator
 import logging
@@ -33,7 +34,23 @@ from validation_framework.core.results import (
     Severity,
 )
 from validation_framework.loaders.factory import LoaderFactory
+from validation_framework.loaders.prefetch_loader import PrefetchLoader, with_prefetch
+from validation_framework.core.projection import resolve_required_columns
+from validation_framework.core.chunk_cache import activate_chunk_cache
+from validation_framework.core.rule_query import answer_rule_validations
+from validation_framework.core.parquet_statistics import answer_statistics_validations
+from validation_framework.core.result_cache import READ_OPTIONS, ResultCache, config_hash, is_error_result
+from validation_framework.core.append_checkpoint import AppendCheckpoint, AppendCheckpointStore
+from validation_framework.core.run_checkpoint import (
+    DEFAULT_CHECKPOINT_INTERVAL, ResumeRead, RunCheckpointer, resume_read,
+)
+from validation_framework.core.exceptions import DataLoadError
 from validation_framework.core.logging_config import get_logger
+from validation_framework.core.parallel_executor import (
+    ParallelChunkExecutor,
+    ParallelFileScheduler,
+    resolve_file_workers,
+)
 
 # Import to trigger registration of built-in validations
 import validation_framework.validations.builtin.registry  # noqa
@@ -111,12 +128,48 @@ class ReservoirSampler:
         return df
 
 
+def _skip_rows(chunks: Iterator[pd.DataFrame], first_row: int, rows: int, file_path: str) -> Iterator[pd.DataFrame]:
+    """
+    Drop the rows a checkpoint already covers from chunks read from ``first_row`` on.
+
+    Chunks are labelled with the file position of their rows.
+
+    Raises:
+        DataLoadError: If the file ends before the checkpointed rows
+    """
+    position = first_row
+    for chunk in chunks:
+        if position < rows:
+            skipped = min(rows - position, len(chunk))
+            position += skipped
+            chunk = chunk.iloc[skipped:]
+            if chunk.empty:
+                continue
+        chunk.index = pd.RangeIndex(position, position + len(chunk))
+        position += len(chunk)
+        yield chunk
+    if position < rows:
+        raise DataLoadError(
+            f"File changed since the checkpoint: expected at least {rows:,} rows, read {position:,}",
+            file_path=file_path,
+        )
+
+
+def _offset_chunks(chunks: Iterator[pd.DataFrame], offset: int) -> Iterator[pd.DataFrame]:
+    """Shift chunk row labels so rows read after a checkpoint keep their file position."""
+    for chunk in chunks:
+        chunk.index = chunk.index + offset
+        yield chunk
+
+
 class SinglePassValidationState:
     """
     Holds state for a single validation during single-pass execution.
 
     This allows validations to accumulate state across chunks without
-    re-reading the file.
+    re-reading the file. Validations that implement the incremental protocol
+    (``supports_incremental``) keep their own exact state across chunks;
+    other validations are run per chunk and their results aggregated.
     """
 
     def __init__(self, validation, validation_config: Dict[str, Any], context: Dict[str, Any]):
@@ -146,6 +199,20 @@ class SinglePassValidationState:
         self.failed_rows = []
         self.max_samples = context.get("max_sample_failures", 100)
 
+        # Native incremental protocol (exact results across chunks)
+        self.incremental = (
+            not self.use_sampling
+            and getattr(validation, "supports_incremental", False) is True
+        )
+        self.error = None
+        self.chunk_errors = 0
+        if self.incremental:
+            try:
+                self.state['incremental'] = validation.init_state(context)
+            except Exception as e:
+                logger.error(f"Error initializing {validation.name}: {str(e)}")
+                self.error = f"Error initializing validation: {str(e)}"
+
     def process_chunk(self, chunk: pd.DataFrame, chunk_idx: int) -> None:
         """
         Process a single chunk of data incrementally.
@@ -160,8 +227,15 @@ class SinglePassValidationState:
         """
         if self.use_sampling:
             # Add to reservoir sample
-            offset = chunk_idx * len(chunk)
-            self.sampler.add_chunk(chunk, offset=offset)
+            self.sampler.add_chunk(chunk, offset=self.total_rows)
+        elif self.incremental:
+            state = self.state.get('incremental')
+            if self.error is None and not state.get("stopped"):
+                try:
+                    self.validation.update_state(state, chunk, self.total_rows, self.context)
+                except Exception as e:
+                    logger.error(f"Error processing chunk {chunk_idx}: {str(e)}")
+                    self.error = f"Error processing chunk {chunk_idx}: {str(e)}"
         else:
             # INCREMENTAL PROCESSING: Run validation on this chunk and aggregate results
             # This avoids storing all chunks in memory
@@ -170,49 +244,142 @@ class SinglePassValidationState:
 
             try:
                 chunk_result = self.validation.validate(single_chunk_iterator(), self.context)
+                self._aggregate_chunk_result(chunk_result)
+            except Exception as e:
+                self._record_chunk_error(chunk_idx, e)
 
-                # Initialize aggregate state on first chunk
-                if 'aggregate' not in self.state:
-                    self.state['aggregate'] = {
-                        'total_count': 0,
-                        'failed_count': 0,
-                        'sample_failures': [],
-                        'passed': True,
-                        'messages': []
-                    }
-
-                # Aggregate results
-                agg = self.state['aggregate']
-                agg['total_count'] += chunk_result.total_count
-                agg['failed_count'] += chunk_result.failed_count
-
-                # Keep sample failures up to max limit
-                if len(agg['sample_failures']) < self.max_samples:
-                    remaining = self.max_samples - len(agg['sample_failures'])
-                    agg['sample_failures'].extend(chunk_result.sample_failures[:remaining])
-
-                # Track if any chunk failed
-                if not chunk_result.passed:
-                    agg['passed'] = False
-
-                # Collect unique messages
-                if chunk_result.message and chunk_result.message not in agg['messages']:
-                    agg['messages'].append(chunk_result.message)
+        self.total_rows += len(chunk)
 
-            except Exception as e:
-                logger.error(f"Error processing chunk {chunk_idx}: {str(e)}")
-                if 'aggregate' not in self.state:
-                    self.state['aggregate'] = {
-                        'total_count': 0,
-                        'failed_count': 0,
-                        'sample_failures': [],
-                        'passed': False,
-                        'messages': [f"Error processing chunk {chunk_idx}: {str(e)}"]
-                    }
+    def merge_partial(self, partial: Tuple[str, Any], chunk_idx: int, chunk_rows: int) -> None:
+        """
+        Merge the outcome of a chunk validated by a parallel worker.
+
+        Partials must be merged in chunk order so results do not depend on
+        the number of workers.
+
+        Args:
+            partial: ("state", incremental state), ("result", ValidationResult)
+                     or ("error", message) as produced by the worker
+            chunk_idx: Chunk index
+            chunk_rows: Number of rows in the chunk
+        """
+        kind, payload = partial
+
+        if self.incremental:
+            if kind == "error":
+                if self.error is None:
+                    logger.error(f"Error processing chunk {chunk_idx}: {payload}")
+                    self.error = f"Error processing chunk {chunk_idx}: {payload}"
+            elif self.error is None:
+                state = self.state['incremental']
+                if state.get("stopped"):
+                    self.validation.release_state(payload)
                 else:
-                    self.state['aggregate']['passed'] = False
+                    self.state['incremental'] = self.validation.merge_states(state, payload)
+            else:
+                self.validation.release_state(payload)
+        elif kind == "error":
+            self._record_chunk_error(chunk_idx, payload)
+        else:
+            self._aggregate_chunk_result(payload)
 
-        self.total_rows += len(chunk)
+        self.total_rows += chunk_rows
+
+    def _aggregate_chunk_result(self, chunk_result: ValidationResult) -> None:
+        """
+        Aggregate the result of running a validation on a single chunk.
+
+        Args:
+            chunk_result: ValidationResult for one chunk
+        """
+        # Initialize aggregate state on first chunk
+        if 'aggregate' not in self.state:
+            self.state['aggregate'] = {
+                'total_count': 0,
+                'failed_count': 0,
+                'sample_failures': [],
+                'passed': True,
+                'messages': []
+            }
+
+        # Aggregate results
+        agg = self.state['aggregate']
+        agg['total_count'] += chunk_result.total_count
+        agg['failed_count'] += chunk_result.failed_count
+
+        # Keep sample failures up to max limit
+        if len(agg['sample_failures']) < self.max_samples:
+            remaining = self.max_samples - len(agg['sample_failures'])
+            agg['sample_failures'].extend(chunk_result.sample_failures[:remaining])
+
+        # Track if any chunk failed
+        if not chunk_result.passed:
+            agg['passed'] = False
+
+        # Collect unique messages
+        if chunk_result.message and chunk_result.message not in agg['messages']:
+            agg['messages'].append(chunk_result.message)
+
+        # The validation could not run (e.g. an invalid regex): keep the reason
+        if is_error_result(chunk_result) and 'error' not in agg:
+            agg['error'] = chunk_result.message
+
+    def _record_chunk_error(self, chunk_idx: int, error: Any) -> None:
+        """
+        Record an error raised while validating a chunk.
+
+        Args:
+            chunk_idx: Chunk index
+            error: Exception (or message) raised by the validation
+        """
+        logger.error(f"Error processing chunk {chunk_idx}: {str(error)}")
+        self.chunk_errors += 1
+        if 'aggregate' not in self.state:
+            self.state['aggregate'] = {
+                'total_count': 0,
+                'failed_count': 0,
+                'sample_failures': [],
+                'passed': False,
+                'messages': [f"Error processing chunk {chunk_idx}: {str(error)}"]
+            }
+        else:
+            self.state['aggregate']['passed'] = False
+        self.state['aggregate'].setdefault('error', f"Error processing chunk {chunk_idx}: {str(error)}")
+
+    @property
+    def has_errors(self) -> bool:
+        """True if initializing the validation or validating a chunk failed."""
+        return self.error is not None or self.chunk_errors > 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Capture the accumulated state so a later run can continue from it.
+
+        Returns:
+            Picklable dictionary for restore()
+        """
+        return {
+            "state": self.state,
+            "total_rows": self.total_rows,
+            "sampler": self.sampler,
+            "error": self.error,
+            "chunk_errors": self.chunk_errors,
+        }
+
+    def restore(self, snapshot: Dict[str, Any]) -> None:
+        """
+        Continue from the state captured by snapshot() in an earlier run.
+
+        Args:
+            snapshot: Dictionary returned by snapshot()
+        """
+        if self.incremental and self.state.get('incremental') is not None:
+            self.validation.release_state(self.state['incremental'])
+        self.state = snapshot["state"]
+        self.total_rows = snapshot["total_rows"]
+        self.sampler = snapshot["sampler"]
+        self.error = snapshot["error"]
+        self.chunk_errors = snapshot["chunk_errors"]
 
     def finalize(self) -> ValidationResult:
         """
@@ -240,6 +407,8 @@ class SinglePassValidationState:
             result.population_size = self.total_rows
 
             return result
+        elif self.incremental:
+            return self._finalize_incremental()
         else:
             # Use aggregated results from incremental chunk processing
             agg = self.state.get('aggregate', {})
@@ -269,7 +438,10 @@ class SinglePassValidationState:
             success_rate = ((total_count - failed_count) / total_count * 100) if total_count > 0 else 100.0
 
             # Build summary message
-            if agg['passed']:
+            if agg.get('error'):
+                # Report why the validation could not run rather than counts
+                message = agg['error']
+            elif agg['passed']:
                 message = f"All {total_count:,} values passed validation"
             else:
                 message = f"Found {failed_count:,} failures out of {total_count:,} values ({100-success_rate:.2f}% failure rate)"
@@ -291,6 +463,57 @@ class SinglePassValidationState:
 
             return result
 
+    def _finalize_incremental(self) -> ValidationResult:
+        """
+        Finalize a validation that implements the incremental protocol.
+
+        Returns:
+            ValidationResult computed from the accumulated state
+        """
+        state = self.state.get('incremental')
+        try:
+            if self.error is None:
+                result = self.validation.finalize_state(state, self.context)
+            else:
+                result = self.validation._create_result(
+                    passed=False,
+                    message=self.error,
+                    failed_count=1,
+                )
+        except Exception as e:
+            logger.error(f"Error finalizing {self.validation.name}: {str(e)}")
+            result = self.validation._create_result(
+                passed=False,
+                message=f"Error finalizing validation: {str(e)}",
+                failed_count=1,
+            )
+        finally:
+            if state is not None:
+                self.validation.release_state(state)
+
+        result.execution_time = time.time() - self.start_time
+        result.is_sampled = False
+        return result
+
+
+class CompiledRuleState:
+    """
+    Stands in for a validation answered before the scan (by the compiled
+    rule query or from Parquet statistics).
+
+    Takes no part in chunk processing; finalize() returns the query's result.
+    """
+
+    def __init__(self, validation, validation_config: Dict[str, Any], result: ValidationResult):
+        self.validation = validation
+        self.validation_config = validation_config
+        self.result = result
+        self.use_sampling = False
+
+    def finalize(self) -> ValidationResult:
+        """Return the precomputed result."""
+        return self.result
+
 
 class OptimizedValidationEngine:
     """
@@ -310,26 +533,41 @@ class OptimizedValidationEngine:
     Backward compatible with existing configurations.
     """
 
-    def __init__(self, config: ValidationConfig, use_single_pass: bool = True) -> None:
+    def __init__(self, config: ValidationConfig, use_single_pass: bool = True,
+                 workers: Optional[int] = None, file_workers: Optional[int] = None) -> None:
         """
         Initialize the optimized validation engine.
 
         Args:
             config: Validation configuration object
             use_single_pass: Whether to use single-pass optimization (default: True)
+            workers: Worker processes for parallel chunk validation
+                     (default: processing.workers from config, normally 1)
+            file_workers: Worker processes for validating files concurrently
+                          (default: from processing.parallel_files, normally 1)
         """
         self.config: ValidationConfig = config
         self.registry: ValidationRegistry = get_registry()
         self.use_single_pass = use_single_pass
+        self.workers = max(1, workers if workers is not None else config.workers)
+        self.file_workers = (
+            file_workers if file_workers is not None
+            else resolve_file_workers(config.parallel_files)
+        )
+        self._result_cache: Optional[ResultCache] = None
+        self._checkpointer: Optional[RunCheckpointer] = None
+        self._file_index = 0
 
     @classmethod
-    def from_config(cls, config_path: str, use_single_pass: bool = True) -> "OptimizedValidationEngine":
+    def from_config(cls, config_path: str, use_single_pass: bool = True,
+                    workers: Optional[int] = None) -> "OptimizedValidationEngine":
         """
         Create engine from YAML configuration file.
 
         Args:
             config_path: Path to YAML configuration file
             use_single_pass: Whether to use single-pass optimization
+            workers: Worker processes for parallel chunk validation
 
         Returns:
             OptimizedValidationEngine instance
@@ -338,14 +576,16 @@ class OptimizedValidationEngine:
             ConfigError: If configuration is invalid
         """
         config = ValidationConfig.from_yaml(config_path)
-        return cls(config, use_single_pass=use_single_pass)
+        return cls(config, use_single_pass=use_single_pass, workers=workers)
 
-    def run(self, verbose: bool = True) -> ValidationReport:
+    def run(self, verbose: bool = True, resume: bool = False) -> ValidationReport:
         """
         Execute all validations defined in the configuration.
 
         Args:
             verbose: If True, print progress information
+            resume: Continue from the checkpoint of an interrupted run of
+                    this job (see processing.checkpoint_interval)
 
         Returns:
             ValidationReport with complete validation results
@@ -375,6 +615,24 @@ class OptimizedValidationEngine:
         )
         logger.debug("Validation report initialized")
 
+        # Periodic checkpoints; files an interrupted run finished are reused
+        checkpointer = self._checkpointer = self._start_checkpointer(resume)
+        finished_reports = {}
+        if checkpointer is not None:
+            for file_idx, file_config in enumerate(self.config.files):
+                finished = checkpointer.finished_report(file_idx, file_config)
+                if finished is not None:
+                    finished_reports[file_idx] = finished
+            if verbose and checkpointer.resumed:
+                po.info(f"Resuming interrupted run ({len(finished_reports)} file(s) already validated)", indent=2)
+                po.blank_line()
+
+        # Validate files concurrently when configured; reports still arrive
+        # in configuration order
+        parallel_reports = self._parallel_file_reports(
+            [f for idx, f in enumerate(self.config.files) if idx not in finished_reports]
+        )
+
         # Process each file
         for file_idx, file_config in enumerate(self.config.files, 1):
             logger.info(f"Processing file {file_idx}/{len(self.config.files)}: {file_config['name']}")
@@ -388,10 +646,18 @@ class OptimizedValidationEngine:
                 po.blank_line()
 
             # Validate the file
-            if self.use_single_pass:
-                file_report = self._validate_file_single_pass(file_config, verbose)
+            if file_idx - 1 in finished_reports:
+                file_report = finished_reports[file_idx - 1]
+                if verbose:
+                    po.info("Validated before the interruption - report restored from the checkpoint", indent=2)
             else:
-                file_report = self._validate_file_standard(file_config, verbose)
+                if parallel_reports is not None:
+                    _, file_report = next(parallel_reports)
+                else:
+                    self._file_index = file_idx - 1
+                    file_report = self._process_file(file_config, verbose)
+                if checkpointer is not None:
+                    checkpointer.file_done(file_idx - 1, file_config, file_report)
 
             logger.info(f"File validation completed: {file_config['name']} - Status: {file_report.status.value}")
 
@@ -413,6 +679,10 @@ class OptimizedValidationEngine:
                 po.key_value("Duration", f"{file_report.execution_time:.2f}s", indent=2, value_color=po.DIM)
                 po.blank_line()
 
+        if checkpointer is not None:
+            checkpointer.finish()
+            self._checkpointer = None
+
         # Update overall status and duration
         report.update_overall_status()
         report.duration_seconds = time.time() - start_time
@@ -426,6 +696,106 @@ class OptimizedValidationEngine:
 
         return report
 
+    def _start_checkpointer(self, resume: bool) -> Optional[RunCheckpointer]:
+        """
+        Create the run checkpointer if checkpoints are enabled.
+
+        Args:
+            resume: Continue from the checkpoint of an interrupted run
+
+        Returns:
+            RunCheckpointer, or None without processing.checkpoint_interval
+            and resume
+        """
+        interval = self.config.checkpoint_interval or (DEFAULT_CHECKPOINT_INTERVAL if resume else None)
+        if not interval:
+            return None
+        run_hash = RunCheckpointer.run_hash(self.config.files, self._cache_scope())
+        return RunCheckpointer(self.config.checkpoint_dir, run_hash, interval, resume=resume)
+
+    def _parallel_file_reports(self, files: List[Dict[str, Any]]):
+        """
+        Start concurrent file validation if more than one file worker is set.
+
+        Args:
+            files: File configurations still to validate
+
+        Returns:
+            Iterator of (file_config, FileValidationReport) in configuration
+            order, or None to validate files serially
+        """
+        if self.file_workers <= 1 or len(files) <= 1:
+            return None
+
+        if self.workers > 1:
+            logger.info("File-level parallelism enabled - chunks of each file are validated serially")
+
+        engine_factory = partial(
+            type(self), self.config,
+            use_single_pass=self.use_single_pass, workers=1, file_workers=1
+        )
+        scheduler = ParallelFileScheduler(
+            engine_factory,
+            files,
+            workers=min(self.file_workers, len(files)),
+            chunk_size=self.config.chunk_size,
+        )
+        return scheduler.run()
+
+    def _process_file(self, file_config: Dict[str, Any], verbose: bool) -> FileValidationReport:
+        """
+        Validate a single file (entry point used by file worker processes).
+
+        Args:
+            file_config: File configuration dictionary
+            verbose: Whether to print progress
+
+        Returns:
+            FileValidationReport with all validation results for this file
+        """
+        validate = self._validate_file_single_pass if self.use_single_pass else self._validate_file_standard
+
+        result_cache = self._get_result_cache()
+        if result_cache is None or file_config.get("append_only"):
+            # Append-only files change every run; their checkpoints do the reuse
+            return validate(file_config, verbose)
+
+        # Reuse results of unchanged (file, validation) pairs; run the rest
+        file_report = result_cache.validate_file(
+            file_config, self.registry, self._cache_scope(),
+            lambda config: validate(config, verbose),
+        )
+        if verbose and file_report.metadata["result_cache"]["hits"]:
+            po.info(f"{file_report.metadata['result_cache']['hits']} result(s) reused from the result cache", indent=2)
+        return file_report
+
+    def _get_result_cache(self) -> Optional[ResultCache]:
+        """Open the cache configured in processing.result_cache (None if disabled)."""
+        if self._result_cache is None:
+            self._result_cache = ResultCache.from_config(self.config.result_cache)
+        return self._result_cache
+
+    def _cache_scope(self) -> Dict[str, Any]:
+        """Engine settings that are part of every result cache key."""
+        return {
+            "engine": type(self).__name__,
+            "single_pass": self.use_single_pass,
+            "chunk_size": self.config.chunk_size,
+            "max_sample_failures": self.config.max_sample_failures,
+        }
+
+    def _append_config_hash(self, file_config: Dict[str, Any]) -> str:
+        """Hash of everything append checkpoint states depend on besides the data."""
+        from validation_framework import __version__
+
+        return config_hash({
+            "version": __version__,
+            "file": {option: file_config.get(option) for option in READ_OPTIONS},
+            "validations": file_config.get("validations", []),
+            "chunk_size": self.config.chunk_size,
+            "max_sample_failures": self.config.max_sample_failures,
+        })
+
     def _validate_file_single_pass(self, file_config: Dict[str, Any], verbose: bool) -> FileValidationReport:
         """
         Validate a single file using single-pass architecture.
@@ -450,7 +820,44 @@ class OptimizedValidationEngine:
         )
 
         try:
-            # Create data loader
+            # Append-only files: read only what was added since the last checkpoint
+            append_plan = None
+            if file_config.get("append_only"):
+                append_store = AppendCheckpointStore(self.config.checkpoint_dir)
+                append_hash = self._append_config_hash(file_config)
+                append_plan = append_store.plan(file_config, append_hash)
+                if append_plan is None:
+                    logger.warning(f"append_only is not supported for {file_config['format']} files; "
+                                   f"validating {file_config['name']} in full")
+
+            # Rule-style validations are answered by one compiled Polars query
+            # (opt-in: the query is an extra scan of the whole file, so not for
+            # append reads either)
+            compiled_results = (
+                answer_rule_validations(file_config, self.registry, self.config.max_sample_failures)
+                if self.config.polars_rules and append_plan is None else {}
+            )
+
+            # Checks settled by Parquet footer statistics read no (or only some) row groups
+            statistics_results = (
+                answer_statistics_validations(
+                    file_config, self.registry, self.config.chunk_size,
+                    self.config.max_sample_failures, skip=compiled_results
+                )
+                if self.config.parquet_statistics and append_plan is None else {}
+            )
+
+            # Create data loader that only parses the columns the validations need
+            columns = resolve_required_columns(
+                [v for idx, v in enumerate(file_config.get("validations", []))
+                 if idx not in compiled_results and idx not in statistics_results],
+                self.registry,
+            )
+            # Crash-safe checkpoints (append-only files checkpoint per run instead)
+            checkpointer = self._checkpointer if append_plan is None else None
+            resume_point = checkpointer.resume_point(self._file_index, file_config) if checkpointer else None
+            resumed_read = resume_read(file_config, resume_point.total_rows) if resume_point else ResumeRead()
+
             loader = LoaderFactory.create_loader(
                 file_path=file_config["path"],
                 file_format=file_config["format"],
@@ -459,24 +866,38 @@ class OptimizedValidationEngine:
                 encoding=file_config.get("encoding"),
                 header=file_config.get("header"),
                 sheet_name=file_config.get("sheet_name"),
+                columns=columns,
+                parse_workers=self.config.csv_parse_workers,
+                engine=file_config.get("engine"),
+                record_path=file_config.get("record_path"),
+                **(append_plan.loader_kwargs() if append_plan is not None else resumed_read.loader_kwargs),
             )
 
             # Get file metadata
             metadata = loader.get_metadata()
             file_report.metadata = metadata
 
+            # Decode upcoming chunks in the background while validations run
+            loader = with_prefetch(loader, self.config.prefetch_depth, self.config.prefetch_mode)
+
             # Build validation context
             context = {
                 "file_path": file_config["path"],
                 "file_name": file_config["name"],
                 "file_format": file_config["format"],
+                "file_config": file_config,
+                "chunk_size": self.config.chunk_size,
                 "max_sample_failures": self.config.max_sample_failures,
+                "reference_index_dir": self.config.reference_index_dir,
                 **metadata,
             }
 
             # Initialize all validations
             validations = file_config.get("validations", [])
-            validation_states: List[SinglePassValidationState] = []
+            validation_states: List[Any] = []
+            state_positions: List[int] = []
+            # Configuration position of every result added below
+            result_positions: List[int] = []
 
             if verbose and validations:
                 po.subsection("Initializing Validations")
@@ -500,11 +921,19 @@ class OptimizedValidationEngine:
                     )
 
                     # Create validation state
-                    state = SinglePassValidationState(validation, validation_config, context)
+                    if val_idx - 1 in compiled_results:
+                        state = CompiledRuleState(validation, validation_config, compiled_results[val_idx - 1])
+                        sampling_status = " (COMPILED QUERY)"
+                    elif val_idx - 1 in statistics_results:
+                        state = CompiledRuleState(validation, validation_config, statistics_results[val_idx - 1])
+                        sampling_status = " (PARQUET STATISTICS)"
+                    else:
+                        state = SinglePassValidationState(validation, validation_config, context)
+                        sampling_status = " (SAMPLING)" if state.use_sampling else " (FULL SCAN)"
                     validation_states.append(state)
+                    state_positions.append(val_idx - 1)
 
                     if verbose:
-                        sampling_status = " (SAMPLING)" if state.use_sampling else " (FULL SCAN)"
                         print(f"  {po.DIM}[{val_idx}/{len(validations)}]{po.RESET} {validation_type}{sampling_status}")
 
                 except KeyError:
@@ -519,6 +948,7 @@ class OptimizedValidationEngine:
                         failed_count=1,
                     )
                     file_report.add_result(error_result)
+                    result_positions.append(val_idx - 1)
 
                 except Exception as e:
                     if verbose:
@@ -533,38 +963,92 @@ class OptimizedValidationEngine:
                         failed_count=1,
                     )
                     file_report.add_result(error_result)
-
-            if verbose and validation_states:
+                    result_positions.append(val_idx - 1)
+
+            # Validations that still need the chunked read
+            scan_states = [s for s in validation_states if isinstance(s, SinglePassValidationState)]
+
+            chunks = loader.load()
+            if append_plan is not None:
+                file_report.metadata["append"] = append_plan.to_dict()
+                if append_plan.resumed:
+                    # Continue from the states the previous run ended with
+                    for state, snapshot in zip(scan_states, append_plan.checkpoint.states):
+                        state.restore(snapshot)
+                    chunks = _offset_chunks(chunks, append_plan.checkpoint.total_rows)
+                    if verbose:
+                        po.info(f"Resuming after {append_plan.checkpoint.total_rows:,} previously validated rows", indent=2)
+
+            skipped_chunks = 0
+            if resume_point is not None:
+                for state, snapshot in zip(scan_states, resume_point.states):
+                    state.restore(snapshot)
+                skipped_chunks = resume_point.chunk_count
+                chunks = _skip_rows(chunks, resumed_read.first_row, resume_point.total_rows, file_config["path"])
+                if verbose:
+                    po.info(f"Resuming after {resume_point.total_rows:,} rows validated before the interruption", indent=2)
+
+            if verbose and scan_states:
                 po.blank_line()
-                po.subsection(f"Processing Data (Single-Pass Mode)")
-                print(f"  {po.INFO}Reading file once, applying {len(validation_states)} validations per chunk...{po.RESET}")
-
-            # SINGLE-PASS EXECUTION: Read file once, apply all validations per chunk
-            chunk_count = 0
-            for chunk_idx, chunk in enumerate(loader.load()):
-                chunk_count += 1
-
-                # Apply all validations to this chunk
-                for state in validation_states:
-                    try:
-                        state.process_chunk(chunk, chunk_idx)
-                    except Exception as e:
-                        logger.error(f"Error processing chunk {chunk_idx} for validation {state.validation.name}: {str(e)}")
+                po.subsection("Processing Data (Single-Pass Mode)")
+                print(f"  {po.INFO}Reading file once, applying {len(scan_states)} validations per chunk...{po.RESET}")
+                if self.workers > 1:
+                    print(f"  {po.INFO}Validating chunks on {self.workers} worker processes{po.RESET}")
 
+            def report_progress(chunk_idx: int, rows_processed: int) -> None:
                 if verbose and chunk_idx % 10 == 0:
-                    rows_processed = (chunk_idx + 1) * self.config.chunk_size
-                    print(f"  {po.DIM}Processed {chunk_count} chunks ({rows_processed:,} rows)...{po.RESET}", end='\r', flush=True)
+                    print(f"  {po.DIM}Processed {chunk_idx + 1} chunks ({rows_processed:,} rows)...{po.RESET}", end='\r', flush=True)
+                if checkpointer is not None and checkpointer.due():
+                    # Only checkpoint when every state has seen the same chunks
+                    # (sampled states run ahead of worker results)
+                    rows = {state.total_rows for state in scan_states}
+                    if len(rows) == 1:
+                        checkpointer.save_progress(self._file_index, file_config,
+                                                   skipped_chunks + chunk_idx + 1, rows.pop(), scan_states)
+
+            # SINGLE-PASS EXECUTION: Read file once, apply all validations per chunk
+            if not scan_states:
+                # Everything was answered before the scan
+                chunk_count = 0
+            elif self.workers > 1:
+                # MAP-REDUCE: Workers validate chunks, partials merged in chunk order
+                executor = ParallelChunkExecutor(scan_states, context, self.workers)
+                chunk_count = executor.run(chunks, progress=report_progress)
+            else:
+                chunk_count = 0
+                rows_processed = 0
+                for chunk_idx, chunk in enumerate(chunks):
+                    chunk_count += 1
+                    rows_processed += len(chunk)
+
+                    # Apply all validations to this chunk, sharing derived columns and masks
+                    with activate_chunk_cache(chunk):
+                        for state in scan_states:
+                            try:
+                                state.process_chunk(chunk, chunk_idx)
+                            except Exception as e:
+                                logger.error(f"Error processing chunk {chunk_idx} for validation {state.validation.name}: {str(e)}")
+
+                    report_progress(chunk_idx, rows_processed)
 
             if verbose:
                 print()  # New line after progress
                 po.blank_line()
                 po.subsection("Finalizing Validation Results")
 
+            if isinstance(loader, PrefetchLoader):
+                file_report.metadata["prefetch"] = loader.stats.to_dict()
+                logger.info(f"Prefetch statistics for {file_config['name']}: {file_report.metadata['prefetch']}")
+
+            if append_plan is not None:
+                self._save_append_checkpoint(append_store, file_config, append_plan, append_hash, scan_states)
+
             # Finalize all validations
             for val_idx, state in enumerate(validation_states, 1):
                 try:
                     result = state.finalize()
                     file_report.add_result(result)
+                    result_positions.append(state_positions[val_idx - 1])
 
                     if verbose:
                         if result.passed:
@@ -585,6 +1069,14 @@ class OptimizedValidationEngine:
                         failed_count=1,
                     )
                     file_report.add_result(error_result)
+                    result_positions.append(state_positions[val_idx - 1])
+
+            # Initialization errors were added first; report in configuration order
+            file_report.validation_results = [
+                result for _, result in sorted(
+                    zip(result_positions, file_report.validation_results), key=lambda pair: pair[0]
+                )
+            ]
 
         except FileNotFoundError:
             if verbose:
@@ -619,6 +1111,39 @@ class OptimizedValidationEngine:
 
         return file_report
 
+    def _save_append_checkpoint(self, store: AppendCheckpointStore, file_config: Dict[str, Any],
+                                plan, append_hash: str, scan_states: List["SinglePassValidationState"]) -> None:
+        """
+        Checkpoint the states of an append-only file after its chunks were read.
+
+        Nothing is saved if the file does not end on a complete line or a
+        validation failed with an error; the previous checkpoint stays valid.
+
+        Args:
+            store: Checkpoint store
+            file_config: File configuration dictionary
+            plan: AppendPlan the file was read with
+            append_hash: Hash of the validation config
+            scan_states: States of the validations that read the chunks
+        """
+        if plan.end_digest is None or any(state.has_errors for state in scan_states):
+            logger.info(f"Not checkpointing {file_config['name']}: incomplete last line or validation errors")
+            return
+
+        previous_rows = plan.checkpoint.total_rows if plan.resumed else 0
+        checkpoint = AppendCheckpoint(
+            config_hash=append_hash,
+            file_format=plan.file_format,
+            position=plan.end,
+            digest=plan.end_digest,
+            total_rows=scan_states[0].total_rows if scan_states else previous_rows,
+            states=[state.snapshot() for state in scan_states],
+        )
+        try:
+            store.save(file_config, checkpoint)
+        except Exception as e:
+            logger.warning(f"Could not save checkpoint for {file_config['name']}: {str(e)}")
+
     def _validate_file_standard(self, file_config: Dict[str, Any], verbose: bool) -> FileValidationReport:
         """
         Validate a single file using standard (non-optimized) architecture.
@@ -0,0 +1,368 @@
+"""
+Parallel execution helpers for the validation engines.
+
+Chunk-level map-reduce: the parent process reads a file once and hands each
+chunk to a pool of worker processes. Workers build a partial result for
+every validation (an incremental state for validations that implement the
+incremental protocol, a per-chunk ValidationResult otherwise) and the parent
+merges the partials strictly in chunk order. Because every partial only
+depends on its chunk and row offset, the merged results are identical for
+any number of workers. Key checks keep the parent's work to one batch per
+chunk: workers ship the hashes (or, for the in-memory tracker, the new
+keys) of their chunk, which the parent adds to its key store in bulk.
+
+File-level scheduling: whole files are validated concurrently in worker
+processes, largest file first, while keeping the estimated memory of all
+running files within a global budget. Reports are handed back in
+configuration order so observers and reports match a serial run.
+
+Worker processes are spawned as fresh interpreters, so a script that runs
+an engine with workers must guard its entry point with
+``if __name__ == "__main__":``.
+
+Author: Daniel Edge
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import logging
+import multiprocessing
+import os
+
+from validation_framework.core.chunk_cache import activate_chunk_cache
+from validation_framework.core.results import (
+    FileValidationReport,
+    Severity,
+    Status,
+    ValidationResult,
+)
+
+logger = logging.getLogger(__name__)
+
+# Worker processes are spawned, not forked: by the time a pool starts the
+# parent may run Polars/PyArrow thread pools, and a forked child inherits
+# their locks in whatever state they were in (and hangs on them).
+MP_CONTEXT = multiprocessing.get_context("spawn")
+
+
+# Per-process worker state, set once by the pool initializer so validations
+# are not re-pickled with every chunk.
+_worker_validations: List[Tuple[Any, bool]] = []
+_worker_context: Dict[str, Any] = {}
+
+
+def _init_chunk_worker(validations: List[Tuple[Any, bool]], context: Dict[str, Any]) -> None:
+    """
+    Pool initializer: remember the validations and context for this worker.
+
+    Args:
+        validations: List of (validation, incremental) pairs
+        context: Validation context shared by all chunks of the file
+    """
+    global _worker_validations, _worker_context
+    _worker_validations = validations
+    _worker_context = context
+
+
+def _validate_chunk(chunk: Any, row_offset: int) -> List[Tuple[str, Any]]:
+    """
+    Validate one chunk with every worker validation.
+
+    Args:
+        chunk: DataFrame chunk (pandas or Polars)
+        row_offset: Absolute row number of the first row in the chunk
+
+    Returns:
+        One partial per validation: ("state", state), ("result", result)
+        or ("error", message)
+    """
+    partials = []
+
+    with activate_chunk_cache(chunk):
+        for validation, incremental in _worker_validations:
+            try:
+                if incremental:
+                    state = validation.init_state(_worker_context)
+                    validation.update_state(state, chunk, row_offset, _worker_context)
+                    partials.append(("state", state))
+                else:
+                    result = validation.validate(iter([chunk]), _worker_context)
+                    partials.append(("result", result))
+            except Exception as e:
+                partials.append(("error", str(e)))
+
+    return partials
+
+
+class ParallelChunkExecutor:
+    """
+    Validates the chunks of one file on a process pool.
+
+    Validations using sampling stay in the parent process (the reservoir
+    needs every row); all other validations run in the workers and their
+    partial results are merged back in chunk order.
+
+    Example:
+        >>> executor = ParallelChunkExecutor(validation_states, context, workers=8)
+        >>> chunk_count = executor.run(loader.load())
+    """
+
+    def __init__(self, validation_states: List[Any], context: Dict[str, Any],
+                 workers: int, max_pending: Optional[int] = None):
+        """
+        Initialize the executor.
+
+        Args:
+            validation_states: SinglePassValidationState objects for the file
+            context: Validation context for the file
+            workers: Number of worker processes
+            max_pending: Maximum chunks in flight (default: 2 x workers). Bounds
+                         the memory used by chunks waiting to be merged.
+        """
+        self.workers = workers
+        self.max_pending = max_pending or workers * 2
+        self.context = context
+
+        self.local_states = [s for s in validation_states if s.use_sampling]
+        self.pool_states = [s for s in validation_states if not s.use_sampling]
+
+    def run(self, chunks: Iterator[Any], progress: Optional[Callable[[int, int], None]] = None) -> int:
+        """
+        Validate all chunks and merge the partial results into the states.
+
+        Args:
+            chunks: Iterator of DataFrame chunks
+            progress: Optional callback(chunk_idx, rows_processed) called as
+                      chunks are merged
+
+        Returns:
+            Number of chunks processed
+        """
+        if not self.pool_states:
+            return self._run_local(chunks, progress)
+
+        validations = [(s.validation, s.incremental) for s in self.pool_states]
+        worker_context = {**self.context, "partial_state": True}
+
+        logger.info(
+            f"Validating chunks on {self.workers} worker processes "
+            f"({len(self.pool_states)} validations in workers, {len(self.local_states)} local)"
+        )
+
+        pending: deque = deque()
+        chunk_count = 0
+        row_offset = 0
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=MP_CONTEXT,
+            initializer=_init_chunk_worker,
+            initargs=(validations, worker_context),
+        ) as pool:
+            for chunk_idx, chunk in enumerate(chunks):
+                chunk_rows = len(chunk)
+                pending.append((chunk_idx, chunk_rows, pool.submit(_validate_chunk, chunk, row_offset)))
+
+                with activate_chunk_cache(chunk):
+                    for state in self.local_states:
+                        state.process_chunk(chunk, chunk_idx)
+
+                row_offset += chunk_rows
+                chunk_count += 1
+
+                while len(pending) >= self.max_pending:
+                    self._merge_next(pending, progress)
+
+            while pending:
+                self._merge_next(pending, progress)
+
+        return chunk_count
+
+    def _merge_next(self, pending: deque, progress: Optional[Callable[[int, int], None]]) -> None:
+        """Wait for the oldest chunk in flight and merge its partials."""
+        chunk_idx, chunk_rows, future = pending.popleft()
+        partials = future.result()
+
+        for state, partial in zip(self.pool_states, partials):
+            state.merge_partial(partial, chunk_idx, chunk_rows)
+
+        if progress:
+            progress(chunk_idx, self.pool_states[0].total_rows)
+
+    def _run_local(self, chunks: Iterator[Any], progress: Optional[Callable[[int, int], None]]) -> int:
+        """Process chunks in the parent when no validation can run in workers."""
+        chunk_count = 0
+        rows = 0
+        for chunk_idx, chunk in enumerate(chunks):
+            with activate_chunk_cache(chunk):
+                for state in self.local_states:
+                    state.process_chunk(chunk, chunk_idx)
+            chunk_count += 1
+            rows += len(chunk)
+            if progress:
+                progress(chunk_idx, rows)
+        return chunk_count
+
+
+def resolve_file_workers(parallel_files: Any) -> int:
+    """
+    Translate the ``processing.parallel_files`` setting into a worker count.
+
+    Args:
+        parallel_files: False/True or an explicit number of worker processes
+
+    Returns:
+        Number of file workers (1 means serial)
+    """
+    if parallel_files is True:
+        return os.cpu_count() or 1
+    if not parallel_files:
+        return 1
+    return max(1, int(parallel_files))
+
+
+def _validate_file_worker(engine_factory: Callable[[], Any], file_config: Dict[str, Any]) -> FileValidationReport:
+    """
+    Validate one file in a worker process.
+
+    Args:
+        engine_factory: Picklable callable that builds the engine
+        file_config: File configuration dictionary
+
+    Returns:
+        FileValidationReport for the file
+    """
+    engine = engine_factory()
+    return engine._process_file(file_config, verbose=False)
+
+
+class ParallelFileScheduler:
+    """
+    Validates several files concurrently in worker processes.
+
+    Files are started largest first (better packing of long-running work)
+    as long as the estimated memory of all running files fits within the
+    memory budget; a file is always started when nothing else is running,
+    so oversized files still make progress. Reports are yielded strictly in
+    configuration order.
+
+    Example:
+        >>> scheduler = ParallelFileScheduler(factory, config.files, workers=4,
+        ...                                   chunk_size=config.chunk_size)
+        >>> for file_config, file_report in scheduler.run():
+        ...     report.add_file_report(file_report)
+    """
+
+    def __init__(self, engine_factory: Callable[[], Any], file_configs: List[Dict[str, Any]],
+                 workers: int, chunk_size: int, memory_budget: Optional[int] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            engine_factory: Picklable callable building the engine in workers
+            file_configs: File configurations in report order
+            workers: Maximum number of concurrent worker processes
+            chunk_size: Rows per chunk, used for memory estimates
+            memory_budget: Memory budget in bytes (default: available memory
+                           as reported by ChunkSizeCalculator)
+        """
+        from validation_framework.utils.chunk_size_calculator import ChunkSizeCalculator
+
+        self.engine_factory = engine_factory
+        self.file_configs = file_configs
+        self.workers = workers
+        self.chunk_size = chunk_size
+
+        calculator = ChunkSizeCalculator()
+        self.memory_budget = memory_budget if memory_budget is not None else calculator.available_memory
+        self.memory_estimates = [
+            calculator.estimate_memory_bytes(
+                file_config.get("format", "csv"),
+                chunk_size,
+                num_validations=len(file_config.get("validations", [])),
+            )
+            for file_config in file_configs
+        ]
+
+    def run(self) -> Iterator[Tuple[Dict[str, Any], FileValidationReport]]:
+        """
+        Validate all files, yielding reports in configuration order.
+
+        Yields:
+            Tuples of (file_config, FileValidationReport)
+        """
+        # Largest file first; ties keep configuration order
+        queue = sorted(
+            range(len(self.file_configs)),
+            key=lambda idx: (-self._file_size(self.file_configs[idx]), idx)
+        )
+        logger.info(
+            f"Validating {len(self.file_configs)} files on up to {self.workers} worker processes "
+            f"(memory budget {self.memory_budget / (1024 * 1024):,.0f} MB)"
+        )
+
+        running: Dict[Any, int] = {}
+        finished: Dict[int, FileValidationReport] = {}
+        next_to_yield = 0
+        memory_in_use = 0
+
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=MP_CONTEXT) as pool:
+            while next_to_yield < len(self.file_configs):
+                # Start as many files as workers and memory allow
+                for idx in list(queue):
+                    if len(running) >= self.workers:
+                        break
+                    estimate = self.memory_estimates[idx]
+                    if running and memory_in_use + estimate > self.memory_budget:
+                        continue
+                    queue.remove(idx)
+                    memory_in_use += estimate
+                    future = pool.submit(_validate_file_worker, self.engine_factory, self.file_configs[idx])
+                    running[future] = idx
+
+                # Hand back every report that is next in configuration order
+                while next_to_yield in finished:
+                    yield self.file_configs[next_to_yield], finished.pop(next_to_yield)
+                    next_to_yield += 1
+
+                if not running:
+                    continue
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    idx = running.pop(future)
+                    memory_in_use -= self.memory_estimates[idx]
+                    finished[idx] = self._collect(future, self.file_configs[idx])
+
+    def _collect(self, future: Any, file_config: Dict[str, Any]) -> FileValidationReport:
+        """Get a worker's report, turning worker failures into an error report."""
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error(f"Error processing file {file_config['name']} in worker: {str(e)}", exc_info=True)
+            file_report = FileValidationReport(
+                file_name=file_config["name"],
+                file_path=file_config["path"],
+                file_format=file_config["format"],
+                status=Status.PASSED,
+            )
+            file_report.add_result(ValidationResult(
+                rule_name="FileProcessing",
+                severity=Severity.ERROR,
+                passed=False,
+                message=f"Error processing file: {str(e)}",
+                failed_count=1,
+            ))
+            file_report.update_status()
+            return file_report
+
+    @staticmethod
+    def _file_size(file_config: Dict[str, Any]) -> int:
+        """File size in bytes (0 for databases and missing files)."""
+        if file_config.get("format") == "database":
+            return 0
+        try:
+            return os.path.getsize(file_config["path"])
+        except (OSError, KeyError, TypeError):
+            return 0
@@ -0,0 +1,312 @@
+"""
+Parquet footer statistics: answer validations without reading data pages.
+
+Every row group of a Parquet file records, per column, its row count, null
+count and min/max values in the file footer. Before a Parquet file is
+scanned, the engines offer these statistics to each validation:
+
+- rules whose outcome follows from the statistics (no nulls in any row
+  group, every min/max inside the range, the row count) return their
+  result straight away and never touch the data
+- rules that can only rule out failures in some row groups read just the
+  remaining row groups; their sample rows are renumbered to file positions
+
+Everything else, and every file without usable statistics, runs on the
+normal chunked path. Set ``processing.parquet_statistics: false`` to
+disable the stage.
+
+Author: Daniel Edge
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from validation_framework.core.results import ValidationResult
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# Largest share of the file's rows a pruned scan may read; above it the
+# rule joins the normal scan, which reads the file once for all rules
+PRUNE_MAX_SHARE = 0.5
+
+# First characters that cannot start a whitespace-only string: above
+# " " and below "\x85", the first non-ASCII character str.strip() removes
+_BLANK_FREE_LOW = " "
+_BLANK_FREE_HIGH = "\x85"
+
+
+@dataclass
+class ColumnChunkStatistics:
+    """
+    Footer statistics of one column in one row group.
+
+    Attributes:
+        num_rows: Rows in the row group
+        null_count: Null values in the column, or None if not recorded
+        min: Smallest non-null value (valid only if has_min_max)
+        max: Largest non-null value (valid only if has_min_max)
+        has_min_max: Whether min and max were recorded
+    """
+
+    num_rows: int
+    null_count: Optional[int] = None
+    min: Any = None
+    max: Any = None
+    has_min_max: bool = False
+
+    @property
+    def all_null(self) -> bool:
+        """Whether every value in the row group is null."""
+        return self.null_count is not None and self.null_count == self.num_rows
+
+    def may_be_blank(self) -> bool:
+        """
+        Whether a string column chunk may hold empty or whitespace-only values.
+
+        Every value sorts between min and max, so if both start with a
+        character that is neither whitespace nor below a space, so does
+        every value.
+        """
+        if not self.has_min_max or not self.min or not self.max:
+            return True
+        return not (_BLANK_FREE_LOW < self.min[0] and self.max[0] < _BLANK_FREE_HIGH)
+
+
+class ParquetStatistics:
+    """
+    Row-group statistics of a Parquet file, read from its footer.
+
+    Attributes:
+        path: Path of the Parquet file
+        num_rows: Rows in the file
+        row_group_rows: Rows in each row group
+        columns: Top-level column names
+    """
+
+    def __init__(self, path: str):
+        """
+        Read the footer of a Parquet file.
+
+        Args:
+            path: Path of the Parquet file
+
+        Raises:
+            Exception: If the file is not a readable Parquet file
+        """
+        parquet_file = pq.ParquetFile(path)
+        self._metadata = parquet_file.metadata
+        self._schema = parquet_file.schema_arrow
+
+        self.path = path
+        self.num_rows = self._metadata.num_rows
+        self.row_group_rows = [
+            self._metadata.row_group(i).num_rows for i in range(self._metadata.num_row_groups)
+        ]
+        self.columns = list(self._schema.names)
+
+        # Position of each flat (non-nested) column among the leaf columns
+        self._leaf_index = {
+            self._metadata.schema.column(j).path: j for j in range(self._metadata.num_columns)
+        }
+        self._cache: Dict[str, List[ColumnChunkStatistics]] = {}
+
+    @property
+    def num_row_groups(self) -> int:
+        """Number of row groups in the file."""
+        return len(self.row_group_rows)
+
+    def column(self, name: str) -> Optional[List[ColumnChunkStatistics]]:
+        """
+        Get the statistics of a column, one entry per row group.
+
+        Args:
+            name: Top-level column name
+
+        Returns:
+            List of ColumnChunkStatistics, or None for unknown or nested columns
+        """
+        if name in self._cache:
+            return self._cache[name]
+        if name not in self.columns or name not in self._leaf_index:
+            return None
+
+        leaf = self._leaf_index[name]
+        chunks = []
+        for index, num_rows in enumerate(self.row_group_rows):
+            stats = self._metadata.row_group(index).column(leaf).statistics
+            if stats is None:
+                chunks.append(ColumnChunkStatistics(num_rows=num_rows))
+                continue
+            chunks.append(ColumnChunkStatistics(
+                num_rows=num_rows,
+                null_count=stats.null_count if stats.has_null_count else None,
+                min=stats.min if stats.has_min_max else None,
+                max=stats.max if stats.has_min_max else None,
+                has_min_max=stats.has_min_max,
+            ))
+
+        self._cache[name] = chunks
+        return chunks
+
+    def _column_type(self, name: str) -> Optional["pa.DataType"]:
+        """Arrow type of a top-level column (None if unknown)."""
+        if name not in self.columns:
+            return None
+        return self._schema.field(name).type
+
+    def is_integer(self, name: str) -> bool:
+        """Whether a column holds integers."""
+        column_type = self._column_type(name)
+        return column_type is not None and pa.types.is_integer(column_type)
+
+    def is_floating(self, name: str) -> bool:
+        """Whether a column holds floats (NaN is not counted in null_count)."""
+        column_type = self._column_type(name)
+        return column_type is not None and pa.types.is_floating(column_type)
+
+    def is_string(self, name: str) -> bool:
+        """Whether a column holds strings."""
+        column_type = self._column_type(name)
+        return column_type is not None and (pa.types.is_string(column_type) or pa.types.is_large_string(column_type))
+
+    def rows_in(self, row_groups: Iterable[int]) -> int:
+        """Number of rows in the given row groups."""
+        return sum(self.row_group_rows[index] for index in row_groups)
+
+    def file_rows(self, row_groups: List[int], positions: List[int]) -> List[int]:
+        """
+        Map row positions within a read of ``row_groups`` to file row numbers.
+
+        Args:
+            row_groups: Row groups that were read, in ascending order
+            positions: 0-based row positions in the concatenated read
+
+        Returns:
+            0-based row numbers in the whole file
+        """
+        starts = np.concatenate([[0], np.cumsum(self.row_group_rows)])[row_groups]
+        read_starts = np.concatenate([[0], np.cumsum([self.row_group_rows[i] for i in row_groups])])
+        groups = np.searchsorted(read_starts, positions, side="right") - 1
+        return [int(starts[group] + position - read_starts[group]) for group, position in zip(groups, positions)]
+
+
+def _read_statistics(file_config: Dict[str, Any]) -> Optional[ParquetStatistics]:
+    """Read the footer statistics of a Parquet file (None if not possible)."""
+    if not HAS_PYARROW or (file_config.get("format") or "").lower() != "parquet":
+        return None
+    try:
+        return ParquetStatistics(file_config["path"])
+    except Exception as e:
+        logger.debug(f"Cannot read Parquet statistics of {file_config.get('path')}: {e}")
+        return None
+
+
+def _pruned_scan(validation: Any, statistics: ParquetStatistics, row_groups: List[int],
+                 file_config: Dict[str, Any], chunk_size: int, max_samples: int) -> ValidationResult:
+    """Run a validation over some row groups and turn it into the whole-file result."""
+    from validation_framework.loaders.factory import LoaderFactory
+
+    loader = LoaderFactory.create_loader(
+        file_path=file_config["path"],
+        file_format="parquet",
+        chunk_size=chunk_size,
+        columns=validation.get_required_columns(),
+        row_groups=row_groups,
+    )
+    context = {
+        "file_path": file_config["path"],
+        "file_name": file_config["name"],
+        "file_format": file_config["format"],
+        "file_config": file_config,
+        "chunk_size": chunk_size,
+        "max_sample_failures": max_samples,
+        "total_rows": statistics.num_rows,
+    }
+    result = validation.validate(loader.load(), context)
+    return validation.result_from_pruned_scan(result, statistics, row_groups)
+
+
+def answer_statistics_validations(file_config: Dict[str, Any], registry: Any, chunk_size: int,
+                                  max_samples: int, skip: Iterable[int] = ()) -> Dict[int, ValidationResult]:
+    """
+    Answer a Parquet file's validations from its footer statistics.
+
+    Args:
+        file_config: File configuration dictionary (with "validations")
+        registry: ValidationRegistry used to instantiate the validations
+        chunk_size: Rows per chunk for pruned scans
+        max_samples: Maximum sample failures collected per validation
+        skip: Indexes already answered elsewhere (e.g. the compiled rule query)
+
+    Returns:
+        Results keyed by index in ``file_config["validations"]``. Validations
+        missing from the dict must run on the normal path.
+    """
+    statistics = _read_statistics(file_config)
+    if statistics is None:
+        return {}
+
+    from validation_framework.validations.base import ValidationRule
+
+    skip = set(skip)
+    results = {}
+    pruned = 0
+
+    for position, validation_config in enumerate(file_config.get("validations", [])):
+        if position in skip or not validation_config.get("enabled", True):
+            continue
+        try:
+            validation_class = registry.get(validation_config["type"])
+        except KeyError:
+            continue
+        if (validation_class.result_from_statistics is ValidationRule.result_from_statistics
+                and validation_class.prune_row_groups is ValidationRule.prune_row_groups):
+            continue
+
+        start = time.time()
+        try:
+            validation = validation_class(
+                name=validation_config["type"],
+                severity=validation_config["severity"],
+                params=validation_config.get("params", {}),
+                condition=validation_config.get("condition"),
+            )
+
+            # Missing columns are reported by the normal path
+            required = validation.get_required_columns()
+            if required is None or not required <= set(statistics.columns):
+                continue
+
+            result = validation.result_from_statistics(statistics)
+            if result is None:
+                row_groups = validation.prune_row_groups(statistics)
+                if row_groups is None or statistics.rows_in(row_groups) > statistics.num_rows * PRUNE_MAX_SHARE:
+                    continue
+                result = _pruned_scan(validation, statistics, sorted(row_groups), file_config, chunk_size, max_samples)
+                pruned += 1
+        except Exception as e:
+            logger.debug(f"Parquet statistics not used for {validation_config['type']}: {e}")
+            continue
+
+        result.execution_time = time.time() - start
+        results[position] = result
+
+    if results:
+        logger.info(
+            f"Answered {len(results)} validation(s) for {file_config.get('name')} from Parquet statistics "
+            f"({pruned} with a pruned scan, {statistics.num_row_groups} row groups)"
+        )
+    return results
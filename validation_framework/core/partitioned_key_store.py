@@ -0,0 +1,572 @@
+"""
+Hash-partitioned on-disk key store for very large duplicate/unique-key checks.
+
+Once ``MemoryBoundedTracker`` spills, every key costs a SHA-256, a pickle and
+a SQLite round trip. ``PartitionedKeyStore`` keeps keys as compact 64-bit
+fingerprints instead:
+
+- each batch of keys is hashed in one vectorized call; a second, independent
+  hash picks one of N partitions, so a key is identified by
+  64 + log2(N) bits
+- new fingerprints are buffered in memory as sorted arrays per partition
+  (arrays of similar size are merged, so there are O(log n) per partition)
+- when the buffer exceeds ``max_memory_keys`` every partition is written to
+  disk as a sorted run of fixed-width uint64 values; runs of similar size are
+  merged (sort + dedupe) so each partition only has O(log n) runs
+- lookups group the batch by partition and binary-search the buffered
+  array and the memory-mapped runs
+
+At 8 bytes per key, 2 billion keys need ~16 GB of disk and only the
+in-memory buffer plus one partition's runs are touched at a time. Keys are
+not stored, only fingerprints: the probability of reporting a false
+duplicate is about n^2 / 2^(65 + log2(N)) (below 1e-3 for 2 billion keys
+with 256 partitions).
+
+The batch APIs (``add_many``/``contains_many``) take a DataFrame of key
+columns, a Series/array of scalar keys or a list of keys. Numeric columns
+are hashed by value: integers from their exact int64 value and floats
+holding a whole number as that integer, so a column read as int in one
+chunk and float in another hashes identically while int64 IDs above 2^53
+stay distinct. Object columns hash every value with its type: numbers
+(and nulls) as in a numeric column, strings as text and other values as
+``<type>:<repr>``, so the int 1 and the string "1" of a JSON id column
+stay distinct. Keys of one store should always be passed the same way: a
+tuple key passed to ``add`` is hashed as a tuple value, not column by
+column.
+
+Example:
+    >>> with PartitionedKeyStore(max_memory_keys=5_000_000) as store:
+    ...     for chunk in chunks:
+    ...         is_new = store.add_many(chunk[["customer_id", "date"]])
+    ...         duplicates += int((~is_new).sum())
+
+Author: Daniel Edge
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+import uuid
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Changes whenever hash_keys() hashes some key differently; part of the
+# file names of persisted hashes (reference indexes)
+HASH_VERSION = 2
+
+# siphash keys for object columns and input mix for numeric columns, per seed
+_HASH_KEYS = ("datak9keystore00", "datak9partition1")
+# siphash keys for "<type>:<repr>" texts of values that are neither numbers nor strings
+_TYPED_KEYS = ("datak9typedval00", "datak9typedval01")
+_NUMERIC_MIX = (np.uint64(0), np.uint64(0x9E3779B97F4A7C15))
+# Mixed into the bits of fractional/NaN/infinite floats so they never equal an integer's bits
+_FLOAT_TAG = np.uint64(0xC2B2AE3D27D4EB4F)
+# Multiplier used to combine column hashes (odd, so combining is bijective)
+_COMBINE = np.uint64(0x100000001B3)
+
+
+def hash_keys(keys: Any, seed: int = 0) -> np.ndarray:
+    """
+    Hash keys into uint64 values, one per row/key.
+
+    Args:
+        keys: DataFrame of key columns, Series/array of scalar keys, or a
+              list of keys (tuples are hashed as one value each)
+        seed: 0 or 1, selecting one of two independent hash functions
+
+    Returns:
+        uint64 array with one hash per key
+    """
+    if isinstance(keys, pd.DataFrame):
+        columns = [series for _, series in keys.items()]
+    elif isinstance(keys, pd.Series):
+        columns = [keys]
+    else:
+        columns = [pd.Series(keys if isinstance(keys, np.ndarray) else list(keys))]
+
+    hashes = np.full(len(columns[0]) if columns else 0, _NUMERIC_MIX[seed], dtype=np.uint64)
+    for series in columns:
+        hashes = (hashes ^ _hash_column(series, seed)) * _COMBINE
+    return hashes
+
+
+def _hash_column(series: pd.Series, seed: int) -> np.ndarray:
+    """Hash one key column (numeric by value, otherwise by value and type)."""
+    if pd.api.types.is_numeric_dtype(series):
+        return _hash_numbers(series, seed)
+
+    values = series.to_numpy(dtype=object)
+    if pd.api.types.infer_dtype(values, skipna=True) != "string":
+        return _hash_typed_values(values, seed)
+
+    # Strings (the common case) in one call; nulls hash as in numeric columns
+    hashes = pd.util.hash_array(values, hash_key=_HASH_KEYS[seed])
+    missing = pd.isna(values)
+    if missing.any():
+        hashes[missing] = _hash_numbers(pd.Series([np.nan]), seed)[0]
+    return hashes
+
+
+def _hash_numbers(series: pd.Series, seed: int) -> np.ndarray:
+    """Hash a numeric column by value."""
+    return pd.util.hash_array(_numeric_bits(series) ^ _NUMERIC_MIX[seed])
+
+
+def _hash_typed_values(values: np.ndarray, seed: int) -> np.ndarray:
+    """
+    Hash an object column holding other values than strings.
+
+    hash_array hashes objects through their string form, so the int 1 and
+    the string "1" would collide. Numbers in int64/float range and nulls are
+    hashed as in a numeric column instead, strings as text, and every other
+    value (dates, tuples, very large ints, ...) as "<type>:<repr>" with a
+    separate hash key.
+    """
+    is_string = np.fromiter((isinstance(value, str) for value in values), dtype=bool, count=len(values))
+    is_number = np.fromiter((_is_hashable_number(value) for value in values), dtype=bool, count=len(values))
+    is_other = ~(is_string | is_number)
+
+    hashes = np.empty(len(values), dtype=np.uint64)
+    if is_string.any():
+        hashes[is_string] = pd.util.hash_array(values[is_string], hash_key=_HASH_KEYS[seed])
+    if is_number.any():
+        numbers = values[is_number]
+        numbers[pd.isna(numbers)] = np.nan
+        hashes[is_number] = _hash_numbers(pd.to_numeric(pd.Series(numbers)), seed)
+    if is_other.any():
+        tagged = np.array(
+            [f"{type(value).__module__}.{type(value).__qualname__}:{value!r}" for value in values[is_other]],
+            dtype=object,
+        )
+        hashes[is_other] = pd.util.hash_array(tagged, hash_key=_TYPED_KEYS[seed])
+    return hashes
+
+
+def _is_hashable_number(value: Any) -> bool:
+    """True for nulls and for numbers _numeric_bits hashes exactly (bools, int64 range ints, floats)."""
+    if isinstance(value, (bool, np.bool_, float, np.floating)) or value is None:
+        return True
+    if isinstance(value, (int, np.integer)):
+        return -2 ** 63 <= value < 2 ** 63
+    return value is pd.NA or value is pd.NaT
+
+
+def _numeric_bits(series: pd.Series) -> np.ndarray:
+    """
+    Map numeric keys to uint64 bits that identify their value.
+
+    Integer and boolean columns use their int64 bits, which are exact for
+    every int64 (a float64 has only 53 bits of mantissa). Floats holding a
+    whole number in int64 range use the bits of that integer, so 3 and 3.0
+    match; other floats (and nulls) use their float64 bits mixed with a tag.
+    """
+    if pd.api.types.is_integer_dtype(series) or pd.api.types.is_bool_dtype(series):
+        if not series.hasnans:
+            return series.to_numpy(dtype=np.int64).view(np.uint64)
+        # Nullable integers: exact bits for values, the float NaN bits for nulls
+        missing = series.isna().to_numpy()
+        bits = series.to_numpy(dtype=np.int64, na_value=0).view(np.uint64)
+        bits[missing] = np.array([np.nan]).view(np.uint64)[0] ^ _FLOAT_TAG
+        return bits
+
+    # + 0.0 folds -0.0 into 0.0; NaNs are replaced to drop their payload bits
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan) + 0.0
+    values[np.isnan(values)] = np.nan
+    with np.errstate(invalid="ignore"):
+        whole = np.isfinite(values) & (values == np.floor(values)) & (np.abs(values) < 2.0 ** 63)
+    integers = np.where(whole, values, 0.0).astype(np.int64).view(np.uint64)
+    return np.where(whole, integers, values.view(np.uint64) ^ _FLOAT_TAG)
+
+
+def _in_sorted(sorted_values: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Membership of ``values`` in a sorted array (binary search)."""
+    if len(sorted_values) == 0:
+        return np.zeros(len(values), dtype=bool)
+    positions = np.minimum(np.searchsorted(sorted_values, values), len(sorted_values) - 1)
+    return sorted_values[positions] == values
+
+
+class PartitionedKeyStore:
+    """
+    Set of keys kept as fingerprints in hash-partitioned sorted runs on disk.
+
+    Drop-in alternative to MemoryBoundedTracker for key-based checks that
+    track far more keys than fit in memory. Offers the same single-key API
+    (``add``, ``has_seen``, ``add_and_check``) plus vectorized ``add_many``
+    and ``contains_many``. Original keys are not kept, so ``iter_keys`` is
+    not available; partial stores are combined with ``fingerprints`` and
+    ``add_fingerprints`` instead.
+    """
+
+    def __init__(
+        self,
+        max_memory_keys: int = 10_000_000,
+        partitions: int = 256,
+        directory: Optional[str] = None,
+        auto_cleanup: bool = True
+    ):
+        """
+        Initialize the key store.
+
+        Args:
+            max_memory_keys: Fingerprints buffered in memory before they are
+                             written to disk (8 bytes each)
+            partitions: Number of hash partitions
+            directory: Directory for partition runs. If None, a temporary
+                       directory is created on first spill.
+            auto_cleanup: Whether to delete the partition runs on close
+        """
+        if partitions < 1:
+            raise ValueError("partitions must be at least 1")
+
+        self.max_memory_keys = max_memory_keys
+        self.partitions = partitions
+        self.directory = directory
+        self.auto_cleanup = auto_cleanup
+
+        self._created_directory = False
+        self._pending: List[List[np.ndarray]] = [[] for _ in range(partitions)]
+        self._pending_count = 0
+        self._runs: List[List[Tuple[str, int]]] = [[] for _ in range(partitions)]
+        self._run_sequence = 0
+        self.is_spilled = False
+        # Prefix of this store's run files in run checkpoints (set when first saved)
+        self._spill_id: Optional[str] = None
+
+        # Statistics
+        self.total_keys = 0
+        self.total_keys_added = 0
+        self.total_lookups = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+
+    # ------------------------------------------------------------------
+    # Batch API
+    # ------------------------------------------------------------------
+
+    def fingerprint(self, keys: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the (partition, fingerprint) of every key.
+
+        Args:
+            keys: Keys as accepted by hash_keys()
+
+        Returns:
+            Tuple of (partition index array, uint64 fingerprint array)
+        """
+        fingerprints = hash_keys(keys, seed=0)
+        partitions = (hash_keys(keys, seed=1) % np.uint64(self.partitions)).astype(np.int64)
+        return partitions, fingerprints
+
+    def contains_many(self, keys: Any) -> np.ndarray:
+        """
+        Check which keys have been added before.
+
+        Args:
+            keys: Keys as accepted by hash_keys()
+
+        Returns:
+            Boolean array, True where the key was previously added
+        """
+        return self._contains(*self.fingerprint(keys))
+
+    def add_many(self, keys: Any) -> np.ndarray:
+        """
+        Add a batch of keys.
+
+        A key repeated within the batch is only new at its first position.
+
+        Args:
+            keys: Keys as accepted by hash_keys()
+
+        Returns:
+            Boolean array, True where the key was newly added (False marks a
+            duplicate)
+        """
+        return self.add_fingerprints(*self.fingerprint(keys))
+
+    def add_fingerprints(self, partitions: np.ndarray, fingerprints: np.ndarray) -> np.ndarray:
+        """
+        Add precomputed fingerprints (e.g. from another store's fingerprints()).
+
+        Args:
+            partitions: Partition index of every fingerprint
+            fingerprints: uint64 fingerprints
+
+        Returns:
+            Boolean array, True where the fingerprint was newly added
+        """
+        partitions = np.asarray(partitions, dtype=np.int64)
+        fingerprints = np.asarray(fingerprints, dtype=np.uint64)
+
+        # First occurrence of each (partition, fingerprint) within the batch
+        order = np.lexsort((fingerprints, partitions))
+        repeat = np.zeros(len(order), dtype=bool)
+        repeat[1:] = (
+            (partitions[order][1:] == partitions[order][:-1])
+            & (fingerprints[order][1:] == fingerprints[order][:-1])
+        )
+        first_in_batch = np.ones(len(order), dtype=bool)
+        first_in_batch[order[repeat]] = False
+
+        new = first_in_batch & ~self._contains(partitions, fingerprints)
+        self._insert(partitions[new], fingerprints[new])
+        return new
+
+    def fingerprints(self) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Iterate over the stored fingerprints, one partition at a time.
+
+        Yields:
+            Tuples of (partition index, sorted unique uint64 fingerprints)
+        """
+        for partition in range(self.partitions):
+            values = self._partition_values(partition)
+            if len(values):
+                yield partition, values
+
+    # ------------------------------------------------------------------
+    # Single-key API (compatible with MemoryBoundedTracker)
+    # ------------------------------------------------------------------
+
+    def has_seen(self, key: Any) -> bool:
+        """Check if a key has been added before."""
+        return bool(self.contains_many([key])[0])
+
+    def add(self, key: Any) -> bool:
+        """Add a key; returns True if it was newly added."""
+        return bool(self.add_many([key])[0])
+
+    def add_and_check(self, key: Any) -> Tuple[bool, bool]:
+        """Add a key; returns (was_seen_before, was_added)."""
+        added = self.add(key)
+        return not added, added
+
+    def iter_keys(self) -> Iterator[Any]:
+        """Not available: only fingerprints are stored (use fingerprints())."""
+        raise NotImplementedError(
+            "PartitionedKeyStore keeps fingerprints only; use fingerprints() and add_fingerprints()"
+        )
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get statistics about key store usage.
+
+        Returns:
+            Dictionary with the same keys as MemoryBoundedTracker.get_statistics()
+            plus the partition count
+        """
+        memory_hit_rate = (
+            (self.memory_hits / self.total_lookups * 100)
+            if self.total_lookups > 0
+            else 0
+        )
+        return {
+            "total_keys": self.total_keys,
+            "memory_keys": self._pending_count,
+            "disk_keys": self.total_keys - self._pending_count,
+            "is_spilled": self.is_spilled,
+            "total_lookups": self.total_lookups,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "memory_hit_rate": round(memory_hit_rate, 2),
+            "total_keys_added": self.total_keys_added,
+            "partitions": self.partitions,
+        }
+
+    def close(self) -> None:
+        """Release memory and, if auto_cleanup is enabled, delete the partition runs."""
+        if self.auto_cleanup:
+            for runs in self._runs:
+                for path, _ in runs:
+                    if os.path.exists(path):
+                        os.remove(path)
+            if self._created_directory and self.directory and os.path.isdir(self.directory):
+                shutil.rmtree(self.directory, ignore_errors=True)
+                self._created_directory = False
+
+        self._runs = [[] for _ in range(self.partitions)]
+        self._pending = [[] for _ in range(self.partitions)]
+        self._pending_count = 0
+
+        logger.info(
+            f"Key store closed. Statistics: {self.total_keys:,} total keys, "
+            f"{self.total_lookups:,} lookups, spilled={self.is_spilled}"
+        )
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _contains(self, partitions: np.ndarray, fingerprints: np.ndarray) -> np.ndarray:
+        """Membership of fingerprints, resolved one partition at a time."""
+        found = np.zeros(len(fingerprints), dtype=bool)
+        self.total_lookups += len(fingerprints)
+
+        for partition, positions in self._group(partitions):
+            values = fingerprints[positions]
+            in_memory = np.zeros(len(values), dtype=bool)
+            for buffered in self._pending[partition]:
+                in_memory |= _in_sorted(buffered, values)
+            hits = in_memory.copy()
+            for path, length in self._runs[partition]:
+                remaining = ~hits
+                if not remaining.any():
+                    break
+                run = np.memmap(path, dtype=np.uint64, mode="r", shape=(length,))
+                hits[remaining] = _in_sorted(run, values[remaining])
+            found[positions] = hits
+            self.memory_hits += int(in_memory.sum())
+            self.disk_hits += int(hits.sum() - in_memory.sum())
+
+        return found
+
+    def _insert(self, partitions: np.ndarray, fingerprints: np.ndarray) -> None:
+        """Buffer new (unique, unseen) fingerprints; spill when the buffer is full."""
+        for partition, positions in self._group(partitions):
+            buffered = self._pending[partition]
+            buffered.append(np.sort(fingerprints[positions]))
+            while len(buffered) > 1 and len(buffered[-2]) <= 2 * len(buffered[-1]):
+                newer = buffered.pop()
+                buffered.append(np.union1d(buffered.pop(), newer))
+
+        self._pending_count += len(fingerprints)
+        self.total_keys += len(fingerprints)
+        self.total_keys_added += len(fingerprints)
+
+        if self._pending_count >= self.max_memory_keys:
+            self._spill_to_disk()
+
+    @staticmethod
+    def _group(partitions: np.ndarray) -> Iterator[Tuple[int, np.ndarray]]:
+        """Yield (partition, positions) for every partition present in a batch."""
+        if len(partitions) == 0:
+            return
+        order = np.argsort(partitions, kind="stable")
+        values, starts = np.unique(partitions[order], return_index=True)
+        bounds = list(starts[1:]) + [len(order)]
+        for partition, start, end in zip(values, starts, bounds):
+            yield int(partition), order[start:end]
+
+    def _spill_to_disk(self) -> None:
+        """Write every partition's buffer to disk as a sorted run."""
+        if self.directory is None:
+            self.directory = tempfile.mkdtemp(prefix="keystore_")
+            self._created_directory = True
+            logger.info(f"Created key store directory for spillover: {self.directory}")
+        os.makedirs(self.directory, exist_ok=True)
+
+        logger.info(f"Key store buffer full ({self._pending_count:,} keys). Writing partition runs...")
+
+        for partition in range(self.partitions):
+            buffered = self._pending[partition]
+            if not buffered:
+                continue
+            values = buffered[0] if len(buffered) == 1 else np.unique(np.concatenate(buffered))
+            self._runs[partition].append(self._write_run(partition, values))
+            self._pending[partition] = []
+            self._compact(partition)
+
+        self._pending_count = 0
+        self.is_spilled = True
+
+    def _write_run(self, partition: int, values: np.ndarray) -> Tuple[str, int]:
+        """Write a sorted uint64 run file for a partition."""
+        self._run_sequence += 1
+        path = os.path.join(self.directory, f"p{partition:05d}-{self._run_sequence:08d}.u64")
+        values.astype(np.uint64, copy=False).tofile(path)
+        return path, len(values)
+
+    def _compact(self, partition: int) -> None:
+        """Merge runs of similar size so a partition keeps O(log n) runs."""
+        runs = self._runs[partition]
+        while len(runs) > 1 and runs[-2][1] <= 2 * runs[-1][1]:
+            newer = runs.pop()
+            older = runs.pop()
+            merged = np.union1d(np.fromfile(older[0], dtype=np.uint64), np.fromfile(newer[0], dtype=np.uint64))
+            runs.append(self._write_run(partition, merged))
+            os.remove(older[0])
+            os.remove(newer[0])
+
+    def _partition_values(self, partition: int) -> np.ndarray:
+        """Read all fingerprints of one partition (sorted, unique)."""
+        parts = [np.fromfile(path, dtype=np.uint64) for path, _ in self._runs[partition]]
+        parts.extend(self._pending[partition])
+        if not parts:
+            return np.empty(0, dtype=np.uint64)
+        if len(parts) == 1:
+            return parts[0]
+        return np.unique(np.concatenate(parts))
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Support pickling (partial states from worker processes, checkpoints).
+
+        Run files belong to this store, so the fingerprints are read back and
+        sent in memory; the receiving store spills again if needed. Inside a
+        run checkpoint the run files (never modified once written) are
+        hard-linked into the checkpoint's spill directory instead and only
+        their paths and the in-memory buffer are pickled.
+        """
+        from validation_framework.core.run_checkpoint import active_spill_files
+
+        state = self.__dict__.copy()
+        state["directory"] = None
+        state["_created_directory"] = False
+
+        spill_files = active_spill_files()
+        if spill_files is not None and self.is_spilled:
+            if self._spill_id is None:
+                self._spill_id = state["_spill_id"] = uuid.uuid4().hex
+            state["_runs"] = [
+                [(spill_files.link(path, f"{self._spill_id}-{os.path.basename(path)}"), length)
+                 for path, length in runs]
+                for runs in self._runs
+            ]
+            state["_checkpoint_runs"] = True
+            return state
+
+        state["_pending"] = [[self._partition_values(p)] for p in range(self.partitions)]
+        state["_pending_count"] = self.total_keys
+        state["_runs"] = [[] for _ in range(self.partitions)]
+        state["is_spilled"] = False
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled store, spilling to disk if over the memory limit."""
+        from validation_framework.core.run_checkpoint import link_spill_file
+
+        checkpoint_runs = state.pop("_checkpoint_runs", False)
+        self.__dict__.update(state)
+        if checkpoint_runs:
+            # Link the checkpoint's runs into a directory of this store, which
+            # may merge and delete them without touching the checkpoint
+            self.directory = tempfile.mkdtemp(prefix="keystore_")
+            self._created_directory = True
+            prefix = f"{self._spill_id}-"
+            self._runs = [
+                [(link_spill_file(path, os.path.join(self.directory, os.path.basename(path)[len(prefix):])), length)
+                 for path, length in runs]
+                for runs in self._runs
+            ]
+        if self._pending_count >= self.max_memory_keys:
+            self._spill_to_disk()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - ensures cleanup."""
+        self.close()
+        return False
+
+    def __del__(self):
+        """Destructor - removes a temporary run directory if close() was not called."""
+        if getattr(self, "_created_directory", False) and getattr(self, "auto_cleanup", False):
+            shutil.rmtree(self.directory, ignore_errors=True)
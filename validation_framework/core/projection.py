@@ -0,0 +1,59 @@
+"""
+Column projection for file validation.
+
+Most validations read one or two columns, yet loaders parse every column
+of every row. The engines ask each validation which columns it needs
+(``ValidationRule.get_required_columns``) and pass the union down to the
+loader, which then only parses those columns (CSV ``usecols``, Parquet
+column selection).
+
+If any validation cannot declare its columns, the whole file is read.
+
+Author: Daniel Edge
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_required_columns(validation_configs: List[Dict[str, Any]], registry: Any) -> Optional[List[str]]:
+    """
+    Work out which columns a file's validations need.
+
+    Args:
+        validation_configs: Validation configurations for one file
+        registry: ValidationRegistry used to instantiate the validations
+
+    Returns:
+        Sorted list of column names, or None if every column must be read
+    """
+    columns = set()
+
+    for validation_config in validation_configs:
+        if not validation_config.get("enabled", True):
+            continue
+
+        try:
+            validation_class = registry.get(validation_config["type"])
+            validation = validation_class(
+                name=validation_config["type"],
+                severity=validation_config["severity"],
+                params=validation_config.get("params", {}),
+                condition=validation_config.get("condition"),
+            )
+        except Exception:
+            # The engine reports unknown or misconfigured validations; they read nothing
+            continue
+
+        required = validation.get_required_columns()
+        if required is None:
+            return None
+        columns |= required
+
+    if not columns:
+        # Only file-level checks: keep the loaders' row counts meaningful
+        return None
+
+    return sorted(columns)
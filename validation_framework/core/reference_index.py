@@ -0,0 +1,374 @@
+"""
+Shared, persistent index of reference-file keys for cross-file checks.
+
+ReferentialIntegrityCheck, CrossFileKeyCheck and CrossFileDuplicateCheck
+all look keys up in another ("reference") file. Without an index every
+validation re-reads and re-hashes that file, once per rule and once per
+run. ``get_reference_index`` builds the index once and shares it:
+
+- an index holds the sorted, unique uint64 hashes (``hash_keys``) of every
+  reference row whose key columns are all non-null (8 bytes per key)
+- indexes are cached per process, keyed on (path, key columns, format), and
+  rebuilt when the file's modification time or size changes
+- with a cache directory, indexes are also written to disk as ``.npy`` files
+  and memory-mapped by later validations and later runs, so an unchanged
+  reference file is only read once
+
+Lookups are vectorized: a chunk's key columns are hashed in one call and
+resolved with a binary search (``contains``). Keys match by value, the same
+way as the duplicate checks: numeric columns compare as float64 (so an int
+column matches a float column) and other columns by object value. Because
+only hashes are stored, ``lookup_values`` re-reads the reference file when a
+rule needs to report actual key values (e.g. reference keys missing from the
+current file).
+
+Example YAML:
+    processing:
+      reference_index_dir: ".datak9_cache/reference_index"   # null: memory only
+
+Author: Daniel Edge
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from validation_framework.core.exceptions import DataLoadError
+from validation_framework.core.partitioned_key_store import HASH_VERSION, hash_keys, _in_sorted
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFERENCE_INDEX_DIR = os.path.join(".datak9_cache", "reference_index")
+
+# Reference indexes kept per process (least recently used are dropped first)
+MAX_CACHED_INDEXES = 32
+
+# Rows read per batch when building an index from CSV or Parquet
+_READ_BATCH_ROWS = 1_000_000
+
+_cache: "OrderedDict[Tuple[str, Tuple[str, ...], str], ReferenceKeyIndex]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+class ReferenceKeyIndex:
+    """
+    Sorted hashes of the (non-null) keys of one reference file.
+
+    Created by get_reference_index(); the ``hashes`` array may be memory-mapped
+    from the on-disk index and must not be modified.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        columns: Sequence[str],
+        file_format: str,
+        hashes: np.ndarray,
+        signature: Tuple[int, int] = (0, 0)
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            path: Absolute path of the reference file
+            columns: Key columns of the reference file
+            file_format: Reference file format (csv, parquet, excel, json)
+            hashes: Sorted unique uint64 key hashes
+            signature: (mtime_ns, size) of the file the index was built from
+        """
+        self.path = path
+        self.columns = list(columns)
+        self.file_format = file_format
+        self.hashes = hashes
+        self.signature = signature
+
+    def __len__(self) -> int:
+        """Number of distinct reference keys."""
+        return len(self.hashes)
+
+    def contains(self, keys: Any) -> np.ndarray:
+        """
+        Check which keys exist in the reference file.
+
+        Args:
+            keys: DataFrame of key columns (in the order of the reference key
+                  columns) or a Series of single-column keys
+
+        Returns:
+            Boolean array, True where the key exists in the reference file
+        """
+        return self.contains_hashes(hash_keys(keys))
+
+    def contains_hashes(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Check which key hashes (from hash_keys()) exist in the reference file.
+
+        Args:
+            hashes: uint64 key hashes
+
+        Returns:
+            Boolean array, True where the hash is in the index
+        """
+        return _in_sorted(self.hashes, np.asarray(hashes, dtype=np.uint64))
+
+    def positions(self, hashes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Locate key hashes in the index.
+
+        Args:
+            hashes: uint64 key hashes
+
+        Returns:
+            Tuple of (found mask, index positions of the found hashes)
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if len(self.hashes) == 0:
+            return np.zeros(len(hashes), dtype=bool), np.empty(0, dtype=np.intp)
+        positions = np.minimum(np.searchsorted(self.hashes, hashes), len(self.hashes) - 1)
+        found = self.hashes[positions] == hashes
+        return found, positions[found]
+
+    def lookup_values(self, hashes: np.ndarray, limit: Optional[int] = None) -> List[Any]:
+        """
+        Fetch the original key values of some hashes by re-reading the file.
+
+        Args:
+            hashes: uint64 key hashes to resolve
+            limit: Maximum number of values to return
+
+        Returns:
+            Key values in file order: scalars for single-column keys, tuples
+            for composite keys
+        """
+        wanted = np.unique(np.asarray(hashes, dtype=np.uint64))
+        values: List[Any] = []
+        if len(wanted) == 0 or limit == 0:
+            return values
+
+        for keys in iter_reference_keys(self.path, self.columns, self.file_format):
+            batch_hashes = hash_keys(keys)
+            match = _in_sorted(wanted, batch_hashes)
+            if not match.any():
+                continue
+            matched = keys[match]
+            matched = matched[~pd.Series(batch_hashes[match]).duplicated().to_numpy()]
+            for row in matched.itertuples(index=False, name=None):
+                values.append(row[0] if len(row) == 1 else row)
+                if limit is not None and len(values) >= limit:
+                    return values
+            wanted = wanted[~_in_sorted(np.unique(batch_hashes[match]), wanted)]
+            if len(wanted) == 0:
+                break
+        return values
+
+
+def get_reference_index(
+    path: str,
+    columns: Sequence[str],
+    file_format: str = "csv",
+    cache_dir: Optional[str] = None
+) -> ReferenceKeyIndex:
+    """
+    Get the key index of a reference file, building it if needed.
+
+    The index is reused while the file's modification time and size are
+    unchanged: from this process's cache, else from ``cache_dir``.
+
+    Args:
+        path: Path of the reference file
+        columns: Key column(s) of the reference file
+        file_format: Reference file format (csv, parquet, excel, json)
+        cache_dir: Directory for persistent indexes (None: memory only)
+
+    Returns:
+        ReferenceKeyIndex for the file's current content
+
+    Raises:
+        DataLoadError: If the file cannot be read or lacks a key column
+    """
+    if isinstance(columns, str):
+        columns = [columns]
+    path = os.path.abspath(path)
+    file_format = file_format.lower()
+    cache_key = (path, tuple(columns), file_format)
+
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        raise DataLoadError(f"Cannot read reference file: {e}", file_path=path, original_exception=e)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _cache_lock:
+        index = _cache.get(cache_key)
+        if index is not None and index.signature == signature:
+            _cache.move_to_end(cache_key)
+            return index
+
+    index = _load_index(cache_key, signature, cache_dir) if cache_dir else None
+    if index is None:
+        index = _build_index(path, columns, file_format, signature)
+        if cache_dir:
+            _save_index(index, cache_key, cache_dir)
+
+    with _cache_lock:
+        _cache[cache_key] = index
+        _cache.move_to_end(cache_key)
+        while len(_cache) > MAX_CACHED_INDEXES:
+            _cache.popitem(last=False)
+    return index
+
+
+def clear_reference_cache() -> None:
+    """Drop every index cached in this process (persistent indexes are kept)."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def iter_reference_keys(
+    path: str,
+    columns: Sequence[str],
+    file_format: str = "csv",
+    batch_rows: int = _READ_BATCH_ROWS
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream the key columns of a reference file, skipping rows with a null key.
+
+    Args:
+        path: Path of the reference file
+        columns: Key column(s) to read
+        file_format: Reference file format (csv, parquet, excel, json)
+        batch_rows: Rows per batch for CSV and Parquet (Excel and JSON files
+                    are read in one batch)
+
+    Yields:
+        DataFrames with the key columns, in file order
+
+    Raises:
+        DataLoadError: If the file cannot be read or lacks a key column
+    """
+    columns = list(columns)
+    try:
+        for batch in _read_batches(path, columns, file_format.lower(), batch_rows):
+            batch = batch[columns].dropna()
+            if len(batch):
+                yield batch.reset_index(drop=True)
+    except DataLoadError:
+        raise
+    except Exception as e:
+        raise DataLoadError(
+            f"Error loading reference keys {columns} from {path}: {e}",
+            file_path=path,
+            original_exception=e
+        )
+
+
+def _read_batches(
+    path: str,
+    columns: List[str],
+    file_format: str,
+    batch_rows: int
+) -> Iterator[pd.DataFrame]:
+    """Read only the key columns of a reference file, in batches where the format allows."""
+    if file_format == "csv":
+        with pd.read_csv(path, usecols=columns, chunksize=batch_rows) as reader:
+            yield from reader
+    elif file_format in ("parquet", "pq"):
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        missing = [col for col in columns if col not in parquet_file.schema_arrow.names]
+        if missing:
+            raise ValueError(f"Columns not found in reference file: {missing}")
+        for batch in parquet_file.iter_batches(batch_size=batch_rows, columns=columns):
+            yield batch.to_pandas()
+    elif file_format in ("excel", "xlsx", "xls"):
+        yield pd.read_excel(path, usecols=columns)
+    elif file_format == "json":
+        df = pd.read_json(path)
+        missing = [col for col in columns if col not in df.columns]
+        if missing:
+            raise ValueError(f"Columns not found in reference file: {missing}")
+        yield df[columns]
+    else:
+        raise ValueError(f"Unsupported reference file format: {file_format}")
+
+
+def _build_index(
+    path: str,
+    columns: List[str],
+    file_format: str,
+    signature: Tuple[int, int]
+) -> ReferenceKeyIndex:
+    """Read and hash the key columns of a reference file."""
+    parts = [np.unique(hash_keys(keys)) for keys in iter_reference_keys(path, columns, file_format)]
+    if not parts:
+        hashes = np.empty(0, dtype=np.uint64)
+    elif len(parts) == 1:
+        hashes = parts[0]
+    else:
+        hashes = np.unique(np.concatenate(parts))
+
+    logger.debug(f"Built reference index for {path} {columns}: {len(hashes):,} keys")
+    return ReferenceKeyIndex(path, columns, file_format, hashes, signature)
+
+
+def _index_file_names(
+    cache_key: Tuple[str, Tuple[str, ...], str],
+    signature: Tuple[int, int]
+) -> Tuple[str, str]:
+    """(prefix shared by all versions of an index, file name of this version)."""
+    prefix = hashlib.sha256(repr(cache_key).encode("utf-8")).hexdigest()[:32]
+    version = hashlib.sha256(repr((signature, HASH_VERSION)).encode("utf-8")).hexdigest()[:16]
+    return prefix, f"{prefix}-{version}.npy"
+
+
+def _load_index(
+    cache_key: Tuple[str, Tuple[str, ...], str],
+    signature: Tuple[int, int],
+    cache_dir: str
+) -> Optional[ReferenceKeyIndex]:
+    """Memory-map a persistent index of this file version, if one exists."""
+    _, file_name = _index_file_names(cache_key, signature)
+    index_path = os.path.join(cache_dir, file_name)
+    if not os.path.exists(index_path):
+        return None
+    try:
+        hashes = np.load(index_path, mmap_mode="r")
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable reference index {index_path}: {e}")
+        return None
+    if hashes.dtype != np.uint64 or hashes.ndim != 1:
+        return None
+
+    path, columns, file_format = cache_key
+    logger.debug(f"Loaded reference index for {path} {list(columns)} from {index_path}")
+    return ReferenceKeyIndex(path, columns, file_format, hashes, signature)
+
+
+def _save_index(
+    index: ReferenceKeyIndex,
+    cache_key: Tuple[str, Tuple[str, ...], str],
+    cache_dir: str
+) -> None:
+    """Write an index atomically and remove older versions of it."""
+    prefix, file_name = _index_file_names(cache_key, index.signature)
+    index_path = os.path.join(cache_dir, file_name)
+    temp_path = f"{index_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(temp_path, "wb") as f:
+            np.save(f, np.ascontiguousarray(index.hashes, dtype=np.uint64))
+        os.replace(temp_path, index_path)
+        for name in os.listdir(cache_dir):
+            if name.startswith(prefix) and name.endswith(".npy") and name != file_name:
+                os.remove(os.path.join(cache_dir, name))
+    except OSError as e:
+        logger.warning(f"Could not persist reference index to {cache_dir}: {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
@@ -0,0 +1,520 @@
+"""
+Persistent result cache keyed by file fingerprint and validation config.
+
+Scheduled jobs often re-run the same configuration against files that have
+not changed since the last run. The result cache stores every
+ValidationResult under a key made of:
+
+- a fingerprint of the file: path, size, modification time and a hash of
+  sampled blocks (or, with ``hash_mode: full``, size and a hash of the whole
+  content, so an identical re-delivered file still matches)
+- a canonical hash of the validation's config and of the settings that
+  influence results (read options, chunk size, sample limit, engine)
+
+Unchanged (file, rule) pairs are answered from the cache; only the remaining
+validations are run. Results are kept in a SQLite database with LRU eviction
+by entry count and total size.
+
+Validations whose outcome depends on anything other than the file (other
+files, databases, history, the current time) declare ``cacheable = False``
+and always run. Conditions or rules mentioning ``today``/``now`` always run.
+
+Example YAML:
+    processing:
+      result_cache:
+        path: ".datak9_cache/results.db"
+        max_entries: 10000
+        max_size_mb: 100
+        hash_mode: sampled      # or "full"
+
+Author: Daniel Edge
+"""
+
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+
+from validation_framework.core.exceptions import ConfigError
+from validation_framework.core.results import (
+    FileValidationReport,
+    Severity,
+    Status,
+    ValidationResult,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(".datak9_cache", "results.db")
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_MAX_SIZE_MB = 100
+
+# Size of each block hashed by the sampled fingerprint (start, middle, end)
+_SAMPLE_BLOCK = 64 * 1024
+
+# File options that change how a file is read
+READ_OPTIONS = ("format", "delimiter", "encoding", "header", "sheet_name", "engine", "record_path")
+
+# Expressions referring to the current time give different results each run
+_CURRENT_TIME = re.compile(r"\b(today|now)\b", re.IGNORECASE)
+
+# Messages of results saying a validation could not run (an exception, an
+# invalid parameter such as a bad regex, an unknown validation type)
+_ERROR_MESSAGE = re.compile(r"^(Error|Invalid)\b|not found in registry")
+
+
+def file_fingerprint(path: str, hash_mode: str = "sampled") -> str:
+    """
+    Fingerprint a file (or a directory of files, e.g. a Parquet dataset).
+
+    Args:
+        path: File or directory path
+        hash_mode: "sampled" (size, mtime and start/middle/end blocks) or
+                   "full" (size and the whole content, ignoring mtime)
+
+    Returns:
+        Hex digest identifying the file's current content
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    digest = hashlib.sha256(f"{hash_mode}|{os.path.abspath(path)}".encode())
+
+    if os.path.isdir(path):
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                member = os.path.join(root, name)
+                digest.update(os.path.relpath(member, path).encode())
+                _hash_file(digest, member, hash_mode)
+    else:
+        _hash_file(digest, path, hash_mode)
+
+    return digest.hexdigest()
+
+
+def _hash_file(digest: Any, path: str, hash_mode: str) -> None:
+    """Add one file's size, mtime and content blocks to a digest."""
+    stat = os.stat(path)
+    size = stat.st_size
+
+    with open(path, "rb") as f:
+        if hash_mode == "full":
+            digest.update(f"|{size}|".encode())
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+            return
+
+        digest.update(f"|{size}|{stat.st_mtime_ns}|".encode())
+        for offset in sorted({0, max(0, size // 2 - _SAMPLE_BLOCK // 2), max(0, size - _SAMPLE_BLOCK)}):
+            f.seek(offset)
+            digest.update(f.read(_SAMPLE_BLOCK))
+
+
+def _json_default(value: Any) -> Any:
+    """Encode enums, numpy scalars and other values for canonical JSON."""
+    if isinstance(value, Enum):
+        return value.value
+    if hasattr(value, "item"):
+        try:
+            return value.item()
+        except (TypeError, ValueError):
+            pass
+    return str(value)
+
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=_json_default, separators=(",", ":"))
+
+
+def config_hash(value: Any) -> str:
+    """
+    Hash configuration values canonically (key order does not matter).
+
+    Args:
+        value: JSON-like configuration (enums and numpy scalars allowed)
+
+    Returns:
+        Hex digest
+    """
+    return hashlib.sha256(_canonical(value).encode()).hexdigest()
+
+
+def is_cacheable(validation_config: Dict[str, Any], registry: Any) -> bool:
+    """
+    Check whether a validation's result depends only on the file.
+
+    Args:
+        validation_config: Validation configuration dictionary
+        registry: ValidationRegistry used to look up the validation class
+
+    Returns:
+        True if the result may be reused while the file is unchanged
+    """
+    try:
+        validation_class = registry.get(validation_config["type"])
+    except KeyError:
+        return False
+
+    if not getattr(validation_class, "cacheable", True):
+        return False
+
+    params = validation_config.get("params") or {}
+    expressions = [validation_config.get("condition")]
+    expressions += [params.get(p) for p in getattr(validation_class, "expression_params", ())]
+    return not any(_CURRENT_TIME.search(e) for e in expressions if isinstance(e, str))
+
+
+def encode_result(result: ValidationResult) -> str:
+    """Serialize a ValidationResult to JSON (all fields, no truncation)."""
+    return _canonical({
+        "rule_name": result.rule_name,
+        "severity": result.severity,
+        "passed": result.passed,
+        "message": result.message,
+        "failed_count": result.failed_count,
+        "total_count": result.total_count,
+        "details": result.details,
+        "sample_failures": result.sample_failures,
+        "execution_time": result.execution_time,
+    })
+
+
+def decode_result(payload: str) -> ValidationResult:
+    """Restore a ValidationResult serialized by ``encode_result``."""
+    data = json.loads(payload)
+    data["severity"] = Severity(data["severity"])
+    return ValidationResult(**data)
+
+
+class ResultCache:
+    """
+    SQLite-backed cache of validation results with LRU eviction.
+
+    Example:
+        >>> cache = ResultCache(".datak9_cache/results.db", max_entries=5000)
+        >>> report = cache.validate_file(file_config, registry, scope, run_validations)
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_size_mb: float = DEFAULT_MAX_SIZE_MB, hash_mode: str = "sampled"):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file (parent directories are created)
+            max_entries: Maximum number of cached results
+            max_size_mb: Maximum total size of cached results in MB
+            hash_mode: File fingerprint mode, "sampled" or "full"
+
+        Raises:
+            ConfigError: If a limit or the hash mode is invalid
+        """
+        if hash_mode not in ("sampled", "full"):
+            raise ConfigError(f"Invalid result_cache hash_mode: {hash_mode}. Must be 'sampled' or 'full'")
+        if max_entries < 1 or max_size_mb <= 0:
+            raise ConfigError("result_cache max_entries and max_size_mb must be positive")
+
+        self.path = path
+        self.max_entries = int(max_entries)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.hash_mode = hash_mode
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def from_config(cls, options: Any) -> Optional["ResultCache"]:
+        """
+        Create a cache from the ``processing.result_cache`` setting.
+
+        Args:
+            options: False/None (disabled), True (defaults) or a dict of
+                     path, max_entries, max_size_mb, hash_mode, enabled
+
+        Returns:
+            ResultCache, or None when caching is disabled
+        """
+        if not options:
+            return None
+        if options is True:
+            options = {}
+        if not options.get("enabled", True):
+            return None
+        return cls(
+            path=options.get("path", DEFAULT_CACHE_PATH),
+            max_entries=options.get("max_entries", DEFAULT_MAX_ENTRIES),
+            max_size_mb=options.get("max_size_mb", DEFAULT_MAX_SIZE_MB),
+            hash_mode=options.get("hash_mode", "sampled"),
+        )
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """SQLite connection, opened on first use."""
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS results (
+                    key TEXT PRIMARY KEY,
+                    fingerprint TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_results_last_used ON results (last_used)")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS files (
+                    fingerprint TEXT PRIMARY KEY,
+                    metadata TEXT NOT NULL
+                )
+            """)
+            self._conn.commit()
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Connections cannot be pickled; worker processes open their own
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        return state
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    def result_key(self, fingerprint: str, file_config: Dict[str, Any],
+                   validation_config: Dict[str, Any], scope: Dict[str, Any]) -> str:
+        """
+        Build the cache key of one (file, validation) pair.
+
+        Args:
+            fingerprint: File fingerprint
+            file_config: File configuration (read options are part of the key)
+            validation_config: Validation configuration
+            scope: Engine settings that influence results
+
+        Returns:
+            Hex digest key
+        """
+        from validation_framework import __version__
+
+        return config_hash({
+            "version": __version__,
+            "fingerprint": fingerprint,
+            "file": {option: file_config.get(option) for option in READ_OPTIONS},
+            "scope": scope,
+            "validation": validation_config,
+        })
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def get_many(self, keys: List[str]) -> Dict[str, ValidationResult]:
+        """
+        Look up results and mark them as recently used.
+
+        Args:
+            keys: Result keys
+
+        Returns:
+            Cached results by key (missing keys are absent)
+        """
+        if not keys:
+            return {}
+
+        placeholders = ",".join("?" * len(keys))
+        rows = self.conn.execute(
+            f"SELECT key, payload FROM results WHERE key IN ({placeholders})", keys
+        ).fetchall()
+
+        found = {}
+        for key, payload in rows:
+            result = decode_result(payload)
+            result.cached = True
+            result.execution_time = 0.0
+            found[key] = result
+
+        if found:
+            now = time.time()
+            self.conn.executemany("UPDATE results SET last_used = ? WHERE key = ?", [(now, k) for k in found])
+            self.conn.commit()
+        return found
+
+    def put_many(self, fingerprint: str, entries: List[Tuple[str, ValidationResult]],
+                 metadata: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Store results of one file and evict least recently used entries.
+
+        Args:
+            fingerprint: File fingerprint the results belong to
+            entries: (key, result) pairs
+            metadata: File metadata shown when every result comes from the cache
+        """
+        now = time.time()
+        rows = []
+        for key, result in entries:
+            payload = encode_result(result)
+            rows.append((key, fingerprint, payload, len(payload), now))
+
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO results (key, fingerprint, payload, size, last_used) VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        if metadata is not None:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO files (fingerprint, metadata) VALUES (?, ?)",
+                (fingerprint, _canonical(metadata)),
+            )
+        self._evict()
+        self.conn.commit()
+
+    def get_metadata(self, fingerprint: str) -> Dict[str, Any]:
+        """Return the stored file metadata for a fingerprint (empty if none)."""
+        row = self.conn.execute("SELECT metadata FROM files WHERE fingerprint = ?", (fingerprint,)).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def _evict(self) -> None:
+        """Delete least recently used results until both limits are met."""
+        count, total_size = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        if count <= self.max_entries and total_size <= self.max_size_bytes:
+            return
+
+        doomed = []
+        for key, size in self.conn.execute("SELECT key, size FROM results ORDER BY last_used, key"):
+            if count <= self.max_entries and total_size <= self.max_size_bytes:
+                break
+            doomed.append((key,))
+            count -= 1
+            total_size -= size
+
+        self.conn.executemany("DELETE FROM results WHERE key = ?", doomed)
+        self.conn.execute("DELETE FROM files WHERE fingerprint NOT IN (SELECT fingerprint FROM results)")
+        logger.debug(f"Result cache evicted {len(doomed)} least recently used entries")
+
+    def clear(self) -> None:
+        """Remove every cached result."""
+        self.conn.execute("DELETE FROM results")
+        self.conn.execute("DELETE FROM files")
+        self.conn.commit()
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Engine integration
+    # ------------------------------------------------------------------
+
+    def validate_file(self, file_config: Dict[str, Any], registry: Any, scope: Dict[str, Any],
+                      validate: Callable[[Dict[str, Any]], FileValidationReport]) -> FileValidationReport:
+        """
+        Validate a file, reusing cached results of unchanged validations.
+
+        Args:
+            file_config: File configuration dictionary
+            registry: ValidationRegistry used to check cacheability
+            scope: Engine settings that influence results
+            validate: Callable validating a file config (with only the
+                      validations that must run) and returning its report
+
+        Returns:
+            FileValidationReport with results in configuration order
+        """
+        path = file_config.get("path")
+        if file_config.get("format") == "database" or not path or not os.path.exists(path):
+            return validate(file_config)
+
+        start = time.time()
+        try:
+            fingerprint = file_fingerprint(path, self.hash_mode)
+        except OSError as e:
+            logger.warning(f"Result cache disabled for {path}: {e}")
+            return validate(file_config)
+
+        # Key every enabled validation; non-cacheable ones get no key
+        validations = [v for v in file_config.get("validations", []) if v.get("enabled", True)]
+        keys = [
+            self.result_key(fingerprint, file_config, v, scope) if is_cacheable(v, registry) else None
+            for v in validations
+        ]
+        cached = self.get_many([k for k in keys if k])
+
+        to_run = [v for v, k in zip(validations, keys) if k not in cached]
+        self.hits += len(validations) - len(to_run)
+        self.misses += len(to_run)
+
+        if to_run:
+            run_report = validate({**file_config, "validations": to_run})
+            run_results = run_report.validation_results
+            # Run statistics (prefetch) describe this run only
+            metadata = {k: v for k, v in run_report.metadata.items() if k != "prefetch"}
+        else:
+            run_results = []
+            metadata = self.get_metadata(fingerprint)
+
+        report = FileValidationReport(
+            file_name=file_config["name"],
+            file_path=file_config["path"],
+            file_format=file_config["format"],
+            status=Status.PASSED,
+            metadata=dict(metadata),
+        )
+
+        if len(run_results) == len(to_run):
+            fresh = iter(run_results)
+            entries = []
+            for key in keys:
+                if key in cached:
+                    result = cached[key]
+                else:
+                    result = next(fresh)
+                    if key and not is_error_result(result):
+                        entries.append((key, result))
+                report.add_result(result)
+            if entries or to_run:
+                self.put_many(fingerprint, entries, metadata)
+        else:
+            # File-level failure (e.g. unreadable file): report as produced
+            for result in list(cached.values()) + run_results:
+                report.add_result(result)
+
+        report.metadata["result_cache"] = {
+            "hits": len(validations) - len(to_run),
+            "misses": len(to_run),
+        }
+        report.update_status()
+        report.execution_time = time.time() - start
+
+        logger.info(
+            f"Result cache for {file_config['name']}: {len(validations) - len(to_run)} reused, "
+            f"{len(to_run)} validated"
+        )
+        return report
+
+
+def is_error_result(result: ValidationResult) -> bool:
+    """
+    Check whether a result says the validation could not run.
+
+    Such results (exceptions, invalid parameters, unknown types) are not
+    cached: errors may be transient, and a fixed environment should not
+    keep returning them.
+    """
+    if any(isinstance(d, dict) and "exception_type" in d for d in result.details):
+        return True
+    return not result.passed and bool(_ERROR_MESSAGE.search(result.message or ""))
@@ -72,6 +72,7 @@ class ValidationResult:
         details: Additional structured details about the validation
         sample_failures: List of sample failure examples (max 100)
         execution_time: Time taken to execute validation (seconds)
+        cached: True if the result was reused from the result cache
 
     Example:
         >>> result = ValidationResult(
@@ -100,6 +101,7 @@ class ValidationResult:
     details: List[Dict[str, Any]] = field(default_factory=list)
     sample_failures: List[Dict[str, Any]] = field(default_factory=list)
     execution_time: float = 0.0
+    cached: bool = False
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -119,7 +121,8 @@ class ValidationResult:
                 'total_count': 1000,
                 'success_rate': 95.8,
                 'sample_failures': [...],  # Max 10 samples
-                'execution_time': 0.523
+                'execution_time': 0.523,
+                'cached': False
             }
         """
         return {
@@ -132,6 +135,7 @@ class ValidationResult:
             "success_rate": self._calculate_success_rate(),
             "sample_failures": self.sample_failures[:10],  # Limit to 10 samples
             "execution_time": round(self.execution_time, 3),
+            "cached": self.cached,
         }
 
     def _calculate_success_rate(self) -> float:
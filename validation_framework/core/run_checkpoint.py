@@ -0,0 +1,410 @@
+"""
+Crash-safe checkpoints for long validation runs.
+
+A multi-hour run over a very large file should not start from zero after
+an OOM kill or a pod eviction. With ``processing.checkpoint_interval`` set
+(or ``--resume`` on the CLI) the optimized engine saves, at most every
+interval seconds:
+
+- the reports of the files already validated
+- for the file being read: the number of chunks consumed and the
+  accumulated state of every validation (the same snapshots append-only
+  files use between runs)
+
+Each checkpoint is one pickle written atomically, so its size follows the
+validation states (key trackers, aggregates, samples), not the data. Key
+trackers that spilled to disk are not read back into the pickle: their
+spill files are kept in a directory next to the checkpoint (immutable
+partition runs are hard-linked once, SQLite spillover only appends the
+keys added since the previous checkpoint) and the pickle holds their paths
+plus the in-memory part of each tracker.
+
+``run(resume=True)`` continues from the last checkpoint of the same job:
+finished files are not validated again and the interrupted file is read
+from the rows already validated on: a CSV file from the byte offset of
+the first such row (found by scanning the bytes, without parsing), a
+Parquet file from the row group holding it. Files that cannot be indexed
+safely are read from the start and the validated rows skipped. A file
+that changed since the checkpoint is validated from the start. The
+checkpoint is deleted when the run completes.
+
+Example:
+    >>> engine = OptimizedValidationEngine.from_config("job.yaml")
+    >>> report = engine.run(resume=True)
+
+Author: Daniel Edge
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
+import logging
+import os
+import shutil
+import threading
+import time
+
+from validation_framework.core.append_checkpoint import dump_checkpoint, load_checkpoint
+from validation_framework.core.result_cache import config_hash, file_fingerprint
+from validation_framework.loaders.csv_loader import detect_delimiter, detect_encoding
+from validation_framework.loaders.parallel_csv import SPLITTABLE_ENCODINGS, index_rows
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# Checkpoint interval used by --resume when none is configured (seconds)
+DEFAULT_CHECKPOINT_INTERVAL = 300
+
+# Bumped when the checkpoint layout changes; older checkpoints are ignored
+_CHECKPOINT_VERSION = 1
+
+
+@dataclass
+class RunCheckpoint:
+    """
+    Progress of an interrupted validation run.
+
+    Attributes:
+        run_hash: Hash of the job configuration
+        file_reports: Fingerprint and FileValidationReport of finished files,
+                      by file index
+        file_index: Index of the file being read, or None between files
+        fingerprint: Fingerprint of that file
+        validations_hash: Hash of the validations its states belong to
+        chunk_count: Chunks of that file already validated
+        states: Snapshot of each scan state after ``chunk_count`` chunks
+        elapsed: Seconds spent before the checkpoint
+    """
+
+    run_hash: str
+    file_reports: Dict[int, Any] = field(default_factory=dict)
+    file_index: Optional[int] = None
+    fingerprint: Optional[str] = None
+    validations_hash: Optional[str] = None
+    chunk_count: int = 0
+    total_rows: int = 0
+    states: List[Dict[str, Any]] = field(default_factory=list)
+    elapsed: float = 0.0
+    version: int = _CHECKPOINT_VERSION
+
+
+@dataclass
+class ResumeRead:
+    """
+    Where to start reading a file to resume after ``total_rows`` rows.
+
+    Attributes:
+        loader_kwargs: Loader options starting the read (``byte_range`` or
+                       ``row_groups``), empty to read from the start
+        first_row: Data row number of the first row the loader reads
+    """
+
+    loader_kwargs: Dict[str, Any] = field(default_factory=dict)
+    first_row: int = 0
+
+
+def resume_read(file_config: Dict[str, Any], total_rows: int) -> ResumeRead:
+    """
+    Plan the read of a file resumed after ``total_rows`` validated rows.
+
+    The read starts at or before the first unvalidated row; the rows in
+    between are still read and must be skipped.
+
+    Args:
+        file_config: File configuration as passed to the validation pass
+        total_rows: Rows validated before the interruption
+
+    Returns:
+        ResumeRead (from the start of the file if it cannot seek safely)
+    """
+    path = file_config["path"]
+    file_format = file_config.get("format")
+    try:
+        if file_format == "parquet" and pq is not None:
+            metadata = pq.ParquetFile(path).metadata
+            first_row = 0
+            for group in range(metadata.num_row_groups):
+                rows = metadata.row_group(group).num_rows
+                if first_row + rows > total_rows:
+                    return ResumeRead({"row_groups": list(range(group, metadata.num_row_groups))}, first_row)
+                first_row += rows
+            return ResumeRead({"row_groups": []}, first_row)
+
+        # Without a header, a read from the middle would take its column count from its first row
+        if (file_format == "csv" and file_config.get("header", 0) == 0
+                and (file_config.get("engine") or "pandas").lower() == "pandas"):
+            encoding = file_config.get("encoding") or detect_encoding(path)
+            if str(encoding).lower() not in SPLITTABLE_ENCODINGS:
+                return ResumeRead()
+            index = index_rows(path, file_config.get("delimiter") or detect_delimiter(path), stop_row=total_rows)
+            if index is not None:
+                offset, skip = index.locate(total_rows)
+                if offset > 0:
+                    return ResumeRead({"byte_range": (offset, index.file_size)}, total_rows - skip)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Cannot seek in {path} ({e}); skipping the validated rows")
+    return ResumeRead()
+
+
+class SpillFiles:
+    """
+    Spill files of key trackers referenced by a run checkpoint.
+
+    While a checkpoint is pickled inside ``exporting()``, spilled trackers
+    save their files here (see PartitionedKeyStore and MemoryBoundedTracker
+    ``__getstate__``) and pickle only the paths. Files no longer referenced
+    by the latest checkpoint are removed once it has been written.
+
+    Attributes:
+        directory: Directory holding the files
+        referenced: Names of the files the checkpoint being written uses
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.referenced: Set[str] = set()
+
+    def path(self, name: str) -> str:
+        """Path of a file the checkpoint uses (the directory is created if needed)."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.referenced.add(name)
+        return str(self.directory / name)
+
+    def link(self, source: str, name: str) -> str:
+        """
+        Keep an immutable file for the checkpoint, linking it only once.
+
+        Args:
+            source: File owned by a tracker (never modified after writing)
+            name: Name unique to that file
+
+        Returns:
+            Path of the checkpoint's copy
+        """
+        target = self.path(name)
+        if not os.path.exists(target):
+            link_spill_file(source, target)
+        return target
+
+    @contextmanager
+    def exporting(self) -> Iterator["SpillFiles"]:
+        """Make trackers pickled inside the block reference files in this directory."""
+        self.referenced = set()
+        _active.files = self
+        try:
+            yield self
+        finally:
+            _active.files = None
+
+    def remove_unreferenced(self) -> None:
+        """Delete the files the last written checkpoint does not use."""
+        if not self.directory.is_dir():
+            return
+        for path in self.directory.iterdir():
+            if path.name not in self.referenced:
+                path.unlink(missing_ok=True)
+
+    def remove(self) -> None:
+        """Delete the directory with all files."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+_active = threading.local()
+
+
+def active_spill_files() -> Optional[SpillFiles]:
+    """SpillFiles of the checkpoint being pickled, or None outside a checkpoint."""
+    return getattr(_active, "files", None)
+
+
+def link_spill_file(source: str, target: str) -> str:
+    """Hard-link a file (copied if linking is not possible, e.g. across devices)."""
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+    return target
+
+
+def _fingerprint(file_config: Dict[str, Any]) -> Optional[str]:
+    """Fingerprint of a file source; None for databases and missing files."""
+    path = file_config.get("path")
+    if file_config.get("format") == "database" or not path or not os.path.exists(path):
+        return None
+    return file_fingerprint(path)
+
+
+class RunCheckpointer:
+    """
+    Saves the progress of one run and answers what a resumed run can skip.
+
+    Example:
+        >>> checkpointer = RunCheckpointer(".datak9_cache/checkpoints", run_hash, 300, resume=True)
+        >>> report = checkpointer.finished_report(0, file_config)
+    """
+
+    def __init__(self, directory: str, run_hash: str, interval: float, resume: bool = False):
+        """
+        Initialize the checkpointer.
+
+        Args:
+            directory: Directory holding checkpoint files
+            run_hash: Hash identifying the job (see run_hash())
+            interval: Minimum seconds between two in-file checkpoints
+            resume: Continue from the existing checkpoint of the job
+        """
+        self.path = Path(directory) / f"run-{run_hash[:24]}.ckpt"
+        self.spill_files = SpillFiles(Path(directory) / f"run-{run_hash[:24]}.spill")
+        self.interval = interval
+        self.started = time.monotonic()
+        self._last_save = self.started
+        self._resumed: Optional[RunCheckpoint] = None
+
+        if resume:
+            checkpoint = load_checkpoint(self.path)
+            if (isinstance(checkpoint, RunCheckpoint) and checkpoint.run_hash == run_hash
+                    and checkpoint.version == _CHECKPOINT_VERSION):
+                self._resumed = checkpoint
+            else:
+                logger.info("No checkpoint to resume from; starting a new run")
+
+        self.checkpoint = RunCheckpoint(
+            run_hash=run_hash,
+            elapsed=self._resumed.elapsed if self._resumed else 0.0,
+        )
+
+    @staticmethod
+    def run_hash(files: List[Dict[str, Any]], scope: Dict[str, Any]) -> str:
+        """
+        Hash of everything the checkpointed reports and states depend on.
+
+        Args:
+            files: Parsed file configurations of the job
+            scope: Engine settings affecting results (chunk size etc.)
+
+        Returns:
+            Hex digest
+        """
+        from validation_framework import __version__
+
+        return config_hash({"version": __version__, "files": files, "scope": scope})
+
+    @property
+    def resumed(self) -> bool:
+        """True if a checkpoint of this job was found."""
+        return self._resumed is not None
+
+    @property
+    def previous_elapsed(self) -> float:
+        """Seconds spent by the interrupted run(s)."""
+        return self._resumed.elapsed if self._resumed else 0.0
+
+    def finished_report(self, file_index: int, file_config: Dict[str, Any]) -> Optional[Any]:
+        """
+        Report of a file the interrupted run already finished.
+
+        Args:
+            file_index: Index of the file in the job
+            file_config: File configuration dictionary
+
+        Returns:
+            FileValidationReport, or None if the file must be validated
+        """
+        if self._resumed is None or file_index not in self._resumed.file_reports:
+            return None
+        fingerprint, report = self._resumed.file_reports[file_index]
+        if fingerprint != _fingerprint(file_config):
+            logger.info(f"{file_config['name']} changed since the checkpoint; validating it again")
+            return None
+        self.file_done(file_index, file_config, report, fingerprint=fingerprint)
+        return report
+
+    def resume_point(self, file_index: int, file_config: Dict[str, Any]) -> Optional[RunCheckpoint]:
+        """
+        Progress of the file the interrupted run was reading.
+
+        Args:
+            file_index: Index of the file in the job
+            file_config: File configuration as passed to the validation pass
+
+        Returns:
+            The checkpoint (chunk_count, total_rows, states), or None to
+            validate the file from the start
+        """
+        resumed = self._resumed
+        if resumed is None or resumed.file_index != file_index:
+            return None
+        if (resumed.validations_hash != config_hash(file_config.get("validations", []))
+                or resumed.fingerprint != _fingerprint(file_config)):
+            logger.info(f"{file_config['name']} changed since the checkpoint; validating it from the start")
+            return None
+        return resumed
+
+    def due(self) -> bool:
+        """True once the checkpoint interval has elapsed since the last save."""
+        return time.monotonic() - self._last_save >= self.interval
+
+    def save_progress(self, file_index: int, file_config: Dict[str, Any], chunk_count: int,
+                      total_rows: int, states: List[Any]) -> None:
+        """
+        Checkpoint the file being read.
+
+        Args:
+            file_index: Index of the file in the job
+            file_config: File configuration as passed to the validation pass
+            chunk_count: Chunks validated so far
+            total_rows: Rows validated so far
+            states: SinglePassValidationState objects, all at ``chunk_count``
+        """
+        checkpoint = self.checkpoint
+        if checkpoint.file_index != file_index:
+            checkpoint.file_index = file_index
+            checkpoint.fingerprint = _fingerprint(file_config)
+            checkpoint.validations_hash = config_hash(file_config.get("validations", []))
+        checkpoint.chunk_count = chunk_count
+        checkpoint.total_rows = total_rows
+        checkpoint.states = [state.snapshot() for state in states]
+        self._save()
+
+    def file_done(self, file_index: int, file_config: Dict[str, Any], report: Any,
+                  fingerprint: Optional[str] = None) -> None:
+        """
+        Record a finished file.
+
+        Args:
+            file_index: Index of the file in the job
+            file_config: File configuration dictionary
+            report: Its FileValidationReport
+            fingerprint: Known fingerprint of the file (computed if omitted)
+        """
+        checkpoint = self.checkpoint
+        checkpoint.file_reports[file_index] = (
+            fingerprint if fingerprint is not None else _fingerprint(file_config), report
+        )
+        checkpoint.file_index = None
+        checkpoint.fingerprint = None
+        checkpoint.validations_hash = None
+        checkpoint.chunk_count = checkpoint.total_rows = 0
+        checkpoint.states = []
+        self._save()
+
+    def finish(self) -> None:
+        """Delete the checkpoint once the run completed."""
+        self.path.unlink(missing_ok=True)
+        self.spill_files.remove()
+
+    def _save(self) -> None:
+        now = time.monotonic()
+        self.checkpoint.elapsed = self.previous_elapsed + (now - self.started)
+        try:
+            with self.spill_files.exporting():
+                dump_checkpoint(self.path, self.checkpoint)
+            self.spill_files.remove_unreferenced()
+        except Exception as e:
+            logger.warning(f"Could not save run checkpoint {self.path}: {str(e)}")
+        self._last_save = now
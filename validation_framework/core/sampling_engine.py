@@ -187,6 +187,7 @@ class SamplingValidationEngine:
                 "file_name": file_config["name"],
                 "file_format": file_config["format"],
                 "max_sample_failures": self.config.max_sample_failures,
+                "reference_index_dir": self.config.reference_index_dir,
                 **metadata,
             }
 
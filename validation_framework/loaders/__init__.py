@@ -6,6 +6,7 @@ from validation_framework.loaders.excel_loader import ExcelLoader
 from validation_framework.loaders.parquet_loader import ParquetLoader
 from validation_framework.loaders.json_loader import JSONLoader
 from validation_framework.loaders.factory import LoaderFactory
+from validation_framework.loaders.prefetch_loader import PrefetchLoader, PrefetchStats
 
 # Async loaders
 from validation_framework.loaders.async_base import AsyncDataLoader, AsyncFileLoader
@@ -21,6 +22,8 @@ __all__ = [
     "ParquetLoader",
     "JSONLoader",
     "LoaderFactory",
+    "PrefetchLoader",
+    "PrefetchStats",
     # Async loaders
     "AsyncDataLoader",
     "AsyncFileLoader",
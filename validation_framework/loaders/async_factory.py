@@ -63,6 +63,8 @@ class AsyncLoaderFactory:
                 - header: Row number to use as column names (default: 0)
                 - lines: For JSON files, True for JSON Lines format (default: auto-detect)
                 - flatten: For JSON files, flatten nested structures (default: True)
+                - record_path: For JSON files, dot-separated keys leading to the
+                  record array in an object envelope (e.g. "data")
 
         Returns:
             AsyncDataLoader: An instance of the appropriate async loader class
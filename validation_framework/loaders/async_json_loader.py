@@ -10,6 +10,7 @@ import pandas as pd
 import asyncio
 import json
 from validation_framework.loaders.async_base import AsyncFileLoader
+from validation_framework.loaders.json_stream import iter_json_batches, starts_with_array
 import logging
 
 # Optional dependency for async file I/O
@@ -44,6 +45,7 @@ class AsyncJSONLoader(AsyncFileLoader):
         chunk_size: int = 50000,
         lines: bool = None,
         flatten: bool = True,
+        record_path: str = None,
         **kwargs
     ):
         """
@@ -55,11 +57,14 @@ class AsyncJSONLoader(AsyncFileLoader):
             lines: True for JSON Lines format, False for standard JSON,
                   None for auto-detection (default: None)
             flatten: Whether to flatten nested JSON structures (default: True)
+            record_path: Dot-separated keys leading to the record array in an
+                        object envelope, e.g. "data" for {"data": [...]}
             **kwargs: Additional parameters passed to pandas read_json
         """
         super().__init__(file_path, chunk_size)
         self.lines = lines
         self.flatten = flatten
+        self.record_path = record_path
         self.kwargs = kwargs
 
     async def _detect_format(self) -> bool:
@@ -104,7 +109,7 @@ class AsyncJSONLoader(AsyncFileLoader):
         # Auto-detect format if not specified
         is_lines = self.lines
         if is_lines is None:
-            is_lines = await self._detect_format()
+            is_lines = not self.record_path and await self._detect_format()
 
         logger.info(f"Async loading JSON file: {self.file_path} (lines={is_lines})")
 
@@ -113,7 +118,7 @@ class AsyncJSONLoader(AsyncFileLoader):
             async for chunk in self._load_jsonl_chunks():
                 yield chunk
         else:
-            # Standard JSON array - load entire array then chunk
+            # Standard JSON array - parse incrementally in a thread
             async for chunk in self._load_json_array_chunks():
                 yield chunk
 
@@ -176,43 +181,66 @@ class AsyncJSONLoader(AsyncFileLoader):
         """
         Load standard JSON array file in chunks.
 
-        Since pandas read_json doesn't support chunking for arrays,
-        we load the entire array and then chunk it.
+        The array (at the top level or at ``record_path``) is parsed one
+        element at a time in the thread pool, so memory is bounded by the
+        chunk size. A top-level object is oriented data and is read whole
+        with pandas read_json.
 
         Yields:
             DataFrame chunks
         """
         loop = asyncio.get_event_loop()
+        chunk_count = 0
 
-        def _read_json():
-            """Synchronous function to read JSON."""
-            df = pd.read_json(self.file_path, **self.kwargs)
+        with open(self.file_path, 'r', encoding='utf-8') as f:
+            if self.record_path or await loop.run_in_executor(None, starts_with_array, f):
+                batches = iter_json_batches(f, self.chunk_size, self.record_path)
+                chunks = self._array_chunks(loop, batches)
+            else:
+                df = await loop.run_in_executor(None, self._read_oriented_json)
+                chunks = self._slice_chunks(df)
 
-            if self.flatten and len(df) > 0:
-                df = self._flatten_dataframe(df)
+            async for chunk in chunks:
+                chunk_count += 1
+                logger.debug(f"Loaded JSON chunk {chunk_count}: {len(chunk)} rows")
 
-            return df
+                yield chunk
 
-        # Load entire JSON in thread pool
-        df = await loop.run_in_executor(None, _read_json)
+                # Yield control to event loop
+                await asyncio.sleep(0)
 
-        # Yield in chunks
-        total_rows = len(df)
-        chunk_count = 0
+        logger.info(f"Completed loading {chunk_count} chunks from {self.file_path}")
 
-        for start_idx in range(0, total_rows, self.chunk_size):
-            end_idx = min(start_idx + self.chunk_size, total_rows)
-            chunk = df.iloc[start_idx:end_idx].copy()
+    async def _array_chunks(self, loop, batches) -> AsyncIterator[pd.DataFrame]:
+        """Turn record batches, each decoded in the thread pool, into DataFrames."""
+        rows = 0
+        while True:
+            records = await loop.run_in_executor(None, next, batches, None)
+            if records is None:
+                return
 
-            chunk_count += 1
-            logger.debug(f"Loaded JSON chunk {chunk_count}: {len(chunk)} rows")
+            df = pd.DataFrame(records)
+            if self.flatten and len(df) > 0:
+                df = self._flatten_dataframe(df)
+
+            # Number rows through the file
+            df.index = pd.RangeIndex(rows, rows + len(df))
+            rows += len(df)
+            yield df
 
-            yield chunk
+    async def _slice_chunks(self, df: pd.DataFrame) -> AsyncIterator[pd.DataFrame]:
+        """Slice a DataFrame read whole into chunks."""
+        for start_idx in range(0, len(df), self.chunk_size):
+            yield df.iloc[start_idx:start_idx + self.chunk_size].copy()
 
-            # Yield control to event loop
-            await asyncio.sleep(0)
+    def _read_oriented_json(self) -> pd.DataFrame:
+        """Read a top-level JSON object with pandas read_json."""
+        df = pd.read_json(self.file_path, **self.kwargs)
 
-        logger.info(f"Completed loading {chunk_count} chunks from {self.file_path}")
+        if self.flatten and len(df) > 0:
+            df = self._flatten_dataframe(df)
+
+        return df
 
     def _flatten_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -238,7 +266,7 @@ class AsyncJSONLoader(AsyncFileLoader):
         # Detect format
         is_lines = self.lines
         if is_lines is None:
-            is_lines = await self._detect_format()
+            is_lines = not self.record_path and await self._detect_format()
 
         loop = asyncio.get_event_loop()
 
@@ -258,10 +286,19 @@ class AsyncJSONLoader(AsyncFileLoader):
                     else:
                         columns = []
             else:
-                # Load JSON array
-                df = pd.read_json(self.file_path)
-                row_count = len(df)
-                columns = list(df.columns)
+                with open(self.file_path, 'r', encoding='utf-8') as f:
+                    if self.record_path or starts_with_array(f):
+                        # Count array elements incrementally; columns from the first batch
+                        row_count = 0
+                        columns = []
+                        for records in iter_json_batches(f, self.chunk_size, self.record_path):
+                            if not row_count:
+                                columns = list(pd.DataFrame(records).columns)
+                            row_count += len(records)
+                    else:
+                        df = pd.read_json(self.file_path)
+                        row_count = len(df)
+                        columns = list(df.columns)
 
             return {
                 "columns": columns,
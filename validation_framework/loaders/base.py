@@ -6,6 +6,38 @@ from pathlib import Path
 import pandas as pd
 
 
+def regroup_chunks(frames: Iterator[pd.DataFrame], chunk_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Regroup DataFrames read in file order into chunks of ``chunk_size`` rows.
+
+    The chunks get the same row labels as pd.read_csv(chunksize=...):
+    a RangeIndex counting rows through the file.
+
+    Args:
+        frames: DataFrames of any size, in file order
+        chunk_size: Rows per output chunk (the last chunk may be smaller)
+
+    Yields:
+        DataFrames of ``chunk_size`` rows
+    """
+    rows = 0
+    carry: Optional[pd.DataFrame] = None
+    for frame in frames:
+        frame.index = pd.RangeIndex(rows, rows + len(frame))
+        rows += len(frame)
+        if carry is not None:
+            frame = pd.concat([carry, frame])
+            carry = None
+        start = 0
+        while len(frame) - start >= chunk_size:
+            yield frame.iloc[start:start + chunk_size]
+            start += chunk_size
+        if start < len(frame):
+            carry = frame.iloc[start:]
+    if carry is not None:
+        yield carry
+
+
 class DataLoader(ABC):
     """Base class for data loaders."""
 
@@ -1,14 +1,28 @@
 """CSV data loader with chunked reading for large files."""
 
 import csv
+import io
 import logging
 from pathlib import Path
-from typing import Iterator, Dict, Any, Optional
+from typing import Iterator, Dict, Any, List, Optional
 import pandas as pd
-from validation_framework.loaders.base import DataLoader
+from validation_framework.loaders.base import DataLoader, regroup_chunks
+from validation_framework.loaders.parallel_csv import CSVRowIndex, ParallelCSVReader, SPLITTABLE_ENCODINGS
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+    pa = None
+    pa_csv = None
 
 logger = logging.getLogger(__name__)
 
+# Bytes of the file each PyArrow block covers (``engine: pyarrow``)
+ARROW_BLOCK_SIZE = 4 * 1024 * 1024
+
 
 def detect_delimiter(file_path: str, sample_size: int = 8192) -> str:
     """
@@ -62,6 +76,32 @@ def detect_encoding(file_path: str) -> str:
     return 'utf-8'
 
 
+class _ByteRange(io.RawIOBase):
+    """Read-only view of the bytes [start, end) of a file."""
+
+    def __init__(self, file_path: Path, start: int, end: int):
+        super().__init__()
+        self._file = open(file_path, 'rb')
+        self._file.seek(start)
+        self._remaining = max(0, end - start)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), self._remaining)
+        if size <= 0:
+            return 0
+        data = self._file.read(size)
+        buffer[:len(data)] = data
+        self._remaining -= len(data)
+        return len(data)
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
 class CSVLoader(DataLoader):
     """Loader for CSV and delimited text files with robust error handling."""
 
@@ -72,10 +112,28 @@ class CSVLoader(DataLoader):
         Args:
             file_path: Path to CSV file
             chunk_size: Number of rows per chunk
-            **kwargs: Additional options (delimiter, encoding, header)
+            **kwargs: Additional options (delimiter, encoding, header, columns,
+                      byte_range, parse_workers, ordered, engine, block_size).
+                      ``columns`` limits
+                      parsing to the listed columns; names not present in the
+                      file are ignored. ``byte_range`` (start, end) reads only
+                      the rows in that byte range; ``start`` must be 0 or the
+                      start of a line, and column names still come from the
+                      file's header. ``parse_workers`` above 1 parses byte
+                      ranges of the file in that many processes; ``ordered``
+                      False lets their chunks arrive out of file order.
+                      ``engine`` "pyarrow" streams the file with PyArrow's
+                      multi-threaded reader in ``block_size`` byte blocks
+                      (default "pandas").
         """
         super().__init__(file_path, chunk_size, **kwargs)
 
+        # Row-offset index built by the last complete parallel read
+        self.row_index: Optional[CSVRowIndex] = None
+
+        # Rows with too many fields skipped by the last PyArrow read
+        self.skipped_rows = 0
+
         # Auto-detect delimiter if not specified
         if 'delimiter' not in kwargs or kwargs.get('delimiter') is None:
             self.kwargs['delimiter'] = detect_delimiter(file_path)
@@ -100,17 +158,19 @@ class CSVLoader(DataLoader):
         header = self.kwargs.get("header", 0)
 
         try:
+            usecols = self._resolve_usecols(delimiter, encoding, header)
+
+            if self._use_arrow():
+                yield from self._read_arrow(delimiter, encoding, header, usecols)
+                return
+
+            if self._use_parallel(encoding, header):
+                yield from self._read_parallel(delimiter, encoding, header)
+                return
+
             # Use chunksize for memory-efficient reading
-            for chunk in pd.read_csv(
-                self.file_path,
-                delimiter=delimiter,
-                encoding=encoding,
-                header=header,
-                chunksize=self.chunk_size,
-                low_memory=False,
-                on_bad_lines='warn',  # Warn but don't fail on bad lines
-                quoting=0,  # QUOTE_MINIMAL - handle quoted fields properly
-            ):
+            # on_bad_lines='warn': warn but don't fail on bad lines
+            for chunk in self._read_chunks(delimiter, encoding, header, usecols, on_bad_lines='warn'):
                 yield chunk
 
         except pd.errors.EmptyDataError:
@@ -124,16 +184,8 @@ class CSVLoader(DataLoader):
                 # Try to recover by skipping bad lines
                 logger.warning(f"CSV has inconsistent columns, attempting recovery with on_bad_lines='skip'")
                 try:
-                    for chunk in pd.read_csv(
-                        self.file_path,
-                        delimiter=delimiter,
-                        encoding=encoding,
-                        header=header,
-                        chunksize=self.chunk_size,
-                        low_memory=False,
-                        on_bad_lines='skip',  # Skip problematic rows
-                        quoting=0,
-                    ):
+                    # Skip problematic rows
+                    for chunk in self._read_chunks(delimiter, encoding, header, usecols, on_bad_lines='skip'):
                         yield chunk
                     logger.warning("CSV loaded with some rows skipped due to parsing errors")
                     return
@@ -161,9 +213,257 @@ class CSVLoader(DataLoader):
                 f"Original error: {str(e)}"
             )
 
+        except RuntimeError:
+            raise
+
         except Exception as e:
             raise RuntimeError(f"Error loading CSV file {self.file_path}: {str(e)}")
 
+    def _use_arrow(self) -> bool:
+        """Whether to stream the file with PyArrow's CSV reader."""
+        engine = (self.kwargs.get("engine") or "pandas").lower()
+        if engine not in ("pandas", "pyarrow"):
+            raise ValueError(f"Unknown CSV engine '{engine}': use 'pandas' or 'pyarrow'")
+        if engine == "pyarrow" and self.is_empty():
+            return False
+        if engine == "pyarrow" and not HAS_PYARROW:
+            logger.warning("engine 'pyarrow' requested but pyarrow is not installed; using pandas")
+            return False
+        return engine == "pyarrow"
+
+    def _read_arrow(self, delimiter: str, encoding: str, header: Any,
+                    usecols: Optional[List[str]]) -> Iterator[pd.DataFrame]:
+        """
+        Stream the file (or its ``byte_range``) with pyarrow.csv.open_csv.
+
+        Rows with more fields than the header are skipped and counted in
+        ``skipped_rows``, as pandas' on_bad_lines does, without re-parsing
+        the file. On any other parse error (a short row, a value that does
+        not fit the column type inferred from the first block) reading
+        continues with pandas after the chunks already yielded.
+
+        Yields:
+            DataFrames containing chunks of data
+        """
+        yielded = 0
+        self.skipped_rows = 0
+        try:
+            for chunk in regroup_chunks(self._arrow_batches(delimiter, encoding, header, usecols), self.chunk_size):
+                yield chunk
+                yielded += 1
+            if self.skipped_rows:
+                logger.warning(f"Skipped {self.skipped_rows} row(s) with too many fields in {self.file_path}")
+            return
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            logger.warning(f"PyArrow cannot parse {self.file_path}, continuing with pandas: {e}")
+
+        # Every chunk yielded so far held exactly chunk_size rows
+        for position, chunk in enumerate(self._read_chunks(delimiter, encoding, header, usecols, on_bad_lines='warn')):
+            if position >= yielded:
+                yield chunk
+
+    def _arrow_batches(self, delimiter: str, encoding: str, header: Any,
+                       usecols: Optional[List[str]]) -> Iterator[pd.DataFrame]:
+        """
+        Read record batches with pyarrow.csv.open_csv as DataFrames.
+
+        Yields:
+            DataFrames of one Arrow block each
+        """
+        def skip_long_rows(row) -> str:
+            if row.actual_columns > row.expected_columns:
+                self.skipped_rows += 1
+                return "skip"
+            return "error"
+
+        names = None
+        byte_range = self.kwargs.get("byte_range")
+        if byte_range is not None:
+            start, end = byte_range
+            if start >= end:
+                return
+            if start > 0 and header is not None:
+                names = list(pd.read_csv(
+                    self.file_path, delimiter=delimiter, encoding=encoding, header=header, nrows=0
+                ).columns)
+                header = None
+
+        read_options = pa_csv.ReadOptions(
+            use_threads=True,
+            block_size=self.kwargs.get("block_size") or ARROW_BLOCK_SIZE,
+            encoding=encoding,
+            skip_rows=header or 0,
+            column_names=names,
+            autogenerate_column_names=header is None and names is None,
+        )
+        parse_options = pa_csv.ParseOptions(
+            delimiter=delimiter,
+            newlines_in_values=True,
+            invalid_row_handler=skip_long_rows,
+        )
+        convert_options = pa_csv.ConvertOptions(include_columns=usecols, strings_can_be_null=True)
+
+        def open_reader():
+            source = (
+                io.BufferedReader(_ByteRange(self.file_path, *byte_range))
+                if byte_range is not None else str(self.file_path)
+            )
+            return pa_csv.open_csv(source, read_options=read_options,
+                                   parse_options=parse_options, convert_options=convert_options)
+
+        skipped_before = self.skipped_rows
+        reader = open_reader()
+        try:
+            # Dates and timestamps stay strings, as pd.read_csv leaves them
+            temporal = {
+                field.name: pa.string() for field in reader.schema
+                if pa.types.is_temporal(field.type)
+            }
+            if temporal:
+                reader.close()
+                convert_options.column_types = temporal
+                # The reopened reader meets the rows of its first block again
+                self.skipped_rows = skipped_before
+                reader = open_reader()
+
+            for batch in reader:
+                frame = batch.to_pandas()
+                if header is None and names is None:
+                    frame.columns = range(len(frame.columns))
+                yield frame
+        finally:
+            reader.close()
+
+    def _use_parallel(self, encoding: str, header: Any) -> bool:
+        """Whether to parse byte ranges of the file in worker processes."""
+        if (self.kwargs.get("parse_workers") or 1) <= 1:
+            return False
+        if self.is_empty():
+            return False
+        if header not in (0, None) or str(encoding).lower() not in SPLITTABLE_ENCODINGS:
+            logger.debug(f"Parsing {self.file_path} serially: header {header!r}, encoding {encoding}")
+            return False
+        return True
+
+    def _read_parallel(self, delimiter: str, encoding: str, header: Any) -> Iterator[pd.DataFrame]:
+        """
+        Parse byte ranges of the file in worker processes.
+
+        Falls back to the serial reader if the file cannot be split at row
+        boundaries. A complete read of the whole file stores its row-offset
+        index in ``row_index``; later reads of the unchanged file reuse its
+        split points. A ``byte_range`` read parses the ranges inside it.
+
+        Yields:
+            DataFrames containing chunks of data
+        """
+        index = self.row_index
+        if index is not None and index.file_size != self.get_file_size():
+            index = None
+
+        reader = ParallelCSVReader(
+            str(self.file_path),
+            chunk_size=self.chunk_size,
+            workers=self.kwargs["parse_workers"],
+            options={
+                "delimiter": delimiter,
+                "encoding": encoding,
+                "header": header,
+                "columns": self.kwargs.get("columns"),
+            },
+            split_points=index.byte_offsets + [index.file_size] if index is not None else None,
+        )
+        points = reader.plan()
+        if points is None:
+            logger.info(f"Quotes in {self.file_path} do not pair up; parsing serially")
+            yield from self._read_chunks(
+                delimiter, encoding, header, self._resolve_usecols(delimiter, encoding, header), on_bad_lines='warn'
+            )
+            return
+
+        byte_range = self.kwargs.get("byte_range")
+        if byte_range is not None:
+            start, end = byte_range
+            end = max(start, min(end, points[-1]))
+            reader.split_points = [start] + [point for point in points if start < point < end] + [end]
+
+        if self.kwargs.get("ordered", True):
+            yield from regroup_chunks(reader.chunks(), self.chunk_size)
+        else:
+            for frame in reader.chunks(ordered=False):
+                for start in range(0, len(frame), self.chunk_size):
+                    yield frame.iloc[start:start + self.chunk_size]
+        if byte_range is None:
+            self.row_index = reader.row_index
+
+    def _read_chunks(self, delimiter: str, encoding: str, header: Any,
+                     usecols: Optional[List[str]], on_bad_lines: str) -> Iterator[pd.DataFrame]:
+        """
+        Read the file (or its ``byte_range``) in chunks with pd.read_csv.
+
+        Yields:
+            DataFrames containing chunks of data
+        """
+        source: Any = self.file_path
+        names = None
+        byte_range = self.kwargs.get("byte_range")
+
+        if byte_range is not None:
+            start, end = byte_range
+            if start >= end:
+                return
+            if start > 0 and header is not None:
+                # Rows after the header: take the column names from the file
+                names = list(pd.read_csv(
+                    self.file_path, delimiter=delimiter, encoding=encoding, header=header, nrows=0
+                ).columns)
+                header = None
+            source = io.BufferedReader(_ByteRange(self.file_path, start, end))
+
+        try:
+            with pd.read_csv(
+                source,
+                delimiter=delimiter,
+                encoding=encoding,
+                header=header,
+                names=names,
+                usecols=usecols,
+                chunksize=self.chunk_size,
+                low_memory=False,
+                on_bad_lines=on_bad_lines,
+                quoting=0,  # QUOTE_MINIMAL - handle quoted fields properly
+            ) as reader:
+                yield from reader
+        finally:
+            if byte_range is not None:
+                source.close()
+
+    def _resolve_usecols(self, delimiter: str, encoding: str, header: Any) -> Optional[List[str]]:
+        """
+        Translate the requested columns into ``usecols`` for pd.read_csv.
+
+        Only the header row is read. Requested names missing from the file
+        are dropped so validations still report them as missing columns.
+
+        Returns:
+            Columns to parse in file order, or None to parse every column
+        """
+        columns = self.kwargs.get("columns")
+        if not columns or header is None:
+            return None
+
+        file_columns = pd.read_csv(
+            self.file_path, delimiter=delimiter, encoding=encoding, header=header, nrows=0
+        ).columns
+        wanted = set(columns)
+        usecols = [col for col in file_columns if col in wanted]
+
+        if not usecols or len(usecols) == len(file_columns):
+            return None
+
+        logger.debug(f"Reading {len(usecols)} of {len(file_columns)} columns from {self.file_path}")
+        return usecols
+
     def get_metadata(self) -> Dict[str, Any]:
         """
         Get CSV file metadata.
@@ -205,6 +505,10 @@ class CSVLoader(DataLoader):
                 estimated_rows = int((self.get_file_size() / sample_size_bytes) * len(first_chunk))
                 metadata["estimated_rows"] = estimated_rows
 
+                # Exact count from an earlier parallel read of the unchanged file
+                if self.row_index is not None and self.row_index.file_size == self.get_file_size():
+                    metadata["total_rows"] = self.row_index.total_rows
+
             except Exception as e:
                 metadata["error"] = f"Could not read metadata: {str(e)}"
 
@@ -66,6 +66,20 @@ class LoaderFactory:
                 - sheet_name: Sheet name or index for Excel files (default: 0)
                 - lines: For JSON files, True for JSON Lines format (default: auto-detect)
                 - flatten: For JSON files, flatten nested structures (default: True)
+                - record_path: For JSON files, dot-separated keys leading to the
+                  record array in an object envelope (e.g. "data")
+                - columns: Only parse these columns (CSV and Parquet)
+                - byte_range: For CSV files, (start, end) bytes to read; start
+                  must be 0 or the start of a line
+                - parse_workers: For CSV files, processes parsing byte ranges
+                  of the file in parallel (default: 1)
+                - ordered: For CSV files with parse_workers, False yields
+                  chunks as soon as they are parsed (default: True)
+                - engine: For CSV files, "pyarrow" streams the file with
+                  pyarrow.csv.open_csv instead of pandas (default: "pandas")
+                - block_size: For CSV files with engine "pyarrow", bytes per
+                  Arrow block (default: 4 MB)
+                - row_groups: For Parquet files, indexes of the row groups to read
 
         Returns:
             DataLoader: An instance of the appropriate loader class
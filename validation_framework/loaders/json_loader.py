@@ -4,17 +4,84 @@ JSON data loader with support for standard JSON arrays and JSON Lines format.
 Supports:
 - Standard JSON arrays: [{"col1": "val1"}, {"col2": "val2"}]
 - JSON Lines (JSONL/NDJSON): One JSON object per line
+- JSON arrays inside an object envelope: {"data": [...]} (record_path)
 - Nested JSON structures (automatically flattened)
-- Chunked processing for large files
+- Chunked processing for large files; arrays are parsed incrementally
+- JSON Lines decoded in blocks by pyarrow.json when PyArrow is installed
 
 Author: daniel edge
 """
 
-from typing import Iterator, Dict, Any, List
+from typing import BinaryIO, Iterator, Dict, Any, List, Optional
 import pandas as pd
+import io
 import json
+import logging
 from pathlib import Path
-from validation_framework.loaders.base import DataLoader
+from validation_framework.loaders.base import DataLoader, regroup_chunks
+from validation_framework.loaders.json_stream import iter_json_batches, starts_with_array
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.json as pa_json
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+    pa = None
+    pc = None
+    pa_json = None
+
+logger = logging.getLogger(__name__)
+
+# Bytes of JSON Lines decoded at a time
+JSONL_BLOCK_SIZE = 4 * 1024 * 1024
+
+
+def _line_blocks(f: BinaryIO, block_size: int) -> Iterator[bytes]:
+    """Read a binary file in blocks of about ``block_size`` bytes that end at a newline."""
+    carry = b""
+    while True:
+        data = f.read(block_size)
+        if not data:
+            if carry:
+                yield carry
+            return
+        data = carry + data
+        end = data.rfind(b"\n") + 1
+        if end == 0:
+            # One line longer than the block: keep reading
+            carry = data
+            continue
+        carry = data[end:]
+        yield data[:end]
+
+
+def _strings_for_temporal(data_type: "pa.DataType") -> "pa.DataType":
+    """The type with every date/timestamp (also nested) replaced by string."""
+    if pa.types.is_temporal(data_type):
+        return pa.string()
+    if pa.types.is_struct(data_type):
+        return pa.struct([field.with_type(_strings_for_temporal(field.type)) for field in data_type])
+    if pa.types.is_list(data_type):
+        return pa.list_(_strings_for_temporal(data_type.value_type))
+    return data_type
+
+
+def _flatten_table(table: "pa.Table") -> "pa.Table":
+    """Expand struct columns into ``parent_child`` columns, as json_normalize(sep='_') does."""
+    while any(pa.types.is_struct(field.type) for field in table.schema):
+        names, columns = [], []
+        for field, column in zip(table.schema, table.columns):
+            if not pa.types.is_struct(field.type):
+                names.append(field.name)
+                columns.append(column)
+                continue
+            for index, child in enumerate(field.type):
+                names.append(f"{field.name}_{child.name}")
+                columns.append(pc.struct_field(column, [index]))
+        table = pa.table(columns, names=names)
+    return table
 
 
 class JSONLoader(DataLoader):
@@ -29,8 +96,17 @@ class JSONLoader(DataLoader):
         lines (bool): If True, treat as JSON Lines format (default: auto-detect)
         orient (str): Pandas json orientation ('records', 'index', etc.)
         flatten (bool): Flatten nested JSON structures (default: True)
+        record_path (str): Dot-separated keys leading to the record array
+                           in an object envelope, e.g. "data" for {"data": [...]}
+        block_size (int): Bytes of JSON Lines decoded at a time (default: 4 MB)
+
+    Attributes:
+        malformed_lines: Lines of the last JSON Lines read that were not
+                         valid JSON and were skipped
     """
 
+    malformed_lines = 0
+
     def load(self) -> Iterator[pd.DataFrame]:
         """
         Load JSON data in chunks.
@@ -43,18 +119,19 @@ class JSONLoader(DataLoader):
         lines = self.kwargs.get("lines", None)  # None = auto-detect
         orient = self.kwargs.get("orient", "records")
         flatten = self.kwargs.get("flatten", True)
+        record_path = self.kwargs.get("record_path")
 
         try:
             # Auto-detect format if not specified
             if lines is None:
-                lines = self._is_jsonl_format()
+                lines = not record_path and self._is_jsonl_format()
 
             if lines:
                 # JSON Lines format - process line by line in chunks
                 yield from self._load_jsonl(flatten)
             else:
                 # Standard JSON array format
-                yield from self._load_json_array(orient, flatten)
+                yield from self._load_json_array(orient, flatten, record_path)
 
         except json.JSONDecodeError as e:
             raise RuntimeError(
@@ -98,77 +175,162 @@ class JSONLoader(DataLoader):
         """
         Load JSON Lines format in chunks.
 
+        The file is read in blocks of whole lines. With PyArrow, each block
+        is decoded by pyarrow.json and nested objects are flattened column
+        by column in Arrow; blocks Arrow rejects (malformed lines, a field
+        changing type) are decoded line by line with json.loads. Malformed
+        lines are skipped, counted in ``malformed_lines`` and logged.
+
         Args:
             flatten: Whether to flatten nested structures
 
         Yields:
             DataFrames containing chunks of records
         """
-        records: List[Dict[str, Any]] = []
+        self.malformed_lines = 0
+        self._first_malformed_line: Optional[int] = None
+
+        yield from regroup_chunks(self._jsonl_frames(flatten), self.chunk_size)
+
+        if self.malformed_lines:
+            logger.warning(
+                f"Skipped {self.malformed_lines} malformed JSON line(s) in {self.file_path} "
+                f"(first at line {self._first_malformed_line})"
+            )
+
+    def _jsonl_frames(self, flatten: bool) -> Iterator[pd.DataFrame]:
+        """
+        Decode JSON Lines block by block.
+
+        Yields:
+            One DataFrame per block of lines
+        """
+        block_size = self.kwargs.get("block_size") or JSONL_BLOCK_SIZE
+        arrow_schema: Dict[str, "pa.Field"] = {}
+        lines_before = 0
+
+        with open(self.file_path, 'rb') as f:
+            for block in _line_blocks(f, block_size):
+                df = self._decode_block_arrow(block, flatten, arrow_schema) if HAS_PYARROW else None
+                if df is None:
+                    df = self._decode_block_python(block, flatten, lines_before)
+                lines_before += block.count(b"\n")
+                if len(df):
+                    yield df
+
+    def _decode_block_arrow(self, block: bytes, flatten: bool,
+                            string_fields: Dict[str, "pa.Field"]) -> Optional[pd.DataFrame]:
+        """
+        Decode a block of JSON Lines with pyarrow.json.
+
+        Dates and timestamps are read as strings, as json.loads leaves them;
+        the fields that needed it are remembered in ``string_fields`` so
+        later blocks are decoded that way straight away.
+
+        Returns:
+            DataFrame, or None if Arrow cannot decode the block
+        """
+        def read(fields: Dict[str, "pa.Field"]) -> "pa.Table":
+            parse_options = pa_json.ParseOptions(
+                explicit_schema=pa.schema(list(fields.values())) if fields else None,
+                unexpected_field_behavior="infer",
+            )
+            return pa_json.read_json(io.BytesIO(block), read_options=pa_json.ReadOptions(use_threads=True),
+                                     parse_options=parse_options)
 
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
+        try:
+            table = read(string_fields)
+            temporal = [
+                field for field in table.schema
+                if _strings_for_temporal(field.type) != field.type
+            ]
+            if temporal:
+                for field in temporal:
+                    string_fields[field.name] = field.with_type(_strings_for_temporal(field.type))
+                table = read(string_fields)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            logger.debug(f"pyarrow.json cannot decode a block of {self.file_path}, using json.loads: {e}")
+            return None
+
+        if string_fields:
+            # Explicit fields come first; restore the order of the first record
+            first = json.loads(block.lstrip().split(b"\n", 1)[0])
+            order = [name for name in first if name in table.column_names]
+            table = table.select(order + [name for name in table.column_names if name not in first])
+
+        if flatten:
+            table = _flatten_table(table)
+        return table.to_pandas()
+
+    def _decode_block_python(self, block: bytes, flatten: bool, lines_before: int) -> pd.DataFrame:
+        """
+        Decode a block of JSON Lines line by line, skipping malformed lines.
 
-                # Skip empty lines
-                if not line:
-                    continue
+        Args:
+            block: Whole lines of the file
+            flatten: Whether to flatten nested structures
+            lines_before: Lines in the file before the block
+
+        Returns:
+            DataFrame with the valid records of the block
+        """
+        records: List[Dict[str, Any]] = []
 
-                try:
-                    record = json.loads(line)
-                    records.append(record)
+        for line_number, line in enumerate(block.decode('utf-8').split('\n'), start=lines_before + 1):
+            line = line.strip()
 
-                    # Yield chunk when we reach chunk_size
-                    if len(records) >= self.chunk_size:
-                        df = self._records_to_dataframe(records, flatten)
-                        yield df
-                        records = []
+            # Skip empty lines
+            if not line:
+                continue
 
-                except json.JSONDecodeError as e:
-                    # Log warning but continue processing
-                    print(f"Warning: Invalid JSON on line, skipping: {str(e)}")
-                    continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                self.malformed_lines += 1
+                if self._first_malformed_line is None:
+                    self._first_malformed_line = line_number
+                logger.debug(f"Skipping invalid JSON on line {line_number} of {self.file_path}: {e}")
 
-        # Yield remaining records
-        if records:
-            df = self._records_to_dataframe(records, flatten)
-            yield df
+        return self._records_to_dataframe(records, flatten)
 
-    def _load_json_array(self, orient: str, flatten: bool) -> Iterator[pd.DataFrame]:
+    def _load_json_array(self, orient: str, flatten: bool,
+                         record_path: Optional[str] = None) -> Iterator[pd.DataFrame]:
         """
         Load standard JSON array format in chunks.
 
+        Arrays (at the top level or at ``record_path``) are parsed one element
+        at a time, so memory is bounded by the chunk size. A top-level object
+        without ``record_path`` is oriented data and is read whole.
+
         Args:
-            orient: Pandas JSON orientation
+            orient: Pandas JSON orientation (top-level objects only)
             flatten: Whether to flatten nested structures
+            record_path: Dot-separated keys leading to the record array
 
         Yields:
             DataFrames containing chunks of data
         """
-        # For standard JSON arrays, pandas can handle it efficiently
-        # but we need to chunk it for memory efficiency
-
         try:
-            # Read entire JSON (for arrays, we need to parse the whole structure)
             with open(self.file_path, 'r', encoding='utf-8') as f:
+                if record_path or starts_with_array(f):
+                    rows = 0
+                    for records in iter_json_batches(f, self.chunk_size, record_path):
+                        chunk = self._records_to_dataframe(records, flatten)
+                        # Number rows through the file
+                        chunk.index = pd.RangeIndex(rows, rows + len(chunk))
+                        rows += len(chunk)
+                        yield chunk
+                    return
+
                 data = json.load(f)
 
-            # Handle different JSON structures
-            if isinstance(data, list):
-                records = data
-            elif isinstance(data, dict):
-                # If it's a dict, might be oriented data
-                records = data
-            else:
+            if not isinstance(data, dict):
                 raise ValueError(f"Unexpected JSON structure: {type(data)}")
 
-            # Convert to DataFrame
-            if isinstance(records, list):
-                df = self._records_to_dataframe(records, flatten)
-            else:
-                df = pd.DataFrame.from_dict(records, orient=orient)
-                if flatten:
-                    df = self._flatten_dataframe(df)
+            # A dict is oriented data
+            df = pd.DataFrame.from_dict(data, orient=orient)
+            if flatten:
+                df = self._flatten_dataframe(df)
 
             # Yield in chunks
             for i in range(0, len(df), self.chunk_size):
@@ -250,14 +412,15 @@ class JSONLoader(DataLoader):
                         line_count = sum(1 for line in f if line.strip())
                     metadata["estimated_rows"] = line_count
                 else:
-                    # For JSON arrays, we'd need to parse entire file
-                    # Just count from what we have
-                    with open(self.file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        if isinstance(data, list):
-                            metadata["estimated_rows"] = len(data)
-                        else:
-                            metadata["estimated_rows"] = len(first_chunk)
+                    # Estimate from the size of the first chunk; counting
+                    # exactly would mean parsing the entire file
+                    sample_size_bytes = len(first_chunk.to_json(orient='records').encode('utf-8'))
+                    if len(first_chunk) < self.chunk_size or not sample_size_bytes:
+                        metadata["estimated_rows"] = len(first_chunk)
+                    else:
+                        metadata["estimated_rows"] = int(
+                            (self.get_file_size() / sample_size_bytes) * len(first_chunk)
+                        )
 
             except Exception as e:
                 metadata["error"] = f"Could not read metadata: {str(e)}"
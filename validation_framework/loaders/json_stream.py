@@ -0,0 +1,164 @@
+"""
+Incremental parsing of JSON arrays.
+
+json.load() needs the whole document in memory, and the DataFrame built
+from it several times more. The parser here reads the file in blocks and
+decodes one array element at a time with json.JSONDecoder.raw_decode, so
+memory is bounded by the batch size instead of the file size:
+
+- the array may be the whole document (``[{...}, {...}]``) or sit under a
+  key path in an object envelope (``{"meta": {...}, "data": [...]}`` with
+  ``record_path="data"``; nested keys are separated by dots)
+- elements are handed back in batches of ``batch_size``
+- reading stops at the end of the array; anything after it is not parsed
+
+Author: Daniel Edge
+"""
+
+from typing import Any, Iterator, List, Optional, TextIO
+import json
+
+# Characters read from the file at a time
+READ_SIZE = 1024 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+class _JSONBuffer:
+    """Text buffer over a file that decodes one JSON value at a time."""
+
+    def __init__(self, f: TextIO, read_size: int):
+        self._file = f
+        self._read_size = read_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int) -> bool:
+        """Append up to ``size`` more characters; False at end of file."""
+        if self._eof:
+            return False
+        data = self._file.read(size)
+        if not data:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + data
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ("" at end of file)."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill(self._read_size):
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume the next non-whitespace character, which must be one of ``chars``."""
+        char = self.peek()
+        if not char or char not in chars:
+            found = repr(char) if char else "end of file"
+            raise json.JSONDecodeError(f"Expected one of {chars!r}, found {found}", self._buffer, self._pos)
+        self._pos += 1
+        return char
+
+    def decode(self) -> Any:
+        """Decode the next JSON value, reading more of the file as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Incomplete value: read at least as much again and retry
+                if not self._fill(max(self._read_size, len(self._buffer) - self._pos)):
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the file
+            if end == len(self._buffer) and self._fill(self._read_size):
+                continue
+            self._pos = end
+            return value
+
+
+def _enter_record_path(buffer: _JSONBuffer, record_path: Optional[str]) -> None:
+    """Consume the document up to the opening bracket of the record array."""
+    for key in record_path.split(".") if record_path else []:
+        missing = ValueError(f"Key '{key}' of record_path '{record_path}' not found")
+        buffer.expect("{")
+        if buffer.peek() == "}":
+            raise missing
+        while True:
+            name = buffer.decode()
+            buffer.expect(":")
+            if name == key:
+                break
+            # Sibling values before the key are decoded whole
+            buffer.decode()
+            if buffer.expect(",}") == "}":
+                raise missing
+    buffer.expect("[")
+
+
+def iter_json_array(f: TextIO, record_path: Optional[str] = None, read_size: int = READ_SIZE) -> Iterator[Any]:
+    """
+    Yield the elements of a JSON array one at a time.
+
+    Args:
+        f: Text file positioned at the start of the document
+        record_path: Dot-separated keys leading to the array in an object
+                     envelope (None: the document is the array)
+        read_size: Characters read from the file at a time
+
+    Yields:
+        Decoded array elements
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+        ValueError: If a key of ``record_path`` is missing
+    """
+    buffer = _JSONBuffer(f, read_size)
+    _enter_record_path(buffer, record_path)
+
+    if buffer.peek() == "]":
+        return
+    while True:
+        yield buffer.decode()
+        if buffer.expect(",]") == "]":
+            return
+
+
+def iter_json_batches(f: TextIO, batch_size: int, record_path: Optional[str] = None,
+                      read_size: int = READ_SIZE) -> Iterator[List[Any]]:
+    """
+    Yield the elements of a JSON array in lists of ``batch_size``.
+
+    Args:
+        f: Text file positioned at the start of the document
+        batch_size: Elements per batch (the last batch may be smaller)
+        record_path: Dot-separated keys leading to the array (see iter_json_array)
+        read_size: Characters read from the file at a time
+
+    Yields:
+        Lists of decoded array elements
+    """
+    batch: List[Any] = []
+    for element in iter_json_array(f, record_path, read_size):
+        batch.append(element)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def starts_with_array(f: TextIO) -> bool:
+    """Whether the document in a text file is a JSON array (restores the position)."""
+    position = f.tell()
+    buffer = _JSONBuffer(f, 64)
+    is_array = buffer.peek() == "["
+    f.seek(position)
+    return is_array
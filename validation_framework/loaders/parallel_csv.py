@@ -0,0 +1,518 @@
+"""
+Parallel CSV parsing over quote-aware byte ranges.
+
+pd.read_csv parses on a single thread. With ``parse_workers`` above 1 the
+CSV loader instead memory-maps the file, cuts it into byte ranges that
+start at row boundaries, and parses the ranges in worker processes:
+
+- a newline ends a row only if an even number of quote characters come
+  before it (an escaped quote inside a quoted field is doubled, so it does
+  not change the parity); ranges are cut at the first such newline after
+  every ``chunk_size`` rows' worth of bytes
+- files with an odd number of quote characters (a stray quote inside an
+  unquoted field) and encodings in which a 0x0A byte is not always a
+  newline are parsed serially as before
+- parsed ranges are handed back in file order, or as soon as they are
+  ready for callers that do not need row order
+- the number of rows in every range is recorded in a CSVRowIndex, which
+  maps row numbers to byte offsets: exact row counts, and reading from the
+  middle of a file without parsing what comes before
+- index_rows() builds the same index by scanning the bytes with numpy,
+  without parsing, for resuming an interrupted run at a data row
+
+Example YAML:
+    processing:
+      csv_parse_workers: 4
+
+Author: Daniel Edge
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import bisect
+import logging
+import mmap
+import os
+
+import numpy as np
+import pandas as pd
+
+from validation_framework.core.parallel_executor import MP_CONTEXT
+
+logger = logging.getLogger(__name__)
+
+# Encodings in which every 0x0A byte is a newline and every 0x22 byte a quote
+SPLITTABLE_ENCODINGS = {
+    "utf-8", "utf8", "utf-8-sig", "ascii", "cp1252", "latin-1", "latin1", "iso-8859-1",
+}
+
+# Bytes sampled to estimate the size of a row
+_SAMPLE_BYTES = 64 * 1024
+
+# Smallest byte range handed to a worker
+_MIN_RANGE_BYTES = 64 * 1024
+
+# Bytes scanned at a time by index_rows()
+_INDEX_BLOCK_BYTES = 4 * 1024 * 1024
+
+
+@dataclass
+class CSVRowIndex:
+    """
+    Row numbers at byte offsets of a CSV file.
+
+    ``byte_offsets[i]`` is the start of a row and ``row_offsets[i]`` the
+    0-based data row number of that row (the header is not counted).
+    Built by ParallelCSVReader or index_rows(); a resumed run reads from
+    the offset locate() finds for its first unvalidated row.
+
+    Attributes:
+        byte_offsets: Ascending byte offsets of row starts; the first is 0
+        row_offsets: Data row number at each byte offset
+        total_rows: Data rows in the file
+        file_size: File size the index was built for
+    """
+
+    byte_offsets: List[int] = field(default_factory=list)
+    row_offsets: List[int] = field(default_factory=list)
+    total_rows: int = 0
+    file_size: int = 0
+
+    def locate(self, row: int) -> Tuple[int, int]:
+        """
+        Find where to start reading to reach a data row.
+
+        Args:
+            row: 0-based data row number
+
+        Returns:
+            Tuple of (byte offset of an indexed row start at or before the
+            row, rows to skip after that offset to reach the row)
+        """
+        if not self.byte_offsets:
+            return 0, row
+        position = bisect.bisect_right(self.row_offsets, row) - 1
+        position = max(position, 0)
+        return self.byte_offsets[position], row - self.row_offsets[position]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "byte_offsets": self.byte_offsets,
+            "row_offsets": self.row_offsets,
+            "total_rows": self.total_rows,
+            "file_size": self.file_size,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CSVRowIndex":
+        """Create an index from to_dict() output."""
+        return cls(**data)
+
+
+def find_split_points(file_path: str, target_bytes: int, quotechar: str = '"') -> Optional[List[int]]:
+    """
+    Cut a CSV file into byte ranges that start at row boundaries.
+
+    Args:
+        file_path: Path to the CSV file
+        target_bytes: Approximate size of each range
+        quotechar: Quote character of the file
+
+    Returns:
+        Ascending offsets starting with 0 and ending with the file size;
+        consecutive offsets delimit one range. None if the file's quote
+        characters do not pair up, so rows cannot be found by counting them.
+    """
+    size = os.path.getsize(file_path)
+    if size == 0:
+        return [0, 0]
+
+    quote = quotechar.encode("ascii")
+    target_bytes = max(1, target_bytes)
+    points = [0]
+    parity = 0
+    position = 0
+
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        while position + target_bytes < size:
+            cut = position + target_bytes
+            parity ^= mm[position:cut].count(quote) & 1
+
+            # First newline after the cut that is outside a quoted field
+            while True:
+                newline = mm.find(b"\n", cut)
+                if newline == -1:
+                    newline = size - 1
+                parity ^= mm[cut:newline].count(quote) & 1
+                if parity == 0 or newline >= size - 1:
+                    break
+                cut = newline + 1
+
+            position = newline + 1
+            if position >= size:
+                break
+            points.append(position)
+
+        parity ^= mm[position:size].count(quote) & 1
+
+    if parity:
+        return None
+    points.append(size)
+    return points
+
+
+def estimate_row_bytes(file_path: str) -> float:
+    """Average bytes per line in the first 64 KB of a file."""
+    with open(file_path, "rb") as f:
+        sample = f.read(_SAMPLE_BYTES)
+    return len(sample) / max(sample.count(b"\n"), 1)
+
+
+def _parse_range(file_path: str, start: int, end: int, options: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Parse the rows in a byte range with the serial CSV loader.
+
+    Args:
+        file_path: Path to the CSV file
+        start: First byte (0 or the start of a row)
+        end: End byte (exclusive; the start of a row or the file size)
+        options: CSVLoader keyword arguments (delimiter, encoding, header, columns)
+
+    Returns:
+        DataFrame with the rows of the range
+    """
+    from validation_framework.loaders.csv_loader import CSVLoader
+
+    loader = CSVLoader(file_path, chunk_size=max(end - start, 1), byte_range=(start, end), **options)
+    chunks = [chunk for chunk in loader.load() if len(chunk)]
+    if not chunks:
+        return pd.DataFrame()
+    if len(chunks) == 1:
+        return chunks[0]
+    return pd.concat(chunks, ignore_index=True)
+
+
+class ParallelCSVReader:
+    """
+    Parses byte ranges of a CSV file in worker processes.
+
+    Example:
+        >>> reader = ParallelCSVReader("big.csv", chunk_size=50000, workers=4,
+        ...                            options={"delimiter": ",", "encoding": "utf-8", "header": 0})
+        >>> for chunk in reader.chunks():
+        ...     process(chunk)
+        >>> reader.row_index.total_rows
+    """
+
+    def __init__(self, file_path: str, chunk_size: int, workers: int, options: Dict[str, Any],
+                 split_points: Optional[List[int]] = None):
+        """
+        Initialize the reader.
+
+        Args:
+            file_path: Path to the CSV file
+            chunk_size: Approximate rows per range (and per yielded chunk)
+            workers: Number of worker processes
+            options: CSVLoader keyword arguments (delimiter, encoding, header, columns)
+            split_points: Range boundaries from find_split_points or an
+                          earlier row index (computed when None)
+        """
+        self.file_path = str(file_path)
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.options = options
+        self.split_points = split_points
+        self.row_index: Optional[CSVRowIndex] = None
+
+    def plan(self) -> Optional[List[int]]:
+        """
+        Compute the range boundaries.
+
+        Returns:
+            Split points, or None if the file cannot be split safely
+        """
+        if self.split_points is None:
+            target = max(int(estimate_row_bytes(self.file_path) * self.chunk_size), _MIN_RANGE_BYTES)
+            self.split_points = find_split_points(self.file_path, target)
+        return self.split_points
+
+    def chunks(self, ordered: bool = True) -> Iterator[pd.DataFrame]:
+        """
+        Parse the file and yield one DataFrame per byte range.
+
+        The row index is available in ``row_index`` once every range has
+        been parsed.
+
+        Args:
+            ordered: Yield ranges in file order (False: as soon as parsed)
+
+        Yields:
+            DataFrames with the rows of each range
+
+        Raises:
+            RuntimeError: If the file cannot be split or a range cannot be parsed
+        """
+        points = self.plan()
+        if points is None:
+            raise RuntimeError(f"Cannot split {self.file_path} at row boundaries: quotes do not pair up")
+
+        ranges = [(points[i], points[i + 1]) for i in range(len(points) - 1) if points[i] < points[i + 1]]
+        row_counts: Dict[int, int] = {}
+
+        try:
+            pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=MP_CONTEXT)
+            pool.submit(int).result()
+        except Exception as e:
+            # e.g. inside a daemonic prefetch process, which cannot have children
+            logger.debug(f"Parsing {self.file_path} serially: cannot start worker processes ({e})")
+            for position, (start, end) in enumerate(ranges):
+                frame = _parse_range(self.file_path, start, end, self.options)
+                row_counts[position] = len(frame)
+                yield frame
+            self._build_index(ranges, row_counts, points[-1])
+            return
+
+        logger.debug(f"Parsing {len(ranges)} byte ranges of {self.file_path} on {self.workers} processes")
+        pending: deque = deque()
+        max_pending = self.workers * 2
+        try:
+            for position, (start, end) in enumerate(ranges):
+                pending.append((position, pool.submit(_parse_range, self.file_path, start, end, self.options)))
+                while len(pending) >= max_pending:
+                    yield from self._collect(pending, row_counts, ordered)
+            while pending:
+                yield from self._collect(pending, row_counts, ordered)
+        finally:
+            for _, future in pending:
+                future.cancel()
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        self._build_index(ranges, row_counts, points[-1])
+
+    @staticmethod
+    def _collect(pending: deque, row_counts: Dict[int, int], ordered: bool) -> Iterator[pd.DataFrame]:
+        """Yield the oldest parsed range, or (unordered) every finished one."""
+        if ordered:
+            position, future = pending.popleft()
+            frame = future.result()
+            row_counts[position] = len(frame)
+            yield frame
+            return
+
+        wait([future for _, future in pending], return_when=FIRST_COMPLETED)
+        for item in [item for item in pending if item[1].done()]:
+            pending.remove(item)
+            frame = item[1].result()
+            row_counts[item[0]] = len(frame)
+            yield frame
+
+    def _build_index(self, ranges: List[Tuple[int, int]], row_counts: Dict[int, int], file_size: int) -> None:
+        """Record the first row number of every range."""
+        index = CSVRowIndex(file_size=file_size)
+        rows = 0
+        for position, (start, _) in enumerate(ranges):
+            index.byte_offsets.append(start)
+            index.row_offsets.append(rows)
+            rows += row_counts[position]
+        index.total_rows = rows
+        self.row_index = index
+
+
+def index_rows(file_path: str, delimiter: str = ",", header: Any = 0, stop_row: Optional[int] = None,
+               quotechar: str = '"', block_size: int = _INDEX_BLOCK_BYTES) -> Optional[CSVRowIndex]:
+    """
+    Index the byte offsets of data rows by scanning the file, without parsing.
+
+    Rows are counted the way pd.read_csv counts them: newlines inside
+    quoted fields do not end a row and blank (whitespace-only) lines are
+    skipped. The scan gives up (None) rather than guess wherever the
+    parser could see the file differently:
+
+    - a quote that does not start or end a field (e.g. ``6" pipe``), or
+      quote characters that do not pair up
+    - a carriage return not followed by a newline, which pd.read_csv also
+      reads as the end of a row
+    - a data row up to ``stop_row`` with more fields than the header (or the
+      first row), which pd.read_csv drops or reads as an index column
+    - a header other than the first row (0) or none (None)
+
+    Args:
+        file_path: Path to the CSV file (in an encoding of SPLITTABLE_ENCODINGS)
+        delimiter: Single-character field delimiter
+        header: 0 or None, as passed to pd.read_csv
+        stop_row: Stop once the offset of this 0-based data row is known
+                  (None: scan the whole file)
+        quotechar: Quote character of the file
+        block_size: Bytes scanned at a time
+
+    Returns:
+        CSVRowIndex with an entry per scanned block (and one at ``stop_row``),
+        whose ``total_rows`` counts the rows scanned; None if the file
+        cannot be indexed safely or has fewer than ``stop_row`` rows
+    """
+    if header not in (0, None) or len(delimiter) != 1 or len(quotechar) != 1:
+        return None
+    if ord(delimiter) > 127 or ord(quotechar) > 127:
+        return None
+
+    size = os.path.getsize(file_path)
+    if size == 0:
+        return CSVRowIndex() if not stop_row else None
+
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = np.frombuffer(mm, dtype=np.uint8)
+        try:
+            return _scan_rows(data, ord(delimiter), ord(quotechar), header == 0, stop_row, block_size)
+        finally:
+            # The memory map cannot close while numpy still views it
+            del data
+
+
+def _scan_rows(data: np.ndarray, delimiter: int, quote: int, has_header: bool,
+               stop_row: Optional[int], block_size: int) -> Optional[CSVRowIndex]:
+    """Block-wise row scan behind index_rows()."""
+    size = len(data)
+    index = CSVRowIndex(file_size=size)
+    parity = 0            # quote parity at the start of the block
+    row_start = 0         # start of the row that continues into the block
+    row_fields = 1        # fields of that row so far
+    row_content = False   # whether that row has non-blank bytes so far
+    expected = None       # fields of the header (or first) row
+    rows = 0
+
+    for base in range(0, size, block_size):
+        block = data[base:base + block_size]
+        length = len(block)
+        quotes = np.flatnonzero(block == quote) + base
+
+        # Quotes must open at the start of a field and close at its end
+        quote_parity = (parity + np.arange(len(quotes))) & 1
+        opening = quotes[quote_parity == 0]
+        before = data[np.maximum(opening - 1, 0)]
+        if not np.all((opening == 0) | (before == delimiter) | (before == 10) | (before == quote)):
+            return None
+        closing = quotes[quote_parity == 1]
+        after = data[np.minimum(closing + 1, size - 1)]
+        if not np.all((closing == size - 1) | (after == delimiter) | (after == 10)
+                      | (after == 13) | (after == quote)):
+            return None
+
+        # Quoted spans [open, close) in block positions, cut at the block edges
+        span_starts = opening - base
+        span_ends = closing - base
+        if parity:
+            span_starts = np.concatenate([[0], span_starts])
+        if len(span_starts) > len(span_ends):
+            span_ends = np.concatenate([span_ends, [length]])
+        parity = (parity + len(quotes)) & 1
+
+        def outside(positions: np.ndarray) -> np.ndarray:
+            if not len(span_starts):
+                return positions
+            depth = (np.bincount(np.searchsorted(positions, span_starts), minlength=len(positions) + 1)
+                     - np.bincount(np.searchsorted(positions, span_ends), minlength=len(positions) + 1))
+            return positions[np.cumsum(depth[:-1]) == 0]
+
+        # pd.read_csv also ends rows at a lone carriage return
+        returns = np.flatnonzero(block == 13)
+        lone = returns[data[np.minimum(returns + base + 1, size - 1)] != 10]
+        if len(outside(lone)):
+            return None
+
+        ends = outside(np.flatnonzero(block == 10))
+
+        # Fields per row: delimiters between its newlines, less those in quoted spans
+        delimiters = np.flatnonzero(block == delimiter)
+        per_row = np.diff(np.concatenate([[0], np.searchsorted(delimiters, ends), [len(delimiters)]]))
+        quoted = np.bincount(np.searchsorted(ends, span_starts), minlength=len(ends) + 1,
+                             weights=np.searchsorted(delimiters, span_ends) - np.searchsorted(delimiters, span_starts))
+        fields = per_row - quoted.astype(np.int64) + 1
+        fields[0] += row_fields - 1
+
+        if len(ends) == 0:
+            row_fields = int(fields[0])
+            row_content = row_content or bool(_content(block).any())
+            continue
+
+        starts = np.concatenate([[row_start], ends[:-1] + 1 + base])
+        # Rows with a delimiter are not blank; the others need a non-blank byte
+        filled = fields[:-1] > 1
+        filled[0] |= row_content
+        if not filled.all():
+            bounds = np.empty(2 * len(ends), dtype=np.int64)
+            bounds[0] = 0
+            bounds[2::2] = ends[:-1] + 1
+            bounds[1::2] = ends
+            filled |= np.logical_or.reduceat(_content(block), bounds)[0::2]
+
+        rows, expected, done = _count_rows(index, starts[filled], fields[:-1][filled], rows, expected,
+                                           has_header, stop_row)
+        if done:
+            return index if expected is not None else None
+        has_header = has_header and expected is None
+
+        row_start = int(ends[-1]) + 1 + base
+        row_fields = int(fields[-1])
+        row_content = bool(_content(block[row_start - base:]).any())
+
+    if parity:
+        return None
+    if row_start < size and row_content:
+        # Last row without a trailing newline
+        rows, expected, done = _count_rows(index, np.array([row_start]), np.array([row_fields]), rows, expected,
+                                           has_header, stop_row)
+        if done:
+            return index if expected is not None else None
+    if stop_row is not None:
+        if stop_row != rows:
+            return None
+        index.byte_offsets.append(size)
+        index.row_offsets.append(rows)
+    index.total_rows = rows
+    return index
+
+
+def _content(block: np.ndarray) -> np.ndarray:
+    """Mask of the bytes other than spaces, tabs and newlines."""
+    return (block > 32) | (block < 9) | ((block > 10) & (block != 13) & (block != 32))
+
+
+def _count_rows(index: CSVRowIndex, starts: np.ndarray, fields: np.ndarray, rows: int,
+                expected: Optional[int], has_header: bool,
+                stop_row: Optional[int]) -> Tuple[int, Optional[int], bool]:
+    """
+    Record the non-blank rows of one block.
+
+    Returns:
+        Tuple of (rows counted so far, expected fields, done), where done
+        means the scan can stop: ``stop_row`` was reached (``expected`` is
+        set) or a row before it has too many fields (``expected`` is None)
+    """
+    if len(starts) == 0:
+        return rows, expected, False
+    if expected is None:
+        expected = int(fields[0])
+        if has_header:
+            starts, fields = starts[1:], fields[1:]
+
+    # The row at stop_row is checked too: read first, it would become an index column
+    limit = len(starts) if stop_row is None else min(len(starts), stop_row - rows + 1)
+    if np.any(fields[:limit] > expected):
+        return rows, None, True
+
+    if not index.byte_offsets:
+        # Reading from the start of the file reaches the first row too
+        index.byte_offsets.append(0)
+        index.row_offsets.append(0)
+    elif len(starts):
+        index.byte_offsets.append(int(starts[0]))
+        index.row_offsets.append(rows)
+    if stop_row is not None and rows + len(starts) > stop_row:
+        index.byte_offsets.append(int(starts[stop_row - rows]))
+        index.row_offsets.append(stop_row)
+        index.total_rows = stop_row
+        return stop_row, expected, True
+    return rows + len(starts), expected, False
@@ -5,7 +5,7 @@ Parquet is a columnar storage format ideal for large datasets (200GB+).
 It provides excellent compression and allows for efficient column-based reading.
 """
 
-from typing import Iterator, Dict, Any, List
+from typing import Iterator, Dict, Any, List, Optional
 import pandas as pd
 from validation_framework.loaders.base import DataLoader
 
@@ -51,9 +51,18 @@ class ParquetLoader(DataLoader):
             # Use PyArrow for efficient chunked reading
             parquet_file = pq.ParquetFile(self.file_path)
 
+            # Only decode the requested columns (columnar projection)
+            columns = self._resolve_columns(parquet_file)
+
             # Read in batches for memory efficiency
             # batch_size is in rows, similar to chunk_size for consistency
-            for batch in parquet_file.iter_batches(batch_size=self.chunk_size):
+            # Optionally only the given row groups (e.g. those appended since a checkpoint)
+            row_groups = self.kwargs.get("row_groups")
+            if row_groups is not None and not row_groups:
+                return
+
+            for batch in parquet_file.iter_batches(batch_size=self.chunk_size, columns=columns,
+                                                   row_groups=row_groups):
                 # Convert PyArrow batch to pandas DataFrame
                 df = batch.to_pandas()
                 yield df
@@ -68,6 +77,28 @@ class ParquetLoader(DataLoader):
                 f"Ensure the file is a valid Parquet format."
             )
 
+    def _resolve_columns(self, parquet_file: Any) -> Optional[List[str]]:
+        """
+        Get the requested columns that exist in the file.
+
+        Args:
+            parquet_file: Open pq.ParquetFile
+
+        Returns:
+            Column names in schema order, or None to read every column
+        """
+        columns = self.kwargs.get("columns")
+        if not columns:
+            return None
+
+        wanted = set(columns)
+        names = parquet_file.schema_arrow.names
+        selected = [name for name in names if name in wanted]
+
+        if not selected or len(selected) == len(names):
+            return None
+        return selected
+
     def get_metadata(self) -> Dict[str, Any]:
         """
         Get Parquet file metadata efficiently without loading data.
@@ -72,6 +72,44 @@ def detect_encoding(file_path: str) -> str:
     return 'utf-8'
 
 
+def _rechunk(batches: Iterator[DataFrame], chunk_size: int) -> Iterator[DataFrame]:
+    """
+    Regroup Polars DataFrames into chunks of exactly ``chunk_size`` rows.
+
+    Args:
+        batches: DataFrames of any size, in order
+        chunk_size: Rows per output chunk (the last chunk may be smaller)
+
+    Yields:
+        pl.DataFrame: Chunks of ``chunk_size`` rows
+    """
+    pending = []
+    pending_rows = 0
+    for batch in batches:
+        if batch.height == 0:
+            continue
+        if not pending and batch.height == chunk_size:
+            yield batch
+            continue
+
+        pending.append(batch)
+        pending_rows += batch.height
+        if pending_rows < chunk_size:
+            continue
+
+        combined = pl.concat(pending, rechunk=False)
+        start = 0
+        while combined.height - start >= chunk_size:
+            yield combined.slice(start, chunk_size)
+            start += chunk_size
+        remainder = combined.slice(start)
+        pending = [remainder] if remainder.height else []
+        pending_rows = remainder.height
+
+    if pending:
+        yield pl.concat(pending, rechunk=False)
+
+
 class PolarsCSVLoader(DataLoader):
     """
     Polars-based loader for CSV and delimited text files with robust error handling.
@@ -112,8 +150,9 @@ class PolarsCSVLoader(DataLoader):
         """
         Load CSV data in chunks using Polars' optimized parser.
 
-        Polars CSV parser is multi-threaded and highly optimized,
-        providing significant speedup over pandas especially for large files.
+        The file is streamed: Polars keeps parsing the following batches in
+        its own threads while a chunk is being validated, and only a few
+        chunks of ``chunk_size`` rows are held in memory at once.
 
         Yields:
             pl.DataFrame: Chunks of data from the CSV file
@@ -136,27 +175,17 @@ class PolarsCSVLoader(DataLoader):
             encoding = 'utf8'  # Polars only supports utf8
         has_header = self.kwargs.get("header", 0) == 0  # 0 means first row is header
 
-        try:
-            # Polars scan_csv provides lazy reading with automatic optimization
-            lazy_df = pl.scan_csv(
-                str(self.file_path),
-                separator=delimiter,
-                encoding=encoding,
-                has_header=has_header,
-                ignore_errors=True,  # Skip rows with parsing errors
-                low_memory=False,  # Better performance for large files
-                quote_char='"',  # Handle quoted fields properly
-            )
-
-            # Collect the data (Polars is memory efficient)
-            df = lazy_df.collect()
+        read_options = dict(
+            separator=delimiter,
+            encoding=encoding,
+            has_header=has_header,
+            ignore_errors=True,  # Skip rows with parsing errors
+            low_memory=False,  # Better performance for large files
+            quote_char='"',  # Handle quoted fields properly
+        )
 
-            # Yield chunks
-            total_rows = df.height
-            for start_row in range(0, total_rows, self.chunk_size):
-                end_row = min(start_row + self.chunk_size, total_rows)
-                chunk = df.slice(start_row, end_row - start_row)
-                yield chunk
+        try:
+            yield from self._read_batches(read_options)
 
         except FileNotFoundError:
             raise FileNotFoundError(f"CSV file not found: {self.file_path}")
@@ -192,6 +221,51 @@ class PolarsCSVLoader(DataLoader):
             logger.error(f"Error loading CSV file {self.file_path}: {error_msg}", exc_info=True)
             raise RuntimeError(f"Error loading CSV file {self.file_path}: {error_msg}")
 
+    def _read_batches(self, read_options: Dict[str, Any]) -> Iterator[DataFrame]:
+        """
+        Stream the parsed file in chunks of ``chunk_size`` rows.
+
+        Uses the streaming engine (``LazyFrame.collect_batches``) where
+        available, else the batched CSV reader of older Polars versions.
+        Only when neither exists is the whole file collected and sliced.
+
+        Args:
+            read_options: Keyword arguments for the Polars CSV reader
+
+        Yields:
+            pl.DataFrame: Chunks of at most ``chunk_size`` rows
+        """
+        path = str(self.file_path)
+        lazy_df = pl.scan_csv(path, **read_options)
+
+        if hasattr(lazy_df, "collect_batches"):
+            batches = lazy_df.collect_batches(chunk_size=self.chunk_size)
+            try:
+                yield from _rechunk(batches, self.chunk_size)
+            finally:
+                # Stop the background query if the consumer stops early
+                stop = getattr(batches, "stop", None)
+                if stop is not None:
+                    stop()
+            return
+
+        if hasattr(pl, "read_csv_batched"):
+            reader = pl.read_csv_batched(path, batch_size=self.chunk_size, **read_options)
+
+            def reader_batches() -> Iterator[DataFrame]:
+                while True:
+                    batches = reader.next_batches(1)
+                    if not batches:
+                        return
+                    yield from batches
+
+            yield from _rechunk(reader_batches(), self.chunk_size)
+            return
+
+        df = lazy_df.collect()
+        for start_row in range(0, df.height, self.chunk_size):
+            yield df.slice(start_row, self.chunk_size)
+
     def get_metadata(self) -> Dict[str, Any]:
         """
         Get CSV file metadata using Polars.
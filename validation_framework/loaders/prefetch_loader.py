@@ -0,0 +1,274 @@
+"""
+Background prefetch wrapper for data loaders.
+
+Loaders parse the next chunk only when the consumer asks for it, so file
+I/O and parsing time add up with validation time. PrefetchLoader runs the
+wrapped loader in a background thread (or process) that keeps a bounded
+queue of decoded chunks ready, overlapping parsing with validation.
+
+Statistics on how long the consumer waited for chunks and how full the
+queue was tell whether a job is I/O-bound (consumer waits, queue empty) or
+CPU-bound (producer waits, queue full).
+
+Author: Daniel Edge
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator
+
+from validation_framework.core.parallel_executor import MP_CONTEXT
+
+logger = logging.getLogger(__name__)
+
+# Queue markers sent by the producer
+_END = "__prefetch_end__"
+_ERROR = "__prefetch_error__"
+
+# How often a blocked producer re-checks whether the consumer went away
+_PUT_TIMEOUT = 0.1
+
+
+@dataclass
+class PrefetchStats:
+    """
+    Statistics collected by PrefetchLoader for one or more passes.
+
+    Attributes:
+        chunks: Chunks handed to the consumer
+        consumer_wait_seconds: Time the consumer spent waiting for a chunk
+        producer_wait_seconds: Time the producer spent blocked on a full queue
+        queue_fill_total: Sum of queue sizes observed at each get (for averages)
+        max_queue_fill: Largest queue size observed at a get
+        queue_depth: Configured queue depth
+    """
+    chunks: int = 0
+    consumer_wait_seconds: float = 0.0
+    producer_wait_seconds: float = 0.0
+    queue_fill_total: int = 0
+    max_queue_fill: int = 0
+    queue_depth: int = 0
+
+    @property
+    def average_queue_fill(self) -> float:
+        """Average number of ready chunks when the consumer asked for one."""
+        return self.queue_fill_total / self.chunks if self.chunks else 0.0
+
+    @property
+    def bottleneck(self) -> str:
+        """'io' if the consumer mostly waited for data, 'cpu' if the loader waited on validation."""
+        if self.consumer_wait_seconds >= self.producer_wait_seconds:
+            return "io"
+        return "cpu"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (for reports and logging)."""
+        return {
+            "chunks": self.chunks,
+            "consumer_wait_seconds": round(self.consumer_wait_seconds, 4),
+            "producer_wait_seconds": round(self.producer_wait_seconds, 4),
+            "average_queue_fill": round(self.average_queue_fill, 2),
+            "max_queue_fill": self.max_queue_fill,
+            "queue_depth": self.queue_depth,
+            "bottleneck": self.bottleneck,
+        }
+
+
+def _produce(loader: Any, chunk_queue: Any, stop_event: Any, wait_time: Any) -> None:
+    """
+    Producer loop: iterate the wrapped loader and fill the queue.
+
+    Runs in a thread or a child process. Stops early when the consumer sets
+    stop_event.
+
+    Args:
+        loader: Wrapped DataLoader
+        chunk_queue: Bounded queue to fill
+        stop_event: Event set by the consumer to stop producing
+        wait_time: Object with a ``value`` attribute (shared double for
+                   processes) receiving the time blocked on a full queue
+    """
+    producer_wait = 0.0
+
+    def put(item: Any) -> bool:
+        nonlocal producer_wait
+        start = time.perf_counter()
+        while not stop_event.is_set():
+            try:
+                chunk_queue.put(item, timeout=_PUT_TIMEOUT)
+                producer_wait += time.perf_counter() - start
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    try:
+        for chunk in loader.load():
+            if not put(chunk):
+                return
+        put((_END, None))
+    except Exception as e:
+        put((_ERROR, e))
+    finally:
+        wait_time.value = producer_wait
+
+
+class PrefetchLoader:
+    """
+    Wraps any DataLoader and decodes upcoming chunks in the background.
+
+    Behaves like the wrapped loader: load() yields the same chunks in the
+    same order, and other attributes (get_metadata, file_path, ...) are
+    delegated. Each call to load() starts a fresh background pass.
+
+    Modes:
+        - "thread" (default): producer thread; effective because pandas,
+          PyArrow and Polars parsers release the GIL while decoding
+        - "process": producer process; chunks are pickled across the process
+          boundary, worthwhile for pure-Python parsing (e.g. JSON)
+
+    Example:
+        >>> loader = PrefetchLoader(CSVLoader("data.csv"), queue_depth=2)
+        >>> for chunk in loader.load():
+        ...     validate(chunk)
+        >>> loader.stats.bottleneck
+        'cpu'
+    """
+
+    def __init__(self, loader: Any, queue_depth: int = 2, mode: str = "thread") -> None:
+        """
+        Initialize the prefetch wrapper.
+
+        Args:
+            loader: DataLoader to wrap
+            queue_depth: Maximum number of decoded chunks waiting in the queue
+            mode: "thread" or "process"
+
+        Raises:
+            ValueError: If mode is not supported or queue_depth < 1
+        """
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unsupported prefetch mode '{mode}'. Use 'thread' or 'process'")
+        if queue_depth < 1:
+            raise ValueError("Prefetch queue_depth must be at least 1")
+
+        self.loader = loader
+        self.queue_depth = queue_depth
+        self.mode = mode
+        self.stats = PrefetchStats(queue_depth=queue_depth)
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else to the wrapped loader."""
+        if name == "loader":
+            raise AttributeError(name)
+        return getattr(self.loader, name)
+
+    def load(self) -> Iterator[Any]:
+        """
+        Load data in chunks, prefetching ahead of the consumer.
+
+        Yields:
+            The wrapped loader's chunks, in order
+
+        Raises:
+            Any exception raised by the wrapped loader, re-raised in the
+            consumer at the point the failing chunk would have been yielded
+        """
+        if self.mode == "process":
+            ctx = MP_CONTEXT
+            chunk_queue = ctx.Queue(maxsize=self.queue_depth)
+            stop_event = ctx.Event()
+            wait_time = ctx.Value("d", 0.0)
+            worker = ctx.Process(
+                target=_produce, args=(self.loader, chunk_queue, stop_event, wait_time), daemon=True
+            )
+        else:
+            chunk_queue = queue.Queue(maxsize=self.queue_depth)
+            stop_event = threading.Event()
+            wait_time = SimpleNamespace(value=0.0)
+            worker = threading.Thread(
+                target=_produce, args=(self.loader, chunk_queue, stop_event, wait_time), daemon=True,
+                name="datak9-prefetch",
+            )
+
+        worker.start()
+        finished = False
+        try:
+            while True:
+                fill = self._queue_size(chunk_queue)
+                start = time.perf_counter()
+                item = self._get(chunk_queue, worker)
+                self.stats.consumer_wait_seconds += time.perf_counter() - start
+
+                if isinstance(item, tuple) and len(item) == 2 and isinstance(item[0], str):
+                    marker, payload = item
+                    if marker == _END:
+                        finished = True
+                        return
+                    if marker == _ERROR:
+                        finished = True
+                        raise payload
+
+                self.stats.chunks += 1
+                self.stats.queue_fill_total += fill
+                self.stats.max_queue_fill = max(self.stats.max_queue_fill, fill)
+                yield item
+        finally:
+            stop_event.set()
+            if not finished:
+                self._drain(chunk_queue)
+            worker.join(timeout=5)
+            self.stats.producer_wait_seconds += wait_time.value
+            logger.debug(f"Prefetch stats for {getattr(self.loader, 'file_path', 'loader')}: {self.stats.to_dict()}")
+
+    @staticmethod
+    def _get(chunk_queue: Any, worker: Any) -> Any:
+        """Wait for the next item, failing if the producer died without finishing."""
+        while True:
+            try:
+                return chunk_queue.get(timeout=_PUT_TIMEOUT)
+            except queue.Empty:
+                if worker.is_alive():
+                    continue
+                try:
+                    return chunk_queue.get(timeout=_PUT_TIMEOUT)
+                except queue.Empty:
+                    raise RuntimeError("Prefetch worker stopped unexpectedly") from None
+
+    @staticmethod
+    def _queue_size(chunk_queue: Any) -> int:
+        """Current queue size (not available for process queues on every OS)."""
+        try:
+            return chunk_queue.qsize()
+        except NotImplementedError:
+            return 0
+
+    @staticmethod
+    def _drain(chunk_queue: Any) -> None:
+        """Empty the queue so a blocked producer can notice the stop event."""
+        try:
+            while True:
+                chunk_queue.get_nowait()
+        except (queue.Empty, OSError, ValueError):
+            pass
+
+
+def with_prefetch(loader: Any, queue_depth: int = 2, mode: str = "thread") -> Any:
+    """
+    Wrap a loader in a PrefetchLoader unless prefetching is disabled.
+
+    Args:
+        loader: DataLoader to wrap
+        queue_depth: Prefetch queue depth; 0 (or less) disables prefetching
+        mode: "thread" or "process"
+
+    Returns:
+        PrefetchLoader, or the loader itself when prefetching is disabled
+    """
+    if not queue_depth or queue_depth < 1:
+        return loader
+    return PrefetchLoader(loader, queue_depth=queue_depth, mode=mode)
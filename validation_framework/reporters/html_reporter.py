@@ -483,6 +483,7 @@ HTML_TEMPLATE = """
         .severity-error { background: var(--error-soft); color: var(--error); }
         .severity-warning { background: var(--warning-soft); color: var(--warning); }
         .severity-success { background: var(--success-soft); color: var(--success); }
+        .severity-cached { background: var(--info-soft); color: var(--info); margin-left: 4px; }
 
         .validation-stats {
             display: flex;
@@ -961,6 +962,9 @@ HTML_TEMPLATE = """
                     {% if file_report.status == Status.PASSED %}
                     <span class="accordion-badge good">All passed</span>
                     {% endif %}
+                    {% if file_report.metadata.result_cache and file_report.metadata.result_cache.hits %}
+                    <span class="accordion-badge info">{{ file_report.metadata.result_cache.hits }} cached</span>
+                    {% endif %}
                     <span class="accordion-chevron">▼</span>
                 </div>
             </div>
@@ -1008,6 +1012,9 @@ HTML_TEMPLATE = """
                                     <span class="severity-badge {% if result.passed %}severity-success{% else %}{% if result.severity.value == 'ERROR' %}severity-error{% else %}severity-warning{% endif %}{% endif %}">
                                         {% if result.passed %}PASSED{% else %}{{ result.severity.value }}{% endif %}
                                     </span>
+                                    {% if result.cached %}
+                                    <span class="severity-badge severity-cached" title="Reused from the result cache: file and validation unchanged since it was computed">CACHED</span>
+                                    {% endif %}
                                 </div>
                             </div>
                             <div class="validation-stats">
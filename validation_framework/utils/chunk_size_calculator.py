@@ -29,6 +29,9 @@ class ChunkSizeCalculator:
     # Memory safety margin (use only 70% of available RAM)
     MEMORY_SAFETY_MARGIN = 0.7
 
+    # Parquet/CSV expand ~3x when loaded into pandas
+    MEMORY_EXPANSION_FACTOR = 3.0
+
     # Average bytes per row estimates by format
     BYTES_PER_ROW = {
         'csv': 150,      # Text-based, larger
@@ -101,15 +104,7 @@ class ChunkSizeCalculator:
         )
 
         # Calculate memory per row in memory (decompressed)
-        # Parquet/CSV expand ~3x when loaded into pandas
-        memory_expansion_factor = 3.0
-        memory_per_row = bytes_per_row * memory_expansion_factor
-
-        # Account for validation overhead
-        memory_per_row *= complexity_factor
-
-        # Account for multiple validations (some state accumulation)
-        memory_per_row *= (1 + (num_validations * 0.1))
+        memory_per_row = self._memory_per_row(bytes_per_row, num_validations, complexity_factor)
 
         # Calculate optimal chunk size
         optimal_chunk_size = int(target_memory_bytes / memory_per_row)
@@ -149,6 +144,43 @@ class ChunkSizeCalculator:
             )
         }
 
+    def _memory_per_row(self, bytes_per_row: float, num_validations: int, complexity_factor: float) -> float:
+        """In-memory bytes per row including validation overhead."""
+        memory_per_row = bytes_per_row * self.MEMORY_EXPANSION_FACTOR
+
+        # Account for validation overhead
+        memory_per_row *= complexity_factor
+
+        # Account for multiple validations (some state accumulation)
+        memory_per_row *= (1 + (num_validations * 0.1))
+        return memory_per_row
+
+    def estimate_memory_bytes(
+        self,
+        file_format: str,
+        chunk_size: int,
+        num_validations: int = 1,
+        validation_complexity: str = 'simple'
+    ) -> int:
+        """
+        Estimate peak memory needed to validate one file at a given chunk size.
+
+        Used by the engines to schedule several files concurrently within
+        the available memory budget.
+
+        Args:
+            file_format: File format (csv, parquet, json, excel)
+            chunk_size: Rows per chunk
+            num_validations: Number of validations to run
+            validation_complexity: Complexity level (simple, moderate, complex, heavy)
+
+        Returns:
+            Estimated peak memory in bytes
+        """
+        bytes_per_row = self.BYTES_PER_ROW.get(file_format.lower(), 100)
+        complexity_factor = self.VALIDATION_COMPLEXITY.get(validation_complexity.lower(), 1.0)
+        return int(chunk_size * self._memory_per_row(bytes_per_row, num_validations, complexity_factor))
+
     def _generate_warnings(
         self,
         estimated_memory_mb: float,
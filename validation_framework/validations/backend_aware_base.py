@@ -8,6 +8,7 @@ to work seamlessly with both pandas and Polars DataFrames without code duplicati
 from typing import Iterator, Dict, Any, List, Optional, Union
 from validation_framework.validations.base import DataValidationRule, ValidationResult
 from validation_framework.core.backend import HAS_POLARS
+from validation_framework.core.chunk_cache import null_mask
 
 if HAS_POLARS:
     import polars as pl
@@ -133,7 +134,7 @@ class BackendAwareValidationRule(DataValidationRule):
         if self.is_polars(df):
             return df[column].is_not_null()
         else:
-            return df[column].notna()
+            return ~null_mask(df, column)
 
     def filter_df(self, df, mask):
         """
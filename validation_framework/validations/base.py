@@ -1,11 +1,17 @@
 """Base classes for validation rules."""
 
 from abc import ABC, abstractmethod
-from typing import Iterator, Dict, Any, Optional
+from typing import Iterator, Dict, Any, List, Optional, Set, Tuple
 import pandas as pd
 from validation_framework.core.results import ValidationResult, Severity
+from validation_framework.core.backend import HAS_POLARS
+from validation_framework.core.chunk_cache import condition_mask
+from validation_framework.core.expression_compiler import evaluate_expression, expression_columns
 import logging
 
+if HAS_POLARS:
+    import polars as pl
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,12 +54,265 @@ class ValidationRule(ABC):
         """Get human-readable description of the validation rule."""
         pass
 
+    # ------------------------------------------------------------------
+    # Column projection
+    # ------------------------------------------------------------------
+    #
+    # Rules list the params naming the columns they read (single names or
+    # lists) in ``column_params`` and params holding expressions in
+    # ``expression_params``. The engines read only the union of the columns
+    # needed by a file's rules. Rules that declare neither read every column.
+
+    column_params: Tuple[str, ...] = ()
+    expression_params: Tuple[str, ...] = ()
+
+    def get_required_columns(self) -> Optional[Set[str]]:
+        """
+        Get the columns this rule needs to read.
+
+        Returns:
+            Set of column names, or None if the rule needs every column
+        """
+        if not self.column_params and not self.expression_params:
+            return None
+
+        columns: Set[str] = set()
+        for param in self.column_params:
+            value = self.params.get(param)
+            if isinstance(value, str):
+                columns.add(value)
+            elif isinstance(value, (list, tuple)):
+                columns.update(str(v) for v in value)
+
+        for param in self.expression_params:
+            columns |= expression_columns(self.params.get(param))
+
+        columns |= expression_columns(self.condition)
+        return columns
+
+    # Results of rules that depend only on the file being validated are
+    # reused by the result cache (core.result_cache) while the file and the
+    # rule's config are unchanged. Rules that also read other files,
+    # databases, history or the clock set ``cacheable = False``.
+
+    cacheable: bool = True
+
+    # ------------------------------------------------------------------
+    # Compiled rule queries
+    # ------------------------------------------------------------------
+    #
+    # Rules where each row passes or fails on its own values can be answered
+    # by a single lazy Polars query per file (core.rule_query) instead of a
+    # pass over pandas chunks. They return an expression marking failing
+    # rows and build their result from the query's counts and samples.
+
+    def get_failure_expression(self, schema: Dict[str, Any]) -> Optional["pl.Expr"]:
+        """
+        Get a Polars expression that is True for failing rows.
+
+        Args:
+            schema: Mapping of column name to Polars dtype for the file
+
+        Returns:
+            Boolean pl.Expr, or None if the rule cannot run as a compiled query
+        """
+        return None
+
+    def result_from_failures(self, failed_count: int, total_count: int, samples: list) -> ValidationResult:
+        """
+        Build the result of a compiled rule query.
+
+        Args:
+            failed_count: Exact number of failing rows
+            total_count: Number of rows checked
+            samples: Up to max_sample_failures dicts with "row" and "values"
+
+        Returns:
+            ValidationResult object
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support compiled rule queries")
+
+    # ------------------------------------------------------------------
+    # Parquet footer statistics
+    # ------------------------------------------------------------------
+    #
+    # Before a Parquet file is scanned (core.parquet_statistics) rules may
+    # answer from the row-group statistics in its footer, or name the row
+    # groups whose statistics cannot rule out a failure so that only those
+    # are read.
+
+    def result_from_statistics(self, statistics: Any) -> Optional[ValidationResult]:
+        """
+        Answer the rule from Parquet footer statistics alone.
+
+        Args:
+            statistics: ParquetStatistics of the file
+
+        Returns:
+            ValidationResult, or None if the statistics do not settle the rule
+        """
+        return None
+
+    def prune_row_groups(self, statistics: Any) -> Optional[List[int]]:
+        """
+        Get the row groups whose statistics cannot rule out a failure.
+
+        Args:
+            statistics: ParquetStatistics of the file
+
+        Returns:
+            Row group indexes to read, or None if the statistics cannot be used
+        """
+        return None
+
+    def result_from_pruned_scan(self, result: ValidationResult, statistics: Any, row_groups: List[int]) -> ValidationResult:
+        """
+        Turn the result of validating only ``row_groups`` into the whole-file result.
+
+        Sample "row" numbers are mapped to file positions and the rows of the
+        skipped row groups, which all passed, are added to total_count.
+
+        Args:
+            result: Result of validate() over the rows of ``row_groups``
+            statistics: ParquetStatistics of the file
+            row_groups: Row groups that were read, in ascending order
+
+        Returns:
+            The adjusted result
+        """
+        rows = [sample["row"] for sample in result.sample_failures if isinstance(sample.get("row"), int)]
+        if rows:
+            mapped = iter(statistics.file_rows(row_groups, rows))
+            for sample in result.sample_failures:
+                if isinstance(sample.get("row"), int):
+                    sample["row"] = next(mapped)
+
+        if result.total_count:
+            result.total_count += statistics.num_rows - statistics.rows_in(row_groups)
+        return result
+
+    # ------------------------------------------------------------------
+    # Incremental (single-pass) protocol
+    # ------------------------------------------------------------------
+    #
+    # Rules that keep state across chunks (duplicate trackers, running
+    # statistics, completeness counters) set ``supports_incremental = True``
+    # and implement the four methods below. The single-pass engine then keeps
+    # one state object per rule for the whole file instead of calling
+    # validate() with a one-chunk iterator for every chunk.
+    #
+    # Lifecycle:
+    #     state = rule.init_state(context)
+    #     rule.update_state(state, chunk, row_offset, context)   # per chunk
+    #     state = rule.merge_states(state, later_state)          # optional
+    #     result = rule.finalize_state(state, context)
+    #
+    # States built by parallel workers cover a single chunk and are created
+    # with ``context["partial_state"] = True``; they must be picklable and
+    # may skip structures only needed by the final merged state.
+
+    supports_incremental: bool = False
+
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create an empty per-file state for incremental validation.
+
+        Args:
+            context: Validation context
+
+        Returns:
+            Mutable state dictionary passed to update_state/finalize_state
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support incremental validation")
+
+    def update_state(self, state: Dict[str, Any], chunk: pd.DataFrame, row_offset: int, context: Dict[str, Any]) -> None:
+        """
+        Fold one chunk into the state.
+
+        Args:
+            state: State created by init_state
+            chunk: Data chunk
+            row_offset: Absolute row number of the first row in the chunk
+            context: Validation context
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support incremental validation")
+
+    def merge_states(self, state: Dict[str, Any], other: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Merge a partial state covering later rows into this one.
+
+        ``other`` must describe rows that come after every row in ``state``
+        so that order-sensitive checks (first occurrence, sample rows) stay
+        deterministic.
+
+        Args:
+            state: Partial state for earlier rows (updated in place)
+            other: Partial state for later rows
+
+        Returns:
+            The merged state
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support incremental validation")
+
+    def finalize_state(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """
+        Turn the accumulated state into a ValidationResult.
+
+        Args:
+            state: Fully accumulated state
+            context: Validation context
+
+        Returns:
+            ValidationResult object
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support incremental validation")
+
+    def release_state(self, state: Dict[str, Any]) -> None:
+        """
+        Release resources (temporary files, trackers) held by a state.
+
+        Args:
+            state: State created by init_state
+        """
+        pass
+
+    def _validate_incrementally(self, data_iterator: Iterator[pd.DataFrame], context: Dict[str, Any]) -> ValidationResult:
+        """
+        Drive the incremental protocol over a data iterator.
+
+        Lets incremental rules implement validate() in terms of the same
+        state methods the single-pass engine uses. A rule can stop reading
+        early by setting ``state["stopped"] = True``.
+
+        Args:
+            data_iterator: Iterator yielding data chunks
+            context: Validation context
+
+        Returns:
+            ValidationResult object
+        """
+        state = self.init_state(context)
+        try:
+            row_offset = 0
+            for chunk in data_iterator:
+                self.update_state(state, chunk, row_offset, context)
+                row_offset += len(chunk)
+                if state.get("stopped"):
+                    break
+            return self.finalize_state(state, context)
+        finally:
+            self.release_state(state)
+
     def _evaluate_condition(self, df: pd.DataFrame) -> pd.Series:
         """
         Evaluate the condition expression on a DataFrame.
 
+        The condition is compiled to a Polars expression (see
+        core.expression_compiler); expressions the compiler does not support
+        are evaluated with pandas.eval.
+
         Args:
-            df: DataFrame to evaluate condition against
+            df: DataFrame to evaluate condition against (pandas or Polars)
 
         Returns:
             Boolean Series indicating which rows match the condition
@@ -63,6 +322,19 @@ class ValidationRule(ABC):
             # No condition - validation applies to all rows
             return pd.Series([True] * len(df), index=df.index)
 
+        # Validations sharing a condition evaluate it once per chunk
+        return condition_mask(df, self.condition, lambda: self._compute_condition_mask(df))
+
+    def _compute_condition_mask(self, df: pd.DataFrame) -> pd.Series:
+        """Evaluate ``self.condition`` on a DataFrame (uncached)."""
+        try:
+            mask = evaluate_expression(df, self.condition)
+            if isinstance(df, pd.DataFrame):
+                return pd.Series(mask, index=df.index)
+            return pl.Series(mask)
+        except Exception as e:
+            logger.debug(f"Condition '{self.condition}' not compiled ({e}); evaluating with pandas")
+
         try:
             # Convert SQL-like syntax to pandas query syntax
             query = self._convert_condition_syntax(self.condition)
@@ -129,6 +401,10 @@ class ValidationRule(ABC):
 class FileValidationRule(ValidationRule):
     """Base class for file-level validations (not data content)."""
 
+    # File-level checks only need to run once per file. In single-pass mode
+    # the state just counts rows so row-count checks see the exact total.
+    supports_incremental = True
+
     def validate(self, data_iterator: Iterator[pd.DataFrame], context: Dict[str, Any]) -> ValidationResult:
         """
         File-level validations don't need data iterator.
@@ -141,6 +417,29 @@ class FileValidationRule(ValidationRule):
         """Validate file-level properties."""
         pass
 
+    def get_required_columns(self) -> Optional[Set[str]]:
+        """File-level checks use file metadata, not column values."""
+        return set()
+
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Create state counting rows seen."""
+        return {"rows": 0}
+
+    def update_state(self, state: Dict[str, Any], chunk: pd.DataFrame, row_offset: int, context: Dict[str, Any]) -> None:
+        """Count rows; file-level checks do not inspect chunk contents."""
+        state["rows"] += len(chunk)
+
+    def merge_states(self, state: Dict[str, Any], other: Dict[str, Any]) -> Dict[str, Any]:
+        """Sum row counts."""
+        state["rows"] += other["rows"]
+        return state
+
+    def finalize_state(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """Run the file-level check once, with the exact row count when known."""
+        if "total_rows" not in context:
+            context = {**context, "total_rows": state["rows"]}
+        return self.validate_file(context)
+
 
 class DataValidationRule(ValidationRule):
     """Base class for data content validations."""
@@ -10,7 +10,7 @@ efficiency and performance on large datasets.
 Author: daniel edge
 """
 
-from typing import Iterator, Dict, Any, List
+from typing import Iterator, Dict, Any, List, Optional
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -25,6 +25,7 @@ from validation_framework.core.exceptions import (
     DataLoadError
 )
 from validation_framework.core.constants import MAX_SAMPLE_FAILURES
+from validation_framework.core.chunk_cache import null_mask, string_lengths, to_numeric
 
 logger = logging.getLogger(__name__)
 
@@ -40,11 +41,13 @@ class StatisticalOutlierCheck(BackendAwareValidationRule):
     useful for finding data quality issues, sensor errors, or fraudulent transactions.
 
     PERFORMANCE OPTIMIZATIONS:
-    - Z-score: Uses Welford's streaming algorithm (O(1) memory, no sampling needed)
+    - Z-score: Uses mergeable streaming mean/variance (no sampling needed); values
+      are buffered up to buffer_size so small files need a single pass only
     - IQR: Supports smart sampling for huge datasets (10M+ rows)
       * Default: Samples 10M rows for statistical validity
       * User can disable: enable_sampling=false for 100% accuracy
-      * Stratified sampling preserves data distribution
+      * Sample is chosen by row hash, so it is deterministic and independent
+        of chunk size
 
     CRITICAL PERFORMANCE NOTE: This validation caused OOM (15GB memory) with pandas on
     large datasets (54M rows). Polars backend reduces memory usage to 3-5GB for the same
@@ -58,9 +61,11 @@ class StatisticalOutlierCheck(BackendAwareValidationRule):
         method (str): Detection method - 'zscore' or 'iqr' (default: 'zscore')
         threshold (float): For zscore: number of std devs (default: 3.0)
                           For IQR: multiplier for IQR (default: 1.5)
+        buffer_size (int): Values kept in memory for zscore to avoid a second
+                           pass over the file (default: 1,000,000)
         enable_sampling (bool): Enable smart sampling for IQR method (default: True)
         sample_size (int): Target sample size for IQR method (default: 10,000,000)
-        sampling_method (str): Sampling method - 'stratified' or 'random' (default: 'stratified')
+        sampling_method (str): Accepted for compatibility; samples are always chosen by row hash
         min_sample_size (int): Minimum sample size for statistical validity (default: 100,000)
         confidence_level (float): Statistical confidence level (default: 0.95)
 
@@ -103,6 +108,14 @@ class StatisticalOutlierCheck(BackendAwareValidationRule):
             enable_sampling: false  # Use all rows (slow for 100M+)
     """
 
+    column_params = ("field",)
+
+    # Incremental protocol: Z-score keeps mergeable moments (count/mean/M2)
+    # plus a bounded buffer of values; IQR keeps a bottom-k sample keyed on
+    # a hash of the absolute row number, so partial states merge to the same
+    # sample regardless of how the file was chunked.
+    supports_incremental = True
+
     def get_description(self) -> str:
         field = self.params.get("field", "unknown")
         method = self.params.get("method", "zscore")
@@ -112,15 +125,21 @@ class StatisticalOutlierCheck(BackendAwareValidationRule):
         """
         Detect outliers using statistical methods with streaming algorithms.
 
-        OPTIMIZED: Uses Welford's online algorithm for Z-score method to calculate
-        mean and standard deviation in a single pass through chunks without loading
-        all values into memory. Memory usage stays constant regardless of dataset size.
+        OPTIMIZED: Uses vectorized, mergeable running statistics for the Z-score
+        method so mean and standard deviation are calculated in a single pass
+        through chunks. Values are buffered up to ``buffer_size`` so that
+        outliers can be flagged without re-reading the file; larger files fall
+        back to a second pass.
 
-        For IQR method, falls back to loading all values (required for percentile calculation).
+        For IQR method, keeps a deterministic sample of values (all values if
+        sampling is disabled) for percentile calculation.
         """
+        return self._validate_incrementally(data_iterator, context)
+
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Create running statistics / sample state for one file."""
         field = self.params.get("field")
         method = self.params.get("method", "zscore").lower()
-        threshold = self.params.get("threshold", 3.0 if method == "zscore" else 1.5)
 
         if not field:
             raise ParameterValidationError(
@@ -130,81 +149,94 @@ class StatisticalOutlierCheck(BackendAwareValidationRule):
                 value=None
             )
 
-        # Use streaming algorithm for Z-score (memory efficient)
-        if method == "zscore":
-            return self._validate_zscore_streaming(data_iterator, field, threshold, context)
+        state = {
+            "field": field,
+            "method": method,
+            "threshold": self.params.get("threshold", 3.0 if method == "zscore" else 1.5),
+            "error": None,
+            "rows": 0,
+            "values_seen": 0,
+            # Z-score running moments
+            "count": 0,
+            "mean": 0.0,
+            "m2": 0.0,
+            # Buffered (row, value) pairs: Z-score buffer or IQR sample
+            "row_parts": [],
+            "value_parts": [],
+            "buffered": 0,
+            "overflow": False,
+        }
+
+        if method not in ("zscore", "iqr"):
+            state["error"] = f"Invalid method '{method}'. Use 'zscore' or 'iqr'"
+        elif method == "zscore":
+            state["capacity"] = self.params.get("buffer_size", 1_000_000)
+        elif self.params.get("enable_sampling", True):
+            state["capacity"] = self.params.get("sample_size", 10_000_000)  # 10M default
+        else:
+            state["capacity"] = None  # Keep every value
+
+        return state
+
+    def update_state(self, state: Dict[str, Any], chunk, row_offset: int, context: Dict[str, Any]) -> None:
+        """Fold one chunk of numeric values into the running state."""
+        if state["error"]:
+            return
+
+        field = state["field"]
+        # Backend-agnostic column check
+        if not self.has_column(chunk, field):
+            state["error"] = f"Field '{field}' not found"
+            state["stopped"] = True
+            return
+
+        positions, values = self._numeric_values(chunk, field)
+        rows = positions + row_offset
+        state["rows"] += self.get_row_count(chunk)
+        state["values_seen"] += len(values)
+
+        if state["method"] == "zscore" and len(values) > 0:
+            chunk_mean = float(values.mean())
+            chunk_m2 = float(((values - chunk_mean) ** 2).sum())
+            state["count"], state["mean"], state["m2"] = _combine_moments(
+                state["count"], state["mean"], state["m2"],
+                len(values), chunk_mean, chunk_m2
+            )
 
-        # IQR method requires loading values for percentile calculation
-        elif method == "iqr":
-            return self._validate_iqr_batch(data_iterator, field, threshold, context)
+        self._buffer_values(state, rows, values)
 
-        else:
+    def merge_states(self, state: Dict[str, Any], other: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge the state of a later range of rows."""
+        state["error"] = state["error"] or other["error"]
+        state["rows"] += other["rows"]
+        state["values_seen"] += other["values_seen"]
+        state["count"], state["mean"], state["m2"] = _combine_moments(
+            state["count"], state["mean"], state["m2"],
+            other["count"], other["mean"], other["m2"]
+        )
+        state["overflow"] = state["overflow"] or other["overflow"]
+        for rows, values in zip(other["row_parts"], other["value_parts"]):
+            self._buffer_values(state, rows, values)
+        return state
+
+    def finalize_state(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """Flag outliers and build the result."""
+        if state["error"]:
             return self._create_result(
                 passed=False,
-                message=f"Invalid method '{method}'. Use 'zscore' or 'iqr'",
+                message=state["error"],
                 failed_count=1
             )
 
-    def _validate_zscore_streaming(self, data_iterator: Iterator, field: str,
-                                   threshold: float, context: Dict[str, Any]) -> ValidationResult:
-        """
-        Streaming Z-score outlier detection using Welford's online algorithm.
-
-        Pass 1: Calculate mean and std deviation without loading all values
-        Pass 2: Identify outliers using calculated statistics
-
-        Memory: O(1) - only stores running statistics, not all values
-        """
-        # PASS 1: Calculate mean and standard deviation using Welford's algorithm
-        count = 0
-        mean = 0.0
-        M2 = 0.0  # Sum of squared differences from mean
-        total_rows = 0
-
-        # Need to track file metadata to reset iterator
-        file_metadata = []
+        if state["method"] == "zscore":
+            return self._finalize_zscore(state, context)
+        return self._finalize_iqr(state, context)
 
-        for chunk_idx, chunk in enumerate(data_iterator):
-            # Backend-agnostic column check
-            if not self.has_column(chunk, field):
-                return self._create_result(
-                    passed=False,
-                    message=f"Field '{field}' not found",
-                    failed_count=1
-                )
-
-            # Get non-null numeric values - backend-agnostic
-            not_null_mask = self.get_not_null_mask(chunk, field)
-            values_chunk = self.filter_df(chunk, not_null_mask)
-
-            # Extract numeric values efficiently based on backend
-            if self.is_polars(values_chunk):
-                try:
-                    # Cast to Float64, which handles most numeric types
-                    numeric_col = values_chunk[field].cast(pl.Float64, strict=False)
-                    # Filter out null values from failed casts
-                    numeric_col = numeric_col.drop_nulls()
-                    chunk_values = numeric_col.to_numpy()
-                except Exception:
-                    # Skip non-numeric values
-                    chunk_values = np.array([])
-            else:
-                # Pandas: convert to numeric
-                try:
-                    numeric_series = pd.to_numeric(values_chunk[field], errors='coerce')
-                    chunk_values = numeric_series.dropna().values
-                except Exception:
-                    chunk_values = np.array([])
-
-            # Update running statistics using Welford's algorithm
-            for value in chunk_values:
-                count += 1
-                delta = value - mean
-                mean += delta / count
-                delta2 = value - mean
-                M2 += delta * delta2
-
-            total_rows += self.get_row_count(chunk)
+    def _finalize_zscore(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """Flag values whose Z-score exceeds the threshold."""
+        field = state["field"]
+        threshold = state["threshold"]
+        count = state["count"]
 
         if count == 0:
             return self._create_result(
@@ -214,8 +246,9 @@ class StatisticalOutlierCheck(BackendAwareValidationRule):
             )
 
         # Calculate final standard deviation
-        variance = M2 / count if count > 1 else 0
+        variance = state["m2"] / count if count > 1 else 0
         std = np.sqrt(variance)
+        mean = state["mean"]
 
         if std == 0:
             # No variation in data, no outliers possible
@@ -225,80 +258,46 @@ class StatisticalOutlierCheck(BackendAwareValidationRule):
                 total_count=count
             )
 
-        # PASS 2: Identify outliers using calculated statistics
-        # Need to recreate iterator - create new data iterator from same source
-        from validation_framework.loaders.factory import LoaderFactory
-        from validation_framework.core.backend import BackendManager
-
-        # Get file path from context (passed from engine)
-        file_config = context.get('file_config')
-        if not file_config:
-            return self._create_result(
-                passed=False,
-                message="Cannot re-iterate data for second pass",
-                failed_count=1
-            )
-
-        # Create new data iterator for second pass
-        backend = BackendManager.get_default_backend()
-        loader = LoaderFactory.create_loader(file_config.get('path', ''), chunk_size=context.get('chunk_size', 50000))
-        data_iterator_pass2 = loader.load()
-
         failed_rows = []
         max_samples = context.get("max_sample_failures", MAX_SAMPLE_FAILURES)
-        outlier_count = 0
-        row_offset = 0
-
-        for chunk in data_iterator_pass2:
-            # Get non-null numeric values
-            not_null_mask = self.get_not_null_mask(chunk, field)
-            values_chunk = self.filter_df(chunk, not_null_mask)
 
-            if self.get_row_count(values_chunk) == 0:
-                row_offset += self.get_row_count(chunk)
-                continue
-
-            # Extract numeric values
-            if self.is_polars(values_chunk):
-                try:
-                    numeric_col = values_chunk[field].cast(pl.Float64, strict=False).drop_nulls()
-                    chunk_values = numeric_col.to_numpy()
-                except Exception:
-                    row_offset += self.get_row_count(chunk)
-                    continue
-            else:
-                try:
-                    numeric_series = pd.to_numeric(values_chunk[field], errors='coerce')
-                    chunk_values = numeric_series.dropna().values
-                except Exception:
-                    row_offset += self.get_row_count(chunk)
-                    continue
-
-            # Calculate Z-scores for this chunk (vectorized)
-            z_scores = np.abs((chunk_values - mean) / std)
-            outlier_mask = z_scores > threshold
-
-            # Count outliers
-            chunk_outlier_count = np.sum(outlier_mask)
-            outlier_count += chunk_outlier_count
-
-            # Collect sample failures
-            if chunk_outlier_count > 0 and len(failed_rows) < max_samples:
-                outlier_indices = np.where(outlier_mask)[0]
-                for idx in outlier_indices:
-                    if len(failed_rows) >= max_samples:
-                        break
-                    failed_rows.append({
-                        "row": int(row_offset + idx),
-                        "field": field,
-                        "value": f"{chunk_values[idx]:.4f}",
-                        "message": f"Statistical outlier detected (Z-score: {z_scores[idx]:.2f} > {threshold})"
-                    })
+        if not state["overflow"]:
+            # Every value is buffered - no need to re-read the file
+            rows, values = _concat_parts(state)
+            outlier_count = self._collect_zscore_outliers(
+                rows, values, mean, std, threshold, field, failed_rows, max_samples
+            )
+        else:
+            # PASS 2: Identify outliers using calculated statistics
+            # Need to recreate iterator - create new data iterator from same source
+            file_config = context.get('file_config')
+            if not file_config:
+                return self._create_result(
+                    passed=False,
+                    message="Cannot re-iterate data for second pass",
+                    failed_count=1
+                )
 
-            row_offset += self.get_row_count(chunk)
+            from validation_framework.loaders.factory import LoaderFactory
+            loader = LoaderFactory.create_loader(
+                file_config.get('path', ''),
+                file_format=file_config.get('format'),
+                chunk_size=context.get('chunk_size', 50000),
+                delimiter=file_config.get('delimiter'),
+                encoding=file_config.get('encoding'),
+                header=file_config.get('header', 0),
+                sheet_name=file_config.get('sheet_name', 0),
+                columns=[field],
+            )
 
-        # Create result
-        method_desc = f"Z-score > {threshold}"
+            outlier_count = 0
+            row_offset = 0
+            for chunk in loader.load():
+                positions, values = self._numeric_values(chunk, field)
+                outlier_count += self._collect_zscore_outliers(
+                    positions + row_offset, values, mean, std, threshold, field, failed_rows, max_samples
+                )
+                row_offset += self.get_row_count(chunk)
 
         if outlier_count > 0:
             return self._create_result(
@@ -318,84 +317,42 @@ class StatisticalOutlierCheck(BackendAwareValidationRule):
             total_count=count
         )
 
-    def _validate_iqr_batch(self, data_iterator: Iterator, field: str,
-                           threshold: float, context: Dict[str, Any]) -> ValidationResult:
-        """
-        IQR outlier detection with smart sampling optimization.
-
-        For large datasets (>10M rows), uses stratified sampling by default to reduce
-        memory usage and processing time while maintaining statistical validity.
-
-        User can disable sampling with enable_sampling=false for 100% accuracy.
-        """
-        # Get sampling parameters
-        enable_sampling = self.params.get("enable_sampling", True)
-        sample_size = self.params.get("sample_size", 10_000_000)  # 10M default
-        sampling_method = self.params.get("sampling_method", "stratified")
+    def _finalize_iqr(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """Flag values outside the IQR fences of the (sampled) values."""
+        field = state["field"]
+        threshold = state["threshold"]
         min_sample_size = self.params.get("min_sample_size", 100_000)
-        confidence_level = self.params.get("confidence_level", 0.95)
 
-        # First pass: Count total rows to decide if sampling is needed
-        total_rows = 0
-        for chunk in data_iterator:
-            total_rows += self.get_row_count(chunk)
-
-        # Log sampling decision
-        use_sampling = enable_sampling and total_rows > sample_size
-        if use_sampling:
-            logger.info(
-                f"IQR outlier check: Sampling {sample_size:,} of {total_rows:,} rows "
-                f"({sampling_method} method, {confidence_level*100}% confidence)"
-            )
-        else:
-            if total_rows > sample_size and not enable_sampling:
-                logger.info(
-                    f"IQR outlier check: Processing all {total_rows:,} rows "
-                    f"(sampling disabled by user)"
-                )
+        rows, values = _concat_parts(state)
+        if state["capacity"] is not None and len(values) > state["capacity"]:
+            rows, values = _bottom_k(rows, values, state["capacity"])
 
-        # Recreate iterator for data collection
-        from validation_framework.loaders.factory import LoaderFactory
-        from validation_framework.core.backend import BackendManager
-
-        file_config = context.get('file_config')
-        if not file_config:
+        if len(values) == 0:
             return self._create_result(
                 passed=False,
-                message="Cannot access file configuration",
+                message=f"No valid numeric values found in '{field}'",
                 failed_count=1
             )
 
-        backend = BackendManager.get_default_backend()
-        loader = LoaderFactory.create_loader(file_config.get('path', ''), chunk_size=context.get('chunk_size', 50000))
-        data_iterator = loader.load()
-
-        # Collect values (with or without sampling)
-        if use_sampling:
-            all_values = self._collect_stratified_sample(
-                data_iterator, field, sample_size, total_rows
+        if len(values) < state["values_seen"]:
+            logger.info(
+                f"IQR outlier check: Sampled {len(values):,} of {state['values_seen']:,} values "
+                f"({state['rows']:,} rows)"
             )
-            sampling_info = f" (sampled {len(all_values):,} of {total_rows:,} rows)"
+            sampling_info = f" (sampled {len(values):,} of {state['rows']:,} rows)"
         else:
-            all_values = self._collect_all_values(data_iterator, field)
             sampling_info = ""
 
-        if len(all_values) == 0:
-            return self._create_result(
-                passed=False,
-                message=f"No valid numeric values found in '{field}'",
-                failed_count=1
-            )
-
         # Check if sample size is sufficient
-        if len(all_values) < min_sample_size:
+        if len(values) < min_sample_size:
             logger.warning(
-                f"Sample size {len(all_values):,} is below minimum {min_sample_size:,}. "
+                f"Sample size {len(values):,} is below minimum {min_sample_size:,}. "
                 f"Results may not be statistically significant."
             )
 
-        # Convert to numpy array
-        values = np.array(all_values)
+        # Report samples in file order
+        order = np.argsort(rows, kind="stable")
+        rows, values = rows[order], values[order]
 
         # Detect outliers using IQR method
         outlier_mask = self._detect_iqr_outliers(values, threshold)
@@ -405,17 +362,16 @@ class StatisticalOutlierCheck(BackendAwareValidationRule):
         outlier_percentage = (outlier_count / len(values)) * 100
 
         # Collect sample failures
-        failed_rows = []
         max_samples = context.get("max_sample_failures", MAX_SAMPLE_FAILURES)
-
-        for i, is_outlier in enumerate(outlier_mask):
-            if is_outlier and len(failed_rows) < max_samples:
-                failed_rows.append({
-                    "row": int(i),
-                    "field": field,
-                    "value": f"{values[i]:.4f}",
-                    "message": f"Statistical outlier detected (IQR method{sampling_info})"
-                })
+        failed_rows = [
+            {
+                "row": int(rows[i]),
+                "field": field,
+                "value": f"{values[i]:.4f}",
+                "message": f"Statistical outlier detected (IQR method{sampling_info})"
+            }
+            for i in np.flatnonzero(outlier_mask)[:max_samples]
+        ]
 
         # Create result
         if outlier_count > 0:
@@ -442,102 +398,76 @@ class StatisticalOutlierCheck(BackendAwareValidationRule):
             total_count=len(values)
         )
 
-    def _collect_all_values(self, data_iterator: Iterator, field: str) -> List[float]:
-        """Collect all numeric values from the dataset."""
-        all_values = []
-
-        for chunk in data_iterator:
-            if not self.has_column(chunk, field):
-                continue
-
-            # Get non-null numeric values
-            not_null_mask = self.get_not_null_mask(chunk, field)
-            values_chunk = self.filter_df(chunk, not_null_mask)
-
-            # Extract numeric values
-            if self.is_polars(values_chunk):
-                try:
-                    numeric_col = values_chunk[field].cast(pl.Float64, strict=False)
-                    numeric_col = numeric_col.drop_nulls()
-                    all_values.extend(numeric_col.to_list())
-                except Exception:
-                    pass
-            else:
-                try:
-                    numeric_series = pd.to_numeric(values_chunk[field], errors='coerce')
-                    all_values.extend(numeric_series.dropna().tolist())
-                except Exception:
-                    pass
-
-        return all_values
-
-    def _collect_stratified_sample(self, data_iterator: Iterator, field: str,
-                                   sample_size: int, total_rows: int) -> List[float]:
+    def _numeric_values(self, chunk, field: str):
         """
-        Collect stratified sample from the dataset.
+        Extract the numeric values of a column with their chunk positions.
 
-        Stratified sampling ensures we sample proportionally from each chunk,
-        preserving the data distribution better than pure random sampling.
+        Returns:
+            Tuple of (positions, values) numpy arrays; non-numeric and null
+            values are skipped.
         """
-        all_values = []
-        rows_processed = 0
-
-        # Calculate sampling rate
-        sampling_rate = sample_size / total_rows
-
-        for chunk in data_iterator:
-            if not self.has_column(chunk, field):
-                rows_processed += self.get_row_count(chunk)
-                continue
-
-            # Get non-null numeric values
-            not_null_mask = self.get_not_null_mask(chunk, field)
-            values_chunk = self.filter_df(chunk, not_null_mask)
-
-            # Extract numeric values
-            if self.is_polars(values_chunk):
-                try:
-                    numeric_col = values_chunk[field].cast(pl.Float64, strict=False)
-                    numeric_col = numeric_col.drop_nulls()
-                    chunk_values = numeric_col.to_list()
-                except Exception:
-                    chunk_values = []
-            else:
-                try:
-                    numeric_series = pd.to_numeric(values_chunk[field], errors='coerce')
-                    chunk_values = numeric_series.dropna().tolist()
-                except Exception:
-                    chunk_values = []
-
-            # Sample from this chunk proportionally
-            if chunk_values:
-                chunk_sample_size = int(len(chunk_values) * sampling_rate)
-                # Ensure at least 1 value if chunk is not empty
-                chunk_sample_size = max(1, min(chunk_sample_size, len(chunk_values)))
-
-                # Random sample from this chunk
-                import random
-                sampled_values = random.sample(chunk_values, chunk_sample_size)
-                all_values.extend(sampled_values)
-
-            rows_processed += self.get_row_count(chunk)
-
-            # Stop if we've collected enough samples
-            if len(all_values) >= sample_size:
-                break
-
-        return all_values[:sample_size]  # Trim to exact sample size
+        if self.is_polars(chunk):
+            try:
+                # Cast to Float64, which handles most numeric types
+                numeric_col = chunk[field].cast(pl.Float64, strict=False)
+            except Exception:
+                return np.array([], dtype=np.int64), np.array([], dtype=np.float64)
+            all_values = numeric_col.to_numpy()
+        else:
+            # Pandas: convert to numeric (conversion shared with other validations)
+            try:
+                numeric_series = to_numeric(chunk, field)
+            except Exception:
+                return np.array([], dtype=np.int64), np.array([], dtype=np.float64)
+            all_values = numeric_series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+        all_values = np.asarray(all_values, dtype=np.float64)
+        positions = np.flatnonzero(~np.isnan(all_values))
+        return positions.astype(np.int64), all_values[positions]
+
+    def _buffer_values(self, state: Dict[str, Any], rows: np.ndarray, values: np.ndarray) -> None:
+        """Append values to the buffer, honouring the method's capacity."""
+        if len(values) == 0 or state["overflow"]:
+            return
+
+        capacity = state["capacity"]
+        state["row_parts"].append(rows)
+        state["value_parts"].append(values)
+        state["buffered"] += len(values)
+
+        if capacity is None or state["buffered"] <= capacity:
+            return
+
+        if state["method"] == "zscore":
+            # Too many values to hold - fall back to a second pass
+            state["overflow"] = True
+            state["row_parts"], state["value_parts"], state["buffered"] = [], [], 0
+        elif state["buffered"] > 2 * capacity:
+            # Compact IQR sample to its bottom-k rows
+            kept_rows, kept_values = _bottom_k(*_concat_parts(state), capacity)
+            state["row_parts"], state["value_parts"] = [kept_rows], [kept_values]
+            state["buffered"] = len(kept_values)
+
+    def _collect_zscore_outliers(self, rows: np.ndarray, values: np.ndarray, mean: float, std: float,
+                                 threshold: float, field: str, failed_rows: List[Dict[str, Any]],
+                                 max_samples: int) -> int:
+        """Count Z-score outliers and append sample failures (vectorized)."""
+        if len(values) == 0:
+            return 0
 
-    def _detect_zscore_outliers(self, values: np.ndarray, threshold: float) -> np.ndarray:
-        """Detect outliers using Z-score method."""
-        mean = np.mean(values)
-        std = np.std(values)
+        z_scores = np.abs((values - mean) / std)
+        outlier_indices = np.flatnonzero(z_scores > threshold)
 
-        if std == 0:
-            return np.zeros(len(values), dtype=bool)
+        room = max_samples - len(failed_rows)
+        for idx in outlier_indices[:max(room, 0)]:
+            failed_rows.append({
+                "row": int(rows[idx]),
+                "field": field,
+                "value": f"{values[idx]:.4f}",
+                "message": f"Statistical outlier detected (Z-score: {z_scores[idx]:.2f} > {threshold})"
+            })
 
-        z_scores = np.abs((values - mean) / std)
-        return z_scores > threshold
+        return len(outlier_indices)
 
     def _detect_iqr_outliers(self, values: np.ndarray, multiplier: float) -> np.ndarray:
         """Detect outliers using Interquartile Range (IQR) method."""
@@ -554,6 +484,45 @@ class StatisticalOutlierCheck(BackendAwareValidationRule):
         return (values < lower_bound) | (values > upper_bound)
 
 
+def _combine_moments(count_a: int, mean_a: float, m2_a: float,
+                     count_b: int, mean_b: float, m2_b: float):
+    """
+    Combine running mean/variance statistics (Chan et al. parallel algorithm).
+
+    Returns:
+        Tuple of (count, mean, M2) for the union of both sets of values
+    """
+    count = count_a + count_b
+    if count == 0:
+        return 0, 0.0, 0.0
+
+    delta = mean_b - mean_a
+    mean = mean_a + delta * count_b / count
+    m2 = m2_a + m2_b + delta * delta * count_a * count_b / count
+    return count, mean, m2
+
+
+def _concat_parts(state: Dict[str, Any]):
+    """Concatenate buffered (rows, values) parts into two arrays."""
+    if not state["value_parts"]:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.float64)
+    return np.concatenate(state["row_parts"]), np.concatenate(state["value_parts"])
+
+
+def _bottom_k(rows: np.ndarray, values: np.ndarray, k: int):
+    """
+    Keep the k entries with the smallest row-hash priority.
+
+    The priority only depends on the absolute row number, so the resulting
+    sample is a uniform random sample that is identical however the rows
+    were split into chunks or partial states.
+    """
+    priorities = rows.astype(np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+    priorities ^= priorities >> np.uint64(29)
+    keep = np.argpartition(priorities, k - 1)[:k]
+    return rows[keep], values[keep]
+
+
 class CrossFieldComparisonCheck(BackendAwareValidationRule):
     """
     Validates logical relationships between two fields.
@@ -585,6 +554,8 @@ class CrossFieldComparisonCheck(BackendAwareValidationRule):
             field_b: "product_price"
     """
 
+    column_params = ("field_a", "field_b")
+
     VALID_OPERATORS = ['>', '<', '>=', '<=', '==', '!=']
 
     def get_description(self) -> str:
@@ -735,6 +706,8 @@ class FreshnessCheck(FileValidationRule):
             date_field: "transaction_timestamp"
     """
 
+    cacheable = False  # Compares against the current time
+
     def get_description(self) -> str:
         check_type = self.params.get("check_type", "file")
         max_age = self.params.get("max_age_hours", "?")
@@ -846,6 +819,9 @@ class CompletenessCheck(BackendAwareValidationRule):
             min_completeness: 1.0  # All records must have customer_id
     """
 
+    column_params = ("field",)
+    supports_incremental = True
+
     def get_description(self) -> str:
         field = self.params.get("field", "unknown")
         min_comp = self.params.get("min_completeness", "?")
@@ -853,6 +829,30 @@ class CompletenessCheck(BackendAwareValidationRule):
 
     def validate(self, data_iterator: Iterator, context: Dict[str, Any]) -> ValidationResult:
         """Validate field completeness."""
+        return self._validate_incrementally(data_iterator, context)
+
+    def result_from_statistics(self, statistics) -> Optional[ValidationResult]:
+        """Count non-null values from the Parquet null counts of every row group."""
+        field = self.params.get("field")
+        if not field or self.params.get("min_completeness") is None:
+            return None
+
+        chunks = statistics.column(field)
+        # NaN is missing here but not counted in Parquet null counts
+        if chunks is None or statistics.is_floating(field) or any(chunk.null_count is None for chunk in chunks):
+            return None
+
+        null_count = sum(chunk.null_count for chunk in chunks)
+        state = {
+            "field": field,
+            "total_rows": statistics.num_rows,
+            "non_null_rows": statistics.num_rows - null_count,
+            "missing_field": False,
+        }
+        return self.finalize_state(state, {})
+
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate parameters and start counting rows and non-null values."""
         field = self.params.get("field")
         min_completeness = self.params.get("min_completeness")
 
@@ -872,31 +872,50 @@ class CompletenessCheck(BackendAwareValidationRule):
                 value=None
             )
 
-        # Convert percentage to decimal if needed
-        if min_completeness > 1.0:
-            min_completeness = min_completeness / 100.0
+        return {"field": field, "total_rows": 0, "non_null_rows": 0, "missing_field": False}
 
-        total_rows = 0
-        non_null_rows = 0
+    def update_state(self, state: Dict[str, Any], chunk, row_offset: int, context: Dict[str, Any]) -> None:
+        """Count rows and non-null values of one chunk."""
+        field = state["field"]
 
-        for chunk in data_iterator:
-            # Backend-agnostic column check
-            if not self.has_column(chunk, field):
-                return self._create_result(
-                    passed=False,
-                    message=f"Field '{field}' not found",
-                    failed_count=1
-                )
+        # Backend-agnostic column check
+        if not self.has_column(chunk, field):
+            state["missing_field"] = True
+            state["stopped"] = True
+            return
 
-            # Count rows and non-null values - backend-agnostic
-            chunk_rows = self.get_row_count(chunk)
-            total_rows += chunk_rows
+        # Count rows and non-null values - backend-agnostic
+        state["total_rows"] += self.get_row_count(chunk)
 
-            # Count non-null values
-            if self.is_polars(chunk):
-                non_null_rows += chunk[field].is_not_null().sum()
-            else:
-                non_null_rows += chunk[field].notna().sum()
+        if self.is_polars(chunk):
+            state["non_null_rows"] += int(chunk[field].is_not_null().sum())
+        else:
+            state["non_null_rows"] += len(chunk) - int(null_mask(chunk, field).sum())
+
+    def merge_states(self, state: Dict[str, Any], other: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the counts of a later range of rows."""
+        state["total_rows"] += other["total_rows"]
+        state["non_null_rows"] += other["non_null_rows"]
+        state["missing_field"] = state["missing_field"] or other["missing_field"]
+        return state
+
+    def finalize_state(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """Compare completeness against the configured minimum."""
+        field = state["field"]
+        if state["missing_field"]:
+            return self._create_result(
+                passed=False,
+                message=f"Field '{field}' not found",
+                failed_count=1
+            )
+
+        # Convert percentage to decimal if needed
+        min_completeness = self.params.get("min_completeness")
+        if min_completeness > 1.0:
+            min_completeness = min_completeness / 100.0
+
+        total_rows = state["total_rows"]
+        non_null_rows = state["non_null_rows"]
 
         # Calculate completeness
         if total_rows == 0:
@@ -955,6 +974,8 @@ class StringLengthCheck(BackendAwareValidationRule):
             min_length: 10  # At least 10 characters
     """
 
+    column_params = ("field",)
+
     def get_description(self) -> str:
         field = self.params.get("field", "unknown")
         min_len = self.params.get("min_length")
@@ -1035,8 +1056,8 @@ class StringLengthCheck(BackendAwareValidationRule):
                     )
 
             else:
-                # Pandas: Use vectorized string length
-                lengths = values_chunk[field].astype(str).str.len()
+                # Pandas: Use vectorized string length (shared with other validations)
+                lengths = string_lengths(chunk, field)[not_null_mask]
 
                 # Create failure mask
                 import pandas as pd
@@ -1129,6 +1150,8 @@ class NumericPrecisionCheck(BackendAwareValidationRule):
             max_decimal_places: 4  # Up to 4 decimal places allowed
     """
 
+    column_params = ("field",)
+
     def get_description(self) -> str:
         field = self.params.get("field", "unknown")
         exact = self.params.get("exact_decimal_places")
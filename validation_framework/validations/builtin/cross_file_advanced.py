@@ -13,37 +13,243 @@ New validation types:
 All validations support both pandas and Polars backends with constant memory usage.
 """
 
-from typing import Iterator, Dict, Any, List, Optional, Union
+from typing import Iterator, Dict, Any, List, Optional, Tuple, Union
 from pathlib import Path
 from validation_framework.validations.backend_aware_base import BackendAwareValidationRule
 from validation_framework.validations.base import ValidationResult
 from validation_framework.core.backend import HAS_POLARS
-from validation_framework.core.memory_bounded_tracker import MemoryBoundedTracker
+from validation_framework.core.partitioned_key_store import PartitionedKeyStore, hash_keys
+from validation_framework.core.reference_index import (
+    ReferenceKeyIndex,
+    get_reference_index,
+    iter_reference_keys,
+)
 from validation_framework.loaders.factory import LoaderFactory
 from validation_framework.core.exceptions import (
     ColumnNotFoundError,
     ParameterValidationError,
     DataLoadError
 )
-from validation_framework.core.constants import MAX_SAMPLE_FAILURES
+from validation_framework.core.constants import DEFAULT_CHUNK_SIZE, MAX_SAMPLE_FAILURES
 import logging
-import pickle
 
 if HAS_POLARS:
     import polars as pl
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
 
+class _SortOrderError(Exception):
+    """An input of a sort-merge key check is not in key order."""
+
+
+def _rows_at_most(keys: pd.DataFrame, bound: tuple) -> np.ndarray:
+    """Rows of ``keys`` that sort at or before ``bound`` (column by column)."""
+    result = np.ones(len(keys), dtype=bool)
+    for position in range(keys.shape[1] - 1, -1, -1):
+        values = keys.iloc[:, position].to_numpy()
+        result = (values < bound[position]) | ((values == bound[position]) & result)
+    return result
+
+
+def _rows_sorted(keys: pd.DataFrame) -> bool:
+    """Whether the rows of ``keys`` are in non-decreasing order (column by column)."""
+    if len(keys) < 2:
+        return True
+    result = np.ones(len(keys) - 1, dtype=bool)
+    for position in range(keys.shape[1] - 1, -1, -1):
+        values = keys.iloc[:, position].to_numpy()
+        before, after = values[:-1], values[1:]
+        result = (before < after) | ((before == after) & result)
+    return bool(result.all())
+
+
+class _SortedKeyMerge:
+    """
+    Streaming merge join of sorted current-file keys with sorted reference keys.
+
+    ``match`` takes the non-null keys of one current chunk, pulls reference
+    batches until it is past the chunk's last key, and resolves that window:
+    which current keys exist in the reference and (superset mode) which
+    reference keys no current key matched. Only the window is held in
+    memory. Raises _SortOrderError as soon as either input is out of order
+    or the keys of the two files cannot be compared.
+    """
+
+    def __init__(self, reference_frames: Iterator[pd.DataFrame], track_missing_reference: bool = False):
+        """
+        Initialize the merge.
+
+        Args:
+            reference_frames: Non-null reference key batches in file order
+            track_missing_reference: Whether to record the reference keys no
+                                     current key matched (superset mode)
+        """
+        self._frames = reference_frames
+        self._exhausted = False
+        self._buffer: Optional[pd.DataFrame] = None
+        self._buffer_hashes = np.empty(0, dtype=np.uint64)
+        self._last_reference: Optional[tuple] = None
+        self._last_current: Optional[tuple] = None
+        self._last_resolved: Optional[np.uint64] = None
+        self._carry = np.empty(0, dtype=np.uint64)
+        self._numeric: Optional[tuple] = None
+        self.track_missing_reference = track_missing_reference
+
+        self.max_samples = 100
+        self.consumed_rows = 0
+        self.reference_keys = 0
+        self.missing_count = 0
+        self.missing_reference: List[np.ndarray] = []
+        self.missing_samples: List[str] = []
+
+    def match(self, keys: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Look up one sorted chunk of current keys.
+
+        Args:
+            keys: Non-null current keys, continuing the order of earlier chunks
+
+        Returns:
+            Tuple of (found mask, key hashes)
+
+        Raises:
+            _SortOrderError: If the current or reference keys are out of order
+        """
+        key_hashes = hash_keys(keys)
+        if len(keys) == 0:
+            return np.zeros(0, dtype=bool), key_hashes
+
+        self._check_order(keys, self._last_current, "current file")
+        high = tuple(keys.iloc[-1])
+        self._last_current = high
+        self._fill(high)
+
+        split = 0
+        if self._buffer is not None and len(self._buffer):
+            split = int(self._compare(_rows_at_most, self._buffer, high).sum())
+        window = self._buffer.iloc[:split] if split else None
+        window_hashes = self._buffer_hashes[:split]
+        if split:
+            self._buffer = self._buffer.iloc[split:]
+            self._buffer_hashes = self._buffer_hashes[split:]
+
+        found = np.isin(key_hashes, np.concatenate([window_hashes, self._carry]))
+        matched = np.isin(window_hashes, key_hashes) if self.track_missing_reference else None
+        self._resolve(window, window_hashes, matched)
+
+        # Reference keys equal to the last key also match the next chunk's first keys
+        if split and tuple(window.iloc[-1]) == high:
+            self._carry = window_hashes[-1:]
+        else:
+            self._carry = np.empty(0, dtype=np.uint64)
+
+        return found, key_hashes
+
+    def finish(self) -> None:
+        """
+        Resolve the rest of the reference file (no current keys remain).
+
+        The remaining batches are still read so that an out-of-order
+        reference file is detected.
+
+        Raises:
+            _SortOrderError: If the reference keys are out of order
+        """
+        while True:
+            if self._buffer is not None and len(self._buffer):
+                self._resolve(self._buffer, self._buffer_hashes, np.zeros(len(self._buffer), dtype=bool))
+            self._buffer = None
+            self._buffer_hashes = np.empty(0, dtype=np.uint64)
+            if self._exhausted or not self._read_batch():
+                return
+
+    def _fill(self, high: tuple) -> None:
+        """Read reference batches until the buffer extends past ``high``."""
+        while not self._exhausted:
+            if self._buffer is not None and len(self._buffer):
+                if not self._compare(_rows_at_most, self._buffer.iloc[-1:], high)[0]:
+                    return
+            if not self._read_batch():
+                return
+
+    def _read_batch(self) -> bool:
+        """Append the next reference batch to the buffer (False at the end)."""
+        frame = next(self._frames, None)
+        if frame is None:
+            self._exhausted = True
+            return False
+
+        self._check_order(frame, self._last_reference, "reference file")
+        self._last_reference = tuple(frame.iloc[-1])
+        frame_hashes = hash_keys(frame)
+        if self._buffer is None or len(self._buffer) == 0:
+            self._buffer, self._buffer_hashes = frame, frame_hashes
+        else:
+            self._buffer = pd.concat([self._buffer, frame], ignore_index=True)
+            self._buffer_hashes = np.concatenate([self._buffer_hashes, frame_hashes])
+        return True
+
+    def _resolve(self, window: Optional[pd.DataFrame], window_hashes: np.ndarray, matched: Optional[np.ndarray]) -> None:
+        """Account for a window of reference keys that no later current key can match."""
+        if len(window_hashes) == 0:
+            return
+        self.consumed_rows += len(window_hashes)
+
+        # A key repeated across windows is the last key of the previous one
+        previous = self._last_resolved
+        self._last_resolved = window_hashes[-1]
+        distinct = np.unique(window_hashes)
+        self.reference_keys += int((distinct != previous).sum()) if previous is not None else len(distinct)
+
+        if not self.track_missing_reference or matched.all():
+            return
+        unique_missing, first_rows = np.unique(window_hashes[~matched], return_index=True)
+        if previous is not None:
+            keep = unique_missing != previous
+            unique_missing, first_rows = unique_missing[keep], first_rows[keep]
+        if len(unique_missing) == 0:
+            return
+        self.missing_reference.append(unique_missing)
+        self.missing_count += len(unique_missing)
+
+        if len(self.missing_samples) < self.max_samples:
+            rows = window[~matched].iloc[np.sort(first_rows)[:self.max_samples - len(self.missing_samples)]]
+            for row in rows.itertuples(index=False, name=None):
+                self.missing_samples.append(str(row[0] if len(row) == 1 else row))
+
+    def _check_order(self, keys: pd.DataFrame, previous: Optional[tuple], source: str) -> None:
+        """Raise _SortOrderError unless ``keys`` are sorted and start at or after ``previous``."""
+        numeric = tuple(pd.api.types.is_numeric_dtype(keys[column]) for column in keys.columns)
+        if self._numeric is None:
+            self._numeric = numeric
+        elif numeric != self._numeric:
+            raise _SortOrderError("key columns have different types in the two files")
+
+        if not self._compare(lambda frame: _rows_sorted(frame), keys):
+            raise _SortOrderError(f"{source} is not sorted on the key")
+        if previous is not None and self._compare(lambda first: first < previous, tuple(keys.iloc[0])):
+            raise _SortOrderError(f"{source} is not sorted on the key (across chunks)")
+
+    @staticmethod
+    def _compare(function, *args):
+        """Run a key comparison, turning incomparable values into _SortOrderError."""
+        try:
+            return function(*args)
+        except TypeError as e:
+            raise _SortOrderError(f"keys cannot be compared ({e})")
+
+
 class CrossFileKeyCheck(BackendAwareValidationRule):
     """
     Validates key relationships between two files with multiple check modes.
 
     This is an advanced version of ReferentialIntegrityCheck that supports multiple
-    check modes and uses MemoryBoundedTracker for memory-efficient key tracking.
-    Can process billions of keys by automatically spilling to disk when memory limit
-    is reached.
+    check modes. Reference keys are looked up in the shared reference index
+    (sorted 64-bit key hashes, persisted between runs), and distinct current keys
+    are tracked in a PartitionedKeyStore that spills to disk when it grows large.
 
     Check Modes:
         - exact_match: All foreign keys must exist in reference (strict foreign key)
@@ -60,11 +266,16 @@ class CrossFileKeyCheck(BackendAwareValidationRule):
             allow_null (bool, optional): Allow NULL keys (exact_match only). Default: false
             min_overlap_pct (float, optional): Minimum overlap % (overlap mode). Default: 100.0
             reference_file_format (str, optional): csv|parquet|excel|json. Default: csv
+            join_strategy (str, optional): hash|sort_merge. Default: hash. sort_merge
+                streams both files in key order (exact_match, subset and superset
+                only) and falls back to hash if either file turns out unsorted.
 
     Performance:
         - File sizes: 200GB+ supported
-        - Memory usage: O(1) constant via MemoryBoundedTracker disk spillover
-        - Time complexity: O(n + m) where n=current rows, m=reference rows
+        - Memory usage: 8 bytes per reference key (memory-mapped index); current
+          keys (overlap mode) spill to disk
+        - Time complexity: O(n log m) where n=current rows, m=reference keys;
+          the reference file is only read when its index is missing or stale
         - Vectorized operations: 10-100x faster than row iteration
 
     Example YAML:
@@ -95,8 +306,19 @@ class CrossFileKeyCheck(BackendAwareValidationRule):
             reference_file: "order_lines.parquet"
             reference_key: ["order_id", "line_number"]
             reference_file_format: "parquet"
+
+        # Both extracts arrive sorted on the key: merge join, no index
+        - type: "CrossFileKeyCheck"
+          severity: "ERROR"
+          params:
+            foreign_key: "account_id"
+            reference_file: "accounts_sorted.csv"
+            reference_key: "account_id"
+            join_strategy: "sort_merge"
     """
 
+    cacheable = False  # Result depends on the reference file
+
     def get_description(self) -> str:
         """Get human-readable description."""
         fk = self.params.get("foreign_key", "?")
@@ -134,6 +356,7 @@ class CrossFileKeyCheck(BackendAwareValidationRule):
             allow_null = self.params.get("allow_null", False)
             min_overlap_pct = self.params.get("min_overlap_pct", 1.0)  # 1% minimum overlap by default
             reference_format = self.params.get("reference_file_format", "csv")
+            join_strategy = self.params.get("join_strategy", "hash")
 
             # Validate required parameters
             if not foreign_key:
@@ -166,6 +389,21 @@ class CrossFileKeyCheck(BackendAwareValidationRule):
                     failed_count=1
                 )
 
+            # Validate join_strategy
+            if join_strategy not in ("hash", "sort_merge"):
+                return self._create_result(
+                    passed=False,
+                    message=f"Invalid join_strategy '{join_strategy}'. Must be one of: ['hash', 'sort_merge']",
+                    failed_count=1
+                )
+            if join_strategy == "sort_merge" and check_mode == "overlap":
+                return self._create_result(
+                    passed=False,
+                    message="Invalid join_strategy 'sort_merge' for overlap mode. "
+                            "Supported modes: ['exact_match', 'subset', 'superset']",
+                    failed_count=1
+                )
+
             # Resolve reference file path securely
             reference_path = self._resolve_reference_path(reference_file, context)
             if not Path(reference_path).exists():
@@ -175,71 +413,58 @@ class CrossFileKeyCheck(BackendAwareValidationRule):
                     failed_count=1
                 )
 
-            # Peek at first chunk to detect backend
-            first_chunk = None
-            backend = None
-            chunk_list = []
-            for chunk in data_iterator:
-                if first_chunk is None:
-                    first_chunk = chunk
-                    backend = self.get_backend_name(chunk)
-                    logger.debug(f"CrossFileKeyCheck using {backend} backend")
-                chunk_list.append(chunk)
-                break
-
-            # Load reference keys efficiently with MemoryBoundedTracker
-            logger.info(f"Loading reference keys from {reference_path}...")
-            reference_tracker = self._load_reference_keys_efficient(
-                reference_path,
-                reference_key,
-                reference_format,
-                backend if backend else 'pandas'
-            )
+            if isinstance(reference_key, str):
+                reference_key = [reference_key]
 
-            # Get reference statistics
-            ref_stats = reference_tracker.get_statistics()
-            logger.info(
-                f"Loaded {ref_stats['total_keys']:,} unique reference keys. "
-                f"Spilled to disk: {reference_tracker.is_spilled}"
-            )
-
-            # Reconstruct iterator with first chunk
-            def reconstructed_iterator():
-                for chunk in chunk_list:
-                    yield chunk
-                for chunk in data_iterator:
-                    yield chunk
-
-            # Execute appropriate check mode
-            if check_mode == "exact_match":
-                result = self._check_exact_match(
-                    reconstructed_iterator(),
-                    foreign_key,
-                    reference_tracker,
-                    allow_null
-                )
-            elif check_mode == "overlap":
-                result = self._check_overlap(
-                    reconstructed_iterator(),
+            if join_strategy == "sort_merge":
+                result = self._check_sort_merge(
+                    data_iterator,
                     foreign_key,
-                    reference_tracker,
-                    min_overlap_pct
+                    reference_path,
+                    reference_key,
+                    reference_format,
+                    check_mode,
+                    allow_null,
+                    context
                 )
-            elif check_mode == "subset":
-                result = self._check_subset(
-                    reconstructed_iterator(),
-                    foreign_key,
-                    reference_tracker
-                )
-            elif check_mode == "superset":
-                result = self._check_superset(
-                    reconstructed_iterator(),
-                    foreign_key,
-                    reference_tracker
+            else:
+                # Reference keys come from the shared index (built once per file version)
+                logger.info(f"Loading reference keys from {reference_path}...")
+                reference_index = get_reference_index(
+                    reference_path,
+                    reference_key,
+                    reference_format,
+                    cache_dir=context.get("reference_index_dir")
                 )
-
-            # Clean up tracker resources
-            reference_tracker.close()
+                logger.info(f"Reference index has {len(reference_index):,} unique keys")
+
+                # Execute appropriate check mode
+                if check_mode == "exact_match":
+                    result = self._check_exact_match(
+                        data_iterator,
+                        foreign_key,
+                        reference_index,
+                        allow_null
+                    )
+                elif check_mode == "overlap":
+                    result = self._check_overlap(
+                        data_iterator,
+                        foreign_key,
+                        reference_index,
+                        min_overlap_pct
+                    )
+                elif check_mode == "subset":
+                    result = self._check_subset(
+                        data_iterator,
+                        foreign_key,
+                        reference_index
+                    )
+                elif check_mode == "superset":
+                    result = self._check_superset(
+                        data_iterator,
+                        foreign_key,
+                        reference_index
+                    )
 
             # Build ValidationResult from check result
             return self._create_result(
@@ -258,6 +483,14 @@ class CrossFileKeyCheck(BackendAwareValidationRule):
                 message=f"Validation error: {str(e)}",
                 failed_count=1
             )
+        except DataLoadError as e:
+            # Reference file could not be read (or lacks the key columns)
+            logger.error(f"Reference load error in CrossFileKeyCheck: {str(e)}")
+            return self._create_result(
+                passed=False,
+                message=f"Failed to load reference keys: {str(e)}",
+                failed_count=1
+            )
         except (IOError, OSError) as e:
             # File access errors
             logger.error(f"File access error in CrossFileKeyCheck: {str(e)}")
@@ -278,176 +511,26 @@ class CrossFileKeyCheck(BackendAwareValidationRule):
                 failed_count=1
             )
 
-    def _load_reference_keys_efficient(
-        self,
-        reference_path: str,
-        reference_key: Union[str, List[str]],
-        reference_format: str,
-        backend: str
-    ) -> MemoryBoundedTracker:
-        """
-        Load reference keys with automatic disk spillover for memory efficiency.
-
-        Uses MemoryBoundedTracker to keep up to 1M keys in memory, then automatically
-        spills to SQLite database for unlimited key support.
-
-        Args:
-            reference_path: Path to reference file
-            reference_key: Column(s) to load as keys
-            reference_format: File format (csv, parquet, excel, json)
-            backend: 'pandas' or 'polars'
-
-        Returns:
-            MemoryBoundedTracker with loaded keys
-
-        Performance:
-            - Memory: O(min(unique_keys, 1M)) - constant after spillover
-            - Time: O(n) where n = total rows in reference file
-        """
-        # Initialize tracker with 1M key limit (~40-80MB in memory)
-        tracker = MemoryBoundedTracker(
-            max_memory_keys=1_000_000,
-            auto_cleanup=True
-        )
-
-        # Normalize reference_key to list
-        if isinstance(reference_key, str):
-            reference_key = [reference_key]
-
-        # Load reference file directly (matching pattern in cross_file_checks.py)
-        # Load only the needed columns for efficiency
-        try:
-            df = None
-
-            if backend == 'polars' and HAS_POLARS:
-                # Use Polars for better performance
-                if reference_format.lower() == "csv":
-                    df = pl.read_csv(reference_path, columns=reference_key)
-                elif reference_format.lower() in ["parquet", "pq"]:
-                    df = pl.read_parquet(reference_path, columns=reference_key)
-                elif reference_format.lower() in ["excel", "xlsx", "xls"]:
-                    # Polars doesn't support Excel natively - fall back to pandas
-                    temp_df = pd.read_excel(reference_path, usecols=reference_key)
-                    df = pl.from_pandas(temp_df)
-                elif reference_format.lower() == "json":
-                    # Use pandas for JSON, then convert
-                    with open(reference_path, 'r', encoding='utf-8') as f:
-                        temp_df = pd.read_json(f)
-                    # Validate columns
-                    for col in reference_key:
-                        if col not in temp_df.columns:
-                            raise ValueError(
-                                f"Reference key column '{col}' not found in {reference_path}"
-                            )
-                    df = pl.from_pandas(temp_df[reference_key])
-                else:
-                    raise ValueError(f"Unsupported reference file format: {reference_format}")
-
-                # Extract unique keys with Polars
-                if df is not None:
-                    if len(reference_key) == 1:
-                        # Single column - get unique non-null values
-                        keys = df[reference_key[0]].drop_nulls().unique().to_list()
-                    else:
-                        # Multiple columns - create composite keys
-                        keys = self._create_composite_keys(df, reference_key)
-
-                    # Add to tracker
-                    for key in keys:
-                        tracker.add(key)
-
-            else:
-                # Use pandas (default or fallback)
-                if reference_format.lower() == "csv":
-                    df = pd.read_csv(reference_path, usecols=reference_key, encoding='utf-8')
-                elif reference_format.lower() in ["parquet", "pq"]:
-                    df = pd.read_parquet(reference_path, columns=reference_key)
-                elif reference_format.lower() in ["excel", "xlsx", "xls"]:
-                    df = pd.read_excel(reference_path, usecols=reference_key)
-                elif reference_format.lower() == "json":
-                    with open(reference_path, 'r', encoding='utf-8') as f:
-                        df = pd.read_json(f)
-                    # Validate columns
-                    for col in reference_key:
-                        if col not in df.columns:
-                            raise ValueError(
-                                f"Reference key column '{col}' not found in {reference_path}"
-                            )
-                    df = df[reference_key]
-                else:
-                    raise ValueError(f"Unsupported reference file format: {reference_format}")
-
-                # Extract unique keys with pandas
-                if df is not None:
-                    if len(reference_key) == 1:
-                        # Single column - get unique non-null values
-                        keys = df[reference_key[0]].dropna().unique().tolist()
-                    else:
-                        # Multiple columns - create composite keys
-                        keys = self._create_composite_keys(df, reference_key)
-
-                    # Add to tracker
-                    for key in keys:
-                        tracker.add(key)
-
-            logger.debug(f"Loaded {tracker.total_keys_added:,} unique keys from reference file")
-            return tracker
-
-        except (IOError, OSError) as e:
-            logger.error(f"File access error loading reference keys from {reference_path}: {str(e)}")
-            raise
-        except (KeyError, ValueError) as e:
-            logger.error(f"Data parsing error loading reference keys from {reference_path}: {str(e)}")
-            raise
-        except Exception as e:
-            logger.error(
-                f"Unexpected error loading reference keys from {reference_path}: {str(e)}",
-                exc_info=True
-            )
-            raise
-
-    def _create_composite_keys(
-        self,
-        df,
-        columns: List[str]
-    ) -> List[str]:
+    def _key_frame(self, df, columns: List[str]) -> pd.DataFrame:
         """
-        Create composite key values from multiple columns (backend-agnostic).
-
-        Concatenates column values with '|' separator to create unique composite keys.
+        Get the key columns of a chunk as a pandas DataFrame (backend-agnostic).
 
         Args:
             df: DataFrame (pandas or Polars)
-            columns: List of column names
+            columns: Key column names
 
         Returns:
-            List of composite key strings
+            pandas DataFrame with the key columns, ready for hash_keys()
         """
         if self.is_polars(df):
-            # Polars vectorized approach
-            # Concatenate columns with separator, convert to string, get unique
-            composite = df.select(
-                pl.concat_str(
-                    [pl.col(c).cast(pl.Utf8) for c in columns],
-                    separator="|"
-                ).alias("_composite_key")
-            )
-            # Drop nulls and get unique values
-            keys = composite["_composite_key"].drop_nulls().unique().to_list()
-            return keys
-        else:
-            # pandas vectorized approach
-            # Convert all columns to string and concatenate
-            composite = df[columns].astype(str).agg('|'.join, axis=1)
-            # Drop nulls and get unique values
-            keys = composite.dropna().unique().tolist()
-            return keys
+            return df.select(columns).to_pandas()
+        return df[columns]
 
     def _check_exact_match(
         self,
         data_iterator: Iterator,
         foreign_key: Union[str, List[str]],
-        reference_tracker: MemoryBoundedTracker,
+        reference_index: ReferenceKeyIndex,
         allow_null: bool
     ) -> Dict[str, Any]:
         """
@@ -456,7 +539,7 @@ class CrossFileKeyCheck(BackendAwareValidationRule):
         Args:
             data_iterator: Iterator yielding data chunks
             foreign_key: Foreign key column(s) in current file
-            reference_tracker: Tracker with reference keys
+            reference_index: Index of the reference keys
             allow_null: Whether to allow NULL values in foreign key
 
         Returns:
@@ -470,164 +553,163 @@ class CrossFileKeyCheck(BackendAwareValidationRule):
         if isinstance(foreign_key, str):
             foreign_key = [foreign_key]
 
-        total_checked = 0
-        total_violations = 0
-        sample_violations = []
-        max_samples = 100
+        stats = {"total_checked": 0, "total_violations": 0, "sample_violations": []}
 
         for chunk in data_iterator:
-            # Validate columns exist
-            for col in foreign_key:
-                if not self.has_column(chunk, col):
-                    raise ValueError(
-                        f"Foreign key column '{col}' not found in data. "
-                        f"Available columns: {', '.join(self.get_columns(chunk))}"
-                    )
+            non_null_chunk = self._prepare_exact_match_chunk(chunk, foreign_key, allow_null, stats)
 
-            # Apply conditional filter if specified
-            if self.condition:
-                mask = self._evaluate_condition(chunk)
-                chunk = self.filter_df(chunk, mask)
+            # Check non-null keys against reference
+            if self.get_row_count(non_null_chunk) > 0:
+                # Look every row's key up in the reference index (one vectorized call)
+                found = reference_index.contains(self._key_frame(non_null_chunk, foreign_key))
+                self._record_missing_keys(non_null_chunk, foreign_key, found, stats)
 
-            total_checked += self.get_row_count(chunk)
+        return self._exact_match_result(stats)
 
-            # Handle NULL values based on allow_null parameter
-            if len(foreign_key) == 1:
-                # Single column - check for nulls
-                null_mask = self.get_null_mask(chunk, foreign_key[0])
+    def _prepare_exact_match_chunk(
+        self,
+        chunk,
+        foreign_key: List[str],
+        allow_null: bool,
+        stats: Dict[str, Any]
+    ):
+        """
+        Filter a chunk, count it and report NULL keys (exact_match/subset).
 
-                has_nulls = False
-                if self.is_polars(chunk):
-                    has_nulls = null_mask.sum() > 0
-                else:
-                    has_nulls = null_mask.any()
-
-                if not allow_null and has_nulls:
-                    # NULL not allowed - these are violations
-                    null_violations = self.filter_df(chunk, null_mask)
-                    null_count = self.get_row_count(null_violations)
-                    total_violations += null_count
-
-                    # Collect null violation samples
-                    if len(sample_violations) < max_samples:
-                        samples = self.df_to_dicts(
-                            null_violations,
-                            limit=max_samples - len(sample_violations)
-                        )
-                        for sample in samples:
-                            sample_violations.append({
-                                "foreign_key": foreign_key[0],
-                                "value": None,
-                                "reason": "NULL not allowed",
-                                "row_data": sample
-                            })
-
-                # Filter out nulls for reference checking
-                non_null_chunk = self.filter_df(chunk, ~null_mask)
+        Args:
+            chunk: Data chunk (pandas or Polars)
+            foreign_key: Foreign key column(s)
+            allow_null: Whether to allow NULL values in foreign key
+            stats: Running totals and samples, updated in place
+
+        Returns:
+            The rows of the chunk with a non-null key
+        """
+        max_samples = 100
+        sample_violations = stats["sample_violations"]
+
+        # Validate columns exist
+        for col in foreign_key:
+            if not self.has_column(chunk, col):
+                raise ValueError(
+                    f"Foreign key column '{col}' not found in data. "
+                    f"Available columns: {', '.join(self.get_columns(chunk))}"
+                )
+
+        # Apply conditional filter if specified
+        if self.condition:
+            mask = self._evaluate_condition(chunk)
+            chunk = self.filter_df(chunk, mask)
+
+        stats["total_checked"] += self.get_row_count(chunk)
+
+        # Handle NULL values based on allow_null parameter
+        if len(foreign_key) == 1:
+            # Single column - check for nulls
+            null_mask = self.get_null_mask(chunk, foreign_key[0])
+            reason = "NULL not allowed"
+            key_label = foreign_key[0]
+        else:
+            # Multi-column composite key - filter rows with any nulls
+            if self.is_polars(chunk):
+                null_mask = chunk.select(
+                    pl.any_horizontal([pl.col(col).is_null() for col in foreign_key])
+                ).to_series()
             else:
-                # Multi-column composite key - filter rows with any nulls
-                # Create combined null mask (any column is null)
-                if self.is_polars(chunk):
-                    null_mask = pl.any_horizontal([chunk[col].is_null() for col in foreign_key])
-                else:
-                    null_mask = chunk[foreign_key].isna().any(axis=1)
-
-                if not allow_null:
-                    has_nulls = False
-                    if self.is_polars(chunk):
-                        has_nulls = null_mask.sum() > 0
-                    else:
-                        has_nulls = null_mask.any()
-
-                    if has_nulls:
-                        null_violations = self.filter_df(chunk, null_mask)
-                        null_count = self.get_row_count(null_violations)
-                        total_violations += null_count
-
-                        # Collect samples
-                        if len(sample_violations) < max_samples:
-                            samples = self.df_to_dicts(
-                                null_violations,
-                                limit=max_samples - len(sample_violations)
-                            )
-                            for sample in samples:
-                                sample_violations.append({
-                                    "foreign_key": str(foreign_key),
-                                    "value": None,
-                                    "reason": "NULL in composite key (not allowed)",
-                                    "row_data": sample
-                                })
-
-                # Filter out nulls
-                non_null_chunk = self.filter_df(chunk, ~null_mask)
+                null_mask = chunk[foreign_key].isna().any(axis=1)
+            reason = "NULL in composite key (not allowed)"
+            key_label = str(foreign_key)
 
-            # Check non-null keys against reference
-            if self.get_row_count(non_null_chunk) > 0:
-                # Get unique keys to check
+        if self.is_polars(chunk):
+            has_nulls = null_mask.sum() > 0
+        else:
+            has_nulls = null_mask.any()
+
+        if not allow_null and has_nulls:
+            # NULL not allowed - these are violations
+            null_violations = self.filter_df(chunk, null_mask)
+            stats["total_violations"] += self.get_row_count(null_violations)
+
+            # Collect null violation samples
+            if len(sample_violations) < max_samples:
+                samples = self.df_to_dicts(
+                    null_violations,
+                    limit=max_samples - len(sample_violations)
+                )
+                for sample in samples:
+                    sample_violations.append({
+                        "foreign_key": key_label,
+                        "value": None,
+                        "reason": reason,
+                        "row_data": sample
+                    })
+
+        # Filter out nulls for reference checking
+        return self.filter_df(chunk, ~null_mask)
+
+    def _record_missing_keys(
+        self,
+        non_null_chunk,
+        foreign_key: List[str],
+        found: np.ndarray,
+        stats: Dict[str, Any],
+        key_hashes: Optional[np.ndarray] = None
+    ) -> None:
+        """
+        Count and sample the rows whose key was not found in the reference.
+
+        Args:
+            non_null_chunk: Rows with a non-null key (pandas or Polars)
+            foreign_key: Foreign key column(s)
+            found: Boolean array, True where the row's key is in the reference
+            stats: Running totals and samples, updated in place
+            key_hashes: Key hashes of the rows; when given (sort-merge mode)
+                        the hashes of missing keys are kept so the verdicts
+                        can be re-checked if the merge has to fall back
+        """
+        if found.all():
+            return
+
+        max_samples = 100
+        sample_violations = stats["sample_violations"]
+
+        invalid_mask = pl.Series(~found) if self.is_polars(non_null_chunk) else ~found
+        invalid_rows = self.filter_df(non_null_chunk, invalid_mask)
+        stats["total_violations"] += self.get_row_count(invalid_rows)
+        if key_hashes is not None:
+            missing_hashes = key_hashes[~found]
+            stats.setdefault("missing_hashes", []).append(missing_hashes)
+
+        # Collect invalid key samples
+        if len(sample_violations) < max_samples:
+            samples = self.df_to_dicts(
+                invalid_rows,
+                limit=max_samples - len(sample_violations)
+            )
+            for position, sample in enumerate(samples):
+                # Extract key value(s)
                 if len(foreign_key) == 1:
-                    # Single column
-                    unique_keys = self.get_unique_values(non_null_chunk, foreign_key[0])
+                    key_value = str(sample.get(foreign_key[0]))
                 else:
-                    # Composite key
-                    unique_keys = self._create_composite_keys(non_null_chunk, foreign_key)
-
-                # Find invalid keys (not in reference) using tracker
-                invalid_keys = [
-                    key for key in unique_keys
-                    if not reference_tracker.has_seen(key)
-                ]
-
-                if invalid_keys:
-                    # Filter rows with invalid keys (vectorized)
-                    invalid_set = set(invalid_keys)
-
-                    if len(foreign_key) == 1:
-                        # Single column - filter directly
-                        if self.is_polars(non_null_chunk):
-                            invalid_mask = non_null_chunk[foreign_key[0]].is_in(list(invalid_set))
-                        else:
-                            invalid_mask = non_null_chunk[foreign_key[0]].isin(invalid_set)
-                    else:
-                        # Composite key - recreate keys and filter
-                        if self.is_polars(non_null_chunk):
-                            # Recreate composite keys for masking
-                            chunk_composite = non_null_chunk.select(
-                                pl.concat_str(
-                                    [pl.col(c).cast(pl.Utf8) for c in foreign_key],
-                                    separator="|"
-                                ).alias("_composite")
-                            )["_composite"]
-                            invalid_mask = chunk_composite.is_in(list(invalid_set))
-                        else:
-                            # pandas
-                            chunk_composite = non_null_chunk[foreign_key].astype(str).agg('|'.join, axis=1)
-                            invalid_mask = chunk_composite.isin(invalid_set)
-
-                    invalid_rows = self.filter_df(non_null_chunk, invalid_mask)
-                    invalid_count = self.get_row_count(invalid_rows)
-                    total_violations += invalid_count
-
-                    # Collect invalid key samples
-                    if len(sample_violations) < max_samples:
-                        samples = self.df_to_dicts(
-                            invalid_rows,
-                            limit=max_samples - len(sample_violations)
-                        )
-                        for sample in samples:
-                            # Extract key value(s)
-                            if len(foreign_key) == 1:
-                                key_value = str(sample.get(foreign_key[0]))
-                            else:
-                                key_value = "|".join(str(sample.get(col, '')) for col in foreign_key)
-
-                            sample_violations.append({
-                                "foreign_key": str(foreign_key),
-                                "value": key_value,
-                                "reason": "Key not found in reference",
-                                "row_data": sample
-                            })
-
-        # Build result
+                    key_value = "|".join(str(sample.get(col, '')) for col in foreign_key)
+
+                violation = {
+                    "foreign_key": str(foreign_key),
+                    "value": key_value,
+                    "reason": "Key not found in reference",
+                    "row_data": sample
+                }
+                if key_hashes is not None:
+                    violation["_key_hash"] = missing_hashes[position]
+                sample_violations.append(violation)
+
+    def _exact_match_result(self, stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the exact_match/subset result from the running totals."""
+        total_checked = stats["total_checked"]
+        total_violations = stats["total_violations"]
+        for violation in stats["sample_violations"]:
+            violation.pop("_key_hash", None)
+
         passed = total_violations == 0
         violation_rate = (total_violations / total_checked) if total_checked > 0 else 0
 
@@ -641,7 +723,7 @@ class CrossFileKeyCheck(BackendAwareValidationRule):
             "passed": passed,
             "total_checked": total_checked,
             "total_violations": total_violations,
-            "sample_violations": sample_violations,
+            "sample_violations": stats["sample_violations"],
             "violation_rate": violation_rate,
             "message": message
         }
@@ -650,7 +732,7 @@ class CrossFileKeyCheck(BackendAwareValidationRule):
         self,
         data_iterator: Iterator,
         foreign_key: Union[str, List[str]],
-        reference_tracker: MemoryBoundedTracker,
+        reference_index: ReferenceKeyIndex,
         min_overlap_pct: float
     ) -> Dict[str, Any]:
         """
@@ -659,10 +741,14 @@ class CrossFileKeyCheck(BackendAwareValidationRule):
         Use case: Partial data matching, fuzzy referential integrity.
         Example: At least 95% of customer_ids should match.
 
+        Distinct current keys are tracked as fingerprints in a
+        PartitionedKeyStore; each key is checked against the reference index
+        the first time it is seen, so no second pass over the keys is needed.
+
         Args:
             data_iterator: Iterator yielding data chunks
             foreign_key: Foreign key column(s)
-            reference_tracker: Tracker with reference keys
+            reference_index: Index of the reference keys
             min_overlap_pct: Minimum overlap percentage required
 
         Returns:
@@ -672,57 +758,37 @@ class CrossFileKeyCheck(BackendAwareValidationRule):
         if isinstance(foreign_key, str):
             foreign_key = [foreign_key]
 
-        # Collect unique keys from current file using another tracker
-        current_keys_tracker = MemoryBoundedTracker(
-            max_memory_keys=1_000_000,
-            auto_cleanup=True
-        )
-
         total_rows = 0
+        total_unique_keys = 0
+        matching_keys = 0
 
-        for chunk in data_iterator:
-            # Validate columns exist
-            for col in foreign_key:
-                if not self.has_column(chunk, col):
-                    raise ValueError(
-                        f"Foreign key column '{col}' not found in data"
-                    )
-
-            # Apply conditional filter
-            if self.condition:
-                mask = self._evaluate_condition(chunk)
-                chunk = self.filter_df(chunk, mask)
+        with PartitionedKeyStore(max_memory_keys=1_000_000) as current_keys:
+            for chunk in data_iterator:
+                # Validate columns exist
+                for col in foreign_key:
+                    if not self.has_column(chunk, col):
+                        raise ValueError(
+                            f"Foreign key column '{col}' not found in data"
+                        )
 
-            total_rows += self.get_row_count(chunk)
+                # Apply conditional filter
+                if self.condition:
+                    mask = self._evaluate_condition(chunk)
+                    chunk = self.filter_df(chunk, mask)
 
-            # Get unique non-null keys from chunk
-            if len(foreign_key) == 1:
-                # Single column
-                null_mask = self.get_null_mask(chunk, foreign_key[0])
-                non_null = self.filter_df(chunk, ~null_mask)
-                if self.get_row_count(non_null) > 0:
-                    unique_keys = self.get_unique_values(non_null, foreign_key[0])
-            else:
-                # Composite key
-                if self.is_polars(chunk):
-                    null_mask = pl.any_horizontal([chunk[col].is_null() for col in foreign_key])
-                else:
-                    null_mask = chunk[foreign_key].isna().any(axis=1)
-
-                non_null = self.filter_df(chunk, ~null_mask)
-                if self.get_row_count(non_null) > 0:
-                    unique_keys = self._create_composite_keys(non_null, foreign_key)
+                total_rows += self.get_row_count(chunk)
 
-            # Add to current keys tracker
-            for key in unique_keys:
-                current_keys_tracker.add(key)
+                # Non-null keys of the chunk (fingerprints use the index's hash)
+                keys = self._key_frame(chunk, foreign_key).dropna()
+                if len(keys) == 0:
+                    continue
 
-        # Count how many current keys exist in reference
-        current_stats = current_keys_tracker.get_statistics()
-        total_unique_keys = current_stats['total_keys']
+                partitions, fingerprints = current_keys.fingerprint(keys)
+                is_new = current_keys.add_fingerprints(partitions, fingerprints)
+                total_unique_keys += int(is_new.sum())
+                matching_keys += int(reference_index.contains_hashes(fingerprints[is_new]).sum())
 
         if total_unique_keys == 0:
-            current_keys_tracker.close()
             return {
                 "passed": False,
                 "message": "No keys found in current file",
@@ -730,27 +796,6 @@ class CrossFileKeyCheck(BackendAwareValidationRule):
                 "overlap_pct": 0
             }
 
-        # Check overlap - iterate through current keys and check against reference
-        matching_keys = 0
-
-        # Stream through current keys (memory-efficient whether spilled or not)
-        if current_keys_tracker.is_spilled:
-            # Query from disk
-            cursor = current_keys_tracker.db_conn.execute(
-                "SELECT key_value FROM seen_keys"
-            )
-            for row in cursor:
-                key = pickle.loads(row[0])
-                if reference_tracker.has_seen(key):
-                    matching_keys += 1
-        else:
-            # Check in-memory set
-            for key in current_keys_tracker.memory_keys:
-                if reference_tracker.has_seen(key):
-                    matching_keys += 1
-
-        current_keys_tracker.close()
-
         # Calculate overlap percentage
         overlap_pct = (matching_keys / total_unique_keys) * 100
         passed = overlap_pct >= min_overlap_pct
@@ -774,7 +819,7 @@ class CrossFileKeyCheck(BackendAwareValidationRule):
         self,
         data_iterator: Iterator,
         foreign_key: Union[str, List[str]],
-        reference_tracker: MemoryBoundedTracker
+        reference_index: ReferenceKeyIndex
     ) -> Dict[str, Any]:
         """
         Subset check: All current keys must be in reference keys (current ⊆ reference).
@@ -784,7 +829,7 @@ class CrossFileKeyCheck(BackendAwareValidationRule):
         Args:
             data_iterator: Iterator yielding data chunks
             foreign_key: Foreign key column(s)
-            reference_tracker: Tracker with reference keys
+            reference_index: Index of the reference keys
 
         Returns:
             Dictionary with validation results
@@ -793,7 +838,7 @@ class CrossFileKeyCheck(BackendAwareValidationRule):
         return self._check_exact_match(
             data_iterator,
             foreign_key,
-            reference_tracker,
+            reference_index,
             allow_null=False
         )
 
@@ -801,7 +846,7 @@ class CrossFileKeyCheck(BackendAwareValidationRule):
         self,
         data_iterator: Iterator,
         foreign_key: Union[str, List[str]],
-        reference_tracker: MemoryBoundedTracker
+        reference_index: ReferenceKeyIndex
     ) -> Dict[str, Any]:
         """
         Superset check: All reference keys must exist in current (reference ⊆ current).
@@ -809,10 +854,14 @@ class CrossFileKeyCheck(BackendAwareValidationRule):
         Use case: Ensure completeness - all reference items are represented.
         Example: All products in catalog appear in sales data.
 
+        Keeps one "seen" flag per reference key (1 byte each), set from the
+        index positions of every chunk's keys. Values of missing keys are
+        fetched from the reference file for the samples.
+
         Args:
             data_iterator: Iterator yielding data chunks
             foreign_key: Foreign key column(s)
-            reference_tracker: Tracker with reference keys
+            reference_index: Index of the reference keys
 
         Returns:
             Dictionary with validation results
@@ -821,102 +870,245 @@ class CrossFileKeyCheck(BackendAwareValidationRule):
         if isinstance(foreign_key, str):
             foreign_key = [foreign_key]
 
-        # Build set of current file keys
-        current_keys_tracker = MemoryBoundedTracker(
-            max_memory_keys=1_000_000,
-            auto_cleanup=True
-        )
-
-        total_rows = 0
+        seen = np.zeros(len(reference_index), dtype=bool)
+        total_rows = self._mark_seen_keys(data_iterator, foreign_key, reference_index, seen)
+        return self._superset_index_result(reference_index, seen, total_rows)
 
-        for chunk in data_iterator:
-            # Validate columns exist
-            for col in foreign_key:
-                if not self.has_column(chunk, col):
-                    raise ValueError(
-                        f"Foreign key column '{col}' not found in data"
-                    )
+    def _superset_chunk_keys(self, chunk, foreign_key: List[str]):
+        """
+        Filter a chunk and extract its non-null keys (superset mode).
 
-            # Apply conditional filter
-            if self.condition:
-                mask = self._evaluate_condition(chunk)
-                chunk = self.filter_df(chunk, mask)
+        Args:
+            chunk: Data chunk (pandas or Polars)
+            foreign_key: Foreign key column(s)
 
-            total_rows += self.get_row_count(chunk)
+        Returns:
+            Tuple of (rows checked, pandas DataFrame of non-null keys)
+        """
+        # Validate columns exist
+        for col in foreign_key:
+            if not self.has_column(chunk, col):
+                raise ValueError(
+                    f"Foreign key column '{col}' not found in data"
+                )
 
-            # Get unique non-null keys
-            if len(foreign_key) == 1:
-                null_mask = self.get_null_mask(chunk, foreign_key[0])
-                non_null = self.filter_df(chunk, ~null_mask)
-                if self.get_row_count(non_null) > 0:
-                    unique_keys = self.get_unique_values(non_null, foreign_key[0])
-            else:
-                if self.is_polars(chunk):
-                    null_mask = pl.any_horizontal([chunk[col].is_null() for col in foreign_key])
-                else:
-                    null_mask = chunk[foreign_key].isna().any(axis=1)
+        # Apply conditional filter
+        if self.condition:
+            mask = self._evaluate_condition(chunk)
+            chunk = self.filter_df(chunk, mask)
 
-                non_null = self.filter_df(chunk, ~null_mask)
-                if self.get_row_count(non_null) > 0:
-                    unique_keys = self._create_composite_keys(non_null, foreign_key)
+        return self.get_row_count(chunk), self._key_frame(chunk, foreign_key).dropna()
 
-            # Add to current keys tracker
-            for key in unique_keys:
-                current_keys_tracker.add(key)
+    def _mark_seen_keys(
+        self,
+        data_iterator: Iterator,
+        foreign_key: List[str],
+        reference_index: ReferenceKeyIndex,
+        seen: np.ndarray
+    ) -> int:
+        """Flag the reference keys present in the chunks; returns the rows checked."""
+        total_rows = 0
+        for chunk in data_iterator:
+            rows, keys = self._superset_chunk_keys(chunk, foreign_key)
+            total_rows += rows
 
-        # Check if all reference keys exist in current
-        ref_stats = reference_tracker.get_statistics()
-        total_ref_keys = ref_stats['total_keys']
+            # Mark the reference keys present in this chunk
+            if len(keys):
+                _, positions = reference_index.positions(hash_keys(keys))
+                seen[positions] = True
+        return total_rows
 
+    def _superset_index_result(
+        self,
+        reference_index: ReferenceKeyIndex,
+        seen: np.ndarray,
+        total_rows: int
+    ) -> Dict[str, Any]:
+        """Build the superset result from the seen flags of the reference keys."""
+        # Count missing reference keys and fetch sample values from the file
+        max_samples = 100
+        missing_count = int((~seen).sum())
+        missing_keys = []
+        if missing_count:
+            missing_keys = [
+                str(key)
+                for key in reference_index.lookup_values(reference_index.hashes[~seen], limit=max_samples)
+            ]
+        return self._superset_result(total_rows, len(reference_index), missing_count, missing_keys)
+
+    def _superset_result(
+        self,
+        total_rows: int,
+        total_ref_keys: int,
+        missing_count: int,
+        missing_keys: List[str]
+    ) -> Dict[str, Any]:
+        """Build the superset result dictionary."""
         if total_ref_keys == 0:
-            current_keys_tracker.close()
             return {
                 "passed": False,
                 "message": "No keys in reference file",
                 "total_checked": total_rows
             }
 
-        # Count missing reference keys
-        missing_keys = []
-        max_samples = 100
-
-        # Iterate through reference keys and check if in current
-        if reference_tracker.is_spilled:
-            # Query from disk
-            cursor = reference_tracker.db_conn.execute(
-                "SELECT key_value FROM seen_keys"
-            )
-            for row in cursor:
-                key = pickle.loads(row[0])
-                if not current_keys_tracker.has_seen(key):
-                    if len(missing_keys) < max_samples:
-                        missing_keys.append(str(key))
-        else:
-            # Check in-memory set
-            for key in reference_tracker.memory_keys:
-                if not current_keys_tracker.has_seen(key):
-                    if len(missing_keys) < max_samples:
-                        missing_keys.append(str(key))
-
-        current_keys_tracker.close()
-
-        passed = len(missing_keys) == 0
+        passed = missing_count == 0
 
         message = (
             f"All {total_ref_keys:,} reference keys found in current file"
             if passed else
-            f"{len(missing_keys):,} reference keys not found in current file"
+            f"{missing_count:,} reference keys not found in current file"
         )
 
         return {
             "passed": passed,
             "total_checked": total_rows,
             "total_ref_keys": total_ref_keys,
-            "missing_ref_keys": len(missing_keys),
+            "total_violations": missing_count,
+            "missing_ref_keys": missing_count,
             "sample_missing_keys": missing_keys,
             "message": message
         }
 
+    def _check_sort_merge(
+        self,
+        data_iterator: Iterator,
+        foreign_key: Union[str, List[str]],
+        reference_path: str,
+        reference_key: List[str],
+        reference_format: str,
+        check_mode: str,
+        allow_null: bool,
+        context: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Run exact_match, subset or superset as a streaming merge join.
+
+        Both files must be sorted on the key. The reference file is streamed
+        in chunk-sized batches alongside the current file, so only the keys
+        of the current window are held in memory; no index is built. As soon
+        as either file turns out not to be in key order (or the key types
+        cannot be compared), the check continues on the hash path: verdicts
+        already reached are re-checked against the reference index and the
+        remaining chunks are looked up in it.
+
+        Args:
+            data_iterator: Iterator yielding data chunks, sorted on the key
+            foreign_key: Foreign key column(s)
+            reference_path: Resolved path of the reference file (sorted on the key)
+            reference_key: Key column(s) in the reference file
+            reference_format: Reference file format
+            check_mode: exact_match, subset or superset
+            allow_null: Whether to allow NULL values in foreign key
+            context: Validation context (chunk_size, reference_index_dir)
+
+        Returns:
+            Dictionary with validation results
+        """
+        if isinstance(foreign_key, str):
+            foreign_key = [foreign_key]
+        superset = check_mode == "superset"
+        if check_mode == "subset":
+            allow_null = False
+
+        batch_rows = context.get("chunk_size") or DEFAULT_CHUNK_SIZE
+        merge = _SortedKeyMerge(
+            iter_reference_keys(reference_path, reference_key, reference_format, batch_rows),
+            track_missing_reference=superset
+        )
+
+        stats = {"total_checked": 0, "total_violations": 0, "sample_violations": []}
+        total_rows = 0
+        pending_keys = None
+        pending_chunk = None
+        fallback_reason = None
+
+        chunks = iter(data_iterator)
+        for chunk in chunks:
+            if superset:
+                rows, keys = self._superset_chunk_keys(chunk, foreign_key)
+                total_rows += rows
+            else:
+                chunk = self._prepare_exact_match_chunk(chunk, foreign_key, allow_null, stats)
+                keys = self._key_frame(chunk, foreign_key)
+
+            try:
+                found, key_hashes = merge.match(keys)
+            except _SortOrderError as e:
+                fallback_reason = str(e)
+                pending_keys, pending_chunk = keys, chunk
+                break
+
+            if not superset:
+                self._record_missing_keys(chunk, foreign_key, found, stats, key_hashes)
+        else:
+            try:
+                merge.finish()
+            except _SortOrderError as e:
+                fallback_reason = str(e)
+
+        if fallback_reason is None:
+            if superset:
+                return self._superset_result(
+                    total_rows, merge.reference_keys, merge.missing_count, merge.missing_samples
+                )
+            stats.pop("missing_hashes", None)
+            return self._exact_match_result(stats)
+
+        # Sort order broken: finish on the hash path
+        logger.warning(
+            f"CrossFileKeyCheck sort_merge: {fallback_reason}; falling back to hash lookup"
+        )
+        reference_index = get_reference_index(
+            reference_path,
+            reference_key,
+            reference_format,
+            cache_dir=context.get("reference_index_dir")
+        )
+
+        if superset:
+            seen = np.zeros(len(reference_index), dtype=bool)
+            # Reference keys the merge already resolved: matched unless declared missing
+            remaining = merge.consumed_rows
+            for frame in iter_reference_keys(reference_path, reference_key, reference_format, batch_rows):
+                if remaining <= 0:
+                    break
+                frame = frame.iloc[:remaining]
+                remaining -= len(frame)
+                _, positions = reference_index.positions(hash_keys(frame))
+                seen[positions] = True
+            if merge.missing_reference:
+                _, positions = reference_index.positions(np.concatenate(merge.missing_reference))
+                seen[positions] = False
+
+            if pending_keys is not None and len(pending_keys):
+                _, positions = reference_index.positions(hash_keys(pending_keys))
+                seen[positions] = True
+            total_rows += self._mark_seen_keys(chunks, foreign_key, reference_index, seen)
+            return self._superset_index_result(reference_index, seen, total_rows)
+
+        # Re-check the keys the merge reported as missing
+        missing_hashes = stats.pop("missing_hashes", [])
+        if missing_hashes:
+            missing_hashes = np.concatenate(missing_hashes)
+            stats["total_violations"] -= int(reference_index.contains_hashes(missing_hashes).sum())
+            stats["sample_violations"] = [
+                violation for violation in stats["sample_violations"]
+                if "_key_hash" not in violation
+                or not reference_index.contains_hashes(np.array([violation["_key_hash"]]))[0]
+            ]
+
+        if pending_chunk is not None and self.get_row_count(pending_chunk) > 0:
+            found = reference_index.contains(pending_keys)
+            self._record_missing_keys(pending_chunk, foreign_key, found, stats)
+
+        for chunk in chunks:
+            non_null_chunk = self._prepare_exact_match_chunk(chunk, foreign_key, allow_null, stats)
+            if self.get_row_count(non_null_chunk) > 0:
+                found = reference_index.contains(self._key_frame(non_null_chunk, foreign_key))
+                self._record_missing_keys(non_null_chunk, foreign_key, found, stats)
+
+        return self._exact_match_result(stats)
+
     def _resolve_reference_path(
         self,
         reference_file: str,
@@ -5,9 +5,14 @@ These validations check relationships and consistency across multiple data files
 - Referential integrity (foreign key relationships)
 - Cross-file comparisons and aggregations
 - Duplicate detection across files
+
+Reference keys are read through the shared reference index
+(core/reference_index.py), so a reference file used by several rules, files
+or runs is only read and hashed once per version.
 """
 
-from typing import Iterator, Dict, Any, List
+from typing import Iterator, Dict, Any
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from validation_framework.validations.base import DataValidationRule, ValidationResult
@@ -17,6 +22,8 @@ from validation_framework.core.exceptions import (
     DataLoadError
 )
 from validation_framework.core.constants import MAX_SAMPLE_FAILURES
+from validation_framework.core.partitioned_key_store import hash_keys
+from validation_framework.core.reference_index import get_reference_index
 import logging
 
 logger = logging.getLogger(__name__)
@@ -58,6 +65,8 @@ class ReferentialIntegrityCheck(DataValidationRule):
             allow_null: true
     """
 
+    cacheable = False  # Result depends on the reference file
+
     def get_description(self) -> str:
         """Get human-readable description."""
         foreign_key = self.params.get("foreign_key", "?")
@@ -119,23 +128,22 @@ class ReferentialIntegrityCheck(DataValidationRule):
                     failed_count=1,
                 )
 
-            # Load reference values
-            reference_values = self._load_reference_values(
-                reference_path,
-                reference_key,
-                reference_format
-            )
-
-            if reference_values is None:
+            # Reference keys come from the shared index (built once per file version)
+            try:
+                reference_index = get_reference_index(
+                    reference_path,
+                    [reference_key],
+                    reference_format,
+                    cache_dir=context.get("reference_index_dir")
+                )
+            except DataLoadError as e:
+                logger.error(str(e))
                 return self._create_result(
                     passed=False,
                     message=f"Failed to load reference values from {reference_path}",
                     failed_count=1,
                 )
 
-            # Convert to set for efficient lookups
-            valid_values = set(reference_values)
-
             # Validate foreign keys across all chunks
             total_checked = 0
             total_violations = 0
@@ -181,8 +189,8 @@ class ReferentialIntegrityCheck(DataValidationRule):
                 # (nulls are either already reported as violations, or are allowed and should be skipped)
                 fk_values = fk_values.dropna()
 
-                # Check which values are not in reference
-                invalid_mask = ~fk_values.isin(valid_values)
+                # Check which values are not in reference (one vectorized lookup)
+                invalid_mask = ~reference_index.contains(fk_values)
                 if invalid_mask.any():
                     # Get rows with invalid foreign keys using .loc with the index
                     invalid_indices = fk_values.index[invalid_mask]
@@ -260,44 +268,6 @@ class ReferentialIntegrityCheck(DataValidationRule):
         # Return as-is and let it fail later if not found
         return str(ref_path)
 
-    def _load_reference_values(self, file_path: str, column: str, file_format: str) -> pd.Series:
-        """
-        Load reference values from file efficiently (only the required column).
-
-        Args:
-            file_path: Path to reference file
-            column: Column name to load
-            file_format: Format of the file
-
-        Returns:
-            Series of reference values, or None if error
-        """
-        try:
-            # Load only the required column for memory efficiency
-            if file_format.lower() == "csv":
-                df = pd.read_csv(file_path, usecols=[column])
-            elif file_format.lower() in ["parquet", "pq"]:
-                df = pd.read_parquet(file_path, columns=[column])
-            elif file_format.lower() in ["excel", "xlsx", "xls"]:
-                df = pd.read_excel(file_path, usecols=[column])
-            elif file_format.lower() == "json":
-                df = pd.read_json(file_path)
-                if column not in df.columns:
-                    logger.error(f"Column '{column}' not found in reference file")
-                    return None
-                df = df[[column]]
-            else:
-                logger.error(f"Unsupported reference file format: {file_format}")
-                return None
-
-            # Get unique values (drop nulls for reference)
-            values = df[column].dropna().unique()
-            return pd.Series(values)
-
-        except Exception as e:
-            logger.error(f"Error loading reference values from {file_path}: {str(e)}")
-            return None
-
 
 class CrossFileComparisonCheck(DataValidationRule):
     """
@@ -341,6 +311,8 @@ class CrossFileComparisonCheck(DataValidationRule):
             reference_aggregation: "count"
     """
 
+    cacheable = False  # Result depends on the reference file
+
     def get_description(self) -> str:
         """Get human-readable description."""
         agg = self.params.get("aggregation", "?")
@@ -719,6 +691,8 @@ class CrossFileDuplicateCheck(DataValidationRule):
             reference_file_format: "parquet"
     """
 
+    cacheable = False  # Result depends on the other files
+
     def get_description(self) -> str:
         """Get human-readable description."""
         columns = self.params.get("columns", [])
@@ -766,19 +740,25 @@ class CrossFileDuplicateCheck(DataValidationRule):
             if not isinstance(reference_files, list):
                 reference_files = [reference_files]
 
-            # Load all reference values
-            reference_values = set()
+            # Key indexes of all reference files (shared across validations and runs)
+            reference_indexes = []
             for ref_file in reference_files:
                 ref_path = self._resolve_reference_path(ref_file, context)
                 if not Path(ref_path).exists():
                     logger.warning(f"Reference file not found: {ref_path}")
                     continue
 
-                ref_vals = self._load_reference_key_values(ref_path, columns, reference_format)
-                if ref_vals is not None:
-                    reference_values.update(ref_vals)
-
-            if not reference_values:
+                try:
+                    reference_indexes.append(get_reference_index(
+                        ref_path,
+                        columns,
+                        reference_format,
+                        cache_dir=context.get("reference_index_dir")
+                    ))
+                except DataLoadError as e:
+                    logger.error(str(e))
+
+            if not any(len(index) for index in reference_indexes):
                 return self._create_result(
                     passed=False,
                     message="No reference values loaded from reference files",
@@ -808,14 +788,14 @@ class CrossFileDuplicateCheck(DataValidationRule):
                 else:
                     chunk_to_check = chunk
 
-                # Create composite keys
-                if len(columns) == 1:
-                    keys = chunk_to_check[columns[0]].astype(str)
-                else:
-                    keys = chunk_to_check[columns].astype(str).agg('|'.join, axis=1)
+                # Hash the keys once and look them up in every reference index
+                keys = chunk_to_check[columns]
+                key_hashes = hash_keys(keys)
+                duplicate_mask = np.zeros(len(keys), dtype=bool)
+                for index in reference_indexes:
+                    duplicate_mask |= index.contains_hashes(key_hashes)
+                duplicate_mask &= keys.notna().all(axis=1).to_numpy()
 
-                # Check for duplicates
-                duplicate_mask = keys.isin(reference_values)
                 if duplicate_mask.any():
                     duplicates = chunk_to_check[duplicate_mask]
                     total_duplicates += len(duplicates)
@@ -878,41 +858,3 @@ class CrossFileDuplicateCheck(DataValidationRule):
                 return str(resolved)
 
         return str(ref_path)
-
-    def _load_reference_key_values(
-        self,
-        file_path: str,
-        columns: List[str],
-        file_format: str
-    ) -> set:
-        """Load composite key values from reference file."""
-        try:
-            # Load only required columns
-            if file_format.lower() == "csv":
-                df = pd.read_csv(file_path, usecols=columns)
-            elif file_format.lower() in ["parquet", "pq"]:
-                df = pd.read_parquet(file_path, columns=columns)
-            elif file_format.lower() in ["excel", "xlsx", "xls"]:
-                df = pd.read_excel(file_path, usecols=columns)
-            elif file_format.lower() == "json":
-                df = pd.read_json(file_path)
-                missing_cols = [col for col in columns if col not in df.columns]
-                if missing_cols:
-                    logger.error(f"Columns not found in reference file: {missing_cols}")
-                    return None
-                df = df[columns]
-            else:
-                logger.error(f"Unsupported reference file format: {file_format}")
-                return None
-
-            # Create composite keys
-            if len(columns) == 1:
-                keys = df[columns[0]].astype(str)
-            else:
-                keys = df[columns].astype(str).agg('|'.join, axis=1)
-
-            return set(keys.unique())
-
-        except Exception as e:
-            logger.error(f"Error loading reference keys from {file_path}: {str(e)}")
-            return None
@@ -70,6 +70,8 @@ class SQLCustomCheck(DataValidationRule):
               WHERE total_amount < 0
     """
 
+    cacheable = False  # Result depends on the database
+
     def get_description(self) -> str:
         """Get human-readable description."""
         sql_query = self.params.get("sql_query", "")
@@ -197,6 +199,8 @@ class DatabaseReferentialIntegrityCheck(DataValidationRule):
             allow_null: false
     """
 
+    cacheable = False  # Result depends on the database
+
     def get_description(self) -> str:
         """Get human-readable description."""
         fk_table = self.params.get("foreign_key_table", "?")
@@ -388,6 +392,8 @@ class DatabaseConstraintCheck(DataValidationRule):
               HAVING COUNT(*) > 1
     """
 
+    cacheable = False  # Result depends on the database
+
     def get_description(self) -> str:
         """Get human-readable description."""
         table = self.params.get("table", "?")
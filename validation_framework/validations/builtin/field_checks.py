@@ -13,7 +13,8 @@ These validations check individual field (column) values:
 Author: Daniel Edge
 """
 
-from typing import Iterator, Dict, Any, List, Set
+from typing import Iterator, Dict, Any, List, Optional, Set
+import numpy as np
 import pandas as pd
 import re
 from datetime import datetime
@@ -25,6 +26,15 @@ from validation_framework.core.exceptions import (
     ParameterValidationError
 )
 from validation_framework.core.constants import MAX_SAMPLE_FAILURES
+from validation_framework.core.chunk_cache import as_strings, blank_mask, null_mask, regex_mask, to_numeric
+
+
+def _describe_values(values: List[Any], limit: int = 20) -> str:
+    """Comma-separated values for messages, shortened for long lookup lists."""
+    shown = ", ".join(map(str, values[:limit]))
+    if len(values) > limit:
+        shown += f", ... ({len(values):,} values)"
+    return shown
 
 
 class MandatoryFieldCheck(DataValidationRule):
@@ -49,11 +59,52 @@ class MandatoryFieldCheck(DataValidationRule):
             allow_whitespace: false
     """
 
+    column_params = ("fields",)
+
     def get_description(self) -> str:
         """Get human-readable description."""
         fields = self.params.get("fields", [])
         return f"Checks that required fields are not empty: {', '.join(fields)}"
 
+    def prune_row_groups(self, statistics) -> Optional[List[int]]:
+        """Row groups with nulls, or (string fields) possibly blank values."""
+        fields = self.params.get("fields", [])
+        if not fields:
+            return None
+        allow_whitespace = self.params.get("allow_whitespace", False)
+
+        row_groups: Set[int] = set()
+        for field in fields:
+            chunks = statistics.column(field)
+            # NaN is missing here but not counted in Parquet null counts
+            if chunks is None or statistics.is_floating(field):
+                return None
+            check_blanks = not allow_whitespace and statistics.is_string(field)
+            for index, chunk in enumerate(chunks):
+                if chunk.num_rows and (chunk.null_count != 0 or (check_blanks and chunk.may_be_blank())):
+                    row_groups.add(index)
+        return sorted(row_groups)
+
+    def result_from_statistics(self, statistics) -> Optional[ValidationResult]:
+        """Pass when no row group can hold a missing value."""
+        if self.prune_row_groups(statistics) != []:
+            return None
+        fields = self.params.get("fields", [])
+        return self._create_result(
+            passed=True,
+            message=f"All mandatory fields contain values across {statistics.num_rows} rows (Parquet statistics)",
+            total_count=statistics.num_rows * len(fields),
+        )
+
+    def result_from_pruned_scan(self, result: ValidationResult, statistics, row_groups: List[int]) -> ValidationResult:
+        """Renumber sample rows; every field of every row is one check."""
+        result = super().result_from_pruned_scan(result, statistics, row_groups)
+        if result.total_count:
+            result.total_count = statistics.num_rows * len(self.params.get("fields", []))
+            if result.passed:
+                result.message = f"All mandatory fields contain values across {statistics.num_rows} rows"
+        return result
+
     def validate(self, data_iterator: Iterator[pd.DataFrame], context: Dict[str, Any]) -> ValidationResult:
         """
         Check for missing values in mandatory fields across all chunks.
@@ -92,30 +143,30 @@ class MandatoryFieldCheck(DataValidationRule):
                     )
 
                 # Apply conditional filter if condition is specified
+                condition_mask = None
                 if self.condition:
                     condition_mask = self._evaluate_condition(chunk)
-                    # Only validate rows that match the condition
-                    rows_to_check = chunk[condition_mask]
 
                     # If no rows match condition in this chunk, skip validation
-                    if len(rows_to_check) == 0:
+                    if not condition_mask.any():
                         total_rows += len(chunk)
                         continue
-                else:
-                    rows_to_check = chunk
 
                 # Check each required field
                 for field in fields:
-                    # Find rows with missing values (check only rows that meet condition)
-                    mask = rows_to_check[field].isna()
+                    # Find rows with missing values (masks are shared with other validations)
+                    mask = null_mask(chunk, field)
 
                     # Also check for empty strings if not allowing whitespace
-                    if not allow_whitespace and rows_to_check[field].dtype == 'object':
-                        # Convert to string and check for empty/whitespace
-                        mask = mask | (rows_to_check[field].astype(str).str.strip() == '')
+                    if not allow_whitespace and chunk[field].dtype == 'object':
+                        mask = mask | blank_mask(chunk, field)
+
+                    # Check only rows that meet the condition
+                    if condition_mask is not None:
+                        mask = mask & condition_mask
 
                     # Find failed row indices
-                    failed_indices = rows_to_check[mask].index.tolist()
+                    failed_indices = chunk.index[mask.to_numpy(dtype=bool)].tolist()
 
                     # Collect samples
                     for idx in failed_indices:
@@ -191,6 +242,8 @@ class RegexCheck(DataValidationRule):
             message: "Account number must be exactly 8 digits"
     """
 
+    column_params = ("field",)
+
     def __init__(self, name: str, severity, params: Dict[str, Any] = None, condition: str = None):
         """
         Initialize RegexCheck with pre-compiled regex pattern for performance.
@@ -264,6 +317,7 @@ class RegexCheck(DataValidationRule):
             regex = self.compiled_regex
 
             total_rows = 0
+            failed_count = 0
             failed_rows = []
             max_samples = context.get("max_sample_failures", MAX_SAMPLE_FAILURES)
 
@@ -277,29 +331,27 @@ class RegexCheck(DataValidationRule):
                         available_columns=list(chunk.columns)
                     )
 
-                # Apply conditional filter if condition is specified
+                # Rows to check: non-null values that meet the condition
+                rows_to_check = ~null_mask(chunk, field)
                 if self.condition:
-                    condition_mask = self._evaluate_condition(chunk)
-                    rows_to_check = chunk[condition_mask]
+                    rows_to_check &= self._evaluate_condition(chunk)
 
                     # If no rows match condition in this chunk, skip validation
-                    if len(rows_to_check) == 0:
+                    if not rows_to_check.any():
                         total_rows += len(chunk)
                         continue
-                else:
-                    rows_to_check = chunk
-
-                # Convert to string for regex matching (skip nulls)
-                field_values = rows_to_check[field].dropna().astype(str)
-
-                # Test each value against pattern
-                for idx, value in field_values.items():
-                    matches = bool(regex.match(value))
 
-                    # Check if validation fails (considering invert flag)
-                    failed = (matches and invert) or (not matches and not invert)
-
-                    if failed and len(failed_rows) < max_samples:
+                # Match the whole chunk at once (mask shared with other validations)
+                matches = regex_mask(chunk, field, regex)
+                failed_mask = (rows_to_check & matches) if invert else (rows_to_check & ~matches)
+                failed_mask = failed_mask.to_numpy(dtype=bool)
+                chunk_failed = int(failed_mask.sum())
+                failed_count += chunk_failed
+
+                # Collect samples from the first failing rows
+                if chunk_failed and len(failed_rows) < max_samples:
+                    failed_indices = chunk.index[failed_mask][:max_samples - len(failed_rows)]
+                    for idx, value in as_strings(chunk, field).loc[failed_indices].items():
                         failed_rows.append({
                             "row": int(total_rows + idx),
                             "field": field,
@@ -310,8 +362,6 @@ class RegexCheck(DataValidationRule):
                 total_rows += len(chunk)
 
             # Create result
-            failed_count = len(failed_rows)
-
             if failed_count > 0:
                 return self._create_result(
                     passed=False,
@@ -356,6 +406,8 @@ class ValidValuesCheck(DataValidationRule):
             case_sensitive: true
     """
 
+    column_params = ("field",)
+
     def __init__(self, name: str, severity, params: Dict[str, Any] = None, condition: str = None):
         """
         Initialize ValidValuesCheck with pre-computed valid set for performance.
@@ -368,14 +420,15 @@ class ValidValuesCheck(DataValidationRule):
         """
         super().__init__(name, severity, params, condition)
 
-        # Pre-compute valid set for efficient lookup (avoids recreation on each chunk)
+        # Pre-compute the hashed lookup table once (values are compared as strings)
         valid_values = self.params.get("valid_values", [])
         case_sensitive = self.params.get("case_sensitive", True)
 
         if case_sensitive:
-            self.valid_set = set(valid_values)
+            self.valid_set = {str(v) for v in valid_values}
         else:
             self.valid_set = {str(v).lower() for v in valid_values}
+        self.valid_index = pd.Index(list(self.valid_set), dtype=object)
 
         self.case_sensitive = case_sensitive
 
@@ -413,11 +466,13 @@ class ValidValuesCheck(DataValidationRule):
                     failed_count=1,
                 )
 
-            # Use pre-computed valid set (computed in __init__ for performance)
-            valid_set = self.valid_set
+            # Use pre-computed lookup table (built in __init__ for performance)
+            valid_index = self.valid_index
             case_sensitive = self.case_sensitive
+            expected = _describe_values(valid_values)
 
             total_rows = 0
+            failed_count = 0
             failed_rows = []
             max_samples = context.get("max_sample_failures", MAX_SAMPLE_FAILURES)
             invalid_values_found: Set[str] = set()
@@ -432,40 +487,39 @@ class ValidValuesCheck(DataValidationRule):
                         available_columns=list(chunk.columns)
                     )
 
-                # Apply conditional filter if condition is specified
+                # Rows to check: non-null values that meet the condition
+                rows_to_check = ~null_mask(chunk, field).to_numpy(dtype=bool)
                 if self.condition:
-                    condition_mask = self._evaluate_condition(chunk)
-                    rows_to_check = chunk[condition_mask]
+                    rows_to_check &= self._evaluate_condition(chunk).to_numpy(dtype=bool)
 
                     # If no rows match condition in this chunk, skip validation
-                    if len(rows_to_check) == 0:
+                    if not rows_to_check.any():
                         total_rows += len(chunk)
                         continue
-                else:
-                    rows_to_check = chunk
 
-                # Check each value (skip nulls)
-                field_values = rows_to_check[field].dropna()
+                # Hashed membership of the whole chunk against the lookup table
+                values = as_strings(chunk, field)
+                check_values = values if case_sensitive else values.str.lower()
+                failed_mask = rows_to_check & (valid_index.get_indexer(check_values) < 0)
+                chunk_failed = int(failed_mask.sum())
+                failed_count += chunk_failed
 
-                for idx, value in field_values.items():
-                    check_value = str(value) if case_sensitive else str(value).lower()
+                if chunk_failed:
+                    invalid_values = values[failed_mask]
+                    invalid_values_found.update(invalid_values.unique())
 
-                    if check_value not in valid_set:
-                        invalid_values_found.add(str(value))
-
-                        if len(failed_rows) < max_samples:
-                            failed_rows.append({
-                                "row": int(total_rows + idx),
-                                "field": field,
-                                "value": str(value),
-                                "message": f"Invalid value '{value}'. Expected one of: {', '.join(map(str, valid_values))}"
-                            })
+                    # Collect samples from the first failing rows
+                    for idx, value in invalid_values.iloc[:max(0, max_samples - len(failed_rows))].items():
+                        failed_rows.append({
+                            "row": int(total_rows + idx),
+                            "field": field,
+                            "value": value,
+                            "message": f"Invalid value '{value}'. Expected one of: {expected}"
+                        })
 
                 total_rows += len(chunk)
 
             # Create result
-            failed_count = len(failed_rows)
-
             if failed_count > 0:
                 return self._create_result(
                     passed=False,
@@ -508,6 +562,8 @@ class RangeCheck(DataValidationRule):
             max_value: 1000000
     """
 
+    column_params = ("field",)
+
     def get_description(self) -> str:
         """Get human-readable description."""
         field = self.params.get("field", "unknown")
@@ -523,6 +579,51 @@ class RangeCheck(DataValidationRule):
         else:
             return f"Checks '{field}' range (no limits specified)"
 
+    def prune_row_groups(self, statistics) -> Optional[List[int]]:
+        """Row groups whose min/max are not both inside the range (nulls never fail)."""
+        field = self.params.get("field")
+        min_value = self.params.get("min_value")
+        max_value = self.params.get("max_value")
+        limits = [value for value in (min_value, max_value) if value is not None]
+        if not field or not limits or not all(
+            isinstance(value, (int, float)) and not isinstance(value, bool) for value in limits
+        ):
+            return None
+
+        chunks = statistics.column(field)
+        if chunks is None or not (statistics.is_integer(field) or statistics.is_floating(field)):
+            return None
+
+        row_groups = []
+        for index, chunk in enumerate(chunks):
+            if chunk.num_rows == 0 or chunk.all_null:
+                continue
+            # Comparisons with a NaN min/max are False, so such groups are read
+            inside = chunk.has_min_max and (
+                (min_value is None or chunk.min >= min_value)
+                and (max_value is None or chunk.max <= max_value)
+            )
+            if not inside:
+                row_groups.append(index)
+        return row_groups
+
+    def result_from_statistics(self, statistics) -> Optional[ValidationResult]:
+        """Pass when every row group's min/max lie inside the range."""
+        if self.prune_row_groups(statistics) != []:
+            return None
+        return self._create_result(
+            passed=True,
+            message=f"All {statistics.num_rows} values are within acceptable range (Parquet statistics)",
+            total_count=statistics.num_rows,
+        )
+
+    def result_from_pruned_scan(self, result: ValidationResult, statistics, row_groups: List[int]) -> ValidationResult:
+        """Renumber sample rows and count the skipped rows as checked."""
+        result = super().result_from_pruned_scan(result, statistics, row_groups)
+        if result.passed and result.total_count:
+            result.message = f"All {statistics.num_rows} values are within acceptable range"
+        return result
+
     def validate(self, data_iterator: Iterator[pd.DataFrame], context: Dict[str, Any]) -> ValidationResult:
         """
         Validate numeric values are within range.
@@ -554,6 +655,7 @@ class RangeCheck(DataValidationRule):
                 )
 
             total_rows = 0
+            failed_count = 0
             failed_rows = []
             max_samples = context.get("max_sample_failures", MAX_SAMPLE_FAILURES)
 
@@ -568,20 +670,18 @@ class RangeCheck(DataValidationRule):
                     )
 
                 # Apply conditional filter if condition is specified
+                condition_mask = None
                 if self.condition:
                     condition_mask = self._evaluate_condition(chunk)
-                    rows_to_check = chunk[condition_mask]
 
                     # If no rows match condition in this chunk, skip validation
-                    if len(rows_to_check) == 0:
+                    if not condition_mask.any():
                         total_rows += len(chunk)
                         continue
-                else:
-                    rows_to_check = chunk
 
-                # Convert to numeric if needed
+                # Convert to numeric if needed (conversion shared with other validations)
                 try:
-                    field_values = pd.to_numeric(rows_to_check[field], errors='coerce')
+                    field_values = to_numeric(chunk, field)
                 except Exception:
                     return self._create_result(
                         passed=False,
@@ -589,21 +689,25 @@ class RangeCheck(DataValidationRule):
                         failed_count=1,
                     )
 
-                # Check range violations (skip nulls)
-                for idx, value in field_values.dropna().items():
-                    out_of_range = False
-                    message = ""
-
-                    if min_value is not None and value < min_value:
-                        out_of_range = True
-                        message = f"Value {value} is below minimum {min_value}"
-                    elif max_value is not None and value > max_value:
-                        out_of_range = True
-                        message = f"Value {value} exceeds maximum {max_value}"
-
-                    if out_of_range and len(failed_rows) < max_samples:
+                # Compare the whole chunk at once (nulls never fail)
+                numbers = field_values.to_numpy(dtype=float, na_value=np.nan)
+                below = numbers < min_value if min_value is not None else np.zeros(len(numbers), dtype=bool)
+                above = numbers > max_value if max_value is not None else np.zeros(len(numbers), dtype=bool)
+                failed_mask = below | above
+                if condition_mask is not None:
+                    failed_mask &= condition_mask.to_numpy(dtype=bool)
+                failed_count += int(failed_mask.sum())
+
+                # Collect samples from the first failing rows
+                if len(failed_rows) < max_samples:
+                    for position in np.flatnonzero(failed_mask)[:max_samples - len(failed_rows)]:
+                        value = numbers[position]
+                        if below[position]:
+                            message = f"Value {value} is below minimum {min_value}"
+                        else:
+                            message = f"Value {value} exceeds maximum {max_value}"
                         failed_rows.append({
-                            "row": int(total_rows + idx),
+                            "row": int(total_rows + chunk.index[position]),
                             "field": field,
                             "value": float(value),
                             "message": message
@@ -612,8 +716,6 @@ class RangeCheck(DataValidationRule):
                 total_rows += len(chunk)
 
             # Create result
-            failed_count = len(failed_rows)
-
             if failed_count > 0:
                 return self._create_result(
                     passed=False,
@@ -637,14 +739,63 @@ class RangeCheck(DataValidationRule):
             )
 
 
+# Distinct date strings whose validity DateFormatCheck remembers across chunks
+_DATE_CACHE_LIMIT = 100_000
+
+# Share of distinct values above which a date column is parsed without deduplication
+_DATE_DISTINCT_RATIO = 0.5
+
+
+def _parse_dates(values: np.ndarray, formats: List[str]) -> np.ndarray:
+    """
+    Check which strings ``datetime.strptime`` accepts with any of the formats.
+
+    Args:
+        values: Distinct date strings
+        formats: Accepted strftime formats
+
+    Returns:
+        Boolean array aligned with ``values``
+    """
+    valid = np.zeros(len(values), dtype=bool)
+    series = pd.Series(values, dtype=object)
+
+    for date_format in formats:
+        remaining = np.flatnonzero(~valid)
+        if len(remaining) == 0:
+            break
+        try:
+            parsed = pd.to_datetime(series.iloc[remaining], format=date_format, errors="coerce")
+        except (ValueError, TypeError):
+            continue  # e.g. mixed time zones; confirmed one by one below
+        valid[remaining[parsed.notna().to_numpy()]] = True
+
+    # pandas also rejects valid dates outside its nanosecond range (e.g. 0001-01-01)
+    for position in np.flatnonzero(~valid):
+        for date_format in formats:
+            try:
+                datetime.strptime(values[position], date_format)
+            except (ValueError, TypeError):
+                continue
+            valid[position] = True
+            break
+
+    return valid
+
+
 class DateFormatCheck(DataValidationRule):
     """
     Validates that date fields conform to a specified format.
 
+    Dates are parsed in bulk per chunk and each distinct string is parsed
+    only once, so low-cardinality date columns (business dates, months) cost
+    little more than a hash lookup per row.
+
     Configuration:
         params:
             field (str): Field name to validate
-            format (str): Expected date format (strftime format)
+            format (str or list): Expected date format(s) (strftime format);
+                         a value is valid if it matches any of them
                          Examples: "%Y-%m-%d", "%d/%m/%Y", "%Y-%m-%d %H:%M:%S"
             allow_null (bool): Whether null values are acceptable (default: True)
 
@@ -655,14 +806,71 @@ class DateFormatCheck(DataValidationRule):
             field: "transaction_date"
             format: "%Y-%m-%d"
             allow_null: false
+
+        # Feeds mixing two formats
+        - type: "DateFormatCheck"
+          severity: "ERROR"
+          params:
+            field: "settlement_date"
+            format: ["%Y-%m-%d", "%d/%m/%Y"]
     """
 
+    column_params = ("field",)
+
+    def __init__(self, name: str, severity, params: Dict[str, Any] = None, condition: str = None):
+        """
+        Initialize DateFormatCheck.
+
+        Args:
+            name: Validation rule name
+            severity: Severity level (ERROR or WARNING)
+            params: Parameters including 'field' and 'format'
+            condition: Optional conditional expression
+        """
+        super().__init__(name, severity, params, condition)
+
+        # Validity of distinct strings already parsed (kept across chunks);
+        # dropped for high-cardinality columns where deduplicating costs more
+        self._known_dates = pd.Series(dtype=bool)
+        self._dedupe_dates = True
+
     def get_description(self) -> str:
         """Get human-readable description."""
         field = self.params.get("field", "unknown")
         format_str = self.params.get("format", "unknown")
+        if isinstance(format_str, (list, tuple)):
+            format_str = " or ".join(format_str)
         return f"Checks '{field}' matches date format: {format_str}"
 
+    def _valid_dates(self, values: np.ndarray, formats: List[str]) -> np.ndarray:
+        """
+        Check which strings parse with any of the formats.
+
+        Args:
+            values: Non-null date strings
+            formats: Accepted strftime formats
+
+        Returns:
+            Boolean array aligned with ``values``
+        """
+        if not self._dedupe_dates:
+            return _parse_dates(values, formats)
+
+        codes, uniques = pd.factorize(values)
+        if len(uniques) > len(values) * _DATE_DISTINCT_RATIO:
+            self._dedupe_dates = False
+            self._known_dates = pd.Series(dtype=bool)
+
+        known = self._known_dates.reindex(uniques)
+        unknown = known.isna().to_numpy()
+        if unknown.any():
+            parsed = pd.Series(_parse_dates(uniques[unknown], formats), index=uniques[unknown])
+            known[unknown] = parsed.to_numpy()
+            if len(self._known_dates) < _DATE_CACHE_LIMIT:
+                self._known_dates = pd.concat([self._known_dates, parsed])
+
+        return known.to_numpy(dtype=bool)[codes]
+
     def validate(self, data_iterator: Iterator[pd.DataFrame], context: Dict[str, Any]) -> ValidationResult:
         """
         Validate date field format.
@@ -691,9 +899,12 @@ class DateFormatCheck(DataValidationRule):
                     failed_count=1,
                 )
 
+            formats = [date_format] if isinstance(date_format, str) else list(date_format)
+            date_format = " or ".join(formats)
             allow_null = self.params.get("allow_null", True)
 
             total_rows = 0
+            failed_count = 0
             failed_rows = []
             max_samples = context.get("max_sample_failures", MAX_SAMPLE_FAILURES)
 
@@ -708,47 +919,41 @@ class DateFormatCheck(DataValidationRule):
                     )
 
                 # Apply conditional filter if condition is specified
+                rows_to_check = np.ones(len(chunk), dtype=bool)
                 if self.condition:
-                    condition_mask = self._evaluate_condition(chunk)
-                    rows_to_check = chunk[condition_mask]
+                    rows_to_check = self._evaluate_condition(chunk).to_numpy(dtype=bool)
 
                     # If no rows match condition in this chunk, skip validation
-                    if len(rows_to_check) == 0:
+                    if not rows_to_check.any():
                         total_rows += len(chunk)
                         continue
-                else:
-                    rows_to_check = chunk
-
-                # Check each value
-                for idx, value in rows_to_check[field].items():
-                    # Handle nulls
-                    if pd.isna(value):
-                        if not allow_null and len(failed_rows) < max_samples:
-                            failed_rows.append({
-                                "row": int(total_rows + idx),
-                                "field": field,
-                                "value": str(value),
-                                "message": "Null value not allowed"
-                            })
-                        continue
 
-                    # Try to parse date with specified format
-                    try:
-                        datetime.strptime(str(value), date_format)
-                    except (ValueError, TypeError) as e:
-                        if len(failed_rows) < max_samples:
-                            failed_rows.append({
-                                "row": int(total_rows + idx),
-                                "field": field,
-                                "value": str(value),
-                                "message": f"Invalid date format. Expected: {date_format}"
-                            })
+                # Parse every non-null value of the chunk in bulk
+                nulls = null_mask(chunk, field).to_numpy(dtype=bool)
+                to_parse = rows_to_check & ~nulls
+                invalid = np.zeros(len(chunk), dtype=bool)
+                if to_parse.any():
+                    values = as_strings(chunk, field).to_numpy(dtype=object)[to_parse]
+                    invalid[to_parse] = ~self._valid_dates(values, formats)
+
+                null_failures = rows_to_check & nulls if not allow_null else np.zeros(len(chunk), dtype=bool)
+                failed_mask = invalid | null_failures
+                failed_count += int(failed_mask.sum())
+
+                # Collect samples from the first failing rows
+                if len(failed_rows) < max_samples:
+                    for position in np.flatnonzero(failed_mask)[:max_samples - len(failed_rows)]:
+                        failed_rows.append({
+                            "row": int(total_rows + chunk.index[position]),
+                            "field": field,
+                            "value": str(chunk[field].iat[position]),
+                            "message": ("Null value not allowed" if nulls[position]
+                                        else f"Invalid date format. Expected: {date_format}")
+                        })
 
                 total_rows += len(chunk)
 
             # Create result
-            failed_count = len(failed_rows)
-
             if failed_count > 0:
                 return self._create_result(
                     passed=False,
@@ -8,7 +8,7 @@ These validations check file properties before data processing:
 - File size limits
 """
 
-from typing import Iterator, Dict, Any
+from typing import Iterator, Dict, Any, Optional
 import pandas as pd
 from pathlib import Path
 from validation_framework.validations.base import FileValidationRule, ValidationResult
@@ -214,6 +214,10 @@ class RowCountRangeCheck(FileValidationRule):
         else:
             return "Checks row count (no limits specified)"
 
+    def result_from_statistics(self, statistics) -> Optional[ValidationResult]:
+        """Check the row count recorded in the Parquet footer."""
+        return self.validate_file({"total_rows": statistics.num_rows})
+
     def validate_file(self, context: Dict[str, Any]) -> ValidationResult:
         """
         Check if row count is within specified range.
@@ -7,15 +7,22 @@ writing Python code. All configuration is done in the YAML file.
 Author: daniel edge
 """
 
-from typing import Iterator, Dict, Any, List
+from typing import Iterator, Dict, Any, List, Optional
+import logging
+import numpy as np
 import pandas as pd
 import re
 from validation_framework.validations.base import DataValidationRule, ValidationResult
 from validation_framework.core.exceptions import (
     ColumnNotFoundError,
+    ExpressionCompileError,
     ParameterValidationError
 )
 from validation_framework.core.constants import MAX_SAMPLE_FAILURES
+from validation_framework.core.expression_compiler import compile_expression, evaluate_expression
+from validation_framework.core.chunk_cache import as_strings, null_mask, regex_mask
+
+logger = logging.getLogger(__name__)
 
 
 class InlineRegexCheck(DataValidationRule):
@@ -57,6 +64,8 @@ class InlineRegexCheck(DataValidationRule):
             should_match: false
     """
 
+    column_params = ("field",)
+
     def __init__(self, name: str, severity, params: Dict[str, Any] = None, condition: str = None):
         """
         Initialize InlineRegexCheck with pre-compiled regex pattern for performance.
@@ -119,6 +128,7 @@ class InlineRegexCheck(DataValidationRule):
             regex = self.compiled_regex
 
             total_rows = 0
+            failed_count = 0
             failed_rows = []
             max_samples = context.get("max_sample_failures", MAX_SAMPLE_FAILURES)
 
@@ -131,32 +141,37 @@ class InlineRegexCheck(DataValidationRule):
                         failed_count=1,
                     )
 
-                # Check each value
-                for idx, value in chunk[field].dropna().items():
-                    matches = bool(regex.search(str(value)))
-                    failed = (matches and not should_match) or (not matches and should_match)
-
-                    if failed and len(failed_rows) < max_samples:
-                        if should_match:
-                            msg = f"{description} - Value does not match expected pattern"
-                        else:
-                            msg = f"{description} - Value should NOT contain this pattern"
-
+                # Search every non-null value of the chunk at once
+                matches = regex_mask(chunk, field, regex, search=True)
+                failed_mask = ~null_mask(chunk, field) & (~matches if should_match else matches)
+                failed_mask = failed_mask.to_numpy(dtype=bool)
+                chunk_failed = int(failed_mask.sum())
+                failed_count += chunk_failed
+
+                # Collect samples from the first failing rows
+                if chunk_failed and len(failed_rows) < max_samples:
+                    if should_match:
+                        msg = f"{description} - Value does not match expected pattern"
+                    else:
+                        msg = f"{description} - Value should NOT contain this pattern"
+
+                    failed_indices = chunk.index[failed_mask][:max_samples - len(failed_rows)]
+                    for idx, value in as_strings(chunk, field).loc[failed_indices].items():
                         failed_rows.append({
                             "row": int(total_rows + idx),
                             "field": field,
-                            "value": str(value),
+                            "value": value,
                             "message": msg
                         })
 
                 total_rows += len(chunk)
 
             # Create result
-            if failed_rows:
+            if failed_count:
                 return self._create_result(
                     passed=False,
-                    message=f"{description} - Found {len(failed_rows)} values that failed validation",
-                    failed_count=len(failed_rows),
+                    message=f"{description} - Found {failed_count} values that failed validation",
+                    failed_count=failed_count,
                     total_count=total_rows,
                     sample_failures=failed_rows,
                 )
@@ -220,6 +235,9 @@ class InlineBusinessRuleCheck(DataValidationRule):
             error_message: "Savings account has zero interest rate"
     """
 
+    expression_params = ("rule",)
+    supports_incremental = True
+
     def get_description(self) -> str:
         """Get human-readable description."""
         return self.params.get("description", "Custom business rule")
@@ -227,74 +245,13 @@ class InlineBusinessRuleCheck(DataValidationRule):
     def validate(self, data_iterator: Iterator[pd.DataFrame], context: Dict[str, Any]) -> ValidationResult:
         """Validate data against business rule."""
         try:
-            rule = self.params.get("rule")
-            description = self.params.get("description", "Custom business rule")
-            error_message = self.params.get("error_message", "Business rule violation")
-
-            if not rule:
+            if not self.params.get("rule"):
                 return self._create_result(
                     passed=False,
                     message="No rule specified",
                     failed_count=1,
                 )
-
-            total_rows = 0
-            failed_rows = []
-            max_samples = context.get("max_sample_failures", MAX_SAMPLE_FAILURES)
-
-            # Process chunks
-            for chunk in data_iterator:
-                try:
-                    # Prepare evaluation context
-                    eval_context = self._prepare_eval_context(chunk)
-
-                    # Convert SQL-like syntax to pandas query
-                    pandas_query = self._convert_to_pandas_query(rule)
-
-                    # Execute query - rows that PASS the rule
-                    try:
-                        passing_mask = chunk.eval(pandas_query)
-                    except Exception:
-                        # Fallback: try as direct eval
-                        passing_mask = eval(pandas_query, {"__builtins__": {}}, eval_context)
-
-                    # Find failing rows (NOT passing)
-                    failing_indices = chunk[~passing_mask].index.tolist()
-
-                    # Collect samples
-                    for idx in failing_indices:
-                        if len(failed_rows) < max_samples:
-                            row_data = chunk.loc[idx].to_dict()
-                            failed_rows.append({
-                                "row": int(total_rows + idx),
-                                "values": {k: str(v)[:50] for k, v in list(row_data.items())[:5]},  # First 5 columns
-                                "message": error_message
-                            })
-
-                except Exception as e:
-                    return self._create_result(
-                        passed=False,
-                        message=f"Error evaluating rule: {str(e)}",
-                        failed_count=1,
-                    )
-
-                total_rows += len(chunk)
-
-            # Create result
-            if failed_rows:
-                return self._create_result(
-                    passed=False,
-                    message=f"{description} - {len(failed_rows)} rows failed business rule",
-                    failed_count=len(failed_rows),
-                    total_count=total_rows,
-                    sample_failures=failed_rows,
-                )
-
-            return self._create_result(
-                passed=True,
-                message=f"{description} - All {total_rows} rows passed business rule",
-                total_count=total_rows,
-            )
+            return self._validate_incrementally(data_iterator, context)
 
         except Exception as e:
             return self._create_result(
@@ -303,14 +260,130 @@ class InlineBusinessRuleCheck(DataValidationRule):
                 failed_count=1,
             )
 
-    def _prepare_eval_context(self, df: pd.DataFrame) -> dict:
-        """Prepare evaluation context with today's date etc."""
-        from datetime import datetime
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Create state with exact failure counts and capped samples."""
         return {
-            'today': datetime.now().date(),
-            'now': datetime.now(),
+            "rows": 0,
+            "failed": 0,
+            "samples": [],
+            "max_samples": context.get("max_sample_failures", MAX_SAMPLE_FAILURES),
+            "error": None,
         }
 
+    def update_state(self, state: Dict[str, Any], chunk: pd.DataFrame, row_offset: int, context: Dict[str, Any]) -> None:
+        """Evaluate the rule on one chunk."""
+        if state["error"]:
+            return
+
+        rule = self.params.get("rule")
+        if not rule:
+            state["error"] = "No rule specified"
+            state["stopped"] = True
+            return
+
+        try:
+            failing_mask = ~self._passing_mask(chunk, rule)
+            if self.condition:
+                failing_mask &= self._evaluate_condition(chunk).to_numpy(dtype=bool)
+        except Exception as e:
+            state["error"] = f"Error evaluating rule: {str(e)}"
+            state["stopped"] = True
+            return
+
+        failing_positions = np.flatnonzero(failing_mask)
+        state["failed"] += len(failing_positions)
+
+        # Collect samples
+        room = state["max_samples"] - len(state["samples"])
+        if room > 0 and len(failing_positions):
+            sample_columns = self._sample_columns(chunk.columns)
+            for position in failing_positions[:room]:
+                row_data = chunk.iloc[position]
+                state["samples"].append({
+                    "row": int(row_offset + position),
+                    "values": {col: row_data[col] for col in sample_columns},
+                })
+
+        state["rows"] += len(chunk)
+
+    def merge_states(self, state: Dict[str, Any], other: Dict[str, Any]) -> Dict[str, Any]:
+        """Add counts; samples of the later rows go after the earlier ones."""
+        state["error"] = state["error"] or other["error"]
+        state["rows"] += other["rows"]
+        state["failed"] += other["failed"]
+        state["samples"] = (state["samples"] + other["samples"])[:state["max_samples"]]
+        return state
+
+    def finalize_state(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """Create the result from the accumulated counts."""
+        if state["error"]:
+            return self._create_result(passed=False, message=state["error"], failed_count=1)
+        return self.result_from_failures(state["failed"], state["rows"], state["samples"])
+
+    def get_failure_expression(self, schema: Dict[str, Any]) -> Optional["pl.Expr"]:
+        """Compile the rule (and condition) into a failing-row Polars expression."""
+        rule = self.params.get("rule")
+        if not rule:
+            return None
+
+        try:
+            failing = ~compile_expression(rule, schema)
+            if self.condition:
+                failing = compile_expression(self.condition, schema) & failing
+            return failing
+        except ExpressionCompileError as e:
+            logger.debug(f"{self.name}: {e.message}")
+            return None
+
+    def result_from_failures(self, failed_count: int, total_count: int, samples: list) -> ValidationResult:
+        """Create the result from exact failure counts and sample rows."""
+        description = self.params.get("description", "Custom business rule")
+        error_message = self.params.get("error_message", "Business rule violation")
+
+        if failed_count:
+            sample_failures = [
+                {
+                    "row": sample["row"],
+                    "values": {k: str(v)[:50] for k, v in sample["values"].items()},
+                    "message": error_message,
+                }
+                for sample in samples
+            ]
+            return self._create_result(
+                passed=False,
+                message=f"{description} - {failed_count} rows failed business rule",
+                failed_count=failed_count,
+                total_count=total_count,
+                sample_failures=sample_failures,
+            )
+
+        return self._create_result(
+            passed=True,
+            message=f"{description} - All {total_count} rows passed business rule",
+            total_count=total_count,
+        )
+
+    def _passing_mask(self, chunk: pd.DataFrame, rule: str) -> np.ndarray:
+        """
+        Evaluate the rule on a chunk.
+
+        Uses the compiled Polars expression; rules using syntax the compiler
+        does not support are evaluated with pandas.eval.
+        """
+        try:
+            return evaluate_expression(chunk, rule)
+        except ExpressionCompileError as e:
+            logger.debug(f"{self.name}: {e.message}; evaluating with pandas")
+
+        passing_mask = chunk.eval(self._convert_to_pandas_query(rule))
+        return np.asarray(passing_mask, dtype=bool)
+
+    def _sample_columns(self, columns: List[str]) -> List[str]:
+        """Columns shown in sample failures: the ones the rule uses (up to 5)."""
+        referenced = self.get_required_columns() or set()
+        selected = [col for col in columns if col in referenced]
+        return (selected or list(columns))[:5]
+
     def _convert_to_pandas_query(self, rule: str) -> str:
         """Convert SQL-like syntax to pandas query syntax."""
         # Replace SQL keywords with pandas equivalents
@@ -318,8 +391,6 @@ class InlineBusinessRuleCheck(DataValidationRule):
         query = query.replace(" AND ", " & ")
         query = query.replace(" OR ", " | ")
         query = query.replace(" NOT ", " ~ ")
-        query = query.replace("==", "==")
-        query = query.replace("!=", "!=")
         return query
 
 
@@ -364,6 +435,24 @@ class InlineLookupCheck(DataValidationRule):
             description: "Product code must be in approved list"
     """
 
+    column_params = ("field",)
+
+    def __init__(self, name: str, severity, params: Dict[str, Any] = None, condition: str = None):
+        """
+        Initialize InlineLookupCheck with a pre-built lookup table for performance.
+
+        Args:
+            name: Validation rule name
+            severity: Severity level (ERROR or WARNING)
+            params: Parameters including 'reference_values'
+            condition: Optional conditional expression
+        """
+        super().__init__(name, severity, params, condition)
+
+        # Hashed lookup table built once (values are compared as strings)
+        reference_values = self.params.get("reference_values") or []
+        self.reference_index = pd.Index(list({str(v) for v in reference_values}), dtype=object)
+
     def get_description(self) -> str:
         """Get human-readable description."""
         return self.params.get("description", "Reference data lookup")
@@ -384,10 +473,15 @@ class InlineLookupCheck(DataValidationRule):
                     value=None
                 )
 
-            # Convert to set for efficient lookup
-            reference_set = set(reference_values)
+            # Use pre-built lookup table (built in __init__ for performance)
+            reference_index = self.reference_index
+            if check_type == "allow":
+                message = f"Value not in approved list. Allowed: {', '.join(map(str, list(reference_values)[:5]))}"
+            else:
+                message = "Value is in blocked list"
 
             total_rows = 0
+            failed_count = 0
             failed_rows = []
             max_samples = context.get("max_sample_failures", MAX_SAMPLE_FAILURES)
             invalid_values = set()
@@ -401,42 +495,37 @@ class InlineLookupCheck(DataValidationRule):
                         failed_count=1,
                     )
 
-                # Check each value
-                for idx, value in chunk[field].dropna().items():
-                    value_str = str(value)
-
-                    if check_type == "allow":
-                        # Value must be IN the reference list
-                        if value_str not in reference_set:
-                            invalid_values.add(value_str)
-                            if len(failed_rows) < max_samples:
-                                failed_rows.append({
-                                    "row": int(total_rows + idx),
-                                    "field": field,
-                                    "value": value_str,
-                                    "message": f"Value not in approved list. Allowed: {', '.join(list(reference_values)[:5])}"
-                                })
-                    else:  # deny
-                        # Value must NOT be IN the reference list
-                        if value_str in reference_set:
-                            invalid_values.add(value_str)
-                            if len(failed_rows) < max_samples:
-                                failed_rows.append({
-                                    "row": int(total_rows + idx),
-                                    "field": field,
-                                    "value": value_str,
-                                    "message": f"Value is in blocked list"
-                                })
+                # Hashed membership of the whole chunk: allow lists fail values
+                # NOT in the reference list, deny lists fail values IN it
+                values = as_strings(chunk, field)
+                in_reference = reference_index.get_indexer(values) >= 0
+                failed_mask = ~null_mask(chunk, field).to_numpy(dtype=bool)
+                failed_mask &= ~in_reference if check_type == "allow" else in_reference
+                chunk_failed = int(failed_mask.sum())
+                failed_count += chunk_failed
+
+                if chunk_failed:
+                    failed_values = values[failed_mask]
+                    invalid_values.update(failed_values.unique())
+
+                    # Collect samples from the first failing rows
+                    for idx, value in failed_values.iloc[:max(0, max_samples - len(failed_rows))].items():
+                        failed_rows.append({
+                            "row": int(total_rows + idx),
+                            "field": field,
+                            "value": value,
+                            "message": message
+                        })
 
                 total_rows += len(chunk)
 
             # Create result
-            if failed_rows:
+            if failed_count:
                 invalid_list = ', '.join(sorted(invalid_values)[:10])
                 return self._create_result(
                     passed=False,
-                    message=f"{description} - {len(failed_rows)} values failed. Invalid values: {invalid_list}",
-                    failed_count=len(failed_rows),
+                    message=f"{description} - {failed_count} values failed. Invalid values: {invalid_list}",
+                    failed_count=failed_count,
                     total_count=total_rows,
                     sample_failures=failed_rows,
                 )
@@ -9,11 +9,14 @@ These validations check entire rows/records:
 Author: Daniel Edge
 """
 
-from typing import Iterator, Dict, Any, List
+from typing import Iterator, Dict, Any, List, Optional, Set, Tuple
 import logging
+import numpy as np
 import pandas as pd
 from validation_framework.validations.base import DataValidationRule, ValidationResult
+from validation_framework.core.bloom_filter import BloomFilter
 from validation_framework.core.memory_bounded_tracker import MemoryBoundedTracker
+from validation_framework.core.partitioned_key_store import PartitionedKeyStore, hash_keys
 from validation_framework.core.exceptions import (
     ColumnNotFoundError,
     ParameterValidationError
@@ -46,6 +49,18 @@ class DuplicateRowCheck(DataValidationRule):
             hash_table_size (int): In-memory hash table size (default: 10,000,000)
             enable_early_termination (bool): Stop after finding N duplicates (default: False)
             max_duplicates (int): Max duplicates before stopping (default: 1000)
+            hash_keys (bool): Track two 64-bit row hashes per key, a chunk at a
+                              time, instead of per-row key tuples (24 bytes per
+                              distinct key; beyond hash_table_size keys they move
+                              to an on-disk PartitionedKeyStore) (default: False).
+                              Approximate: key values are not kept, so distinct
+                              keys whose hashes both collide (about n^2 / 2^129)
+                              count as duplicates
+            key_store (str): "memory" (MemoryBoundedTracker with SQLite spillover,
+                             default) or "partitioned" (PartitionedKeyStore:
+                             hash-partitioned fingerprints on disk, for billions of keys;
+                             approximate in the same way as hash_keys)
+            key_store_partitions (int): Partitions for key_store "partitioned" (default: 256)
 
     Example YAML - Default (Optimized):
         # Check for duplicate customer IDs
@@ -75,6 +90,9 @@ class DuplicateRowCheck(DataValidationRule):
             use_bloom_filter: false  # No bloom filter for zero false positives
     """
 
+    column_params = ("key_fields",)
+    supports_incremental = True
+
     def get_description(self) -> str:
         """Get human-readable description."""
         if self.params.get("consider_all_fields", False):
@@ -83,6 +101,12 @@ class DuplicateRowCheck(DataValidationRule):
             key_fields = self.params.get("key_fields", [])
             return f"Checks for duplicates based on: {', '.join(key_fields)}"
 
+    def get_required_columns(self) -> Optional[Set[str]]:
+        """Every column is part of the key when consider_all_fields is set."""
+        if self.params.get("consider_all_fields", False):
+            return None
+        return super().get_required_columns()
+
     def validate(self, data_iterator: Iterator[pd.DataFrame], context: Dict[str, Any]) -> ValidationResult:
         """
         Check for duplicate rows with bloom filter optimization.
@@ -99,141 +123,91 @@ class DuplicateRowCheck(DataValidationRule):
         Returns:
             ValidationResult with details of duplicate rows
         """
-        # Get optimization parameters
-        use_bloom = self.params.get("use_bloom_filter", True)
-        bloom_fp_rate = self.params.get("bloom_false_positive_rate", 0.01)
-        hash_table_size = self.params.get("hash_table_size", 10_000_000)  # 10M default
-        enable_early_term = self.params.get("enable_early_termination", False)
-        max_dups = self.params.get("max_duplicates", 1000)
-
-        # Create memory-bounded tracker with context manager for automatic cleanup
-        with MemoryBoundedTracker(max_memory_keys=hash_table_size) as tracker:
-            try:
-                consider_all = self.params.get("consider_all_fields", False)
-                key_fields = self.params.get("key_fields", [])
-
-                if not consider_all and not key_fields:
-                    raise ParameterValidationError(
-                        "No key fields specified for duplicate check",
-                        validation_name=self.name,
-                        parameter="key_fields",
-                        value=None
-                    )
-
-                total_rows = 0
-                failed_rows = []
-                max_samples = context.get("max_sample_failures", MAX_SAMPLE_FAILURES)
-                duplicate_count = 0
-
-                # Initialize bloom filter for fast pre-filtering (optional)
-                bloom_filter = None
-                if use_bloom:
-                    try:
-                        from pybloom_live import BloomFilter
-                        bloom_capacity = hash_table_size * 2
-                        bloom_filter = BloomFilter(capacity=bloom_capacity, error_rate=bloom_fp_rate)
-                        logger.info(
-                            f"DuplicateRowCheck: Bloom filter enabled (capacity={bloom_capacity:,}, "
-                            f"false_positive_rate={bloom_fp_rate})"
-                        )
-                    except ImportError:
-                        logger.warning(
-                            "pybloom_live not available. Install with: pip install pybloom-live. "
-                            "Falling back to standard duplicate detection."
-                        )
-                        bloom_filter = None
-
-                # Process each chunk with VECTORIZED operations (100x faster than iloc)
-                for chunk_idx, chunk in enumerate(data_iterator):
-                    # Determine which columns to check
-                    if consider_all:
-                        check_cols = list(chunk.columns)
-                    else:
-                        # Verify key fields exist
-                        missing_fields = [f for f in key_fields if f not in chunk.columns]
-                        if missing_fields:
-                            raise ColumnNotFoundError(
-                                validation_name=self.name,
-                                column=missing_fields[0],
-                                available_columns=list(chunk.columns)
-                            )
-                        check_cols = key_fields
-
-                    # VECTORIZED: Create tuples for all rows at once (100x faster than row-by-row)
-                    keys_series = chunk[check_cols].apply(tuple, axis=1)
-
-                    # Process keys
-                    for idx, row_key in enumerate(keys_series):
-                        # Fast pre-filter with bloom filter (if enabled)
-                        if bloom_filter is not None:
-                            if row_key in bloom_filter:
-                                # Might be duplicate - check with full tracker
-                                is_duplicate, was_added = tracker.add_and_check(row_key)
-                            else:
-                                # Definitely not seen before - add to both
-                                bloom_filter.add(row_key)
-                                is_duplicate, was_added = False, tracker.add(row_key)
-                        else:
-                            # No bloom filter - check directly with tracker
-                            is_duplicate, was_added = tracker.add_and_check(row_key)
-
-                        if is_duplicate:
-                            duplicate_count += 1
-
-                            # Collect sample
-                            if len(failed_rows) < max_samples:
-                                row_data = chunk.iloc[idx].to_dict()
-                                failed_rows.append({
-                                    "row": int(total_rows + idx),
-                                    "key_values": {k: row_data[k] for k in check_cols},
-                                    "message": f"Duplicate row detected"
-                                })
-
-                            # Early termination if requested
-                            if enable_early_term and duplicate_count >= max_dups:
-                                logger.info(
-                                    f"Early termination: Found {duplicate_count} duplicates "
-                                    f"(max_duplicates={max_dups})"
-                                )
-                                break
-
-                    total_rows += len(chunk)
-
-                    # Stop processing chunks if early termination triggered
-                    if enable_early_term and duplicate_count >= max_dups:
-                        break
+        try:
+            return self._validate_incrementally(data_iterator, context)
+        except Exception as e:
+            return self._create_result(
+                passed=False,
+                message=f"Error during duplicate check: {str(e)}",
+                failed_count=1,
+            )
 
-                # Get statistics from tracker
-                stats = tracker.get_statistics()
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Create the key tracker (and optional bloom filter) for one file."""
+        consider_all = self.params.get("consider_all_fields", False)
+        key_fields = self.params.get("key_fields", [])
+
+        if not consider_all and not key_fields:
+            raise ParameterValidationError(
+                "No key fields specified for duplicate check",
+                validation_name=self.name,
+                parameter="key_fields",
+                value=None
+            )
 
-                # Create result
-                if duplicate_count > 0:
-                    unique_keys = stats["total_keys"]
-                    spill_info = " (disk spillover used)" if stats["is_spilled"] else ""
-                    bloom_info = " (bloom filter enabled)" if bloom_filter is not None else ""
-                    early_term_info = f" (early termination at {max_dups})" if enable_early_term and duplicate_count >= max_dups else ""
+        return _init_key_state(self, "DuplicateRowCheck", context)
 
-                    return self._create_result(
-                        passed=False,
-                        message=f"Found {duplicate_count} duplicate rows ({unique_keys:,} unique records{spill_info}{bloom_info}{early_term_info})",
-                        failed_count=duplicate_count,
-                        total_count=total_rows,
-                        sample_failures=failed_rows,
-                    )
+    def update_state(self, state: Dict[str, Any], chunk: pd.DataFrame, row_offset: int, context: Dict[str, Any]) -> None:
+        """Track the keys of one chunk and record duplicates."""
+        if state["stopped"]:
+            return
 
-                bloom_info = " (bloom filter enabled)" if bloom_filter is not None else ""
-                return self._create_result(
-                    passed=True,
-                    message=f"No duplicates found among {total_rows:,} rows{bloom_info}",
-                    total_count=total_rows,
+        # Determine which columns to check
+        if self.params.get("consider_all_fields", False):
+            check_cols = list(chunk.columns)
+        else:
+            key_fields = self.params.get("key_fields", [])
+            # Verify key fields exist
+            missing_fields = [f for f in key_fields if f not in chunk.columns]
+            if missing_fields:
+                raise ColumnNotFoundError(
+                    validation_name=self.name,
+                    column=missing_fields[0],
+                    available_columns=list(chunk.columns)
                 )
+            check_cols = key_fields
+        state["check_cols"] = check_cols
+
+        # VECTORIZED: the whole chunk is tracked in one batch
+        rows = row_offset + np.arange(len(chunk), dtype=np.int64)
+        _update_batch_state(state, chunk[check_cols], rows)
+        state["rows"] += len(chunk)
+
+    def merge_states(self, state: Dict[str, Any], other: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge trackers from a later range of the file."""
+        return _merge_key_states(state, other)
+
+    def finalize_state(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """Build the duplicate check result from the tracked keys."""
+        stats = _key_statistics(state)
+        duplicate_count = state["duplicates"]
+        total_rows = state["rows"]
+        bloom_info = " (bloom filter enabled)" if state["bloom"] is not None else ""
+
+        if duplicate_count > 0:
+            unique_keys = stats["total_keys"]
+            spill_info = " (disk spillover used)" if stats["is_spilled"] else ""
+            early_term_info = f" (early termination at {state['max_duplicates']})" if state["stopped"] else ""
+            hash_info = _approximate_info(state)
 
-            except Exception as e:
-                return self._create_result(
-                    passed=False,
-                    message=f"Error during duplicate check: {str(e)}",
-                    failed_count=1,
-                )
+            return self._create_result(
+                passed=False,
+                message=f"Found {duplicate_count} duplicate rows ({unique_keys:,} unique records{spill_info}{bloom_info}{early_term_info}{hash_info})",
+                failed_count=duplicate_count,
+                total_count=total_rows,
+                sample_failures=_sorted_samples(state),
+            )
+
+        return self._create_result(
+            passed=True,
+            message=f"No duplicates found among {total_rows:,} rows{bloom_info}",
+            total_count=total_rows,
+        )
+
+    def release_state(self, state: Dict[str, Any]) -> None:
+        """Close the tracker and remove any spillover database."""
+        if state["tracker"] is not None:
+            state["tracker"].close()
 
 
 class BlankRecordCheck(DataValidationRule):
@@ -359,6 +333,18 @@ class UniqueKeyCheck(DataValidationRule):
             hash_table_size (int): In-memory hash table size (default: 10,000,000)
             enable_early_termination (bool): Stop after finding N duplicates (default: False)
             max_duplicates (int): Maximum duplicates to find before stopping (default: 1000)
+            hash_keys (bool): Track two 64-bit row hashes per key, a chunk at a
+                              time, instead of per-row key tuples (24 bytes per
+                              distinct key; beyond hash_table_size keys they move
+                              to an on-disk PartitionedKeyStore) (default: False).
+                              Approximate: key values are not kept, so distinct
+                              keys whose hashes both collide (about n^2 / 2^129)
+                              count as duplicates
+            key_store (str): "memory" (MemoryBoundedTracker with SQLite spillover,
+                             default) or "partitioned" (PartitionedKeyStore:
+                             hash-partitioned fingerprints on disk, for billions of keys;
+                             approximate in the same way as hash_keys)
+            key_store_partitions (int): Partitions for key_store "partitioned" (default: 256)
 
     Example YAML - Default (Optimized):
         - type: "UniqueKeyCheck"
@@ -386,6 +372,9 @@ class UniqueKeyCheck(DataValidationRule):
             use_bloom_filter: false  # Disable bloom filter for zero false positives
     """
 
+    column_params = ("fields",)
+    supports_incremental = True
+
     def get_description(self) -> str:
         """Get human-readable description."""
         fields = self.params.get("fields", [])
@@ -408,161 +397,793 @@ class UniqueKeyCheck(DataValidationRule):
         Returns:
             ValidationResult with details of duplicate keys
         """
-        # Get optimization parameters
-        use_bloom = self.params.get("use_bloom_filter", True)
-        bloom_fp_rate = self.params.get("bloom_false_positive_rate", 0.01)
-        hash_table_size = self.params.get("hash_table_size", 10_000_000)  # 10M default
-        enable_early_term = self.params.get("enable_early_termination", False)
-        max_dups = self.params.get("max_duplicates", 1000)
-
-        # Create memory-bounded tracker with context manager for automatic cleanup
-        with MemoryBoundedTracker(max_memory_keys=hash_table_size) as tracker:
-            try:
-                fields = self.params.get("fields", [])
-                if not fields:
-                    raise ParameterValidationError(
-                        "No fields specified for uniqueness check",
-                        validation_name=self.name,
-                        parameter="fields",
-                        value=None
-                    )
+        try:
+            return self._validate_incrementally(data_iterator, context)
+        except Exception as e:
+            return self._create_result(
+                passed=False,
+                message=f"Error during unique key check: {str(e)}",
+                failed_count=1,
+            )
 
-                total_rows = 0
-                failed_rows = []
-                max_samples = context.get("max_sample_failures", MAX_SAMPLE_FAILURES)
-                duplicate_count = 0
-
-                # Track first occurrence of keys for better error messages
-                # Note: This is memory-bounded separately - we only store first 100k
-                first_occurrence = {}
-                max_first_occurrence = 100_000
-
-                # Initialize bloom filter for fast pre-filtering (optional)
-                bloom_filter = None
-                if use_bloom:
-                    try:
-                        # Lazy import - only load if needed
-                        from pybloom_live import BloomFilter
-                        # Estimate capacity based on hash table size
-                        bloom_capacity = hash_table_size * 2  # 2x for safety margin
-                        bloom_filter = BloomFilter(capacity=bloom_capacity, error_rate=bloom_fp_rate)
-                        logger.info(
-                            f"UniqueKeyCheck: Bloom filter enabled (capacity={bloom_capacity:,}, "
-                            f"false_positive_rate={bloom_fp_rate})"
-                        )
-                    except ImportError:
-                        logger.warning(
-                            "pybloom_live not available. Install with: pip install pybloom-live. "
-                            "Falling back to standard duplicate detection."
-                        )
-                        bloom_filter = None
-
-                # Process each chunk with VECTORIZED operations (100x faster than iloc)
-                for chunk_idx, chunk in enumerate(data_iterator):
-                    # Verify fields exist
-                    missing_fields = [f for f in fields if f not in chunk.columns]
-                    if missing_fields:
-                        raise ColumnNotFoundError(
-                            validation_name=self.name,
-                            column=missing_fields[0],
-                            available_columns=list(chunk.columns)
-                        )
-
-                    # VECTORIZED: Create keys for all rows at once (100x faster than row-by-row)
-                    if len(fields) == 1:
-                        # Single field - direct series
-                        keys_series = chunk[fields[0]]
-                    else:
-                        # Multiple fields - create tuples vectorized
-                        keys_series = chunk[fields].apply(tuple, axis=1)
-
-                    # Filter out null keys vectorized
-                    if len(fields) == 1:
-                        valid_mask = keys_series.notna()
-                    else:
-                        # For tuples, check if any value is null
-                        valid_mask = chunk[fields].notna().all(axis=1)
-
-                    valid_keys = keys_series[valid_mask]
-                    valid_indices = valid_mask[valid_mask].index
-
-                    # Process valid keys
-                    for idx, row_key in zip(valid_indices, valid_keys):
-                        # Fast pre-filter with bloom filter (if enabled)
-                        if bloom_filter is not None:
-                            if row_key in bloom_filter:
-                                # Might be duplicate - check with full tracker
-                                is_duplicate, was_added = tracker.add_and_check(row_key)
-                            else:
-                                # Definitely not seen before - add to both bloom and tracker
-                                bloom_filter.add(row_key)
-                                is_duplicate, was_added = False, tracker.add(row_key)
-                        else:
-                            # No bloom filter - check directly with tracker
-                            is_duplicate, was_added = tracker.add_and_check(row_key)
-
-                        if is_duplicate:
-                            duplicate_count += 1
-
-                            if len(failed_rows) < max_samples:
-                                # Get row position in original chunk
-                                chunk_pos = chunk.index.get_loc(idx)
-                                key_dict = {k: chunk.iloc[chunk_pos][k] for k in fields}
-                                first_row = first_occurrence.get(row_key, "unknown")
-                                failed_rows.append({
-                                    "row": int(total_rows + chunk_pos),
-                                    "key_values": key_dict,
-                                    "first_seen_row": first_row,
-                                    "message": f"Duplicate key found (first occurrence at row {first_row})"
-                                })
-
-                            # Early termination if requested
-                            if enable_early_term and duplicate_count >= max_dups:
-                                logger.info(
-                                    f"Early termination: Found {duplicate_count} duplicates "
-                                    f"(max_duplicates={max_dups})"
-                                )
-                                break
-                        else:
-                            # Track first occurrence if we have space
-                            if len(first_occurrence) < max_first_occurrence:
-                                chunk_pos = chunk.index.get_loc(idx)
-                                first_occurrence[row_key] = total_rows + chunk_pos
-
-                    total_rows += len(chunk)
-
-                    # Stop processing chunks if early termination triggered
-                    if enable_early_term and duplicate_count >= max_dups:
-                        break
+    def init_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Create the key tracker (and optional bloom filter) for one file."""
+        fields = self.params.get("fields", [])
+        if not fields:
+            raise ParameterValidationError(
+                "No fields specified for uniqueness check",
+                validation_name=self.name,
+                parameter="fields",
+                value=None
+            )
 
-                # Get statistics from tracker
-                stats = tracker.get_statistics()
+        state = _init_key_state(self, "UniqueKeyCheck", context)
+        state["check_cols"] = fields
+        state["report_first_seen"] = True
+        state["scalar_keys"] = len(fields) == 1
+        return state
+
+    def update_state(self, state: Dict[str, Any], chunk: pd.DataFrame, row_offset: int, context: Dict[str, Any]) -> None:
+        """Track the non-null keys of one chunk and record duplicates."""
+        if state["stopped"]:
+            return
+
+        fields = state["check_cols"]
+
+        # Verify fields exist
+        missing_fields = [f for f in fields if f not in chunk.columns]
+        if missing_fields:
+            raise ColumnNotFoundError(
+                validation_name=self.name,
+                column=missing_fields[0],
+                available_columns=list(chunk.columns)
+            )
 
-                # Create result
-                if duplicate_count > 0:
-                    spill_info = " (disk spillover used)" if stats["is_spilled"] else ""
-                    bloom_info = " (bloom filter enabled)" if bloom_filter is not None else ""
-                    early_term_info = f" (early termination at {max_dups})" if enable_early_term and duplicate_count >= max_dups else ""
+        # VECTORIZED: track the keys of the chunk in one batch, skipping keys with any null part
+        valid_mask = chunk[fields].notna().all(axis=1).to_numpy()
+        rows = row_offset + np.flatnonzero(valid_mask)
+        _update_batch_state(state, chunk.loc[valid_mask, fields], rows)
+        state["rows"] += len(chunk)
 
-                    return self._create_result(
-                        passed=False,
-                        message=f"Found {duplicate_count} duplicate keys (should be unique{spill_info}{bloom_info}{early_term_info})",
-                        failed_count=duplicate_count,
-                        total_count=total_rows,
-                        sample_failures=failed_rows,
-                    )
+    def merge_states(self, state: Dict[str, Any], other: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge trackers from a later range of the file."""
+        return _merge_key_states(state, other, single_field=len(state["check_cols"]) == 1)
 
-                unique_count = stats["total_keys"]
-                bloom_info = " (bloom filter enabled)" if bloom_filter is not None else ""
-                return self._create_result(
-                    passed=True,
-                    message=f"All {unique_count:,} keys are unique across {total_rows:,} rows{bloom_info}",
-                    total_count=total_rows,
-                )
+    def finalize_state(self, state: Dict[str, Any], context: Dict[str, Any]) -> ValidationResult:
+        """Build the uniqueness result from the tracked keys."""
+        stats = _key_statistics(state)
+        duplicate_count = state["duplicates"]
+        total_rows = state["rows"]
+        bloom_info = " (bloom filter enabled)" if state["bloom"] is not None else ""
+
+        if duplicate_count > 0:
+            spill_info = " (disk spillover used)" if stats["is_spilled"] else ""
+            early_term_info = f" (early termination at {state['max_duplicates']})" if state["stopped"] else ""
+            hash_info = _approximate_info(state)
+
+            return self._create_result(
+                passed=False,
+                message=f"Found {duplicate_count} duplicate keys (should be unique{spill_info}{bloom_info}{early_term_info}{hash_info})",
+                failed_count=duplicate_count,
+                total_count=total_rows,
+                sample_failures=_sorted_samples(state),
+            )
+
+        unique_count = stats["total_keys"]
+        return self._create_result(
+            passed=True,
+            message=f"All {unique_count:,} keys are unique across {total_rows:,} rows{bloom_info}",
+            total_count=total_rows,
+        )
+
+    def release_state(self, state: Dict[str, Any]) -> None:
+        """Close the tracker and remove any spillover database."""
+        if state["tracker"] is not None:
+            state["tracker"].close()
+
+
+# ----------------------------------------------------------------------
+# Shared key-tracking helpers for DuplicateRowCheck and UniqueKeyCheck
+# ----------------------------------------------------------------------
+
+# First occurrences are remembered for sample messages and for merging
+# partial states; bounded separately from the tracker itself.
+MAX_FIRST_OCCURRENCES = 100_000
+
+
+def _init_key_state(rule: DataValidationRule, check_name: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Create the incremental state shared by the key-based record checks.
+
+    Args:
+        rule: DuplicateRowCheck or UniqueKeyCheck instance
+        check_name: Name used in log messages
+        context: Validation context
+
+    Returns:
+        State dictionary with tracker, bloom filter and counters
+    """
+    params = rule.params
+    hash_table_size = params.get("hash_table_size", 10_000_000)  # 10M default
+    key_store = params.get("key_store", "memory")
+    partial = context.get("partial_state", False)
+    # Worker partials of the partitioned store only hash their keys; the
+    # parent adds the hashes to its store in one batch per chunk
+    hashed = params.get("hash_keys", False) or (partial and key_store == "partitioned")
+
+    if key_store not in ("memory", "partitioned"):
+        raise ParameterValidationError(
+            f"Unknown key_store '{key_store}' (expected 'memory' or 'partitioned')",
+            validation_name=rule.name,
+            parameter="key_store",
+            value=key_store
+        )
+
+    if hashed or partial:
+        # Hashed runs need no tracker until they outgrow hash_table_size;
+        # worker partials keep their chunk's new keys in "pending"
+        tracker = None
+    elif key_store == "partitioned":
+        tracker = PartitionedKeyStore(
+            max_memory_keys=hash_table_size,
+            partitions=params.get("key_store_partitions", 256),
+        )
+    else:
+        tracker = MemoryBoundedTracker(max_memory_keys=hash_table_size)
+
+    # The bloom pre-filter sits in front of the MemoryBoundedTracker only
+    # (hash_keys and the partitioned key store do their own hashing).
+    use_bloom = params.get("use_bloom_filter", True) and not hashed and key_store == "memory"
+
+    return {
+        "tracker": tracker,
+        # Sorted runs of 64-bit row hashes (see _track_hashed_keys)
+        "hashed": {
+            "runs": [],
+            "collisions": {},
+            "max_keys": hash_table_size,
+            "partitions": params.get("key_store_partitions", 256),
+        } if hashed else None,
+        # Partial (per-worker, per-chunk) states would ship a full-size
+        # filter for a handful of keys, so they only record the key hashes
+        # and the final state adds them to its filter when merging.
+        "bloom": _create_bloom_filter(
+            check_name,
+            use_bloom and not partial,
+            hash_table_size * 2,  # 2x for safety margin
+            params.get("bloom_false_positive_rate", 0.01),
+        ),
+        # Worker partials of the memory tracker: the chunk's new keys in row
+        # order (and their hashes for the bloom filter), added by the parent
+        # in one batch
+        "pending": {"keys": [], "hashes": [] if use_bloom else None} if partial and not hashed else None,
+        "check_cols": None,
+        "first_rows": {},
+        "rows": 0,
+        "duplicates": 0,
+        "samples": [],
+        "max_samples": context.get("max_sample_failures", MAX_SAMPLE_FAILURES),
+        "early_termination": params.get("enable_early_termination", False),
+        "max_duplicates": params.get("max_duplicates", 1000),
+        "stopped": False,
+        "report_first_seen": False,
+        # MemoryBoundedTracker keys are scalars rather than tuples (UniqueKeyCheck)
+        "scalar_keys": False,
+    }
+
+
+def _create_bloom_filter(check_name: str, enabled: bool, capacity: int, error_rate: float) -> Optional[BloomFilter]:
+    """
+    Create an optional bloom filter for duplicate pre-filtering.
+
+    Returns:
+        BloomFilter instance, or None if disabled
+    """
+    if not enabled:
+        return None
+
+    bloom_filter = BloomFilter(capacity=capacity, error_rate=error_rate)
+    logger.info(
+        f"{check_name}: Bloom filter enabled (capacity={capacity:,}, "
+        f"false_positive_rate={error_rate})"
+    )
+    return bloom_filter
+
+
+def _remember_first_row(state: Dict[str, Any], key: Any, row: int) -> None:
+    """Remember the first row a key was seen on, if there is room."""
+    if len(state["first_rows"]) < MAX_FIRST_OCCURRENCES:
+        state["first_rows"][key] = row
+
+
+def _duplicate_sample(key: tuple, row: int, check_cols: List[str], first_seen_row: Any = None) -> Dict[str, Any]:
+    """Build the sample failure for one duplicate key."""
+    sample = {
+        "row": int(row),
+        "key_values": dict(zip(check_cols, key)),
+    }
+    if first_seen_row is None:
+        sample["message"] = "Duplicate row detected"
+    else:
+        sample["first_seen_row"] = first_seen_row
+        sample["message"] = f"Duplicate key found (first occurrence at row {first_seen_row})"
+    return sample
+
+
+def _approximate_info(state: Dict[str, Any]) -> str:
+    """Result message note for duplicates matched by hash rather than by key value."""
+    if state["hashed"] is None and not isinstance(state["tracker"], PartitionedKeyStore):
+        return ""
+    return " (keys matched by hash; a collision may be counted as a duplicate)"
+
+
+def _early_termination_reached(state: Dict[str, Any]) -> bool:
+    """Stop tracking once enough duplicates were found (if requested)."""
+    if state["early_termination"] and state["duplicates"] >= state["max_duplicates"]:
+        logger.info(
+            f"Early termination: Found {state['duplicates']} duplicates "
+            f"(max_duplicates={state['max_duplicates']})"
+        )
+        state["stopped"] = True
+    return state["stopped"]
+
+
+def _merge_key_states(state: Dict[str, Any], other: Dict[str, Any], single_field: bool = False) -> Dict[str, Any]:
+    """
+    Merge the key state of a later file range into an earlier one.
+
+    Every distinct key of ``other`` that was already seen in ``state`` adds
+    one duplicate: the first occurrence inside ``other`` (later occurrences
+    were already counted there). With early termination the merge stops
+    where a serial run would: the count is capped at max_duplicates and
+    ranges merged after that are ignored.
+
+    Args:
+        state: State for earlier rows (updated in place)
+        other: State for later rows (its tracker is closed)
+        single_field: Keys are scalars rather than tuples (UniqueKeyCheck)
+
+    Returns:
+        The merged state
+    """
+    if state["stopped"]:
+        # A serial run skips the chunks after early termination
+        if other["tracker"] is not None:
+            other["tracker"].close()
+        return state
+
+    check_cols = state["check_cols"] or other["check_cols"]
+    cross_samples = []
+
+    if state["hashed"] is not None and other["hashed"] is not None:
+        cross_samples = _merge_hashed_states(state, other, check_cols)
+    elif other["hashed"] is not None and isinstance(state["tracker"], PartitionedKeyStore):
+        # Worker partials of the partitioned store: their hashes in one batch
+        hashes, checks, _ = _hashed_fingerprints(other["hashed"])
+        partitions = (checks % np.uint64(state["tracker"].partitions)).astype(np.int64)
+        cross_samples = _merge_partitioned_stores(state, other, check_cols, [(partitions, hashes)])
+    else:
+        # A hashed side that is merged with one that outgrew hash_table_size
+        # is moved to a key store as well
+        for side in (state, other):
+            if side["hashed"] is not None:
+                _spill_hashed_runs(side)
+        if isinstance(state["tracker"], PartitionedKeyStore):
+            # One partition at a time: a spilled store may not fit in memory
+            batches = (
+                (np.full(len(fingerprints), partition, dtype=np.int64), fingerprints)
+                for partition, fingerprints in other["tracker"].fingerprints()
+            )
+            cross_samples = _merge_partitioned_stores(state, other, check_cols, batches)
+
+    # Batch paths merged above; their trackers have no keys to iterate
+    if other.get("pending") is not None:
+        merged_keys = _merge_pending_keys(state, other["pending"])
+    else:
+        plain_batches = (
+            other["tracker"].iter_key_batches() if isinstance(other["tracker"], MemoryBoundedTracker) else []
+        )
+        merged_keys = _track_keys_batched(state, plain_batches)
+    for key, is_duplicate in merged_keys:
+        if is_duplicate:
+            state["duplicates"] += 1
+            row = other["first_rows"].get(key)
+            if row is not None and len(cross_samples) < state["max_samples"]:
+                key_tuple = (key,) if single_field else key
+                sample = {"row": int(row), "key_values": dict(zip(check_cols, key_tuple))}
+                if state["report_first_seen"]:
+                    first_seen = state["first_rows"].get(key, "unknown")
+                    sample["first_seen_row"] = first_seen
+                    sample["message"] = f"Duplicate key found (first occurrence at row {first_seen})"
+                else:
+                    sample["message"] = "Duplicate row detected"
+                cross_samples.append(sample)
+        elif key in other["first_rows"]:
+            _remember_first_row(state, key, other["first_rows"][key])
+
+    _merge_bloom_filters(state, other)
+
+    state["duplicates"] += other["duplicates"]
+    state["rows"] += other["rows"]
+    state["check_cols"] = check_cols
+    max_samples = state["max_samples"]
+    if state["early_termination"]:
+        # Duplicates past max_duplicates are neither counted nor sampled
+        state["duplicates"] = min(state["duplicates"], state["max_duplicates"])
+        max_samples = min(max_samples, state["max_duplicates"])
+    state["samples"] = sorted(
+        state["samples"] + cross_samples + other["samples"], key=lambda s: s["row"]
+    )[:max_samples]
+    _early_termination_reached(state)
+
+    if other["tracker"] is not None:
+        other["tracker"].close()
+    return state
+
+
+def _track_keys_batched(state: Dict[str, Any], batches: Iterator[List[Any]]) -> Iterator[Tuple[Any, bool]]:
+    """
+    Track batches of keys, one tracker call per batch.
+
+    Merged keys are always looked up (the bloom filter only covers keys
+    hashed from chunks; the other state's hashes or filter are added to it
+    separately).
+
+    Yields:
+        Tuples of (key, is_duplicate)
+    """
+    for keys in batches:
+        was_seen, _ = state["tracker"].add_and_check_many(keys)
+        yield from zip(keys, was_seen.tolist())
+
+
+def _merge_pending_keys(state: Dict[str, Any], pending: Dict[str, Any]) -> Iterator[Tuple[Any, bool]]:
+    """
+    Add the new keys of a worker partial to the tracker in one batch.
+
+    With a bloom filter only the keys it may have seen are looked up
+    (the partial's keys are distinct, as add_and_check_many requires).
+
+    Yields:
+        Tuples of (key, is_duplicate)
+    """
+    keys = pending["keys"]
+    if not keys:
+        return iter(())
+
+    candidates = None
+    if state["bloom"] is not None and pending["hashes"] is not None:
+        hashes = np.concatenate(pending["hashes"])
+        candidates = state["bloom"].contains_hashes(hashes)
+        state["bloom"].add_hashes(hashes)
+    was_seen, _ = state["tracker"].add_and_check_many(keys, candidates=candidates)
+    return zip(keys, was_seen.tolist())
+
+
+def _merge_bloom_filters(state: Dict[str, Any], other: Dict[str, Any]) -> None:
+    """Add the keys of a later range's bloom filter to the state's filter."""
+    if state["bloom"] is not None and other["bloom"] is not None:
+        state["bloom"].merge(other["bloom"])
+
+
+def _sorted_samples(state: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Return sample failures in row order."""
+    return sorted(state["samples"], key=lambda s: s["row"])
+
+
+# ----------------------------------------------------------------------
+# Batch key tracking: 64-bit row hashing (hash_keys: true), the partitioned
+# key store (key_store: partitioned) and MemoryBoundedTracker batches
+# ----------------------------------------------------------------------
+#
+# With hash_keys each distinct key is stored as two independent 64-bit row
+# hashes and its first row number, in sorted numpy "runs" (24 bytes per
+# key; the key values themselves are not kept, so duplicates are confirmed
+# by the second hash rather than by value and counts are approximate). A chunk is hashed in one
+# call and looked up with np.searchsorted. A row whose first hash matches a
+# stored key with a different second hash is a true collision and is
+# tracked by both hashes in a small dictionary, so a false duplicate needs
+# both hashes to collide (about n^2 / 2^129). Once the runs hold more than
+# hash_table_size keys they are moved to a PartitionedKeyStore, which
+# keeps further keys on disk.
+
+
+def _key_statistics(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Return key-tracking statistics for the tracker or the hashed runs."""
+    hashed = state["hashed"]
+    if hashed is None:
+        return state["tracker"].get_statistics()
+
+    total_keys = sum(len(run["hashes"]) for run in hashed["runs"]) + len(hashed["collisions"])
+    return {"total_keys": total_keys, "is_spilled": False}
+
+
+def _lookup_hashes(runs: List[Dict[str, Any]], hashes: np.ndarray):
+    """
+    Find hashes in the sorted runs.
+
+    Returns:
+        (run index or -1, position within that run) for every hash
+    """
+    run_index = np.full(len(hashes), -1, dtype=np.int64)
+    run_pos = np.zeros(len(hashes), dtype=np.int64)
+    for index, run in enumerate(runs):
+        pos = np.minimum(np.searchsorted(run["hashes"], hashes), len(run["hashes"]) - 1)
+        found = run["hashes"][pos] == hashes
+        run_index[found] = index
+        run_pos[found] = pos[found]
+    return run_index, run_pos
+
+
+def _stored_checks(runs: List[Dict[str, Any]], run_index: np.ndarray, run_pos: np.ndarray):
+    """Return the second hash and first row stored for found hashes, in order."""
+    checks = np.empty(len(run_index), dtype=np.uint64)
+    first_rows = np.empty(len(run_index), dtype=np.int64)
+    for index in np.unique(run_index):
+        selected = np.flatnonzero(run_index == index)
+        run = runs[index]
+        checks[selected] = run["checks"][run_pos[selected]]
+        first_rows[selected] = run["rows"][run_pos[selected]]
+    return checks, first_rows
+
+
+def _add_run(hashed: Dict[str, Any], hashes: np.ndarray, checks: np.ndarray, rows: np.ndarray) -> None:
+    """Store a sorted run of new hashes, merging runs of similar size."""
+    if len(hashes) == 0:
+        return
+
+    runs = hashed["runs"]
+    runs.append({"hashes": hashes, "checks": checks, "rows": rows})
+
+    # Keep run sizes geometrically decreasing: O(log n) runs to search
+    while len(runs) > 1 and len(runs[-2]["hashes"]) <= 2 * len(runs[-1]["hashes"]):
+        newer = runs.pop()
+        older = runs.pop()
+        merged = np.concatenate([older["hashes"], newer["hashes"]])
+        order = np.argsort(merged, kind="stable")
+        runs.append({
+            "hashes": merged[order],
+            "checks": np.concatenate([older["checks"], newer["checks"]])[order],
+            "rows": np.concatenate([older["rows"], newer["rows"]])[order],
+        })
+
+
+def _resolve_collisions(hashed: Dict[str, Any], hashes: np.ndarray, checks: np.ndarray, rows: np.ndarray,
+                        positions: np.ndarray, duplicate: np.ndarray, first_seen: np.ndarray) -> None:
+    """Track keys whose first hash matched a different key by both hashes, in row order."""
+    collisions = hashed["collisions"]
+    positions = positions[np.argsort(rows[positions], kind="stable")]
+    for pos in positions.tolist():
+        fingerprint = (int(hashes[pos]), int(checks[pos]))
+        if fingerprint in collisions:
+            duplicate[pos] = True
+            first_seen[pos] = collisions[fingerprint]
+        else:
+            collisions[fingerprint] = int(rows[pos])
+
+
+def _track_fingerprints(state: Dict[str, Any], hashes: np.ndarray, checks: np.ndarray, rows: np.ndarray):
+    """
+    Track a batch of keys given as their two row hashes.
+
+    Args:
+        state: Key state created with hash_keys enabled
+        hashes: First (seed 0) hash of every key
+        checks: Second (seed 1) hash of every key
+        rows: Absolute row number of every key, ascending
+
+    Returns:
+        (duplicate mask, first-seen row of each duplicate or -1)
+    """
+    hashed = state["hashed"]
+    duplicate = np.zeros(len(hashes), dtype=bool)
+    first_seen = np.full(len(hashes), -1, dtype=np.int64)
+
+    # Hashes seen in earlier batches: confirm with the stored second hash
+    run_index, run_pos = _lookup_hashes(hashed["runs"], hashes)
+    seen = np.flatnonzero(run_index >= 0)
+    if len(seen):
+        stored, stored_rows = _stored_checks(hashed["runs"], run_index[seen], run_pos[seen])
+        equal = checks[seen] == stored
+        duplicate[seen[equal]] = True
+        first_seen[seen[equal]] = stored_rows[equal]
+        _resolve_collisions(hashed, hashes, checks, rows, seen[~equal], duplicate, first_seen)
+
+    # New hashes: the first row of each hash is stored, repeats are candidates
+    fresh = np.flatnonzero(run_index < 0)
+    order = fresh[np.argsort(hashes[fresh], kind="stable")]
+    sorted_hashes = hashes[order]
+    repeat = np.zeros(len(order), dtype=bool)
+    repeat[1:] = sorted_hashes[1:] == sorted_hashes[:-1]
+    leaders = order[~repeat]
+
+    if repeat.any():
+        candidates = order[repeat]
+        leader_of = leaders[np.cumsum(~repeat)[repeat] - 1]
+        equal = checks[candidates] == checks[leader_of]
+        duplicate[candidates[equal]] = True
+        first_seen[candidates[equal]] = rows[leader_of[equal]]
+        _resolve_collisions(hashed, hashes, checks, rows, candidates[~equal], duplicate, first_seen)
+
+    _add_run(hashed, hashes[leaders], checks[leaders], rows[leaders])
+    return duplicate, first_seen
+
+
+def _track_hashed_keys(state: Dict[str, Any], keys: pd.DataFrame, rows: np.ndarray):
+    """
+    Track a batch of keys by their 64-bit row hashes.
+
+    Args:
+        state: Key state created with hash_keys enabled
+        keys: Key columns, one row per key, in row order
+        rows: Absolute row number of every key
+
+    Returns:
+        (duplicate mask, first-seen row of each duplicate or -1)
+    """
+    keys = keys.reset_index(drop=True)
+    if len(keys) == 0:
+        return np.zeros(0, dtype=bool), np.full(0, -1, dtype=np.int64)
+
+    duplicate, first_seen = _track_fingerprints(state, hash_keys(keys), hash_keys(keys, seed=1), rows)
+
+    # Key values of new keys, for samples of duplicates found when merging
+    room = max(MAX_FIRST_OCCURRENCES - len(state["first_rows"]), 0)
+    new_positions = np.flatnonzero(~duplicate)[:room]
+    for pos, key in zip(new_positions, keys.iloc[new_positions].itertuples(index=False, name=None)):
+        state["first_rows"][key] = int(rows[pos])
+
+    if _key_statistics(state)["total_keys"] > state["hashed"]["max_keys"]:
+        _spill_hashed_runs(state)
+    return duplicate, first_seen
+
+
+def _hashed_fingerprints(hashed: Dict[str, Any]):
+    """Return the (first hash, second hash, first row) arrays of every stored key."""
+    runs = hashed["runs"]
+    collisions = list(hashed["collisions"].items())
+    hashes = [run["hashes"] for run in runs] + [np.array([fp[0] for fp, _ in collisions], dtype=np.uint64)]
+    checks = [run["checks"] for run in runs] + [np.array([fp[1] for fp, _ in collisions], dtype=np.uint64)]
+    rows = [run["rows"] for run in runs] + [np.array([row for _, row in collisions], dtype=np.int64)]
+    return np.concatenate(hashes), np.concatenate(checks), np.concatenate(rows)
+
+
+def _spill_hashed_runs(state: Dict[str, Any]) -> None:
+    """
+    Move the hashed runs into a PartitionedKeyStore once they exceed hash_table_size.
+
+    The store's fingerprints are the same two hashes, so later chunks are
+    tracked by it directly; first rows of duplicates then come from the
+    bounded first_rows map.
+    """
+    hashed = state["hashed"]
+    store = PartitionedKeyStore(max_memory_keys=hashed["max_keys"], partitions=hashed["partitions"])
+    hashes, checks, _ = _hashed_fingerprints(hashed)
+    store.add_fingerprints((checks % np.uint64(store.partitions)).astype(np.int64), hashes)
+    logger.info(
+        f"Hashed key runs exceeded hash_table_size ({hashed['max_keys']:,} keys); "
+        f"continuing with a partitioned key store on disk"
+    )
+    state["tracker"] = store
+    state["hashed"] = None
+
+
+def _track_tracker_keys(state: Dict[str, Any], keys: pd.DataFrame, rows: np.ndarray):
+    """
+    Track a batch of keys with one call to the state's tracker.
+
+    MemoryBoundedTracker keys keep their usual form (tuples, or scalars for
+    a single UniqueKeyCheck field); PartitionedKeyStore hashes the key
+    columns and keys first_rows by tuple. First rows come from the bounded
+    first_rows map and may be unknown (-1).
+
+    Returns:
+        (duplicate mask, first-seen row of each duplicate or -1)
+    """
+    keys = keys.reset_index(drop=True)
+    tracker = state["tracker"]
+
+    if isinstance(tracker, PartitionedKeyStore):
+        key_list = None
+        duplicate = ~tracker.add_many(keys)
+    else:
+        key_list = _key_list(state, keys)
+
+        candidates = None
+        if state["bloom"] is not None:
+            # Only keys the filter may have seen, or that repeat within
+            # the chunk, need a tracker lookup
+            hashes = hash_keys(keys)
+            candidates = state["bloom"].contains_hashes(hashes)
+            candidates |= pd.Series(hashes).duplicated(keep=False).to_numpy()
+            state["bloom"].add_hashes(hashes)
+        duplicate, _ = tracker.add_and_check_many(key_list, candidates=candidates)
+
+    return duplicate, _record_first_rows(state, keys, key_list, rows, duplicate)
+
+
+def _track_pending_keys(state: Dict[str, Any], keys: pd.DataFrame, rows: np.ndarray):
+    """
+    Track the keys of a worker partial without a tracker.
+
+    The partial covers one chunk, so only repeats within it are duplicates
+    here; its new keys are kept in ``pending`` for the parent to add to its
+    tracker in one batch (see _merge_pending_keys).
+
+    Returns:
+        (duplicate mask, first-seen row of each duplicate or -1)
+    """
+    keys = keys.reset_index(drop=True)
+    key_list = _key_list(state, keys)
+    pending = state["pending"]
+
+    duplicate = pd.Series(key_list, dtype=object).duplicated().to_numpy()
+    if pending["keys"]:
+        # A partial that is updated again checks its earlier keys as well
+        earlier = set(pending["keys"])
+        duplicate |= np.fromiter((key in earlier for key in key_list), dtype=bool, count=len(key_list))
+
+    new_positions = np.flatnonzero(~duplicate)
+    pending["keys"].extend(key_list[pos] for pos in new_positions)
+    if pending["hashes"] is not None:
+        pending["hashes"].append(hash_keys(keys)[new_positions])
+
+    return duplicate, _record_first_rows(state, keys, key_list, rows, duplicate)
+
+
+def _key_list(state: Dict[str, Any], keys: pd.DataFrame) -> List[Any]:
+    """Keys in MemoryBoundedTracker form: tuples, or scalars for a single UniqueKeyCheck field."""
+    if state["scalar_keys"]:
+        return keys.iloc[:, 0].tolist()
+    return list(keys.itertuples(index=False, name=None))
+
+
+def _record_first_rows(state: Dict[str, Any], keys: pd.DataFrame, key_list: Optional[List[Any]],
+                       rows: np.ndarray, duplicate: np.ndarray) -> np.ndarray:
+    """
+    Remember the first rows of new keys and look up those of duplicates.
+
+    Args:
+        state: Key state
+        keys: Key columns of the batch (index reset)
+        key_list: Keys in tracker form, or None to key first_rows by tuple
+        rows: Absolute row number of every key
+        duplicate: Duplicate mask of the batch
+
+    Returns:
+        First-seen row of each duplicate that can still become a sample
+        (if first rows are reported), -1 elsewhere
+    """
+    def keys_at(positions: np.ndarray) -> List[Any]:
+        if key_list is not None:
+            return [key_list[pos] for pos in positions]
+        return list(keys.iloc[positions].itertuples(index=False, name=None))
+
+    first_seen = np.full(len(keys), -1, dtype=np.int64)
+    first_rows = state["first_rows"]
+
+    room = max(MAX_FIRST_OCCURRENCES - len(first_rows), 0)
+    new_positions = np.flatnonzero(~duplicate)[:room]
+    for pos, key in zip(new_positions, keys_at(new_positions)):
+        first_rows[key] = int(rows[pos])
+
+    if state["report_first_seen"]:
+        # Only duplicates that can still become samples need their first row
+        sampled = np.flatnonzero(duplicate)[:max(state["max_samples"] - len(state["samples"]), 0)]
+        for pos, key in zip(sampled, keys_at(sampled)):
+            first_seen[pos] = first_rows.get(key, -1)
+
+    return first_seen
+
+
+def _update_batch_state(state: Dict[str, Any], keys: pd.DataFrame, rows: np.ndarray) -> None:
+    """Track one chunk of keys in a single batch and record its duplicates."""
+    if state["hashed"] is not None:
+        duplicate, first_seen = _track_hashed_keys(state, keys, rows)
+    elif state.get("pending") is not None:
+        duplicate, first_seen = _track_pending_keys(state, keys, rows)
+    else:
+        duplicate, first_seen = _track_tracker_keys(state, keys, rows)
+    positions = np.flatnonzero(duplicate)
+
+    if state["early_termination"]:
+        remaining = state["max_duplicates"] - state["duplicates"]
+        positions = positions[:max(remaining, 0)]
+    state["duplicates"] += len(positions)
+
+    room = state["max_samples"] - len(state["samples"])
+    if room > 0:
+        sampled = positions[:room]
+        key_rows = keys.iloc[sampled].itertuples(index=False, name=None)
+        for pos, key in zip(sampled, key_rows):
+            first_seen_row = None
+            if state["report_first_seen"]:
+                first_seen_row = int(first_seen[pos]) if first_seen[pos] >= 0 else "unknown"
+            state["samples"].append(_duplicate_sample(key, rows[pos], state["check_cols"], first_seen_row))
+
+    _early_termination_reached(state)
+
+
+def _merge_hashed_states(state: Dict[str, Any], other: Dict[str, Any], check_cols: List[str]) -> List[Dict[str, Any]]:
+    """
+    Merge the hashed runs of a later file range into an earlier one.
+
+    Every key of ``other`` already present in ``state`` adds one duplicate.
+
+    Returns:
+        Samples for the cross-range duplicates whose key values are known
+    """
+    hashes, checks, rows = _hashed_fingerprints(other["hashed"])
+    order = np.argsort(rows, kind="stable")
+    hashes, checks, rows = hashes[order], checks[order], rows[order]
+
+    duplicate, first_seen = _track_fingerprints(state, hashes, checks, rows)
+    positions = np.flatnonzero(duplicate)
+    state["duplicates"] += len(positions)
+
+    # Only the key values of other's first occurrences are known
+    other_first = other["first_rows"]
+    duplicate_rows = {}
+    if other_first:
+        keys = list(other_first)
+        key_frame = pd.DataFrame(keys, columns=check_cols)
+        fingerprints = zip(hash_keys(key_frame).tolist(), hash_keys(key_frame, seed=1).tolist())
+        key_of = dict(zip(fingerprints, keys))
+        for pos in positions.tolist():
+            key = key_of.get((int(hashes[pos]), int(checks[pos])))
+            if key is not None:
+                duplicate_rows[key] = pos
+        for key in keys:
+            if key not in duplicate_rows:
+                _remember_first_row(state, key, other_first[key])
+
+    samples = []
+    for key, pos in sorted(duplicate_rows.items(), key=lambda item: item[1])[:state["max_samples"]]:
+        first_seen_row = int(first_seen[pos]) if state["report_first_seen"] else None
+        samples.append(_duplicate_sample(key, rows[pos], check_cols, first_seen_row))
+
+    if _key_statistics(state)["total_keys"] > state["hashed"]["max_keys"]:
+        _spill_hashed_runs(state)
+    return samples
+
+
+def _merge_partitioned_stores(state: Dict[str, Any], other: Dict[str, Any], check_cols: List[str],
+                              batches: Iterator[Tuple[np.ndarray, np.ndarray]]) -> List[Dict[str, Any]]:
+    """
+    Merge the keys of a later file range into an earlier range's key store.
+
+    Every fingerprint of ``other`` already present in ``state`` adds one
+    duplicate.
+
+    Args:
+        state: State for earlier rows, with a PartitionedKeyStore
+        other: State for later rows
+        check_cols: Key columns
+        batches: (partition, fingerprint) arrays of other's distinct keys,
+                 each added with one add_fingerprints call
+
+    Returns:
+        Samples for the cross-range duplicates whose first row is known
+    """
+    tracker = state["tracker"]
+    overlap = set()
+    for partitions, fingerprints in batches:
+        added = tracker.add_fingerprints(partitions, fingerprints)
+        state["duplicates"] += int((~added).sum())
+        overlap.update(zip(partitions[~added].tolist(), fingerprints[~added].tolist()))
+
+    other_first = other["first_rows"]
+    if not other_first:
+        return []
+
+    keys = list(other_first)
+    partitions, fingerprints = tracker.fingerprint(pd.DataFrame(keys, columns=check_cols))
+    samples = []
+    for key, partition, fp in zip(keys, partitions.tolist(), fingerprints.tolist()):
+        if (partition, fp) not in overlap:
+            _remember_first_row(state, key, other_first[key])
+        elif len(samples) < state["max_samples"]:
+            first_seen_row = state["first_rows"].get(key, "unknown") if state["report_first_seen"] else None
+            samples.append(_duplicate_sample(key, other_first[key], check_cols, first_seen_row))
+    return samples
 
-            except Exception as e:
-                return self._create_result(
-                    passed=False,
-                    message=f"Error during unique key check: {str(e)}",
-                    failed_count=1,
-                )
@@ -57,6 +57,8 @@ class DistributionCheck(DataValidationRule):
             expected_distribution: "uniform"
     """
 
+    column_params = ("column",)
+
     def get_description(self) -> str:
         """Get human-readable description."""
         column = self.params.get("column", "?")
@@ -261,6 +263,8 @@ class CorrelationCheck(DataValidationRule):
             correlation_type: "spearman"
     """
 
+    column_params = ("column1", "column2")
+
     def get_description(self) -> str:
         """Get human-readable description."""
         col1 = self.params.get("column1", "?")
@@ -472,6 +476,8 @@ class AdvancedAnomalyDetectionCheck(DataValidationRule):
             max_anomaly_pct: 5
     """
 
+    column_params = ("column",)
+
     def get_description(self) -> str:
         """Get human-readable description."""
         column = self.params.get("column", "?")
@@ -66,6 +66,8 @@ class BaselineComparisonCheck(DataValidationRule):
             tolerance_pct: 15
     """
 
+    cacheable = False  # Result depends on the baseline file
+
     def get_description(self) -> str:
         """Get human-readable description."""
         metric = self.params.get("metric", "?")
@@ -373,6 +375,8 @@ class TrendDetectionCheck(DataValidationRule):
             comparison_period: 7  # Compare to 7 days ago
     """
 
+    cacheable = False  # Result depends on history and the current date
+
     def get_description(self) -> str:
         """Get human-readable description."""
         metric = self.params.get("metric", "?")